@@ -0,0 +1,25 @@
+# asgi.py - 세션 토큰 쿠키 미들웨어를 붙인 Streamlit ASGI 앱
+#
+# 사용법: python tools/serve_streamlit.py [streamlit run 옵션...]
+#         또는 uvicorn asgi:app --host 0.0.0.0 --port 8501
+# 세션 토큰 쿠키는 이 앱의 미들웨어가 응답 헤더로 HttpOnly/Secure 쿠키를 발급합니다
+# (HTTPS 없이 localhost가 아닌 주소로 개발할 때만 WELLNESS_SESSION_COOKIE_SECURE=0).
+# 공유 세션 저장소 설정이 잘못되었으면 (서명 키 없음) 서버를 띄우기 전에 실패합니다.
+
+import os
+
+import streamlit as st
+from starlette.middleware import Middleware
+
+from wellness.session_cookie import SessionCookieMiddleware
+from wellness.session_store import get_session_store
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+get_session_store()
+
+app = st.App(
+    os.path.join(ROOT_DIR, 'app.py'),
+    middleware=[Middleware(SessionCookieMiddleware,
+                           secure=os.environ.get('WELLNESS_SESSION_COOKIE_SECURE', '1') != '0')],
+)
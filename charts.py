@@ -0,0 +1,132 @@
+# charts.py - Plotly 기반 차트 생성 함수 (utils에서 지연 로딩)
+#
+# 차트는 wellness.figures의 공용 JSON 캐시를 거쳐 만듭니다. 모든 사용자에게 같은 차트는
+# cached_figure로 JSON을 그대로 재사용하고, 사용자별 차트는 patched_figure로
+# 캐시된 템플릿에 데이터 배열만 바꿔 끼웁니다.
+
+import json
+
+import plotly.graph_objects as go
+
+from wellness import get_cluster_info
+from wellness.figures import get_figure_cache, patch_figure
+
+def _figure_from_dict(figure):
+    """그림 딕셔너리를 Figure로 변환 (처음 만들 때 검증을 마친 JSON이므로 다시 검증하지 않음)"""
+    return go.Figure(figure, _validate=False)
+
+def cached_figure(name, build, variant=None, version=None):
+    """(차트 이름, 변형, 데이터 버전)별로 한 번만 build()한 차트를 JSON 캐시에서 복원"""
+    figure_json = get_figure_cache().get(name, variant, version, lambda: build().to_json())
+    return _figure_from_dict(json.loads(figure_json))
+
+def patched_figure(name, build_template, traces=None, layout=None, variant=None, version=None):
+    """캐시된 차트 템플릿에 트레이스 데이터와 레이아웃 값만 바꿔 끼운 차트"""
+    figure_json = get_figure_cache().get(name, variant, version, lambda: build_template().to_json())
+    return _figure_from_dict(patch_figure(figure_json, traces, layout))
+
+def _factor_analysis_template():
+    """요인 점수 차트 템플릿 (데이터는 patched_figure로 채움)"""
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatterpolar(
+        r=[],
+        theta=[],
+        fill='toself',
+        name='나의 여행 성향',
+        line_color='#3498DB',
+        fillcolor='rgba(52, 152, 219, 0.2)'
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 1],
+                tickfont=dict(size=10, color='#2C3E50'),
+                gridcolor='rgba(52, 152, 219, 0.3)'
+            ),
+            angularaxis=dict(
+                tickfont=dict(size=11, color='#2C3E50'),
+                gridcolor='rgba(52, 152, 219, 0.3)'
+            )
+        ),
+        showlegend=True,
+        title="여행 성향 분석",
+        font=dict(color='#2C3E50', size=12),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=500
+    )
+    
+    return fig
+
+def create_factor_analysis_chart(factor_scores):
+    """간소화된 요인 점수 차트 생성 (3개 클러스터용)"""
+    factor_names = list(factor_scores.keys())
+    values = [float(value) for value in factor_scores.values()]
+    
+    return patched_figure(
+        'factor_analysis', _factor_analysis_template,
+        traces={0: {'r': values, 'theta': factor_names}},
+        layout={'polar': {'radialaxis': {'range': [0, max(values) + 1]}}}
+    )
+
+# 클러스터 비교 차트 항목
+COMPARISON_CATEGORIES = ['체류기간', '지출수준', '방문경험', '문화관심']
+
+def _cluster_comparison_template(user_cluster):
+    """클러스터별 비교 차트 템플릿 (클러스터 평균 포함, 사용자 점수는 patched_figure로 채움)"""
+    cluster_info = get_cluster_info()
+    cluster_data = cluster_info[user_cluster]
+    categories = COMPARISON_CATEGORIES
+    
+    # 클러스터 평균 점수 (임의 설정)
+    cluster_averages = {
+        0: [3, 1, 2, 2],  # 장기체류형: 긴 체류, 낮은 지출, 중간 경험, 문화관심
+        1: [2, 2, 1, 3],  # 중간형: 중간 체류, 중간 지출, 낮은 경험, 높은 문화관심
+        2: [1, 3, 3, 1]   # 고소비형: 짧은 체류, 높은 지출, 높은 경험, 낮은 문화관심
+    }
+    
+    cluster_scores = cluster_averages.get(user_cluster, [2, 2, 2, 2])
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=categories,
+        y=[0] * len(categories),
+        name="나의 점수",
+        marker_color='#3498DB'
+    ))
+    
+    fig.add_trace(go.Bar(
+        x=categories,
+        y=cluster_scores,
+        name=f"{cluster_data['name']} 평균",
+        marker_color=cluster_data['color'],
+        opacity=0.7
+    ))
+    
+    fig.update_layout(
+        title=f"나 vs {cluster_data['name']} 비교",
+        xaxis_title="평가 항목",
+        yaxis_title="점수",
+        barmode='group',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='#2C3E50',
+        height=400
+    )
+    
+    return fig
+
+def create_cluster_comparison_chart(user_cluster, factor_scores):
+    """사용자와 클러스터 평균 비교 차트 (3개 클러스터용)"""
+    # 간소화된 비교 차트
+    user_scores = [float(factor_scores.get(cat, 0)) for cat in COMPARISON_CATEGORIES]
+    
+    return patched_figure(
+        'cluster_comparison', lambda: _cluster_comparison_template(user_cluster),
+        traces={0: {'y': user_scores}},
+        variant=user_cluster
+    )
@@ -13,7 +13,7 @@ if parent_dir not in sys.path:
 try:
     from utils import (questions, calculate_cluster_scores, determine_cluster, 
                       validate_answers, show_footer, reset_survey_state, 
-                      check_access_permissions, apply_global_styles)
+                      check_access_permissions, apply_global_styles, end_session)
 except ImportError as e:
     st.error(f"❌ 필수 모듈을 불러올 수 없습니다: {e}")
     st.info("💡 **해결 방법**: `utils.py` 파일이 올바른 위치에 있는지 확인해주세요.")
@@ -57,309 +57,9 @@ if st.session_state.get('reset_survey_flag', False):
     reset_survey_state()
     st.session_state.reset_survey_flag = False
 
-# 전역 스타일 적용
-apply_global_styles()
+# 전역 + 설문 페이지 스타일 적용
+apply_global_styles('questionnaire')
 
-# 설문 전용 추가 스타일
-st.markdown("""
-<style>
-    /* 사이드바 스타일링 */
-    .css-1d391kg {
-        background: linear-gradient(135deg, #F8F9FA 0%, #E8F4FD 100%);
-    }
-    
-    /* 질문 카드 스타일 */
-    .question-card {
-        background: rgba(255, 255, 255, 0.95);
-        border: 2px solid rgba(52, 152, 219, 0.2);
-        border-radius: 20px;
-        padding: 28px;
-        margin: 20px 0;
-        transition: all 0.3s ease;
-        box-shadow: 0 6px 24px rgba(0, 0, 0, 0.08);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .question-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #3498DB, #2ECC71);
-        border-radius: 20px 20px 0 0;
-    }
-    
-    .question-card:hover {
-        transform: translateY(-4px);
-        border-color: #3498DB;
-        box-shadow: 0 12px 36px rgba(52, 152, 219, 0.15);
-    }
-    
-    .question-card.error {
-        border-color: #E74C3C;
-        background: linear-gradient(135deg, rgba(231, 76, 60, 0.05), rgba(255, 255, 255, 0.95));
-        animation: shake 0.6s ease-in-out;
-    }
-    
-    .question-card.error::before {
-        background: linear-gradient(90deg, #E74C3C, #EC7063);
-    }
-    
-    @keyframes shake {
-        0%, 100% { transform: translateX(0); }
-        25% { transform: translateX(-3px); }
-        75% { transform: translateX(3px); }
-    }
-    
-    /* 질문 제목 */
-    .question-title {
-        color: #2C3E50;
-        font-size: 1.8em;
-        font-weight: 700;
-        margin-bottom: 5px;
-        line-height: 1.5;
-    }
-    
-    .question-title.error {
-        color: #E74C3C;
-    }
-    
-    /* 카테고리 태그 */
-    .category-tag {
-        display: inline-block;
-        background: linear-gradient(135deg, #3498DB, #5DADE2);
-        color: white;
-        padding: 6px 14px;
-        border-radius: 16px;
-        font-size: 1.2em;
-        font-weight: 700;
-        margin-bottom: 14px;
-        box-shadow: 0 2px 8px rgba(52, 152, 219, 0.3);
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    /* 라디오 버튼 스타일 개선 */
-    div[data-testid="stRadio"] {
-        margin: 0;
-    }
-    
-    div[data-testid="stRadio"] > div {
-        gap: 5px !important;
-    }
-    
-    div[data-testid="stRadio"] label {
-        background: rgba(255, 255, 255, 0.9) !important;
-        border: 2px solid rgba(52, 152, 219, 0.2) !important;
-        border-radius: 12px !important;
-        padding: 10px 20px !important;
-        margin: 0 !important;
-        transition: all 0.3s ease !important;
-        backdrop-filter: blur(10px) !important;
-        cursor: pointer !important;
-        min-height: 40px !important;
-        display: flex !important;
-        align-items: center !important;
-        box-shadow: 0 3px 12px rgba(0, 0, 0, 0.06) !important;
-        position: relative !important;
-        overflow: hidden !important;
-    }
-    
-    div[data-testid="stRadio"] label::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(52, 152, 219, 0.1), transparent);
-        transition: all 0.6s ease;
-    }
-    
-    div[data-testid="stRadio"] label:hover::before {
-        left: 100%;
-    }
-    
-    div[data-testid="stRadio"] label:hover {
-        transform: translateY(-2px) !important;
-        border-color: #3498DB !important;
-        box-shadow: 0 6px 20px rgba(52, 152, 219, 0.2) !important;
-        background: rgba(255, 255, 255, 1) !important;
-    }
-    
-    div[data-testid="stRadio"] input:checked + div {
-        background: linear-gradient(135deg, rgba(52, 152, 219, 0.1), rgba(93, 173, 226, 0.05)) !important;
-        border-color: #3498DB !important;
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px rgba(52, 152, 219, 0.25) !important;
-    }
-    
-    div[data-testid="stRadio"] label span {
-        font-size: 1em !important;
-        color: #2C3E50 !important;
-        font-weight: 500 !important;
-        line-height: 1.5 !important;
-        z-index: 1 !important;
-        position: relative !important;
-    }
-    
-    /* 메인 제목 */
-    .main-title {
-        color: #2C3E50 !important;
-        text-align: center;
-        font-size: 2.6em !important;
-        font-weight: 800 !important;
-        margin-bottom: 24px;
-        background: rgba(255, 255, 255, 0.95);
-        padding: 32px;
-        border-radius: 24px;
-        border: 3px solid #3498DB;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        position: relative;
-        overflow: hidden;
-        background: linear-gradient(135deg, #2C3E50, #3498DB);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    .main-title::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #3498DB, #2ECC71);
-        border-radius: 24px 24px 0 0;
-    }
-    
-    /* 인트로 카드 */
-    .intro-card {
-        background: rgba(255, 255, 255, 0.95);
-        border: 2px solid rgba(52, 152, 219, 0.2);
-        border-radius: 20px;
-        padding: 28px;
-        margin: 20px 0;
-        text-align: center;
-        box-shadow: 0 6px 24px rgba(0, 0, 0, 0.08);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .intro-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #3498DB, #2ECC71);
-        border-radius: 20px 20px 0 0;
-    }
-    
-    /* 진행률 바 */
-    div[data-testid="stProgress"] > div > div {
-        background: linear-gradient(90deg, #3498DB, #2ECC71) !important;
-        border-radius: 8px !important;
-        height: 14px !important;
-        box-shadow: 0 2px 8px rgba(52, 152, 219, 0.3) !important;
-    }
-    
-    div[data-testid="stProgress"] > div {
-        background: rgba(52, 152, 219, 0.15) !important;
-        border-radius: 8px !important;
-        height: 14px !important;
-        box-shadow: inset 0 2px 8px rgba(52, 152, 219, 0.1) !important;
-    }
-    
-    /* 진행률 텍스트 */
-    .progress-text {
-        font-size: 1.3em;
-        font-weight: 700;
-        color: #2C3E50;
-        text-align: center;
-        margin: 16px 0;
-    }
-    
-    /* 프로그레스 컨테이너 */
-    .progress-container {
-        background: rgba(255, 255, 255, 0.95);
-        border: 2px solid rgba(52, 152, 219, 0.2);
-        border-radius: 16px;
-        padding: 24px;
-        margin: 20px 0;
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .progress-container::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #3498DB, #2ECC71);
-        border-radius: 16px 16px 0 0;
-    }
-    
-    /* 사이드바 사용자 정보 */
-    .sidebar-user-info {
-        background: rgba(255, 255, 255, 0.9);
-        border-radius: 12px;
-        padding: 16px;
-        margin: 12px 0;
-        border: 2px solid rgba(52, 152, 219, 0.2);
-        text-align: center;
-    }
-    
-    .sidebar-progress {
-        background: rgba(255, 255, 255, 0.9);
-        border-radius: 12px;
-        padding: 16px;
-        margin: 12px 0;
-        border: 2px solid rgba(52, 152, 219, 0.2);
-    }
-    
-    /* 반응형 디자인 개선 */
-    @media (max-width: 768px) {
-        .question-card {
-            padding: 20px;
-            margin: 16px 0;
-        }
-        
-        .main-title {
-            font-size: 2.2em !important;
-            padding: 24px;
-        }
-        
-        div[data-testid="stRadio"] label {
-            padding: 14px 16px !important;
-            min-height: 50px !important;
-        }
-    }
-    
-    @media (max-width: 480px) {
-        .question-card {
-            padding: 16px;
-        }
-        
-        .main-title {
-            font-size: 1.8em !important;
-            padding: 20px;
-        }
-        
-        div[data-testid="stRadio"] label {
-            padding: 12px 14px !important;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
 
 def questionnaire_page():
     # 사이드바에 사용자 정보 및 진행 상황
@@ -380,8 +80,7 @@ def questionnaire_page():
         st.markdown("---")
         if st.button("🚪 로그아웃", use_container_width=True, key="sidebar_logout"):
             # 세션 상태 클리어
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            end_session()
             st.switch_page("app.py")
 
     # 세션 상태 초기화
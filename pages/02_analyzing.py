@@ -12,210 +12,9 @@ st.set_page_config(
 # 접근 권한 확인 (기본값: 로그인 + 설문 완료 둘 다 확인)
 check_access_permissions()
 
-# 전역 스타일 적용
-apply_global_styles()
+# 전역 + 분석 페이지 스타일 적용
+apply_global_styles('analyzing')
 
-# --- 분석 페이지 전용 스타일 ---
-st.markdown("""
-    <style>
-        /* 중앙 정렬을 위한 메인 컨테이너 */
-        .main .block-container {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            min-height: 100vh;
-            width: 100%;
-            padding: 30px 10px !important;
-        }
-        
-        /* 분석 카드 스타일 */
-        .analyzing-card {
-            background: var(--card-bg);
-            backdrop-filter: blur(25px);
-            border: 3px solid var(--primary);
-            border-radius: 30px;
-            padding: 40px 30px;
-            text-align: center;
-            box-shadow: 0 20px 60px rgba(76, 175, 80, 0.2);
-            max-width: 600px;
-            width: 90%;
-            margin: 0 auto;
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .analyzing-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 6px;
-            background: linear-gradient(45deg, var(--primary), var(--secondary));
-            border-radius: 30px 30px 0 0;
-        }
-        
-        /* 아이콘 회전 애니메이션 */
-        @keyframes spin {
-            0% { transform: rotate(0deg) scale(1); }
-            25% { transform: rotate(90deg) scale(1.1); }
-            50% { transform: rotate(180deg) scale(1); }
-            75% { transform: rotate(270deg) scale(1.1); }
-            100% { transform: rotate(360deg) scale(1); }
-        }
-        
-        .spinning-brain {
-            animation: spin 4s linear infinite;
-            font-size: 70px;
-            display: inline-block;
-            margin-bottom: 15px;
-            filter: drop-shadow(0 4px 8px rgba(76, 175, 80, 0.3));
-        }
-
-        /* 텍스트 점(.) 애니메이션 */
-        @keyframes ellipsis {
-            0% { content: "."; }
-            33% { content: ".."; }
-            66% { content: "..."; }
-            100% { content: "."; }
-        }
-        
-        .analyzing-text {
-            text-align: center;
-            margin-left: 90px;
-        }
-        
-        .analyzing-text::after {
-            content: ".";
-            animation: ellipsis 1.5s infinite;
-            display: inline-block;
-            width: 2em;
-            text-align: left;
-        }
-
-        /* 제목 스타일 */
-        .analyzing-title {
-            text-align: center;
-            color: var(--primary-dark);
-            font-size: 2.4em;
-            font-weight: 800;
-            margin-top: 20px;
-            margin-bottom: 35px;
-        }
-        
-        /* 설명 텍스트 */
-        .analyzing-description {
-            color: #333;
-            font-size: 1.05em;
-            font-weight: 600;
-            margin-top: 20px;
-            margin-bottom: 35px;
-            line-height: 1.7;
-            opacity: 0.9;
-        }
-            
-        /* 진행률 바 외부 컨테이너 */
-        .progress-wrapper {
-            max-width: 600px;
-            width: 90%;
-            margin: 0 auto;
-        }
-            
-        /* 진행률 컨테이너 */
-        .progress-container {
-            background: rgba(76, 175, 80, 0.15);
-            border-radius: 15px;
-            padding: 0px;
-            margin: 0 0;
-            box-shadow: inset 0 2px 8px rgba(76, 175, 80, 0.2);
-        }
-        
-        /* 진행률 바 */
-        .progress-bar {
-            background: linear-gradient(45deg, var(--primary), var(--secondary));
-            height: 12px;
-            border-radius: 8px;
-            transition: all 0.5s ease;
-            box-shadow: 0 2px 8px rgba(76, 175, 80, 0.4);
-            position: relative;
-            overflow: hidden;
-        }
-        
-        /* 진행률 텍스트 */
-        .progress-text {
-            text-align: left;
-            color: var(--primary-dark);
-            font-weight: 700;
-            font-size: 1.1em;
-            margin-top: 20px;
-            margin: 12px 0;
-            text-shadow: 1px 1px 2px rgba(0,0,0,0.1);
-        }
-        
-        .status-wrapper {
-            max-width: 600px;
-            width: 90%;
-            margin: 0 auto;
-        }
-        
-        /* 상태 메시지 */
-        .status-message {
-            color: var(--primary-dark);
-            font-size: 1.0em;
-            font-weight: 600;
-            margin: 20px 0;
-            padding: 15px 20px;
-            background: rgba(76, 175, 80, 0.1);
-            border-radius: 12px;
-            border-left: 5px solid var(--primary);
-            box-shadow: 0 3px 12px rgba(76, 175, 80, 0.15);
-            transition: all 0.3s ease;
-        }
-        
-        /* 완료 상태 메시지 */
-        .status-message.completed {
-            background: linear-gradient(135deg, rgba(76, 175, 80, 0.2), rgba(129, 199, 132, 0.15));
-            border-left-color: var(--primary);
-            box-shadow: 0 4px 16px rgba(76, 175, 80, 0.25);
-            transform: translateY(-2px);
-        }
-        
-        /* 반응형 디자인 */
-        @media (max-width: 768px) {
-            .analyzing-card {
-                padding: 40px 30px;
-                max-width: 95%;
-            }
-            
-            .analyzing-title {
-                font-size: 2em;
-            }
-            
-            .spinning-brain {
-                font-size: 70px;
-            }
-            
-            .analyzing-description {
-                font-size: 1.1em;
-            }
-        }
-        
-        /* 작은 화면 대응 */
-        @media (max-width: 480px) {
-            .analyzing-card {
-                padding: 30px 20px;
-            }
-            
-            .analyzing-title {
-                font-size: 1.8em;
-            }
-            
-            .spinning-brain {
-                font-size: 60px;
-            }
-        }
-    </style>
-    """, unsafe_allow_html=True)
 
 # --- 직접 접근 방지 로직 (로그인 여부 및 설문 완료 여부 확인) ---
 if 'logged_in' not in st.session_state or not st.session_state.logged_in:
@@ -14,7 +14,8 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 try:
-    from utils import check_access_permissions, get_cluster_info, apply_global_styles
+    from utils import (check_access_permissions, get_cluster_info, apply_global_styles,
+                       cached_figure, patched_figure, restore_session, end_session)
 except ImportError as e:
     st.error(f"❌ 필수 모듈 임포트 실패: {e}")
     st.info("💡 `utils.py` 파일이 올바른 위치에 있는지 확인해주세요.")
@@ -30,6 +31,8 @@ st.set_page_config(
 
 # 보안 및 접근 권한 확인
 try:
+    # 다른 복제본/재시작 후 접속이면 저장된 진행 상황 복원
+    restore_session()
     if 'logged_in' not in st.session_state or not st.session_state.logged_in:
         st.error("⚠️ 로그인이 필요합니다.")
         st.markdown("### 🔐 로그인 후 이용해주세요")
@@ -38,310 +41,16 @@ try:
         st.stop()
     
     check_access_permissions('home')
-    apply_global_styles()
+    apply_global_styles('home')
 except Exception as e:
     st.error(f"❌ 시스템 오류: {e}")
     if st.button("🔄 다시 시도"):
         st.rerun()
     st.stop()
 
-# 홈페이지 전용 CSS 스타일링
-st.markdown("""
-<style>
-    /* 히어로 섹션 스타일 */
-    .hero-section {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.95), rgba(248, 249, 250, 0.95));
-        border: 2px solid rgba(52, 152, 219, 0.2);
-        border-radius: 24px;
-        padding: 48px 40px;
-        margin: 24px 0;
-        text-align: center;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .hero-section::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #3498DB, #2ECC71);
-        border-radius: 24px 24px 0 0;
-    }
-    
-    .hero-title {
-        color: #2C3E50 !important;
-        font-size: 2.8em !important;
-        font-weight: 800 !important;
-        margin-bottom: 16px !important;
-        background: linear-gradient(135deg, #2980B9, #27AE60);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    .hero-subtitle {
-        color: #34495E;
-        font-size: 1.2em;
-        font-weight: 500;
-        margin-bottom: 32px;
-        line-height: 1.6;
-    }
-    
-    /* 기능 카드 그리드 */
-    .feature-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-        gap: 24px;
-        margin: 32px 0;
-    }
-    
-    .feature-card {
-        background: rgba(255, 255, 255, 0.9);
-        border: 2px solid rgba(52, 152, 219, 0.15);
-        border-radius: 20px;
-        padding: 32px 24px;
-        text-align: center;
-        transition: all 0.3s ease;
-        height: 280px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        position: relative;
-        backdrop-filter: blur(10px);
-    }
-    
-    .feature-card:hover {
-        transform: translateY(-8px);
-        box-shadow: 0 20px 40px rgba(52, 152, 219, 0.15);
-        border-color: #3498DB;
-        background: rgba(255, 255, 255, 1);
-    }
-    
-    .feature-icon {
-        font-size: 3.5em;
-        margin-bottom: 20px;
-        background: linear-gradient(135deg, #3498DB, #2ECC71);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    .feature-title {
-        color: #2C3E50;
-        font-size: 1.3em;
-        font-weight: 700;
-        margin-bottom: 12px;
-    }
-    
-    .feature-description {
-        color: #5D6D7E;
-        font-weight: 500;
-        line-height: 1.5;
-        font-size: 0.95em;
-    }
-    
-    /* 통계 대시보드 */
-    .stats-dashboard {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.95), rgba(248, 249, 250, 0.9));
-        border: 2px solid rgba(52, 152, 219, 0.2);
-        border-radius: 20px;
-        padding: 32px;
-        margin: 24px 0;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.08);
-    }
-    
-    .stats-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-        gap: 20px;
-        margin-top: 16px;
-    }
-    
-    .stat-card {
-        background: rgba(255, 255, 255, 0.8);
-        border: 2px solid rgba(52, 152, 219, 0.15);
-        border-radius: 16px;
-        padding: 24px 16px;
-        text-align: center;
-        transition: all 0.3s ease;
-        height: 120px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-    
-    .stat-card:hover {
-        border-color: #3498DB;
-        box-shadow: 0 8px 24px rgba(52, 152, 219, 0.15);
-        transform: translateY(-2px);
-        background: rgba(255, 255, 255, 1);
-    }
-    
-    .stat-number {
-        font-size: 2.4em;
-        font-weight: 800;
-        color: #2980B9;
-        margin-bottom: 6px;
-        background: linear-gradient(135deg, #3498DB, #2ECC71);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-    
-    .stat-label {
-        color: #2C3E50;
-        font-size: 0.95em;
-        font-weight: 600;
-    }
-    
-    /* 사용자 상태 카드 */
-    .user-status-card {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.95), rgba(248, 249, 250, 0.9));
-        border: 2px solid rgba(52, 152, 219, 0.2);
-        border-radius: 20px;
-        padding: 28px;
-        margin: 20px 0;
-        text-align: center;
-        box-shadow: 0 6px 24px rgba(0, 0, 0, 0.08);
-        transition: all 0.3s ease;
-    }
-    
-    .user-status-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 10px 32px rgba(52, 152, 219, 0.12);
-        border-color: #3498DB;
-    }
-    
-    .user-name {
-        color: #2C3E50;
-        font-size: 1.4em;
-        font-weight: 700;
-        margin-bottom: 12px;
-    }
-    
-    .user-status {
-        font-size: 1.1em;
-        font-weight: 600;
-        margin: 8px 0;
-    }
-    
-    /* 클러스터 결과 표시 */
-    .cluster-result {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.95), rgba(248, 249, 250, 0.9));
-        border: 3px solid rgba(52, 152, 219, 0.3);
-        border-radius: 24px;
-        padding: 36px;
-        margin: 24px 0;
-        text-align: center;
-        box-shadow: 0 12px 36px rgba(0, 0, 0, 0.1);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .cluster-result::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(90deg, #3498DB, #2ECC71);
-        border-radius: 24px 24px 0 0;
-    }
-    
-    .cluster-badges {
-        display: flex;
-        justify-content: center;
-        gap: 12px;
-        margin: 20px 0;
-        flex-wrap: wrap;
-    }
-    
-    .cluster-badge {
-        background: linear-gradient(135deg, #3498DB, #2ECC71);
-        color: white;
-        padding: 10px 18px;
-        border-radius: 20px;
-        font-weight: 700;
-        font-size: 0.9em;
-        box-shadow: 0 4px 12px rgba(52, 152, 219, 0.3);
-    }
-    
-    /* 섹션 제목 */
-    .section-title {
-        color: #2C3E50 !important;
-        font-size: 2em;
-        font-weight: 700;
-        margin: 40px 0 24px 0;
-        text-align: center;
-        background: rgba(255, 255, 255, 0.9);
-        padding: 20px 28px;
-        border-radius: 16px;
-        border-left: 4px solid #3498DB;
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.08);
-    }
-    
-    /* 액션 섹션 */
-    .action-section {
-        background: linear-gradient(135deg, rgba(255, 255, 255, 0.95), rgba(248, 249, 250, 0.9));
-        border: 2px solid rgba(52, 152, 219, 0.2);
-        border-radius: 20px;
-        padding: 32px;
-        margin: 24px 0;
-        text-align: center;
-    }
-    
-    .action-buttons {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-        gap: 16px;
-        margin-top: 24px;
-    }
-    
-    /* 푸터 정보 */
-    .footer-info {
-        background: rgba(255, 255, 255, 0.8);
-        border-radius: 16px;
-        padding: 24px;
-        margin: 32px 0;
-        border: 1px solid rgba(52, 152, 219, 0.2);
-        text-align: center;
-        color: #5D6D7E;
-    }
-    
-    /* 반응형 디자인 */
-    @media (max-width: 768px) {
-        .hero-title {
-            font-size: 2.2em !important;
-        }
-        
-        .feature-grid {
-            grid-template-columns: 1fr;
-        }
-        
-        .stats-grid {
-            grid-template-columns: repeat(2, 1fr);
-        }
-        
-        .action-buttons {
-            grid-template-columns: 1fr;
-        }
-        
-        .cluster-badges {
-            flex-direction: column;
-            align-items: center;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
 
 # 차트 생성 함수들 (3개 클러스터 기준)
-@st.cache_data(ttl=3600)
-def create_system_overview_chart():
+def _build_system_overview_chart():
     """3개 클러스터 시스템 개요 차트"""
     factors = [
         "체류기간", "지출수준", "방문경험", "숙박형태", "문화관심", "여행스타일"
@@ -383,75 +92,74 @@ def create_system_overview_chart():
     
     return fig
 
-@st.cache_data(ttl=3600)
-def create_cluster_distribution_chart():
+def create_system_overview_chart():
+    """3개 클러스터 시스템 개요 차트 (모든 사용자에게 같으므로 한 번만 생성)"""
+    return cached_figure('home.system_overview', _build_system_overview_chart)
+
+def _build_cluster_distribution_chart():
     """3개 클러스터 분포 차트"""
+    cluster_info = get_cluster_info()
+    
+    names = [info['name'] for info in cluster_info.values()]
+    percentages = [info['percentage'] for info in cluster_info.values()]
+    colors = [info['color'] for info in cluster_info.values()]
+    
+    fig = px.pie(
+        values=percentages,
+        names=names,
+        title="3개 관광객 유형 분포",
+        color_discrete_sequence=colors,
+        hover_data={'values': percentages}
+    )
+    
+    fig.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate='<b>%{label}</b><br>비율: %{percent}<br>인원: %{value}%<extra></extra>'
+    )
+    
+    fig.update_layout(
+        plot_bgcolor='rgba(255,255,255,0)',
+        paper_bgcolor='rgba(255,255,255,0)',
+        font_color='#2C3E50',
+        title_font_size=16,
+        height=500
+    )
+    
+    return fig
+
+def create_cluster_distribution_chart():
+    """3개 클러스터 분포 차트 (모든 사용자에게 같으므로 한 번만 생성)"""
     try:
-        cluster_info = get_cluster_info()
-        
-        names = [info['name'] for info in cluster_info.values()]
-        percentages = [info['percentage'] for info in cluster_info.values()]
-        colors = [info['color'] for info in cluster_info.values()]
-        
-        fig = px.pie(
-            values=percentages,
-            names=names,
-            title="3개 관광객 유형 분포",
-            color_discrete_sequence=colors,
-            hover_data={'values': percentages}
-        )
-        
-        fig.update_traces(
-            textposition='inside',
-            textinfo='percent+label',
-            hovertemplate='<b>%{label}</b><br>비율: %{percent}<br>인원: %{value}%<extra></extra>'
-        )
-        
-        fig.update_layout(
-            plot_bgcolor='rgba(255,255,255,0)',
-            paper_bgcolor='rgba(255,255,255,0)',
-            font_color='#2C3E50',
-            title_font_size=16,
-            height=500
-        )
-        
-        return fig
+        return cached_figure('home.cluster_distribution', _build_cluster_distribution_chart)
     except Exception as e:
         st.error(f"차트 생성 오류: {e}")
         return None
 
-def create_user_progress_chart():
-    """사용자 진행 상황 차트"""
-    if 'survey_completed' in st.session_state and st.session_state.survey_completed:
-        if 'factor_scores' in st.session_state:
-            try:
-                factor_scores = st.session_state.factor_scores
-                factors = list(factor_scores.keys())
-                scores = list(factor_scores.values())
-                
-                fig = px.bar(
-                    x=factors,
-                    y=scores,
-                    title="나의 관광 성향 점수",
-                    color=scores,
-                    color_continuous_scale=['#E8F4FD', '#3498DB', '#2980B9']
-                )
-                
-                fig.update_layout(
-                    plot_bgcolor='rgba(255,255,255,0)',
-                    paper_bgcolor='rgba(255,255,255,0)',
-                    font_color='#2C3E50',
-                    title_font_size=16,
-                    xaxis_tickangle=-45,
-                    height=400
-                )
-                
-                return fig
-            except Exception as e:
-                st.error(f"개인 차트 생성 오류: {e}")
-                return None
+def _build_user_progress_template():
+    """나의 성향 점수 차트 템플릿 (점수는 patched_figure로 채움)"""
+    # px.bar는 빈 데이터를 받지 않으므로 자리표시 값 하나로 만들고 패치할 때 전부 교체
+    fig = px.bar(
+        x=[""],
+        y=[0],
+        title="나의 관광 성향 점수",
+        color=[0],
+        color_continuous_scale=['#E8F4FD', '#3498DB', '#2980B9']
+    )
     
-    # 기본 차트 (설문 미완료 시)
+    fig.update_layout(
+        plot_bgcolor='rgba(255,255,255,0)',
+        paper_bgcolor='rgba(255,255,255,0)',
+        font_color='#2C3E50',
+        title_font_size=16,
+        xaxis_tickangle=-45,
+        height=400
+    )
+    
+    return fig
+
+def _build_user_progress_placeholder():
+    """설문 완료 전 기본 차트"""
     factors = ["체류기간", "지출수준", "방문경험", "숙박형태", "문화관심", "여행스타일"]
     placeholder_scores = [0] * 6
     
@@ -472,6 +180,26 @@ def create_user_progress_chart():
     
     return fig
 
+def create_user_progress_chart():
+    """사용자 진행 상황 차트"""
+    if 'survey_completed' in st.session_state and st.session_state.survey_completed:
+        if 'factor_scores' in st.session_state:
+            try:
+                factor_scores = st.session_state.factor_scores
+                factors = list(factor_scores.keys())
+                scores = [float(score) for score in factor_scores.values()]
+                
+                return patched_figure(
+                    'home.user_progress', _build_user_progress_template,
+                    traces={0: {'x': factors, 'y': scores, 'marker': {'color': scores}}}
+                )
+            except Exception as e:
+                st.error(f"개인 차트 생성 오류: {e}")
+                return None
+    
+    # 기본 차트 (설문 미완료 시)
+    return cached_figure('home.user_progress_placeholder', _build_user_progress_placeholder)
+
 def render_user_status():
     """사용자 상태 렌더링"""
     user_col1, user_col2 = st.columns(2)
@@ -607,8 +335,7 @@ def render_logout():
     with logout_col2:
         if st.button("🚪 로그아웃", key="logout_btn", use_container_width=True):
             # 확인 없이 바로 로그아웃
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            end_session()
             st.switch_page("app.py")
 
 def home_page():
@@ -797,8 +524,7 @@ def main():
                 
         with col3:
             if st.button("🚪 로그아웃"):
-                for key in list(st.session_state.keys()):
-                    del st.session_state[key]
+                end_session()
                 st.switch_page("app.py")
 
 if __name__ == "__main__":
@@ -1,11 +1,9 @@
 # pages/04_recommendations.py - 실제 CSV 데이터 기반 추천 결과
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-import reverse_geocoder as rg
 import pandas as pd
 import numpy as np
+import logging
 import sys
 import os
 from datetime import datetime
@@ -22,6 +20,7 @@ try:
         # 페이지 접근 관련
         check_access_permissions,
         apply_global_styles,
+        fragment,
         
         # 클러스터 및 분석 관련
         get_cluster_info,
@@ -35,18 +34,36 @@ try:
         # 데이터 처리 관련
         questions,
         load_wellness_destinations,
+        load_wellness_nearby_spots,
         get_nearby_attractions,
         get_wellness_theme_filter_options,
         get_region_filter_options,
         apply_wellness_filters,
+        get_category_facets,
+        get_similar_places,
         export_recommendations_to_csv,
-        get_statistics_summary
+        export_cluster_destinations_to_csv,
+        get_statistics_summary,
+        
+        # 세션 상태 관련
+        store_recommended_places,
+        restore_session,
+        render_locale_selector,
+        localize_places,
+        get_locale,
+        reset_survey_state
     )
+    from wellness.diversity import DEFAULT_DIVERSITY_LAMBDA
+    from wellness.geo import get_nearby_attractions as wellness_nearby_attractions
+    from wellness.templates import get_fragment_cache, render_card, render_card_body, render_similar_list
 except ImportError as e:
     st.error(f"❌ 필수 모듈을 불러올 수 없습니다: {str(e)}")
     st.info("💡 `utils.py` 파일이 올바른 위치에 있는지 확인해주세요.")
     st.stop()
 
+# 다른 복제본/재시작 후 접속이면 저장된 진행 상황 복원
+restore_session()
+
 # 로그인 체크
 if 'logged_in' not in st.session_state or not st.session_state.logged_in:
     st.switch_page("app.py")
@@ -68,384 +85,21 @@ st.set_page_config(
 
 # 접근 권한 확인
 check_access_permissions()
-apply_global_styles()
-
-# 추천 결과 페이지 전용 CSS
-st.markdown("""
-<style>
-    /* 메인 제목 */
-    .main-title {
-        color: var(--primary-dark) !important;
-        text-align: center;
-        background: var(--card-bg);
-        padding: 30px 40px;
-        border-radius: 30px;
-        font-size: 3.2em !important;
-        margin-bottom: 40px;
-        font-weight: 800 !important;
-        border: 3px solid var(--primary);
-        box-shadow: 0 20px 60px rgba(76, 175, 80, 0.2);
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        letter-spacing: 1px;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .main-title::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 6px;
-        background: linear-gradient(45deg, var(--primary), var(--secondary));
-        border-radius: 30px 30px 0 0;
-    }
-            
-    /* 클러스터 결과 카드 */
-    .cluster-result-card {
-        background: var(--card-bg);
-        backdrop-filter: blur(25px);
-        border: 3px solid rgba(76, 175, 80, 0.4);
-        border-radius: 25px;
-        padding: 40px;
-        min-height: 430px;
-        margin: 30px 0;
-        text-align: center;
-        box-shadow: 0 20px 60px rgba(76, 175, 80, 0.15);
-        transition: all 0.4s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .cluster-result-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 25px 70px rgba(76, 175, 80, 0.25);
-        border-color: var(--primary);
-    }
-    
-    .cluster-result-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 6px;
-        background: linear-gradient(45deg, var(--primary), var(--secondary));
-        border-radius: 25px 25px 0 0;
-    }
-    
-    /* 추천 카드 */
-    .recommendation-card {
-        background: var(--card-bg);
-        backdrop-filter: blur(25px);
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 25px;
-        padding: 35px;
-        margin: 25px 0;
-        transition: all 0.4s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .recommendation-card:hover {
-        transform: translateY(-8px) scale(1.02);
-        box-shadow: 0 20px 60px rgba(76, 175, 80, 0.25);
-        background: rgba(255, 255, 255, 1);
-        border-color: var(--primary);
-    }
-    
-    .recommendation-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 6px;
-        background: linear-gradient(45deg, var(--primary), var(--secondary));
-        border-radius: 25px 25px 0 0;
-    }
-    
-    /* 랭킹 배지 */
-    .ranking-badge {
-        position: absolute;
-        top: -15px;
-        right: 25px;
-        background: linear-gradient(45deg, var(--primary), var(--secondary));
-        color: white;
-        padding: 12px 20px;
-        border-radius: 25px;
-        font-weight: 800;
-        font-size: 16px;
-        box-shadow: 0 6px 20px rgba(76, 175, 80, 0.4);
-        text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
-    }
-    
-    /* 섹션 제목 */
-    .section-title {
-        color: var(--primary-dark) !important;
-        font-size: 2.4em;
-        font-weight: 700;
-        margin: 50px 0 30px 0;
-        text-align: center;
-        background: var(--card-bg);
-        padding: 25px 35px;
-        border-radius: 25px;
-        border-left: 6px solid var(--primary);
-        box-shadow: 0 10px 30px rgba(76, 175, 80, 0.15);
-        text-shadow: 1px 1px 2px rgba(0,0,0,0.1);
-    }
-    
-    /* 분석 카드 */
-    .analysis-card {
-        background: var(--card-bg);
-        backdrop-filter: blur(20px);
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 20px;
-        min-height: 430px;
-        padding: 30px;
-        margin: 30px 0;
-        transition: all 0.3s ease;
-    }
-    
-    .analysis-card:hover {
-        border-color: var(--primary);
-        box-shadow: 0 8px 25px rgba(76, 175, 80, 0.2);
-        transform: translateY(-3px);
-    }
-    
-    /* 차트 컨테이너 */
-    .chart-container {
-        background: var(--card-bg);
-        backdrop-filter: blur(20px);
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 25px;
-        padding: 30px;
-        margin: 25px 0;
-        box-shadow: var(--shadow);
-    }
-    
-    .chart-container:hover {
-        border-color: var(--primary);
-        box-shadow: var(--shadow-hover);
-    }
-    
-    /* 정보 태그 */
-    .info-tag {
-        background: rgba(76, 175, 80, 0.15);
-        border: 2px solid rgba(76, 175, 80, 0.3);
-        border-radius: 15px;
-        padding: 10px 18px;
-        margin: 8px 5px;
-        display: inline-block;
-        color: var(--primary-dark);
-        font-size: 0.95em;
-        font-weight: 700;
-        transition: all 0.3s ease;
-    }
-    
-    .info-tag:hover {
-        background: rgba(76, 175, 80, 0.25);
-        border-color: var(--primary);
-        transform: translateY(-2px);
-    }
-    
-    /* 메트릭 카드 */
-    .metric-card {
-        background: var(--card-bg);
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 20px;
-        padding: 30px 20px;
-        text-align: center;
-        margin: 20px 0;
-        transition: all 0.3s ease;
-        height: 160px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-    
-    .metric-card:hover {
-        border-color: var(--primary);
-        box-shadow: 0 8px 25px rgba(76, 175, 80, 0.25);
-        transform: translateY(-3px);
-        background: rgba(255, 255, 255, 1);
-    }
-    
-    .metric-number {
-        font-size: 3.2em;
-        font-weight: 800;
-        color: var(--primary-dark);
-        margin-bottom: 10px;
-        text-shadow: 1px 1px 2px rgba(0,0,0,0.1);
-    }
-    
-    .metric-label {
-        color: var(--primary-dark);
-        font-size: 1.3em;
-        font-weight: 600;
-        letter-spacing: 0.5px;
-    }
-    
-    /* 지역 클러스터 카드 */
-    .region-cluster-card {
-        background: linear-gradient(135deg, var(--card-bg), rgba(232, 245, 232, 0.9));
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 20px;
-        padding: 25px;
-        margin: 20px 0;
-        transition: all 0.3s ease;
-    }
-    
-    .region-cluster-card:hover {
-        border-color: var(--primary);
-        transform: translateY(-3px);
-        box-shadow: 0 8px 25px rgba(76, 175, 80, 0.2);
-    }
-    
-    /* 다운로드 섹션 */
-    .download-section {
-        background: linear-gradient(135deg, rgba(76, 175, 80, 0.1), var(--card-bg));
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 25px;
-        padding: 35px;
-        margin: 30px 0;
-        text-align: center;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .download-section::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 6px;
-        background: linear-gradient(45deg, var(--primary), var(--secondary));
-        border-radius: 25px 25px 0 0;
-    }
-    
-    /* 관광지 상세 정보 */
-    .destination-detail {
-        background: rgba(255, 255, 255, 0.9);
-        border-radius: 15px;
-        padding: 20px;
-        margin: 15px 0;
-        border-left: 4px solid var(--primary);
-    }
-    
-    .destination-rating {
-        background: linear-gradient(45deg, #FF6B6B, #FF8E53);
-        color: white;
-        padding: 8px 16px;
-        border-radius: 20px;
-        font-weight: 700;
-        display: inline-block;
-        margin: 5px;
-        box-shadow: 0 3px 10px rgba(255, 107, 107, 0.3);
-    }
-    
-    .destination-price {
-        background: linear-gradient(45deg, #4CAF50, #66BB6A);
-        color: white;
-        padding: 8px 16px;
-        border-radius: 20px;
-        font-weight: 700;
-        display: inline-block;
-        margin: 5px;
-        box-shadow: 0 3px 10px rgba(76, 175, 80, 0.3);
-    }
-    
-    .destination-distance {
-        background: linear-gradient(45deg, #2196F3, #42A5F5);
-        color: white;
-        padding: 8px 16px;
-        border-radius: 20px;
-        font-weight: 700;
-        display: inline-block;
-        margin: 5px;
-        box-shadow: 0 3px 10px rgba(33, 150, 243, 0.3);
-    }
-    
-    .nearby-spots {
-        margin-top: 15px;
-        padding-top: 15px;
-        border-top: 1px dashed rgba(76, 175, 80, 0.3);
-    }
-    
-    .nearby-spots h4 {
-        color: #2E7D32;
-        margin-bottom: 12px;
-        font-size: 1.1em;
-    }
-    
-    .nearby-spots-list {
-        display: flex;
-        flex-direction: column;
-        gap: 8px;
-    }
-    
-    .nearby-spot-item {
-        background: rgba(76, 175, 80, 0.1);
-        padding: 8px 12px;
-        border-radius: 8px;
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }
-    
-    .nearby-spot-name {
-        font-weight: 600;
-        color: #2E7D32;
-    }
-    
-    .nearby-spot-category {
-        color: #666;
-        font-size: 0.9em;
-    }
-    
-    .nearby-spot-distance {
-        background: #4CAF50;
-        color: white;
-        padding: 4px 8px;
-        border-radius: 12px;
-        font-size: 0.8em;
-        font-weight: 600;
-    }
-    
-    .address {
-        font-size: 1.1em;
-        color: #2E7D32;
-        font-weight: 600;
-        margin-bottom: 10px;
-    }
-    
-    .place-description {
-        color: #666;
-        line-height: 1.6;
-        margin: 15px 0;
-    }
-    
-    div.chart-container-anchor + div [data-testid="stPlotlyChart"] {
-    background: rgba(255,255,255,0.04);
-    border: 1px solid rgba(255,255,255,0.12);
-    border-radius: 12px;
-    padding: 12px;
-    box-shadow: 0 2px 10px rgba(0,0,0,0.08);
-    }
-</style>
-""", unsafe_allow_html=True)
+apply_global_styles('recommendations')
+render_locale_selector()
+
+# 카드 본문은 캐시되므로 카드별 변환 오류는 화면 대신 서버 로그에 남김
+logger = logging.getLogger(__name__)
 
 def get_address_from_coordinates(lat, lon):
     """위도/경도로 주소 정보 가져오기"""
     try:
+        # KD-트리 로딩 비용이 커서 실제 변환이 필요할 때만 임포트
+        import reverse_geocoder as rg
         result = rg.search((lat, lon))
         if result and len(result) > 0:
             location = result[0]
-            # 디버깅을 위한 전체 location 정보 출력
-            print("Location data:", location)
-            
+
             admin1 = location.get('admin1', '')  # 시/도
             admin2 = location.get('name', '')    # 시군구 (admin2 대신 name 사용)
             
@@ -465,7 +119,7 @@ def get_address_from_coordinates(lat, lon):
             
         return "주소 정보 없음"
     except Exception as e:
-        print(f"주소 변환 중 오류 발생: {str(e)}")
+        logger.warning("주소 변환 중 오류 발생: %s", e)
         return "주소 정보 없음"
     
 
@@ -552,8 +206,9 @@ def render_factor_analysis():
         comparison_chart = create_cluster_comparison_chart(user_cluster, factor_scores)
         st.plotly_chart(comparison_chart, use_container_width=True, config={'displayModeBar': False})
 
+@fragment
 def render_wellness_recommendations():
-    """웰니스 관광지 추천 결과 표시"""
+    """웰니스 관광지 추천 결과 표시 (필터를 바꾸면 이 영역만 다시 실행)"""
     if 'cluster_result' not in st.session_state:
         st.error("⚠️ 클러스터 분석 결과를 찾을 수 없습니다.")
         return
@@ -585,15 +240,34 @@ def render_wellness_recommendations():
             default=None
         )
     
+    category_filter = render_category_facets(theme_filter, region_filter)
+
+    toggle_col1, toggle_col2 = st.columns(2)
+    with toggle_col1:
+        personalized = st.toggle(
+            "내 성향 점수로 맞춤 정렬",
+            value=False,
+            help="소속 클러스터 하나의 점수 대신 세 클러스터 점수를 내 설문 결과 비율로 섞어 정렬합니다."
+        )
+    with toggle_col2:
+        diversified = st.toggle(
+            "지역·테마 다양하게 보기",
+            value=False,
+            help="비슷한 지역이나 테마의 관광지가 몰리지 않도록 추천 순서를 조정합니다."
+        )
+
     # 필터 적용
     filtered_places = apply_wellness_filters(
         cluster_result,
         theme_filter,
-        region_filter
+        region_filter,
+        category_filter,
+        scoring='personalized' if personalized else 'cluster',
+        diversity=DEFAULT_DIVERSITY_LAMBDA if diversified else None
     )
     
-    # 세션 상태에 저장 (지도 뷰에서 사용)
-    st.session_state['recommended_places'] = filtered_places
+    # 세션 상태에 저장 (지도 뷰에서 사용, content_id/점수만 보관)
+    store_recommended_places(filtered_places)
 
     # 추천 결과 표시
     render_top_recommendations(filtered_places)
@@ -602,81 +276,93 @@ def render_wellness_recommendations():
     render_download_section(filtered_places, cluster_result)
 
 
-def render_top_recommendations(recommended_places):
-    """상위 추천 관광지 표시"""
-    
+def render_category_facets(theme_filter, region_filter):
+    """주변 시설 카테고리 패싯 필터 (대분류별 최소 시설 수 조건 반환)"""
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        min_count = st.number_input(
+            "최소 주변 시설 수",
+            min_value=1,
+            max_value=500,
+            value=10,
+            step=5
+        )
+
+    # 현재 테마/지역 필터 안에서 조건을 만족하는 관광지 수를 옵션 옆에 표시
+    facets = get_category_facets(theme_filter, region_filter, min_count)
+    if facets.empty:
+        return None
+    labels = {
+        row['code']: f"{row['name']} ({row['destinations']}곳)"
+        for row in facets.to_dict('records')
+    }
+
+    with col1:
+        selected = st.multiselect(
+            "주변 시설 필터",
+            options=list(labels),
+            format_func=labels.get,
+            default=None,
+            help="선택한 시설이 주변에 최소 개수 이상 있는 관광지만 추천합니다."
+        )
+
+    return {code: int(min_count) for code in selected} or None
+
+def _dataset_version(df):
+    """조각 캐시 키에 쓰는 데이터셋 버전"""
+    return df.attrs.get('dataset_version') if isinstance(df, pd.DataFrame) else None
+
+def build_card_body(place, nearby_spots_df):
+    """관광지 카드 본문 (주소 변환과 주변 관광지 조회 포함, content_id별로 캐시됨)"""
+    # 위치 정보 처리
     try:
-        # 주변 관광지 데이터 로드
-        nearby_spots_df = pd.read_csv('GIS/wellness_nearby_spots_list.csv')
-    except Exception as e:
-        st.error(f"주변 관광지 데이터 로드 실패: {str(e)}")
-        nearby_spots_df = pd.DataFrame()
-    
-    # 2개의 컬럼으로 나누기
-    left_col, right_col = st.columns(2)
-    
+        lat = place['latitude']
+        lon = place['longitude']
+        if lat != 0 and lon != 0:
+            address = get_address_from_coordinates(lat, lon)
+        else:
+            address = '위치 정보 없음'
+    except Exception:
+        address = '위치 정보 없음'
+
+    # 주변 관광지 상위 3곳
+    nearby_spots = []
+    if not nearby_spots_df.empty:
+        try:
+            nearby_spots = wellness_nearby_attractions(nearby_spots_df, place.get('content_id', 0), 3)
+        except Exception as e:
+            logger.warning("주변 관광지 정보 처리 중 오류: %s", e)
+
+    return render_card_body(place, address, nearby_spots)
+
+def render_top_recommendations(recommended_places):
+    """상위 추천 관광지 표시 (2열 카드 그리드를 열마다 하나의 마크다운 블록으로 렌더링)"""
+    nearby_spots_df = load_wellness_nearby_spots()
+    version = (_dataset_version(load_wellness_destinations()), _dataset_version(nearby_spots_df))
+    fragments = get_fragment_cache()
+    cluster_result = st.session_state.get('cluster_result')
+    # 선택한 언어의 제목/설명/카테고리로 바꿔 그리고, 카드 본문 캐시도 언어별로 구분
+    locale = get_locale()
+    recommended_places = localize_places(recommended_places, locale)
+
+    # 짝수/홀수 순위에 따라 왼쪽/오른쪽 열에 카드 배치
+    column_cards = ([], [])
     for idx, place in enumerate(recommended_places, 1):
-        # 현재 표시할 컬럼 선택 (짝수/홀수 인덱스에 따라)
-        current_col = left_col if idx % 2 == 1 else right_col
-        
-        with current_col:
-            # 위치 정보 처리
-            try:
-                lat = float(place.get('latitude', place.get('mapY', 0)))
-                lon = float(place.get('longitude', place.get('mapX', 0)))
-                if lat != 0 and lon != 0:
-                    address = get_address_from_coordinates(lat, lon)
-                else:
-                    address = '위치 정보 없음'
-            except:
-                address = '위치 정보 없음'
-            
-            # 주변 관광지 처리
-            nearby_spots_content = ""
-            if not nearby_spots_df.empty:
-                try:
-                    content_id = place.get('content_id', 0)
-                    nearby_places = nearby_spots_df[nearby_spots_df['wellness_contentId'] == content_id]
-                    
-                    if not nearby_places.empty:
-                        nearby_places_list = []
-                        for _, spot in nearby_places.head(3).iterrows():
-                            spot_name = spot['nearby_title']
-                            spot_category = spot['nearby_category1']
-                            nearby_places_list.append(
-                                f'<div class="nearby-spot-item">'
-                                f'<span class="nearby-spot-name">{spot_name}</span>'
-                                f'<span class="nearby-spot-category">{spot_category}</span>'
-                                f'</div>'
-                            )
-                        
-                        if nearby_places_list:
-                            nearby_spots_content = (
-                                '<div class="nearby-spots">'
-                                '<h4>🏷️ 주변 관광지</h4>'
-                                '<div class="nearby-spots-list">'
-                                f"{''.join(nearby_places_list)}"
-                                '</div>'
-                                '</div>'
-                            )
-                except Exception as e:
-                    st.write(f"주변 관광지 정보 처리 중 오류: {str(e)}")
-            
-            # 관광지 카드 표시
-            card_html = f"""
-            <div class="recommendation-card">
-                <div class="ranking-badge">#{idx}</div>
-                <h3>{place.get('title', '제목 없음')}</h3>
-                <p class="place-description">{place.get('description', '설명 정보가 없습니다.')}</p>
-                <div class="destination-detail">
-                    <p class="address">📍 {address}</p>
-                    {nearby_spots_content}
-                </div>
-            </div>
-            """
-            
-            st.markdown(card_html, unsafe_allow_html=True)
+        content_id = place.get('content_id')
+        if content_id:
+            body = fragments.get(f'card:{locale}', content_id, version,
+                                 lambda: build_card_body(place, nearby_spots_df))
+        else:
+            body = build_card_body(place, nearby_spots_df)
 
+        similar = ''
+        if content_id and cluster_result is not None:
+            similar = render_similar_list(localize_places(get_similar_places(content_id, cluster_result), locale))
+        column_cards[(idx - 1) % 2].append(render_card(idx, body, similar))
+
+    for column, cards in zip(st.columns(2), column_cards):
+        with column:
+            st.markdown(''.join(cards), unsafe_allow_html=True)
 
 def render_download_section(recommended_places, cluster_result):
     """다운로드 섹션"""
@@ -692,38 +378,44 @@ def render_download_section(recommended_places, cluster_result):
     </div>
     """, unsafe_allow_html=True)
     
-    download_col1, download_col2, download_col3 = st.columns([1, 1, 1])
-    
-    with download_col2:
-        if st.button("📄 상세 추천 리스트 다운로드", key="download_recommendations", use_container_width=True):
-            try:
-                # 사용자 정보 및 클러스터 정보 준비
-                cluster_info = get_cluster_info()
-                user_info = {
-                    'username': st.session_state.get('username', '익명'),
-                    'cluster_name': cluster_info[cluster_result['cluster']]['name'],
-                    'cluster_id': cluster_result['cluster'],
-                    'confidence': cluster_result['confidence'],
-                    'analysis_date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                
-                # CSV 데이터 생성
-                csv_data = export_recommendations_to_csv(recommended_places, user_info)
-                
-                if csv_data:
-                    st.download_button(
-                        label="💾 CSV 파일 저장",
-                        data=csv_data,
-                        file_name=f"wellness_recommendations_{st.session_state.get('username', 'user')}_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                        key="download_csv_file"
-                    )
-                    st.success("✅ 다운로드가 준비되었습니다!")
-                else:
-                    st.error("❌ 파일 생성 중 오류가 발생했습니다.")
-                    
-            except Exception as e:
-                st.error(f"❌ 다운로드 준비 중 오류: {str(e)}")
+    try:
+        # 사용자 정보 및 클러스터 정보 준비
+        cluster_info = get_cluster_info()
+        user_info = {
+            'username': st.session_state.get('username', '익명'),
+            'cluster_name': cluster_info[cluster_result['cluster']]['name'],
+            'cluster_id': cluster_result['cluster'],
+            'confidence': cluster_result['confidence'],
+            'analysis_date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        file_suffix = f"{st.session_state.get('username', 'user')}_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}"
+
+        download_col1, download_col2 = st.columns(2)
+
+        # 파일은 버튼을 눌렀을 때만 별도 스레드에서 생성 (페이지 재실행마다 만들지 않음)
+        with download_col1:
+            st.download_button(
+                label="📄 상세 추천 리스트 다운로드",
+                data=lambda: export_recommendations_to_csv(recommended_places, user_info) or b'',
+                file_name=f"wellness_recommendations_{file_suffix}.csv",
+                mime="text/csv",
+                key="download_csv_file",
+                use_container_width=True
+            )
+
+        with download_col2:
+            # 내 클러스터 기준 전체 관광지 순위
+            st.download_button(
+                label="🗂️ 전체 관광지 순위 다운로드",
+                data=lambda: export_cluster_destinations_to_csv(cluster_result, user_info),
+                file_name=f"wellness_all_destinations_{file_suffix}.csv",
+                mime="text/csv",
+                key="download_all_csv_file",
+                use_container_width=True
+            )
+
+    except Exception as e:
+        st.error(f"❌ 다운로드 준비 중 오류: {str(e)}")
 
 def render_survey_summary():
     """설문 응답 요약"""
@@ -806,9 +498,7 @@ def recommendations_page():
     with action_col3:
         if st.button("📝 설문 다시하기", key="btn_survey", use_container_width=True):
             # 세션 상태 클리어
-            for key in ['survey_completed', 'answers', 'factor_scores', 'cluster_result']:
-                if key in st.session_state:
-                    del st.session_state[key]
+            reset_survey_state()
             st.switch_page("pages/01_questionnaire.py")
 
 # 메인 실행
@@ -1,8 +1,6 @@
 # pages/05_map_view.py - 실제 CSV 데이터 기반 지도 뷰
 
 import streamlit as st
-import folium
-from streamlit_folium import st_folium
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
@@ -20,7 +18,12 @@ if parent_dir not in sys.path:
 try:
     from utils import (check_access_permissions, determine_cluster, get_cluster_info, 
                       load_wellness_destinations, calculate_recommendations_by_cluster,
-                      get_cluster_region_info, apply_global_styles, export_recommendations_to_csv)
+                      get_cluster_region_info, apply_global_styles, export_recommendations_to_csv,
+                      plan_itinerary, load_wellness_nearby_spots, fragment, patched_figure,
+                      get_recommended_places, reset_survey_state, restore_session,
+                      render_locale_selector, localize_places, get_locale)
+    from wellness.templates import (get_fragment_cache, render_map_popup, render_map_popup_body,
+                                    render_nearby_marker_popup)
 except ImportError as e:
     st.error(f"❌ 필수 모듈을 불러올 수 없습니다: {e}")
     st.info("💡 `utils.py` 파일이 올바른 위치에 있는지 확인해주세요.")
@@ -32,6 +35,9 @@ if 'map_page_instance_id' not in st.session_state:
 
 PAGE_ID = st.session_state.map_page_instance_id
 
+# 다른 복제본/재시작 후 접속이면 저장된 진행 상황 복원
+restore_session()
+
 # 로그인 체크
 if 'logged_in' not in st.session_state or not st.session_state.logged_in:
     st.switch_page("app.py")
@@ -52,209 +58,21 @@ st.set_page_config(
 
 # 접근 권한 확인
 check_access_permissions()
-apply_global_styles()
+apply_global_styles('map_view')
+render_locale_selector()
 
-# 지도 페이지 전용 CSS
-st.markdown("""
-<style>
-    /* 지도 컨테이너 스타일 */
-    .map-container {
-        background: var(--card-bg);
-        backdrop-filter: blur(25px);
-        border: 3px solid rgba(76, 175, 80, 0.4);
-        border-radius: 25px;
-        padding: 20px;
-        margin: 25px 0;
-        box-shadow: var(--shadow);
-        transition: all 0.3s ease;
-    }
-    
-    .map-container:hover {
-        border-color: var(--primary);
-        box-shadow: var(--shadow-hover);
-    }
-    
-    /* 페이지 제목 */
-    .page-title {
-        color: var(--primary-dark) !important;
-        text-align: center;
-        background: var(--card-bg);
-        padding: 30px 40px;
-        border-radius: 25px;
-        font-size: 3.2em !important;
-        margin-bottom: 40px;
-        font-weight: 800 !important;
-        border: 3px solid var(--primary);
-        box-shadow: var(--shadow);
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        letter-spacing: 1px;
-    }
-    
-    /* 필터 카드 */
-    .filter-card {
-        background: var(--card-bg);
-        backdrop-filter: blur(20px);
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 20px;
-        padding: 25px 30px;
-        margin: 25px 0;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .filter-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 4px;
-        background: linear-gradient(45deg, var(--primary), var(--secondary));
-        border-radius: 20px 20px 0 0;
-    }
-    
-    .filter-card:hover {
-        border-color: var(--primary);
-        box-shadow: var(--shadow-hover);
-    }
-    
-    /* 통계 카드 */
-    .stats-card {
-        background: var(--card-bg);
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 20px;
-        padding: 25px 20px;
-        text-align: center;
-        margin: 15px 0;
-        transition: all 0.3s ease;
-        height: 140px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-    
-    .stats-card:hover {
-        border-color: var(--primary);
-        box-shadow: var(--shadow-hover);
-        transform: translateY(-3px);
-    }
-    
-    .stats-number {
-        font-size: 2.8em;
-        font-weight: 800;
-        color: var(--primary-dark);
-        margin-bottom: 8px;
-        text-shadow: 1px 1px 2px rgba(0,0,0,0.1);
-    }
-    
-    .stats-label {
-        color: var(--primary-dark);
-        font-size: 1.2em;
-        font-weight: 600;
-        letter-spacing: 0.5px;
-    }
-    
-    /* 섹션 제목 */
-    .section-title {
-        color: var(--primary-dark) !important;
-        font-size: 2.2em;
-        font-weight: 700;
-        margin: 40px 0 25px 0;
-        text-align: center;
-        background: var(--card-bg);
-        padding: 20px 30px;
-        border-radius: 20px;
-        border-left: 6px solid var(--primary);
-        box-shadow: var(--shadow);
-        text-shadow: 1px 1px 2px rgba(0,0,0,0.1);
-    }
-    
-    /* 클러스터 분석 카드 */
-    .cluster-analysis-card {
-        background: var(--card-bg);
-        backdrop-filter: blur(25px);
-        border: 3px solid rgba(76, 175, 80, 0.4);
-        border-radius: 25px;
-        padding: 35px;
-        margin: 25px 0;
-        text-align: center;
-        box-shadow: var(--shadow);
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .cluster-analysis-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 6px;
-        background: linear-gradient(45deg, var(--primary), var(--secondary));
-        border-radius: 25px 25px 0 0;
-    }
-    
-    .cluster-analysis-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 20px 50px rgba(76, 175, 80, 0.25);
-        border-color: var(--primary);
-    }
-    
-    /* 범례 카드 */
-    .legend-card {
-        background: var(--card-bg);
-        border: 2px solid rgba(76, 175, 80, 0.3);
-        border-radius: 15px;
-        padding: 20px;
-        margin: 15px 0;
-    }
-    
-    .legend-item {
-        display: flex;
-        align-items: center;
-        margin: 10px 0;
-        padding: 8px 12px;
-        background: rgba(76, 175, 80, 0.05);
-        border-radius: 10px;
-        transition: all 0.3s ease;
-    }
-    
-    .legend-item:hover {
-        background: rgba(76, 175, 80, 0.15);
-        transform: translateX(5px);
-    }
-    
-    .legend-color {
-        width: 20px;
-        height: 20px;
-        border-radius: 50%;
-        margin-right: 15px;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.2);
-    }
-    
-    /* 다운로드 버튼 */
-    .download-section {
-        background: linear-gradient(135deg, rgba(76, 175, 80, 0.1), var(--card-bg));
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 20px;
-        padding: 25px;
-        margin: 30px 0;
-        text-align: center;
-    }
-</style>
-""", unsafe_allow_html=True)
 
-def create_folium_map(places_to_show, center_lat=37.5, center_lon=127.0, zoom=7):
-    """Folium 기반 상세 지도 생성"""
+# 여행 일정 경로 색상 (날짜 순서대로 반복)
+ITINERARY_COLORS = ['#E53935', '#1E88E5', '#43A047', '#FB8C00', '#8E24AA', '#00ACC1', '#6D4C41']
+
+def create_folium_map(places_to_show, center_lat=37.5, center_lon=127.0, zoom=7, itinerary=None):
+    """Folium 기반 상세 지도 생성 (itinerary가 있으면 날짜별 경로를 선으로 표시)"""
+    import folium  # Folium 지도를 선택했을 때만 로딩
     
     # 주변 관광지 데이터 로드
-    try:
-        nearby_spots_df = pd.read_csv('GIS/wellness_nearby_spots_list.csv')
-    except Exception as e:
-        st.error(f"주변 관광지 데이터 로드 실패: {str(e)}")
-        nearby_spots_df = pd.DataFrame()
+    nearby_spots_df = load_wellness_nearby_spots()
+    fragments = get_fragment_cache()
+    version = tuple(df.attrs.get('dataset_version') for df in (load_wellness_destinations(), nearby_spots_df))
     
     # 지도 생성
     m = folium.Map(
@@ -284,33 +102,16 @@ def create_folium_map(places_to_show, center_lat=37.5, center_lon=127.0, zoom=7)
             except Exception as e:
                 print(f"주변 관광지 검색 중 오류: {str(e)}")
         
-        # 주변 관광지 정보 HTML 생성
-        nearby_html = ""
-        if not nearby_places.empty:
-            nearby_html = "<div style='margin-top: 10px; padding-top: 10px; border-top: 1px solid #4CAF50;'>"
-            nearby_html += "<strong style='color: #2E7D32;'>🏷️ 주변 관광지</strong><br>"
-            for _, spot in nearby_places.iterrows():
-                nearby_html += f"""
-                <div style='margin: 5px 0; padding: 5px; background-color: #F1F8E9; border-radius: 4px;'>
-                    <span style='font-weight: 600;'>{spot['nearby_title']}</span><br>
-                    <small style='color: #689F38;'>{spot['nearby_category1']}</small>
-                </div>
-                """
-            nearby_html += "</div>"
-        
-        # 메인 관광지 팝업 HTML 생성
-        popup_html = f"""
-        <div style="width: 350px; font-family: 'Noto Sans KR', sans-serif;">
-            <h4 style="color: #2E7D32; margin-bottom: 10px; border-bottom: 2px solid #4CAF50; padding-bottom: 5px;">
-                #{i+1} {place['title']}
-            </h4>
-            <div style="margin: 15px 0; padding: 10px; background-color: #f5f5f5; border-radius: 8px;">
-                <strong>📝 설명:</strong><br>
-                <span style="line-height: 1.4;">{place.get('description', '설명 정보가 없습니다.')[:150]}{'...' if len(place.get('description', '')) > 150 else ''}</span>
-            </div>
-            {nearby_html}
-        </div>
-        """
+        # 팝업 본문(설명 + 주변 관광지)은 관광지별로 캐시
+        content_id = place.get('content_id')
+        nearby_spots = [{'name': spot['nearby_title'], 'category1': spot['nearby_category1']}
+                        for _, spot in nearby_places.iterrows()]
+        if content_id:
+            popup_body = fragments.get(f'map_popup:{get_locale()}', content_id, version,
+                                       lambda: render_map_popup_body(place, nearby_spots))
+        else:
+            popup_body = render_map_popup_body(place, nearby_spots)
+        popup_html = render_map_popup(i + 1, place, popup_body)
         
         # 메인 관광지 마커 생성
         folium.Marker(
@@ -325,17 +126,8 @@ def create_folium_map(places_to_show, center_lat=37.5, center_lon=127.0, zoom=7)
             for _, spot in nearby_places.iterrows():
                 # 위도, 경도 데이터가 있는지 확인
                 if all(col in nearby_spots_df.columns for col in ['mapX', 'mapY']):
-                    spot_popup = f"""
-                    <div style="width: 250px;">
-                        <h5 style="color: #689F38; margin-bottom: 8px;">
-                            {spot['nearby_title']}
-                        </h5>
-                        <p style="color: #666;">
-                            <strong>유형:</strong> {spot['nearby_category1']}<br>
-                            <strong>주변 관광지:</strong> {place['title']}
-                        </p>
-                    </div>
-                    """
+                    spot_popup = render_nearby_marker_popup(spot['nearby_title'], spot['nearby_category1'],
+                                                            place['title'])
                     
                     folium.Marker(
                         [float(spot['mapY']), float(spot['mapX'])],
@@ -344,6 +136,18 @@ def create_folium_map(places_to_show, center_lat=37.5, center_lon=127.0, zoom=7)
                         icon=folium.Icon(color='lightblue', icon='info', prefix='fa')
                     ).add_to(m)
     
+    # 날짜별 여행 경로
+    if itinerary:
+        for day in itinerary['days']:
+            color = ITINERARY_COLORS[(day['day'] - 1) % len(ITINERARY_COLORS)]
+            folium.PolyLine(
+                day['path'],
+                color=color,
+                weight=4,
+                opacity=0.8,
+                tooltip=f"Day {day['day']} · 이동 {day['travel_minutes']:.0f}분"
+            ).add_to(m)
+    
     return m
 
 def create_plotly_map(places_to_show):
@@ -368,8 +172,13 @@ def create_plotly_map(places_to_show):
         '기타': '#78909C'
     }
     
-    # 색상 리스트 생성
-    df_map['color'] = df_map['type'].map(type_colors).fillna('#78909C')
+    # 점수에 따른 마커 크기 (최고 점수 기준 8~25)
+    max_score = df_map['score'].max()
+    marker_sizes = 8 + 17 * (df_map['score'] / max_score if max_score > 0 else 0)
+    
+    # plotly 5.24+는 Scattermap(MapLibre), 이전 버전은 Scattermapbox 사용
+    scatter_map = getattr(go, 'Scattermap', None) or go.Scattermapbox
+    map_layout_key = 'map' if scatter_map is not getattr(go, 'Scattermapbox', None) else 'mapbox'
     
     fig = go.Figure()
     
@@ -377,28 +186,28 @@ def create_plotly_map(places_to_show):
     for type_name in df_map['type'].unique():
         type_data = df_map[df_map['type'] == type_name]
         
-        fig.add_trace(go.Scattermapbox(
-            lat=type_data['lat'],
-            lon=type_data['lon'],
+        fig.add_trace(scatter_map(
+            lat=type_data['latitude'],
+            lon=type_data['longitude'],
             mode='markers',
             marker=dict(
-                size=type_data['recommendation_score'] / 5,  # 점수에 따른 크기
+                size=marker_sizes[type_data.index],  # 점수에 따른 크기
                 color=type_colors.get(type_name, '#78909C'),
                 opacity=0.8
             ),
-            text=type_data['name'],
+            text=type_data['title'],
             hovertemplate='<b>%{text}</b><br>' +
                          'Type: ' + type_name + '<br>' +
                          'Rating: %{customdata[0]}/10<br>' +
                          'Distance: %{customdata[1]}km<br>' +
                          'Score: %{customdata[2]:.1f}<br>' +
                          '<extra></extra>',
-            customdata=type_data[['rating', 'distance_from_incheon', 'recommendation_score']].values,
+            customdata=type_data[['rating', 'distance_from_incheon', 'score']].values,
             name=type_name
         ))
     
     # 인천공항 마커 추가
-    fig.add_trace(go.Scattermapbox(
+    fig.add_trace(scatter_map(
         lat=[37.4602],
         lon=[126.4407],
         mode='markers',
@@ -409,11 +218,11 @@ def create_plotly_map(places_to_show):
     ))
     
     fig.update_layout(
-        mapbox=dict(
+        **{map_layout_key: dict(
             style='open-street-map',
             center=dict(lat=37.5, lon=127.8),
             zoom=6
-        ),
+        )},
         height=700,
         margin=dict(l=0, r=0, t=30, b=0),
         title="웰니스 관광지 분포 (추천점수별 크기)",
@@ -422,37 +231,6 @@ def create_plotly_map(places_to_show):
     
     return fig
 
-def render_map_settings(wellness_df):
-    """지도 설정 렌더링 - type 컬럼이 없어도 동작하도록 처리"""
-    df = wellness_df.copy()
-
-    has_type = 'type' in df.columns
-    if not has_type:
-        # type이 없으면 전체 하나만 제공 (UI 최소화)
-        df['type'] = '전체'
-
-    # 기존 UI 코드와 최대한 동일하게 유지 (다만 type 없는 경우엔 선택 숨김/자동 고정)
-    available_types = df['type'].fillna('기타').unique()
-
-    # 예시: 기존에 이렇게 했다고 가정
-    # num_places = st.slider("표시할 장소 수", 5, 50, 20, step=5)
-    # show_categories = st.toggle("카테고리별 보기", value=True)
-
-    # type 선택 UI: type이 없으면 보이지 않게
-    if has_type:
-        map_type = st.selectbox("카테고리", options=list(available_types))
-        show_categories = True
-    else:
-        map_type = '전체'
-        show_categories = False
-
-    # 지도 중심 등 기존 반환값 구성 유지
-    # (필요한 값 반환!!)
-    map_center = df[['lat', 'lon']].mean().to_dict() if set(['lat','lon']).issubset(df.columns) else {'lat': 37.5665, 'lon': 126.9780}
-    num_places = min(len(df), 50)  # 기존 슬라이더가 있다면 그 값을 사용
-
-    return num_places, map_type, map_center, show_categories
-
 def render_user_cluster_analysis():
     """사용자 클러스터 분석 결과 표시"""
     if 'cluster_result' not in st.session_state:
@@ -531,6 +309,20 @@ def render_user_cluster_analysis():
     
     return cluster_result
 
+def _build_region_pie_template():
+    """지역별 분포 차트 템플릿 (지역과 개수는 patched_figure로 채움)"""
+    fig_pie = px.pie(
+        values=[1],
+        names=[""],
+        title="추천 관광지 지역별 분포"
+    )
+    fig_pie.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font_color='#2E7D32'
+    )
+    return fig_pie
+
 def render_statistics_dashboard(places_to_show):
     """통계 대시보드 렌더링"""
     if not places_to_show:
@@ -567,15 +359,9 @@ def render_statistics_dashboard(places_to_show):
         region_counts[region] = region_counts.get(region, 0) + 1
     
     if region_counts:
-        fig_pie = px.pie(
-            values=list(region_counts.values()),
-            names=list(region_counts.keys()),
-            title="추천 관광지 지역별 분포"
-        )
-        fig_pie.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font_color='#2E7D32'
+        fig_pie = patched_figure(
+            'map_view.region_distribution', _build_region_pie_template,
+            traces={0: {'labels': list(region_counts.keys()), 'values': list(region_counts.values())}}
         )
         st.plotly_chart(fig_pie, use_container_width=True, config={'displayModeBar': False})
 
@@ -595,55 +381,67 @@ def render_download_section(places_to_show, cluster_result):
     download_col1, download_col2, download_col3 = st.columns(3)
     
     with download_col2:
-        if st.button("📄 CSV 파일 다운로드", key=f"download_csv_{PAGE_ID}", use_container_width=True):
-            try:
-                # 사용자 정보 준비
-                user_info = {
-                    'username': st.session_state.get('username', '익명'),
-                    'cluster_name': get_cluster_info()[cluster_result['cluster']]['name'],
-                    'confidence': cluster_result['confidence']
-                }
-                
-                # CSV 데이터 생성
-                csv_data = export_recommendations_to_csv(places_to_show, user_info)
-                
-                if csv_data:
-                    st.download_button(
-                        label="💾 파일 저장",
-                        data=csv_data,
-                        file_name=f"wellness_recommendations_{st.session_state.get('username', 'user')}_{time.strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
-                        key=f"download_file_{PAGE_ID}"
-                    )
-                    st.success("✅ CSV 파일이 준비되었습니다!")
-                else:
-                    st.error("❌ 파일 생성 중 오류가 발생했습니다.")
-                    
-            except Exception as e:
-                st.error(f"❌ 다운로드 준비 중 오류: {str(e)}")
+        try:
+            # 사용자 정보 준비
+            user_info = {
+                'username': st.session_state.get('username', '익명'),
+                'cluster_name': get_cluster_info()[cluster_result['cluster']]['name'],
+                'confidence': cluster_result['confidence']
+            }
+            
+            # 파일은 버튼을 눌렀을 때만 별도 스레드에서 생성 (페이지 재실행마다 만들지 않음)
+            st.download_button(
+                label="📄 CSV 파일 다운로드",
+                data=lambda: export_recommendations_to_csv(places_to_show, user_info) or b'',
+                file_name=f"wellness_recommendations_{st.session_state.get('username', 'user')}_{time.strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv",
+                key=f"download_file_{PAGE_ID}",
+                use_container_width=True
+            )
+        except Exception as e:
+            st.error(f"❌ 다운로드 준비 중 오류: {str(e)}")
 
-def _get_recommended_df():
-    """추천 장소 DF를 안전하게 가져옴"""
-    df = st.session_state.get('recommended_places')
-    if df is None or isinstance(df, pd.DataFrame) and df.empty:
-        st.info("추천 장소 데이터가 없습니다. 먼저 '추천' 페이지에서 결과를 생성하세요.")
-        return pd.DataFrame()
-    return df
+def render_itinerary_controls():
+    """여행 일정 경로 표시 설정 (표시하지 않으면 None, 표시하면 (하루 시간, 최대 일수))"""
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        show_route = st.toggle("🧭 날짜별 여행 경로 보기", value=False, key=f"itinerary_toggle_{PAGE_ID}")
+    with col2:
+        day_hours = st.number_input("하루 여행 시간", min_value=2, max_value=16, value=8, step=1,
+                                    key=f"itinerary_hours_{PAGE_ID}", disabled=not show_route)
+    with col3:
+        max_days = st.number_input("최대 일수", min_value=1, max_value=14, value=7, step=1,
+                                   key=f"itinerary_days_{PAGE_ID}", disabled=not show_route)
+    if not show_route:
+        return None
+    return int(day_hours), int(max_days)
 
-def enhanced_map_view_page():
-    """개선된 지도 뷰 페이지 메인 함수"""
-    # 추천 결과 가져오기
-    if 'recommended_places' not in st.session_state:
-        st.warning("⚠️ 먼저 '추천' 페이지에서 결과를 확인해주세요.")
-        if st.button("👉 추천 결과 보기"):
-            st.switch_page("pages/04_recommendations.py")
+def render_itinerary_summary(itinerary):
+    """날짜별 일정 요약 표시"""
+    if not itinerary or not itinerary['days']:
         return
     
-    recommended_places = st.session_state['recommended_places']
-    
-    # 헤더
-    st.markdown('<h1 class="page-title">🗺️ 맞춤형 웰니스 여행지 지도</h1>', unsafe_allow_html=True)
-    
+    st.markdown('<h2 class="section-title">🧭 날짜별 여행 일정</h2>', unsafe_allow_html=True)
+    st.caption(f"인천국제공항 출발 · 총 이동 약 {itinerary['total_travel_minutes'] / 60:.1f}시간 "
+               f"(직선거리 기준 추정) · 계산 {itinerary['elapsed_ms']:.0f}ms")
+    
+    for day in itinerary['days']:
+        hours = day['total_minutes'] / 60
+        warning = " ⚠️ 하루 일정 초과" if day['over_budget'] else ""
+        with st.expander(f"Day {day['day']} · {len(day['stops'])}곳 · 약 {hours:.1f}시간{warning}",
+                         expanded=day['day'] == 1):
+            for stop in day['stops']:
+                st.markdown(f"- **{stop['place']['title']}** "
+                            f"(이동 {stop['travel_minutes']:.0f}분, "
+                            f"도착 +{stop['arrival_minute'] / 60:.1f}시간)")
+    
+    if itinerary['unscheduled']:
+        names = ", ".join(place['title'] for place in itinerary['unscheduled'])
+        st.info(f"📌 일정에 넣지 못한 관광지 {len(itinerary['unscheduled'])}곳: {names}")
+
+@fragment
+def render_map_panel(recommended_places):
+    """지도 유형 선택, 지도, 여행 일정 요약 영역"""
     # 지도 타입 선택
     map_type = st.radio(
         "지도 유형 선택",
@@ -652,13 +450,22 @@ def enhanced_map_view_page():
     )
     
     if map_type == "상세 지도 (Folium)":
+        route_settings = render_itinerary_controls()
+        itinerary = None
+        if route_settings:
+            day_hours, max_days = route_settings
+            itinerary = plan_itinerary(recommended_places, day_hours=day_hours, max_days=max_days)
+        
         # Folium 지도 생성
         try:
+            from streamlit_folium import st_folium
+            
             m = create_folium_map(
                 recommended_places,
                 center_lat=36.5,  # 한국 중심 위도
                 center_lon=127.5,  # 한국 중심 경도
-                zoom=7
+                zoom=7,
+                itinerary=itinerary
             )
             
             # 지도 표시
@@ -685,6 +492,8 @@ def enhanced_map_view_page():
                     
         except Exception as e:
             st.error(f"❌ 지도 생성 중 오류 발생: {str(e)}")
+        
+        render_itinerary_summary(itinerary)
     
     else:
         # Plotly 지도 생성
@@ -696,10 +505,33 @@ def enhanced_map_view_page():
                 st.error("❌ 분석 지도를 생성할 수 없습니다.")
         except Exception as e:
             st.error(f"❌ 분석 지도 생성 중 오류 발생: {str(e)}")
+
+def enhanced_map_view_page():
+    """개선된 지도 뷰 페이지 메인 함수"""
+    # 추천 결과 가져오기
+    if 'recommended_places' not in st.session_state:
+        st.warning("⚠️ 먼저 '추천' 페이지에서 결과를 확인해주세요.")
+        if st.button("👉 추천 결과 보기"):
+            st.switch_page("pages/04_recommendations.py")
+        return
+    
+    # 세션에는 content_id/점수만 있으므로 표시 필드를 공용 데이터에서 복원 (선택한 언어로)
+    recommended_places = localize_places(get_recommended_places())
+    
+    # 헤더
+    st.markdown('<h1 class="page-title">🗺️ 맞춤형 웰니스 여행지 지도</h1>', unsafe_allow_html=True)
+    
+    # 지도 영역 (지도 유형/경로 설정 변경과 지도 클릭은 이 영역만 다시 실행)
+    render_map_panel(recommended_places)
     
     # 통계 대시보드
     render_statistics_dashboard(recommended_places)
     
+    # 결과 다운로드
+    cluster_result = st.session_state.get('cluster_result')
+    if cluster_result:
+        render_download_section(recommended_places, cluster_result)
+    
     # 액션 버튼
     st.markdown("---")
     st.markdown('<h2 class="section-title">🎯 다음 단계</h2>', unsafe_allow_html=True)
@@ -711,9 +543,7 @@ def enhanced_map_view_page():
     with action_col1:
         if st.button("📝 설문 다시하기", key=f"restart_survey_{PAGE_ID}", use_container_width=True):
             # 세션 상태 클리어
-            for key in ['survey_completed', 'answers', 'score_breakdown', 'cluster_result', 'factor_scores']:
-                if key in st.session_state:
-                    del st.session_state[key]
+            reset_survey_state()
             st.switch_page("pages/01_questionnaire.py")
     
     with action_col2:
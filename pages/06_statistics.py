@@ -2,8 +2,6 @@
 
 import streamlit as st
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 import sys
@@ -16,15 +14,22 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 try:
+    from wellness.stats import DISTANCE_BUCKETS, RATING_BUCKET_WIDTH
+    from wellness.region_index import budget_from_answers
     from utils import (check_access_permissions, get_cluster_info, 
                       create_factor_analysis_chart, create_cluster_comparison_chart,
                       load_wellness_destinations, get_cluster_region_info,
-                      apply_global_styles, get_statistics_summary)
+                      apply_global_styles, get_statistics_summary, get_statistics_cube,
+                      get_region_index, fragment, cached_figure, reset_survey_state,
+                      restore_session)
 except ImportError as e:
     st.error(f"❌ 필수 모듈을 불러올 수 없습니다: {e}")
     st.info("💡 `utils.py` 파일이 올바른 위치에 있는지 확인해주세요.")
     st.stop()
 
+# 다른 복제본/재시작 후 접속이면 저장된 진행 상황 복원
+restore_session()
+
 # 로그인 체크
 if 'logged_in' not in st.session_state or not st.session_state.logged_in:
     st.switch_page("app.py")
@@ -38,243 +43,45 @@ st.set_page_config(
 
 # 접근 권한 확인
 check_access_permissions('home')
-apply_global_styles()
-
-# 통계 페이지 전용 CSS
-st.markdown("""
-<style>
-    /* 페이지 제목 */
-    .page-title {
-        color: var(--primary-dark) !important;
-        text-align: center;
-        background: linear-gradient(135deg, var(--card-bg), rgba(232, 245, 232, 0.9));
-        padding: 35px 45px;
-        border-radius: 30px;
-        font-size: 3.6em !important;
-        margin-bottom: 40px;
-        font-weight: 800 !important;
-        border: 3px solid var(--primary);
-        box-shadow: 0 20px 60px rgba(76, 175, 80, 0.2);
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-        letter-spacing: 1px;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .page-title::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 8px;
-        background: linear-gradient(45deg, var(--primary), var(--secondary));
-        border-radius: 30px 30px 0 0;
-    }
-    
-    /* 통계 대시보드 카드 */
-    .stats-dashboard-card {
-        background: var(--card-bg);
-        backdrop-filter: blur(25px);
-        border: 3px solid rgba(76, 175, 80, 0.4);
-        border-radius: 25px;
-        padding: 40px;
-        margin: 30px 0;
-        transition: all 0.4s ease;
-        box-shadow: 0 15px 40px rgba(76, 175, 80, 0.15);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stats-dashboard-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 6px;
-        background: linear-gradient(45deg, var(--primary), var(--secondary));
-        border-radius: 25px 25px 0 0;
-    }
-    
-    .stats-dashboard-card:hover {
-        transform: translateY(-5px);
-        border-color: var(--primary);
-        box-shadow: 0 20px 50px rgba(76, 175, 80, 0.25);
-    }
-    
-    /* 섹션 제목 */
-    .section-title {
-        color: var(--primary-dark) !important;
-        font-size: 2.6em;
-        font-weight: 700;
-        margin: 50px 0 30px 0;
-        text-align: center;
-        background: var(--card-bg);
-        padding: 25px 35px;
-        border-radius: 25px;
-        border-left: 8px solid var(--primary);
-        box-shadow: 0 12px 35px rgba(76, 175, 80, 0.15);
-        text-shadow: 1px 1px 2px rgba(0,0,0,0.1);
-    }
-    
-    /* 메트릭 카드 */
-    .metric-card {
-        background: var(--card-bg);
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 25px;
-        padding: 35px 25px;
-        text-align: center;
-        margin: 25px 0;
-        transition: all 0.3s ease;
-        height: 180px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-    
-    .metric-card:hover {
-        border-color: var(--primary);
-        box-shadow: 0 15px 40px rgba(76, 175, 80, 0.25);
-        transform: translateY(-5px);
-        background: rgba(255, 255, 255, 1);
-    }
-    
-    .metric-number {
-        font-size: 3.6em;
-        font-weight: 800;
-        color: var(--primary-dark);
-        margin-bottom: 12px;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
-    }
-    
-    .metric-label {
-        color: var(--primary-dark);
-        font-size: 1.4em;
-        font-weight: 600;
-        letter-spacing: 0.5px;
-    }
-    
-    /* 차트 컨테이너 */
-    .chart-container {
-        background: var(--card-bg);
-        backdrop-filter: blur(20px);
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 25px;
-        padding: 35px;
-        margin: 30px 0;
-        transition: all 0.3s ease;
-    }
-    
-    .chart-container:hover {
-        border-color: var(--primary);
-        box-shadow: 0 15px 40px rgba(76, 175, 80, 0.2);
-    }
-    
-    /* 분석 카드 */
-    .analysis-card {
-        background: var(--card-bg);
-        backdrop-filter: blur(20px);
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 20px;
-        padding: 30px;
-        margin: 25px 0;
-        transition: all 0.3s ease;
-    }
-    
-    .analysis-card:hover {
-        border-color: var(--primary);
-        box-shadow: 0 8px 25px rgba(76, 175, 80, 0.2);
-        transform: translateY(-3px);
-    }
-    
-    /* 클러스터 비교 카드 */
-    .cluster-comparison-card {
-        background: var(--card-bg);
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 20px;
-        padding: 25px;
-        margin: 20px 0;
-        transition: all 0.3s ease;
-        text-align: center;
-        height: 200px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-    }
-    
-    .cluster-comparison-card:hover {
-        border-color: var(--primary);
-        box-shadow: 0 8px 25px rgba(76, 175, 80, 0.2);
-        transform: translateY(-3px);
-    }
-    
-    /* 인사이트 카드 */
-    .insight-card {
-        background: linear-gradient(135deg, var(--card-bg), rgba(232, 245, 232, 0.9));
-        border: 2px solid rgba(76, 175, 80, 0.4);
-        border-radius: 20px;
-        padding: 30px;
-        margin: 25px 0;
-        border-left: 6px solid var(--primary);
-    }
-    
-    .insight-card h4 {
-        color: var(--primary-dark);
-        margin-bottom: 15px;
-    }
-    
-    /* 데이터 테이블 스타일 */
-    .dataframe {
-        border-radius: 15px;
-        overflow: hidden;
-        box-shadow: 0 4px 15px rgba(76, 175, 80, 0.1);
-    }
-    
-    .dataframe th {
-        background-color: var(--primary) !important;
-        color: white !important;
-        font-weight: 700 !important;
-    }
-    
-    .dataframe td {
-        background-color: var(--card-bg) !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+apply_global_styles('statistics')
+
 
-@st.cache_data(ttl=3600)
 def load_and_analyze_data():
-    """실제 CSV 데이터 로드 및 기본 통계 분석"""
-    wellness_df = load_wellness_destinations()
+    """사전 집계 큐브 로드 및 기본 통계 (큐브는 데이터 파일이 바뀔 때만 다시 집계됨)"""
+    cube = get_statistics_cube()
     
-    if wellness_df.empty:
+    if cube is None:
         return None, None
     
-    # 기본 통계 계산
+    # 기본 통계 계산 (전체 합계 롤업)
+    totals = cube.totals()
     stats = {
-        'total_destinations': len(wellness_df),
-        'total_types': wellness_df['type'].nunique(),
-        'total_clusters': wellness_df['cluster'].nunique(),
-        'avg_rating': wellness_df['rating'].mean(),
-        'avg_distance': wellness_df['distance_from_incheon'].mean(),
-        'min_rating': wellness_df['rating'].min(),
-        'max_rating': wellness_df['rating'].max(),
-        'min_distance': wellness_df['distance_from_incheon'].min(),
-        'max_distance': wellness_df['distance_from_incheon'].max()
+        'total_destinations': int(totals['count']),
+        'total_types': cube.distinct_count('type'),
+        'total_clusters': cube.distinct_count('cluster'),
+        'avg_rating': totals['rating_mean'],
+        'avg_distance': totals['distance_from_incheon_mean'],
+        'min_rating': totals['rating_min'],
+        'max_rating': totals['rating_max'],
+        'min_distance': totals['distance_from_incheon_min'],
+        'max_distance': totals['distance_from_incheon_max']
     }
     
-    return wellness_df, stats
+    return cube, stats
 
-def create_comprehensive_overview_chart():
-    """포괄적인 시스템 개요 차트"""
-    wellness_df, stats = load_and_analyze_data()
+def cached_statistics_chart(name, build):
+    """사전 집계 큐브로 그리는 공통 차트 (데이터 버전별로 한 번만 build(cube, stats) 실행)"""
+    cube, stats = load_and_analyze_data()
     
-    if wellness_df is None:
+    if cube is None:
         return None
     
+    return cached_figure(f'statistics.{name}', lambda: build(cube, stats), version=cube.version)
+
+def _build_overview_chart(cube, stats):
+    """포괄적인 시스템 개요 차트"""
     # 타입별 분포
-    type_counts = wellness_df['type'].value_counts()
+    type_counts = cube.rollup(('type',))['count'].sort_values(ascending=False)
     
     fig = px.pie(
         values=type_counts.values,
@@ -299,21 +106,23 @@ def create_comprehensive_overview_chart():
     
     return fig
 
-def create_rating_distribution_chart():
+def create_comprehensive_overview_chart():
+    """포괄적인 시스템 개요 차트"""
+    return cached_statistics_chart('overview', _build_overview_chart)
+
+def _build_rating_distribution_chart(cube, stats):
     """평점 분포 분석 차트"""
-    wellness_df, stats = load_and_analyze_data()
-    
-    if wellness_df is None:
-        return None
+    # 평점 구간별 개수
+    rating_counts = cube.rollup(('rating_bucket',))['count']
     
-    fig = px.histogram(
-        wellness_df,
-        x='rating',
-        nbins=20,
+    fig = px.bar(
+        x=rating_counts.index,
+        y=rating_counts.values,
         title="웰니스 관광지 평점 분포",
-        labels={'rating': '평점', 'count': '개수'},
+        labels={'x': '평점', 'y': '개수'},
         color_discrete_sequence=['#4CAF50']
     )
+    fig.update_traces(width=RATING_BUCKET_WIDTH * 0.9, offset=0)
     
     # 평균선 추가
     fig.add_vline(
@@ -333,32 +142,27 @@ def create_rating_distribution_chart():
     
     return fig
 
-def create_distance_analysis_chart():
+def create_rating_distribution_chart():
+    """평점 분포 분석 차트"""
+    return cached_statistics_chart('rating_distribution', _build_rating_distribution_chart)
+
+def _build_distance_analysis_chart(cube, stats):
     """거리별 분석 차트"""
-    wellness_df, stats = load_and_analyze_data()
-    
-    if wellness_df is None:
-        return None
-    
-    # 거리 구간별 분류
-    def distance_category(distance):
-        if distance <= 50:
-            return "수도권 (50km 이내)"
-        elif distance <= 200:
-            return "근거리 (50-200km)"
-        elif distance <= 400:
-            return "중거리 (200-400km)"
-        else:
-            return "원거리 (400km 이상)"
-    
-    wellness_df['distance_category'] = wellness_df['distance_from_incheon'].apply(distance_category)
+    # 거리 구간별 평점 (구간 순서 유지)
+    distance_stats = cube.rollup(('distance_bucket',))
+    distance_stats = distance_stats.reindex(
+        [label for _, label in DISTANCE_BUCKETS if label in distance_stats.index]
+    )
     
-    fig = px.box(
-        wellness_df,
-        x='distance_category',
-        y='rating',
+    fig = px.scatter(
+        x=distance_stats.index,
+        y=distance_stats['rating_mean'],
+        error_y=distance_stats['rating_max'] - distance_stats['rating_mean'],
+        error_y_minus=distance_stats['rating_mean'] - distance_stats['rating_min'],
+        size=distance_stats['count'],
         title="거리별 관광지 평점 분포",
-        labels={'distance_category': '거리 구간', 'rating': '평점'}
+        labels={'x': '거리 구간', 'y': '평점 (평균, 최저~최고)', 'size': '관광지 수'},
+        color_discrete_sequence=['#4CAF50']
     )
     
     fig.update_layout(
@@ -371,17 +175,16 @@ def create_distance_analysis_chart():
     
     return fig
 
-def create_cluster_analysis_chart():
+def create_distance_analysis_chart():
+    """거리별 분석 차트"""
+    return cached_statistics_chart('distance_analysis', _build_distance_analysis_chart)
+
+def _build_cluster_analysis_chart(cube, stats):
     """클러스터별 관광지 분포 분석"""
-    wellness_df, stats = load_and_analyze_data()
-    
-    if wellness_df is None:
-        return None
-    
     cluster_region_info = get_cluster_region_info()
     
     # 클러스터별 개수 계산
-    cluster_counts = wellness_df['cluster'].value_counts().sort_index()
+    cluster_counts = cube.rollup(('cluster',))['count']
     
     # 클러스터 이름 매핑
     cluster_names = []
@@ -412,29 +215,14 @@ def create_cluster_analysis_chart():
     
     return fig
 
-def create_price_analysis_chart():
+def create_cluster_analysis_chart():
+    """클러스터별 관광지 분포 분석"""
+    return cached_statistics_chart('cluster_analysis', _build_cluster_analysis_chart)
+
+def _build_price_analysis_chart(cube, stats):
     """가격대 분석 차트"""
-    wellness_df, stats = load_and_analyze_data()
-    
-    if wellness_df is None:
-        return None
-    
-    # 가격 카테고리 분류
-    def price_category(price_str):
-        if '무료' in str(price_str):
-            return "무료"
-        elif any(x in str(price_str) for x in ['10,000', '20,000', '30,000']):
-            return "저렴 (3만원 이하)"
-        elif any(x in str(price_str) for x in ['50,000', '100,000']):
-            return "중간 (3-10만원)"
-        elif any(x in str(price_str) for x in ['200,000', '300,000', '500,000']):
-            return "고가 (10만원 이상)"
-        else:
-            return "기타"
-    
-    wellness_df['price_category'] = wellness_df['price_range'].apply(price_category)
-    
-    price_counts = wellness_df['price_category'].value_counts()
+    # 가격 구간별 개수
+    price_counts = cube.rollup(('price_bucket',))['count'].sort_values(ascending=False)
     
     fig = px.pie(
         values=price_counts.values,
@@ -453,7 +241,11 @@ def create_price_analysis_chart():
     
     return fig
 
-def create_correlation_heatmap():
+def create_price_analysis_chart():
+    """가격대 분석 차트"""
+    return cached_statistics_chart('price_analysis', _build_price_analysis_chart)
+
+def _build_correlation_heatmap():
     """요인 간 상관관계 히트맵"""
     # 실제 12개 요인 상관관계 시뮬레이션
     factors = [f"요인{i}" for i in range(1, 13)]
@@ -493,6 +285,10 @@ def create_correlation_heatmap():
     
     return fig
 
+def create_correlation_heatmap():
+    """요인 간 상관관계 히트맵 (모든 사용자에게 같으므로 한 번만 생성)"""
+    return cached_figure('statistics.correlation', _build_correlation_heatmap)
+
 def render_user_analysis():
     """사용자 개인 분석 결과"""
     if 'survey_completed' in st.session_state and st.session_state.survey_completed:
@@ -534,7 +330,7 @@ def render_user_analysis():
 
 def render_system_kpis():
     """시스템 핵심 지표"""
-    wellness_df, stats = load_and_analyze_data()
+    cube, stats = load_and_analyze_data()
     
     if stats is None:
         st.error("❌ 데이터를 불러올 수 없습니다.")
@@ -641,19 +437,19 @@ def render_comprehensive_analysis():
 
 def render_detailed_statistics_table():
     """상세 통계 테이블"""
-    wellness_df, stats = load_and_analyze_data()
+    cube, stats = load_and_analyze_data()
     
-    if wellness_df is None:
+    if cube is None:
         return
     
     st.markdown('<h2 class="section-title">📋 상세 통계 데이터</h2>', unsafe_allow_html=True)
     
     # 타입별 상세 통계
     with st.expander("📊 유형별 상세 통계", expanded=False):
-        type_stats = wellness_df.groupby('type').agg({
-            'rating': ['count', 'mean', 'min', 'max', 'std'],
-            'distance_from_incheon': ['mean', 'min', 'max']
-        }).round(2)
+        type_stats = cube.rollup(('type',))[[
+            'count', 'rating_mean', 'rating_min', 'rating_max', 'rating_std',
+            'distance_from_incheon_mean', 'distance_from_incheon_min', 'distance_from_incheon_max'
+        ]].round(2)
         
         type_stats.columns = ['개수', '평균평점', '최저평점', '최고평점', '평점편차', '평균거리', '최단거리', '최장거리']
         st.dataframe(type_stats, use_container_width=True)
@@ -662,10 +458,10 @@ def render_detailed_statistics_table():
     with st.expander("🗺️ 지역별 상세 통계", expanded=False):
         cluster_region_info = get_cluster_region_info()
         
-        cluster_stats = wellness_df.groupby('cluster').agg({
-            'rating': ['count', 'mean', 'std'],
-            'distance_from_incheon': ['mean', 'min', 'max']
-        }).round(2)
+        cluster_stats = cube.rollup(('cluster',))[[
+            'count', 'rating_mean', 'rating_std',
+            'distance_from_incheon_mean', 'distance_from_incheon_min', 'distance_from_incheon_max'
+        ]].round(2)
         
         cluster_stats.columns = ['개수', '평균평점', '평점편차', '평균거리', '최단거리', '최장거리']
         
@@ -677,6 +473,55 @@ def render_detailed_statistics_table():
         # 컬럼 순서 재정렬
         cluster_stats = cluster_stats[['지역명', '개수', '평균평점', '평점편차', '평균거리', '최단거리', '최장거리']]
         st.dataframe(cluster_stats, use_container_width=True)
+    
+    # 예산 조건 검색 (정렬된 가격 인덱스에서 이진 탐색)
+    with st.expander("💰 예산으로 관광지 찾기", expanded=False):
+        region_index = get_region_index()
+        if region_index is None:
+            return
+        
+        render_budget_search(region_index)
+    
+    # 이동 시간 조건 검색 (인천 출발 소요 시간 정렬 인덱스)
+    with st.expander("⏱️ 이동 시간으로 관광지 찾기", expanded=False):
+        render_travel_search(region_index)
+
+@fragment
+def render_budget_search(region_index):
+    """예산 조건 검색 결과 (입력을 바꾸면 이 영역만 다시 실행)"""
+    # 설문 Q2(1일 지출) 답변이 있으면 기본 예산으로 사용
+    default_budget = budget_from_answers(st.session_state.get('answers')) or 100000
+    
+    budget_col1, budget_col2 = st.columns([2, 1])
+    with budget_col1:
+        budget = st.number_input("1인 예산 (원)", min_value=0, max_value=2000000,
+                                 value=int(min(default_budget, 2000000)), step=10000)
+    with budget_col2:
+        fully = st.checkbox("최고 가격까지 예산 이내", value=False)
+    
+    matched = region_index.within_budget(budget, fully=fully)
+    st.caption(f"예산 {budget:,}원 이내 이용 가능: {len(matched)}곳")
+    
+    budget_table = matched[['title', 'type', 'price_range', 'rating', 'distance_from_incheon']]
+    budget_table.columns = ['관광지명', '유형', '가격대', '평점', '거리(km)']
+    st.dataframe(budget_table, use_container_width=True, hide_index=True)
+
+@fragment
+def render_travel_search(region_index):
+    """이동 시간 조건 검색 결과 (입력을 바꾸면 이 영역만 다시 실행)"""
+    travel_col1, travel_col2 = st.columns([2, 1])
+    with travel_col1:
+        hours = st.slider("인천에서 최대 이동 시간 (시간)", min_value=0.5, max_value=6.0, value=2.0, step=0.5)
+    with travel_col2:
+        mode = st.selectbox("교통수단", ['전체'] + region_index.travel_modes())
+    
+    reachable = region_index.reachable_within(hours, None if mode == '전체' else mode)
+    st.caption(f"{hours:g}시간 이내 도착 가능: {len(reachable)}곳")
+    
+    travel_table = reachable[['title', 'type', 'travel_time_primary', 'travel_time_secondary',
+                              'travel_cost_primary', 'travel_cost_secondary']]
+    travel_table.columns = ['관광지명', '유형', '주 교통수단', '보조 교통수단', '주 교통비', '보조 교통비']
+    st.dataframe(travel_table, use_container_width=True, hide_index=True)
 
 def render_cluster_comparison():
     """8개 클러스터 심층 비교"""
@@ -714,7 +559,7 @@ def render_cluster_comparison():
 
 def render_insights_and_recommendations():
     """주요 인사이트 및 제안사항"""
-    wellness_df, stats = load_and_analyze_data()
+    cube, stats = load_and_analyze_data()
     
     if stats is None:
         return
@@ -870,9 +715,7 @@ def statistics_page():
     with action_col3:
         if st.button("📝 새로운 분석 시작"):
             # 세션 상태 클리어
-            for key in ['survey_completed', 'answers', 'factor_scores', 'cluster_result']:
-                if key in st.session_state:
-                    del st.session_state[key]
+            reset_survey_state()
             st.switch_page("pages/01_questionnaire.py")
 
 # 메인 실행
@@ -0,0 +1,77 @@
+# tests/test_ann.py - 근사 최근접 이웃 인덱스 (IVF, LSH)
+
+import numpy as np
+import pytest
+
+from wellness.ann import IVFIndex, RandomProjectionLSH, build_ann_index, exact_search, recall_at_k
+
+
+def _unit_vectors(n=400, dim=16, seed=0):
+    vectors = np.random.default_rng(seed).standard_normal((n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_ivf_probing_all_lists_is_exact():
+    vectors = _unit_vectors()
+    index = IVFIndex(vectors, n_lists=10)
+    approximate, _ = index.search(vectors[:30], 5, n_probe=10)
+    exact, _ = exact_search(vectors, vectors[:30], 5)
+    np.testing.assert_array_equal(approximate, exact)
+    assert recall_at_k(approximate, exact) == 1.0
+
+
+def test_lsh_recall_is_reasonable():
+    vectors = _unit_vectors()
+    index = RandomProjectionLSH(vectors, n_tables=16, n_bits=6, n_probe=2)
+    approximate, _ = index.search(vectors[:30], 5)
+    exact, _ = exact_search(vectors, vectors[:30], 5)
+    # 질의 자신은 항상 같은 버킷에 있음
+    assert (approximate[:, 0] == np.arange(30)).all()
+    assert recall_at_k(approximate, exact) > 0.5
+
+
+def test_search_pads_missing_results():
+    vectors = _unit_vectors(3)
+    rows, scores = exact_search(vectors, vectors[:1], 5)
+    assert rows[0, 3:].tolist() == [-1, -1]
+    assert recall_at_k(rows, rows) == 1.0
+
+
+def _changes(vectors, seed=1):
+    """행 하나 삭제, 두 행 수정, 한 행 추가한 (new_vectors, old_rows, changed)"""
+    keep = np.delete(np.arange(len(vectors)), 7)
+    new_vectors = np.vstack([vectors[keep], _unit_vectors(1, vectors.shape[1], seed)])
+    old_rows = np.append(keep, -1)
+    changed = np.zeros(len(new_vectors), dtype=bool)
+    changed[[3, 10, -1]] = True
+    new_vectors[[3, 10]] = _unit_vectors(2, vectors.shape[1], seed + 1)
+    return new_vectors, old_rows, changed
+
+
+def test_ivf_update_matches_reassignment():
+    vectors = _unit_vectors()
+    index = IVFIndex(vectors, n_lists=10)
+    new_vectors, old_rows, changed = _changes(vectors)
+    updated = index.update(old_rows, changed, new_vectors[changed])
+    np.testing.assert_array_equal(updated.vectors, new_vectors)
+    # 중심점이 그대로이므로 전체를 다시 배정한 결과와 같음
+    np.testing.assert_array_equal(updated.assignment, index._assign(new_vectors))
+    approximate, _ = updated.search(new_vectors[:20], 5, n_probe=10)
+    np.testing.assert_array_equal(approximate, exact_search(new_vectors, new_vectors[:20], 5)[0])
+    # 원래 인덱스는 바뀌지 않음
+    assert len(index.vectors) == len(vectors)
+
+
+def test_lsh_update_matches_rehash():
+    vectors = _unit_vectors()
+    index = RandomProjectionLSH(vectors)
+    new_vectors, old_rows, changed = _changes(vectors)
+    updated = index.update(old_rows, changed, new_vectors[changed])
+    for table, codes in enumerate(updated.codes):
+        np.testing.assert_array_equal(codes, index._codes(new_vectors @ index.planes[table].T))
+
+
+def test_build_ann_index():
+    assert isinstance(build_ann_index(_unit_vectors(), 'lsh', n_bits=4), RandomProjectionLSH)
+    with pytest.raises(ValueError):
+        build_ann_index(_unit_vectors(), 'hnsw')
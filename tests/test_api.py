@@ -0,0 +1,210 @@
+# tests/test_api.py - HTTP API 요청 검증과 이벤트 루프 비차단 동작
+
+import asyncio
+import csv
+import io
+import json
+import time
+
+import pytest
+
+from wellness import api
+from wellness.export import export_cluster_destinations_to_csv
+from wellness.survey import get_cluster_info
+
+
+def _post(path, payload):
+    return api.handle_request('POST', path, json.dumps(payload).encode('utf-8'))
+
+
+@pytest.mark.parametrize('payload', [
+    {'cluster': 1, 'theme': [{'a': 1}]},
+    {'cluster': 1, 'theme': [[1]]},
+    {'cluster': 1, 'region': [{'code': [1]}]},
+    {'cluster': 1, 'region': [True]},
+    {'cluster': True},
+    {'cluster': 1, 'limit': True},
+    {'cluster': 1, 'limit': 0},
+    {'cluster': 1, 'diversity': 1.5},
+    {'cluster': 1, 'category': {'FD': True}},
+    {'cluster': 1, 'category': {'FD': -1}},
+    {'cluster': 1, 'scoring': 'unknown'},
+    {'answers': {'q1': True}},
+    {'answers': {'q999': 0}},
+    {},
+])
+def test_invalid_recommendation_request_is_400(payload):
+    with pytest.raises(api.ApiError) as excinfo:
+        _post('/recommendations', payload)
+    assert excinfo.value.status == 400
+
+
+def test_invalid_batch_item_is_400():
+    with pytest.raises(api.ApiError) as excinfo:
+        _post('/recommendations/batch', {'requests': [{'cluster': 1}, {'cluster': 1, 'theme': [[1]]}]})
+    assert excinfo.value.status == 400
+
+
+def test_invalid_json_is_400():
+    with pytest.raises(api.ApiError) as excinfo:
+        api.handle_request('POST', '/recommendations', b'{not json')
+    assert excinfo.value.status == 400
+
+
+def test_valid_filters_are_accepted():
+    status, result = _post('/recommendations', {'cluster': 1, 'theme': ['EX050100'], 'region': [{'code': 1}],
+                                                'limit': 3})
+    assert status == 200
+    assert len(result['recommendations']) <= 3
+
+
+@pytest.mark.parametrize('value', ['abc', '-1', '1.5'])
+def test_malformed_content_length(value):
+    with pytest.raises(api.ApiError) as excinfo:
+        api._content_length({'content-length': value})
+    assert excinfo.value.status == 400
+
+
+def test_unknown_route_and_method():
+    with pytest.raises(api.ApiError) as excinfo:
+        api.handle_request('GET', '/nope', b'')
+    assert excinfo.value.status == 404
+    with pytest.raises(api.ApiError) as excinfo:
+        api.handle_request('GET', '/recommendations', b'')
+    assert excinfo.value.status == 405
+
+
+async def _exchange(port, raw):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(raw)
+    await writer.drain()
+    status_line = await reader.readline()
+    writer.close()
+    return int(status_line.split()[1])
+
+
+def test_server_rejects_malformed_content_length():
+    async def scenario():
+        server = await asyncio.start_server(api._handle_connection, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await _exchange(port, b'POST /recommendations HTTP/1.1\r\nContent-Length: abc\r\n\r\n')
+
+    assert asyncio.run(scenario()) == 400
+
+
+def test_health_is_not_blocked_by_slow_recommendation(monkeypatch):
+    def slow_service():
+        time.sleep(0.5)
+        raise api.ApiError(503, "warming up")
+
+    monkeypatch.setattr(api, 'get_service', slow_service)
+
+    async def scenario():
+        server = await asyncio.start_server(api._handle_connection, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            slow = asyncio.create_task(_exchange(
+                port, b'POST /recommendations HTTP/1.1\r\nContent-Length: 2\r\nConnection: close\r\n\r\n{}'))
+            await asyncio.sleep(0.05)
+            started = time.perf_counter()
+            health = await _exchange(port, b'GET /health HTTP/1.1\r\nConnection: close\r\n\r\n')
+            health_seconds = time.perf_counter() - started
+            return health, health_seconds, await slow
+
+    health, health_seconds, slow = asyncio.run(scenario())
+    assert health == 200
+    assert health_seconds < 0.3
+    assert slow == 503
+
+
+def test_export_is_streamed_in_chunks(monkeypatch):
+    monkeypatch.setattr(api, 'iter_cluster_destinations_csv',
+                        lambda cluster_result, **kwargs: iter([b'a,b\n', b'', b'1,2\n']))
+    body = json.dumps({'cluster': 1}).encode('utf-8')
+
+    async def scenario():
+        server = await asyncio.start_server(api._handle_connection, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'POST /recommendations/export HTTP/1.1\r\nConnection: close\r\n'
+                         b'Content-Length: %d\r\n\r\n' % len(body) + body)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+
+    head, _, payload = asyncio.run(scenario()).partition(b'\r\n\r\n')
+    assert head.startswith(b'HTTP/1.1 200')
+    assert b'Transfer-Encoding: chunked' in head
+    assert payload == b'4\r\na,b\n\r\n4\r\n1,2\n\r\n0\r\n\r\n'
+
+
+def test_export_matches_download_file():
+    status, response = _post('/recommendations/export', {'cluster': 2, 'theme': ['EX050100']})
+    assert status == 200
+    body = b''.join(response.chunks)
+    user_info = {'cluster_name': get_cluster_info()[2]['name']}
+    assert body == export_cluster_destinations_to_csv({'cluster': 2}, user_info, theme_filter=['EX050100'])
+
+    rows = list(csv.DictReader(io.StringIO(body.decode('utf-8-sig'))))
+    assert rows and {row['사용자클러스터'] for row in rows} == {user_info['cluster_name']}
+
+
+def test_export_applies_category_filter():
+    status, response = _post('/recommendations/export', {'cluster': 0, 'category': {'FD': 5}})
+    assert status == 200
+    filtered = b''.join(response.chunks)
+    _, unfiltered = _post('/recommendations/export', {'cluster': 0})
+    assert filtered == export_cluster_destinations_to_csv(
+        {'cluster': 0}, {'cluster_name': get_cluster_info()[0]['name']}, category_filter={'FD': 5})
+    assert filtered.count(b'\n') < b''.join(unfiltered.chunks).count(b'\n')
+
+
+@pytest.mark.parametrize('options', [{'scoring': 'personalized'}, {'diversity': 0.5}])
+def test_export_rejects_ranking_options(options):
+    with pytest.raises(api.ApiError) as excinfo:
+        _post('/recommendations/export', dict({'cluster': 1}, **options))
+    assert excinfo.value.status == 400
+
+
+async def _raw_exchange(raw):
+    server = await asyncio.start_server(api._handle_connection, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(raw)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        return response
+
+
+def test_export_failure_mid_stream_closes_connection(monkeypatch, caplog):
+    def chunks(cluster_result, **kwargs):
+        yield b'a,b\n'
+        raise RuntimeError("secret detail")
+
+    monkeypatch.setattr(api, 'iter_cluster_destinations_csv', chunks)
+    body = json.dumps({'cluster': 1}).encode('utf-8')
+    # keep-alive 요청이어도 잘린 응답 뒤에는 연결이 닫혀야 함 (read()가 끝남)
+    response = asyncio.run(_raw_exchange(b'POST /recommendations/export HTTP/1.1\r\n'
+                                         b'Content-Length: %d\r\n\r\n' % len(body) + body))
+    head, _, payload = response.partition(b'\r\n\r\n')
+    assert head.startswith(b'HTTP/1.1 200')
+    assert payload == b'4\r\na,b\n\r\n'
+    assert 'secret detail' in caplog.text
+
+
+def test_internal_error_body_is_generic(monkeypatch, caplog):
+    def broken_service():
+        raise RuntimeError("secret detail")
+
+    monkeypatch.setattr(api, 'get_service', broken_service)
+    response = asyncio.run(_raw_exchange(
+        b'POST /recommendations HTTP/1.1\r\nContent-Length: 2\r\nConnection: close\r\n\r\n{}'))
+    head, _, payload = response.partition(b'\r\n\r\n')
+    assert head.startswith(b'HTTP/1.1 500')
+    assert json.loads(payload) == {'error': 'internal server error'}
+    assert 'secret detail' in caplog.text
@@ -0,0 +1,107 @@
+# tests/test_auth.py - 로그인 시도 제한(토큰 버킷)과 회원가입 쓰기 스레드
+
+import sqlite3
+
+import pytest
+
+from wellness.auth import (LOGIN_INVALID, LOGIN_OK, RATE_LIMITED, SIGNUP_CREATED, SIGNUP_EXISTS, SIGNUP_INVALID,
+                           TEST_ACCOUNT, AuthService, RateLimiter, TokenBucket)
+
+
+def test_token_bucket_refills_up_to_capacity():
+    bucket = TokenBucket(3, 0.5, now=0.0)
+    assert [bucket.consume(now=0.0) for _ in range(4)] == [True, True, True, False]
+    assert bucket.retry_after(now=0.0) == pytest.approx(2.0)
+    assert bucket.consume(now=2.0)
+    assert not bucket.consume(now=2.0)
+    # 오래 쉬어도 용량까지만 채워짐
+    assert [bucket.consume(now=100.0) for _ in range(4)] == [True, True, True, False]
+
+
+def test_rate_limiter_is_per_key_and_bounded():
+    limiter = RateLimiter(1, 0.1, max_keys=2)
+    assert limiter.allow('a', now=0.0)
+    assert not limiter.allow('a', now=0.0)
+    assert limiter.retry_after('a', now=5.0) == pytest.approx(5.0)
+    assert limiter.allow('b', now=0.0)
+    limiter.allow('a', now=0.0)
+    limiter.allow('c', now=0.0)
+    # 가장 오래 쓰지 않은 키('b')가 밀려남
+    assert list(limiter._buckets) == ['a', 'c']
+
+
+@pytest.fixture
+def auth(tmp_path):
+    return AuthService(str(tmp_path / 'users.db'), username_login_rate=(100, 1.0), ip_login_rate=(100, 1.0),
+                       ip_signup_rate=(100, 1.0))
+
+
+def test_signup_then_login(auth):
+    assert auth.signup('alice', 'secret').result(timeout=5)['status'] == SIGNUP_CREATED
+    assert auth.login('alice', 'secret')['status'] == LOGIN_OK
+    assert auth.login('alice', 'wrong')['status'] == LOGIN_INVALID
+    assert auth.login('nobody', 'secret')['status'] == LOGIN_INVALID
+    assert auth.login(*TEST_ACCOUNT)['status'] == LOGIN_OK
+    # 다른 서비스 객체(다른 프로세스)도 같은 DB에서 확인
+    other = AuthService(auth.db_path)
+    assert other.login('alice', 'secret')['status'] == LOGIN_OK
+
+
+@pytest.mark.parametrize('username, password', [('', 'secret'), ('bob', '123')])
+def test_signup_rejects_invalid_input(auth, username, password):
+    assert auth.signup(username, password).result(timeout=5)['status'] == SIGNUP_INVALID
+    assert not auth.user_exists(username)
+
+
+def test_duplicate_signups_create_one_user(auth):
+    futures = [auth.signup('carol', 'secret') for _ in range(5)] + [auth.signup(TEST_ACCOUNT[0], 'secret')]
+    statuses = [future.result(timeout=5)['status'] for future in futures]
+    assert statuses == [SIGNUP_CREATED] + [SIGNUP_EXISTS] * 5
+    conn = sqlite3.connect(auth.db_path)
+    assert conn.execute('SELECT COUNT(*) FROM users').fetchone()[0] == 1
+    conn.close()
+
+
+def test_rate_limits(tmp_path):
+    auth = AuthService(str(tmp_path / 'users.db'), username_login_rate=(2, 0.001), ip_login_rate=(100, 1.0),
+                       ip_signup_rate=(1, 0.001))
+    assert [auth.login('dave', 'x')['status'] for _ in range(3)] == [LOGIN_INVALID, LOGIN_INVALID, RATE_LIMITED]
+    assert auth.login('dave', 'x')['retry_after'] > 0
+    assert auth.signup('erin', 'secret', ip='1.2.3.4').result(timeout=5)['status'] == SIGNUP_CREATED
+    result = auth.signup('frank', 'secret', ip='1.2.3.4').result(timeout=5)
+    assert result['status'] == RATE_LIMITED and result['retry_after'] > 0
+    assert auth.signup('frank', 'secret', ip='5.6.7.8').result(timeout=5)['status'] == SIGNUP_CREATED
+
+
+def test_write_error_releases_reservation(auth):
+    conn = sqlite3.connect(auth.db_path)
+    conn.execute('DROP TABLE users')
+    conn.commit()
+    conn.close()
+    with pytest.raises(sqlite3.OperationalError):
+        auth.signup('grace', 'secret').result(timeout=5)
+    assert 'grace' not in auth._usernames
+
+
+def test_user_added_by_other_process_can_log_in_immediately(tmp_path):
+    db_path = str(tmp_path / 'users.db')
+    limits = dict(username_login_rate=(100, 1.0), ip_login_rate=(100, 1.0), ip_signup_rate=(100, 1.0))
+    replica_a = AuthService(db_path, **limits)
+    replica_b = AuthService(db_path, **limits)
+    assert not replica_a.user_exists('carol')
+
+    assert replica_b.signup('carol', 'secret').result(timeout=5)['status'] == SIGNUP_CREATED
+    # 집합에 없는 아이디는 간격을 기다리지 않고 DB에서 바로 확인
+    assert replica_a.login('carol', 'secret')['status'] == LOGIN_OK
+    assert 'carol' in replica_a._usernames
+    assert replica_a.signup('carol', 'other').result(timeout=5)['status'] == SIGNUP_EXISTS
+
+
+def test_unknown_user_lookup_is_one_indexed_query(auth):
+    statements = []
+    auth._connection().set_trace_callback(statements.append)
+    assert auth.login('nobody', 'secret')['status'] == LOGIN_INVALID
+    assert statements == ["SELECT password FROM users WHERE username = 'nobody'"]
+    plan = auth._connection().execute(
+        'EXPLAIN QUERY PLAN SELECT password FROM users WHERE username = ?', ('nobody',)).fetchall()
+    assert 'USING INDEX' in plan[0][-1]
@@ -0,0 +1,163 @@
+# tests/test_batch.py - 배치 CLI (입력 청크, 빈 응답 건너뛰기, 점수 형식, 워커 처리)
+
+import io
+import json
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wellness import batch
+from wellness.schema import conform_to_schema
+from wellness.service import RecommendationService
+from wellness.survey import QUESTION_KEYS, determine_cluster
+
+
+def _destinations(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    return conform_to_schema(pd.DataFrame({
+        'content_id': np.arange(1000, 1000 + n),
+        'title': [f'관광지 {i}' if i % 7 else f'관광지, "{i}"' for i in range(n)],
+        'wellness_theme': rng.choice(['EX050100', 'EX050200'], n),
+        'region_code': rng.integers(1, 4, n),
+        # 반올림 형식을 확인하도록 자릿수가 긴 점수
+        'score_cluster_0': rng.random(n),
+        'score_cluster_1': rng.random(n),
+        'score_cluster_2': rng.random(n),
+    }))
+
+
+@pytest.fixture
+def service():
+    return RecommendationService(_destinations())
+
+
+def _rows(text):
+    return pd.read_csv(io.StringIO(','.join(batch.OUTPUT_COLUMNS) + '\n' + text), dtype=str)
+
+
+def _write_answers(path, rows):
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return path
+
+
+def test_csv_chunks_skip_and_count_unanswered_rows(tmp_path):
+    path = _write_answers(tmp_path / 'answers.csv', [
+        {'respondent_id': 'a', 'q1': 0, 'q2': 1},
+        {'respondent_id': 'b', 'q1': None, 'q2': None},
+        {'respondent_id': 'c', 'q1': 9, 'q2': 'x'},
+        {'respondent_id': 'd', 'q1': None, 'q2': 3},
+    ])
+    stats = {'skipped': 0}
+    chunks = list(batch.iter_csv_chunks(path, chunk_size=2, stats=stats))
+
+    assert stats['skipped'] == 2
+    assert [ids for ids, _ in chunks] == [['a'], ['d']]
+    assert chunks[0][1].tolist() == [[0, 1] + [-1] * (len(QUESTION_KEYS) - 2)]
+    assert chunks[1][1].tolist() == [[-1, 3] + [-1] * (len(QUESTION_KEYS) - 2)]
+
+
+def test_csv_chunks_without_id_column_use_row_numbers(tmp_path):
+    path = _write_answers(tmp_path / 'answers.csv', [{'q1': None}, {'q1': 1}, {'q1': 2}])
+    stats = {'skipped': 0}
+    chunks = list(batch.iter_csv_chunks(path, chunk_size=10, stats=stats))
+    assert [ids for ids, _ in chunks] == [[1, 2]]
+    assert stats['skipped'] == 1
+
+
+@pytest.mark.parametrize('survey_data, expected', [
+    ({'q1': 0, 'q7': 2}, [0, -1, -1, -1, -1, -1, 2]),
+    ({'answers': {'q2': 1}}, [-1, 1, -1, -1, -1, -1, -1]),
+    ({'q1': True, 'q2': 99, 'q3': 1}, [-1, -1, 1, -1, -1, -1, -1]),
+    ({'legacy': 'format'}, None),
+    ('not json', None),
+    ([1, 2], None),
+])
+def test_parse_survey_data(survey_data, expected):
+    raw = survey_data if isinstance(survey_data, str) else json.dumps(survey_data)
+    assert batch.parse_survey_data(raw) == expected
+
+
+def test_db_chunks_skip_legacy_surveys(tmp_path):
+    db_path = tmp_path / 'users.db'
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE user_surveys (id INTEGER PRIMARY KEY, username TEXT, survey_data TEXT)")
+    conn.executemany("INSERT INTO user_surveys VALUES (?, ?, ?)", [
+        (1, 'kim', json.dumps({'q1': 0})),
+        (2, 'lee', json.dumps({'legacy': 1})),
+        (3, 'park', json.dumps({'q2': 2})),
+    ])
+    conn.commit()
+    conn.close()
+
+    stats = {'skipped': 0}
+    chunks = list(batch.iter_db_chunks(db_path, chunk_size=2, stats=stats))
+    assert [ids for ids, _ in chunks] == [['kim:1'], ['park:3']]
+    assert stats['skipped'] == 1
+
+
+def test_cluster_rows_match_service_and_round_scores(service):
+    answers = np.array([[0, 1, 2, 3, 0, 1, 2], [3, 3, 3, 3, 3, 3, 0]])
+    cluster_rows = batch.build_cluster_rows(service, limit=5)
+    rows = _rows(batch.rank_chunk(['a', 'b'], answers, cluster_rows))
+
+    assert len(rows) == 10
+    for respondent_id, answer_row in zip(['a', 'b'], answers):
+        result = determine_cluster(dict(zip(QUESTION_KEYS, answer_row.tolist())))
+        expected = service.recommend(result['cluster'], limit=5)
+        got = rows[rows['respondent_id'] == respondent_id]
+        assert got['cluster'].astype(int).unique().tolist() == [result['cluster']]
+        assert got['content_id'].astype(int).tolist() == [record['content_id'] for record in expected]
+        assert got['title'].tolist() == [record['title'] for record in expected]
+        assert got['score'].tolist() == [str(round(float(record['score']), 4)) for record in expected]
+
+
+@pytest.mark.parametrize('personalized', [False, True])
+def test_score_format_is_the_same_in_both_modes(service, personalized):
+    cluster_rows = batch.build_cluster_rows(service)
+    score_table = batch.build_score_table(service) if personalized else None
+    text = batch.rank_chunk(['a'], np.array([[0, 1, 2, 3, 0, 1, 2]]), cluster_rows, score_table)
+    for column in ('confidence', 'score'):
+        values = _rows(text)[column]
+        assert (values.str.split('.').str[1].str.len() <= 4).all()
+
+
+def test_personalized_rows_match_service(service):
+    answers = {'q1': 0, 'q2': 1, 'q3': 2}
+    matrix = np.array([[answers.get(q_key, -1) for q_key in QUESTION_KEYS]])
+    score_table = batch.build_score_table(service, limit=5)
+    rows = _rows(batch.rank_chunk(['a'], matrix, {}, score_table))
+
+    expected = service.recommend(determine_cluster(answers), limit=5, scoring='personalized')
+    # 서비스는 캐시 키용으로 혼합 가중치를 넷째 자리로 반올림하므로 점수는 근사 비교
+    assert rows['content_id'].astype(int).tolist() == [record['content_id'] for record in expected]
+    assert rows['score'].astype(float).tolist() == pytest.approx([record['score'] for record in expected], abs=1e-3)
+
+
+def test_run_batch_in_process_and_pool_write_the_same_file(service):
+    rng = np.random.default_rng(1)
+    chunks = [([f'r{chunk}-{row}' for row in range(20)], rng.integers(-1, 3, (20, len(QUESTION_KEYS))))
+              for chunk in range(5)]
+    cluster_rows = batch.build_cluster_rows(service, limit=3)
+
+    outputs = []
+    for workers in (0, 2):
+        output = io.StringIO()
+        assert batch.run_batch(iter(chunks), output, cluster_rows, workers) == 100
+        outputs.append(output.getvalue())
+    assert outputs[0] == outputs[1]
+    assert _rows(outputs[0])['respondent_id'].tolist()[::3] == [rid for ids, _ in chunks for rid in ids]
+
+
+def test_main_reports_skipped_csv_rows(tmp_path, capsys):
+    path = _write_answers(tmp_path / 'answers.csv', [
+        {'respondent_id': 'a', 'q1': 0},
+        {'respondent_id': 'b', 'q1': None},
+    ])
+    output = tmp_path / 'out.csv'
+    assert batch.main(['--answers', str(path), '--output', str(output), '--workers', '0', '--limit', '2']) == 0
+
+    rows = pd.read_csv(output, encoding='utf-8-sig', dtype=str)
+    assert rows['respondent_id'].tolist() == ['a', 'a']
+    assert '1건은 건너뛰었습니다' in capsys.readouterr().out
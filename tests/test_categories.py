@@ -0,0 +1,121 @@
+# tests/test_categories.py - 카테고리 분류 체계와 희소 개수 인덱스 (밀집 계산과 비교)
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wellness.categories import CategoryIndex, CategoryTaxonomy, normalize_category_filter
+
+CATEGORY_MAP = pd.DataFrame([
+    ('AC', '숙박', 'AC01', '호텔', 'AC010100', '호텔'),
+    ('AC', '숙박', 'AC02', '콘도미니엄', 'AC020100', '콘도'),
+    ('AC', '숙박', 'AC02', '콘도미니엄', 'AC020200', '레지던스'),
+    ('FD', '음식', 'FD01', '한식', 'FD010100', '한식당'),
+    ('FD', '음식', 'FD02', '카페', 'FD020100', '카페'),
+    ('EX', '체험', 'EX05', '웰니스', 'EX050100', '온천'),
+], columns=['lclsSystm1Cd', 'lclsSystm1Nm', 'lclsSystm2Cd', 'lclsSystm2Nm', 'lclsSystm3Cd', 'lclsSystm3Nm'])
+
+LEAF_CODES = sorted(CATEGORY_MAP['lclsSystm3Cd'])
+
+
+def _counts(n=50, seed=0):
+    rng = np.random.default_rng(seed)
+    counts = rng.poisson(0.7, (n, len(LEAF_CODES)))
+    # 열 순서를 섞고, 분류 체계에 없는 컬럼도 하나 넣음
+    frame = pd.DataFrame(counts, columns=LEAF_CODES)[LEAF_CODES[::-1]]
+    frame.insert(0, 'contentId', rng.permutation(np.arange(1000, 1000 + n)))
+    frame.insert(1, 'title', [f'관광지 {i}' for i in range(n)])
+    frame['ZZ999999'] = 7
+    return frame
+
+
+def _dense_level(frame, level):
+    """분류 단계별 개수 밀집 행렬 (기준 구현)"""
+    column = {1: 'lclsSystm1Cd', 2: 'lclsSystm2Cd', 3: 'lclsSystm3Cd'}[level]
+    parents = CATEGORY_MAP.set_index('lclsSystm3Cd', drop=False)[column]
+    return frame[LEAF_CODES].T.groupby(parents.loc[LEAF_CODES].to_numpy()).sum().T.sort_index(axis=1)
+
+
+@pytest.fixture
+def frame():
+    return _counts()
+
+
+@pytest.fixture
+def index(frame):
+    return CategoryIndex(CATEGORY_MAP, frame)
+
+
+def test_taxonomy_levels_and_names():
+    taxonomy = CategoryTaxonomy(CATEGORY_MAP)
+    assert taxonomy.codes[1].tolist() == ['AC', 'EX', 'FD']
+    assert taxonomy.level_of('AC02') == 2 and taxonomy.level_of('FD020100') == 3 and taxonomy.level_of('XX') is None
+    assert taxonomy.name('AC02') == '콘도미니엄' and taxonomy.name('XX') == 'XX'
+    assert taxonomy.codes[3][taxonomy.leaf_positions('AC')].tolist() == ['AC010100', 'AC020100', 'AC020200']
+    with pytest.raises(KeyError):
+        taxonomy.position('XX')
+
+
+def test_counts_are_sparse_and_match_input(index, frame):
+    assert index.counts.nnz == int((frame[LEAF_CODES].to_numpy() != 0).sum())
+    np.testing.assert_array_equal(index.counts.to_dense(), frame[LEAF_CODES].to_numpy())
+
+
+@pytest.mark.parametrize('level', [1, 2, 3])
+def test_level_counts_and_rollup_match_dense(index, frame, level):
+    dense = _dense_level(frame, level)
+    np.testing.assert_array_equal(index.level_counts(level).to_dense(), dense.to_numpy())
+    assert index.level_counts(level) is index.level_counts(level)
+
+    rollup = index.rollup(level)
+    assert rollup['code'].tolist() == dense.columns.tolist()
+    np.testing.assert_array_equal(rollup['count'], dense.sum().to_numpy())
+    np.testing.assert_array_equal(rollup['destinations'], (dense > 0).sum().to_numpy())
+
+    subset = frame['contentId'].iloc[::3].tolist() + [1]
+    rollup = index.rollup(level, content_ids=subset)
+    expected = dense[frame['contentId'].isin(subset).to_numpy()]
+    np.testing.assert_array_equal(rollup['count'], expected.sum().to_numpy())
+
+
+@pytest.mark.parametrize('minimum', [0, 1, 2, 4])
+def test_facet_counts_match_dense(index, frame, minimum):
+    dense = _dense_level(frame, 2)
+    np.testing.assert_array_equal(index.facet_counts(2, minimum)['destinations'], (dense >= minimum).sum().to_numpy())
+    subset = frame['contentId'].iloc[:20].tolist()
+    np.testing.assert_array_equal(index.facet_counts(2, minimum, subset)['destinations'],
+                                  (dense.iloc[:20] >= minimum).sum().to_numpy())
+
+
+def test_min_count_filters_match_dense(index, frame):
+    dense = _dense_level(frame, 1)
+    leaf = frame['FD010100']
+    np.testing.assert_array_equal(index.counts_for('FD'), dense['FD'])
+    np.testing.assert_array_equal(index.counts_for('FD010100'), leaf)
+
+    expected = (dense['FD'] >= 2) & (frame['AC020100'] >= 1)
+    conditions = {'FD': 2, 'AC020100': 1}
+    assert sorted(index.content_ids_with(conditions)) == sorted(frame['contentId'][expected])
+    content_ids = [1] + frame['contentId'].tolist()[::-1]
+    np.testing.assert_array_equal(index.mask_for(content_ids, conditions), [False] + expected.tolist()[::-1])
+    with pytest.raises(KeyError):
+        index.content_ids_with({'XX': 1})
+
+
+def test_empty_index():
+    index = CategoryIndex(CATEGORY_MAP, _counts().iloc[:0])
+    assert index.rows_for([1000, 1001]).tolist() == []
+    assert index.mask_for([1000], {'FD': 1}).tolist() == [False]
+    assert index.rollup(1)['count'].tolist() == [0, 0, 0]
+    assert index.facet_counts(1, 0)['destinations'].tolist() == [0, 0, 0]
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, None),
+    ({}, None),
+    ({'FD': 0}, None),
+    ({'FD': '2', 'AC': 1}, (('AC', 1), ('FD', 2))),
+    ([('EX050100', 3)], (('EX050100', 3),)),
+])
+def test_normalize_category_filter(value, expected):
+    assert normalize_category_filter(value) == expected
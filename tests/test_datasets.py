@@ -0,0 +1,246 @@
+# tests/test_datasets.py - 데이터셋 관리자 (행 변경 내역, 백그라운드 갱신, 증분 갱신과 전체 생성 비교)
+
+import csv
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wellness.data import DATA_DIR
+from wellness.datasets import DatasetManager, _register_default_datasets, diff_rows
+
+
+def test_diff_rows():
+    old = pd.DataFrame({'id': [1, 2, 3, 4], 'value': [1.0, np.nan, 3.0, 4.0], 'mdfcnDt': [1, 1, 1, 1]})
+    new = pd.DataFrame({'id': [2, 3, 4, 5], 'value': [np.nan, 3.5, 4.0, 5.0], 'mdfcnDt': [1, 1, 2, 1]})
+    # 값이 같아도 수정 일시가 바뀐 행(4)은 수정, 둘 다 결측인 값(2)은 같은 값
+    assert diff_rows(old, new, 'id', 'mdfcnDt') == {'added': [5], 'removed': [1], 'modified': [3, 4]}
+    assert diff_rows(old.drop(columns='mdfcnDt'), new.drop(columns='mdfcnDt'), 'id') == {
+        'added': [5], 'removed': [1], 'modified': [3]}
+
+
+@pytest.mark.parametrize('new', [
+    pd.DataFrame({'id': [1, 1], 'value': [1.0, 2.0]}),
+    pd.DataFrame({'id': [1], 'other': [1.0]}),
+    pd.DataFrame({'key': [1], 'value': [1.0]}),
+])
+def test_diff_rows_is_unknown_for_incomparable_frames(new):
+    assert diff_rows(pd.DataFrame({'id': [1], 'value': [1.0]}), new, 'id') is None
+
+
+def _bump_mtime(path):
+    # 같은 크기로 덮어써도 변경을 알아채도록 수정 시각을 확실히 바꿈
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def _write(path, frame):
+    frame.to_csv(path, index=False)
+    _bump_mtime(path)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    path = tmp_path / 'source.csv'
+    _write(path, pd.DataFrame({'id': [1, 2, 3], 'value': [10, 20, 30]}))
+    manager = DatasetManager(check_interval=0)
+    manager.loads = 0
+    manager.builds = []
+
+    def load():
+        manager.loads += 1
+        return pd.read_csv(path)
+
+    def build(inputs, previous, version):
+        manager.builds.append((inputs['source'].changes, previous))
+        if inputs['source'].frame['value'].lt(0).any():
+            raise ValueError('음수 값')
+        return inputs['source'].frame['value'].sum()
+
+    manager.register('source', load, [str(path)], key='id')
+    manager.register_derived('total', build, ('source',))
+    manager.path = path
+    return manager
+
+
+def test_snapshots_load_lazily_and_share_versions(manager):
+    assert not manager.is_loaded('total')
+    assert manager.get('total') == 60
+    assert manager.loads == 1 and manager.is_loaded('source')
+    assert manager.snapshot('total').sources == {'source': manager.snapshot('source').digest}
+    with pytest.raises(ValueError):
+        manager.register_derived('broken', lambda inputs, previous, version: None, ('missing',))
+
+
+def test_touch_without_content_change_does_not_reload(manager):
+    manager.get('total')
+    snapshot = manager.snapshot('source')
+    _write(manager.path, pd.read_csv(manager.path))
+    manager.refresh(wait=True)
+    assert manager.snapshot('source') is snapshot
+    assert manager.loads == 1 and len(manager.builds) == 1
+
+
+def test_refresh_records_changes_and_passes_previous(manager):
+    manager.get('total')
+    previous = manager.snapshot('total')
+    _write(manager.path, pd.DataFrame({'id': [1, 2, 4], 'value': [10, 25, 40]}))
+    manager.refresh(wait=True)
+    assert manager.get('total') == 75
+    changes, passed_previous = manager.builds[-1]
+    assert changes == {'added': [4], 'removed': [3], 'modified': [2]}
+    assert passed_previous is previous
+    assert manager.snapshot('source').previous_digest == previous.sources['source']
+
+
+def test_failed_build_keeps_previous_snapshot(manager):
+    manager.get('total')
+    _write(manager.path, pd.DataFrame({'id': [1], 'value': [-1]}))
+    manager.refresh(wait=True)
+    assert manager.get('total') == 60
+    assert 'total' in manager.errors
+    _write(manager.path, pd.DataFrame({'id': [1], 'value': [5]}))
+    manager.refresh(wait=True)
+    assert manager.get('total') == 5 and 'total' not in manager.errors
+
+
+def test_background_refresh_swaps_snapshot(manager):
+    manager.get('total')
+    _write(manager.path, pd.DataFrame({'id': [1], 'value': [7]}))
+    manager.get('total')  # 확인 간격이 0이므로 백그라운드 갱신 예약
+    for _ in range(200):
+        if manager.get('total') == 7:
+            break
+        time.sleep(0.01)
+    assert manager.get('total') == 7
+
+
+DERIVED = ('destination_table', 'recommendation_service', 'statistics_cube', 'region_index', 'localized_content',
+           'category_index', 'similarity_index')
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    data_dir = tmp_path / 'GIS'
+    shutil.copytree(DATA_DIR, data_dir)
+    return data_dir
+
+
+def _default_manager(data_dir):
+    manager = _register_default_datasets(DatasetManager(check_interval=0), str(data_dir))
+    for name in DERIVED:
+        manager.get(name)
+    return manager
+
+
+def _edit(path, edit):
+    """CSV 행을 문자열 그대로 읽어 edit(rows)로 고친 뒤 저장 (pandas를 거치면 다른 행의 실수 값이 바뀜)"""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    edit(rows)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    _bump_mtime(path)
+
+
+def _rows_with(rows, content_id):
+    return [row for row in rows if row['contentId'] == str(content_id)]
+
+
+def _assert_same_derived(updated, fresh):
+    pd.testing.assert_frame_equal(updated.get('destination_table'), fresh.get('destination_table'))
+    assert updated.get('recommendation_service')._records == fresh.get('recommendation_service')._records
+    pd.testing.assert_frame_equal(updated.get('statistics_cube').cells, fresh.get('statistics_cube').cells)
+    pd.testing.assert_frame_equal(updated.get('region_index').region_df, fresh.get('region_index').region_df)
+    assert updated.get('localized_content')._rows == fresh.get('localized_content')._rows
+    assert updated.get('localized_content')._tables == fresh.get('localized_content')._tables
+    np.testing.assert_array_equal(updated.get('category_index').counts.to_dense(),
+                                  fresh.get('category_index').counts.to_dense())
+
+
+def test_incremental_refresh_matches_fresh_build(data_dir):
+    manager = _default_manager(data_dir)
+    before = {name: manager.get(name) for name in DERIVED}
+    table = manager.get('destination_table')
+    unrated = int(table[table['rating'].isna() & table['content_id'].notna()]['content_id'].iloc[0])
+
+    def edit_scores(rows):
+        _rows_with(rows, unrated)[0]['score_cluster_0'] = '0.01'
+
+    def edit_counts(rows):
+        column = list(rows[3])[5]
+        rows[3][column] = str(int(rows[3][column]) + 4)
+
+    _edit(data_dir / 'wellness_cluster_score.csv', edit_scores)
+    _edit(data_dir / 'category_counts.csv', edit_counts)
+    manager.refresh(wait=True)
+    assert not manager.errors
+
+    _assert_same_derived(manager, _default_manager(data_dir))
+    changes = manager.snapshot('destination_table').changes
+    assert changes['modified'] == [unrated] and changes['rated'] == []
+    # 평점 보유 행이 그대로이므로 통계 큐브/지역 인덱스는 이전 값 그대로
+    assert manager.get('statistics_cube') is before['statistics_cube']
+    assert manager.get('region_index') is before['region_index']
+    # 바뀌지 않은 관광지의 추천 레코드와 언어별 문자열은 재사용
+    service = manager.get('recommendation_service')
+    assert service is not before['recommendation_service']
+    assert service._records[0][5] is before['recommendation_service']._records[0][5]
+
+
+def test_title_change_matching_region_row_rebuilds_rated_views(data_dir):
+    manager = _default_manager(data_dir)
+    before = manager.get('statistics_cube')
+    region_title = pd.read_csv(manager._specs['region_destinations']['paths'][0])['name'].iloc[0]
+    table = manager.get('destination_table')
+    target = int(table[table['rating'].isna() & table['content_id'].notna()]['content_id'].iloc[0])
+
+    def rename(rows):
+        _rows_with(rows, target)[0]['title'] = region_title
+
+    _edit(data_dir / 'wellness_tourism_list.csv', rename)
+    manager.refresh(wait=True)
+    assert manager.snapshot('destination_table').changes['rated'] == [target]
+    assert manager.get('statistics_cube') is not before
+    _assert_same_derived(manager, _default_manager(data_dir))
+
+
+def test_translation_rows_are_a_tracked_source(data_dir):
+    manager = _default_manager(data_dir)
+    content_id = int(manager.get('destination_table')['content_id'].dropna().iloc[0])
+    assert manager.get('localized_content').lookup(content_id, 'en')['title'] != 'English title'
+
+    def add_translation(rows):
+        rows.append(dict(_rows_with(rows, content_id)[0], contentId=str(content_id + 10 ** 9),
+                         oldContentId=str(content_id), langDivCd='ENG', title='English title'))
+
+    _edit(data_dir / 'wellness_tourism_list.csv', add_translation)
+    manager.refresh(wait=True)
+    assert 'destination_translations' in manager.snapshot('localized_content').sources
+    assert manager.get('localized_content').lookup(content_id, 'en')['title'] == 'English title'
+    # 한국어 행은 그대로이므로 표준 테이블 변경 내역은 비어 있음
+    assert manager.snapshot('destination_table').changes['modified'] == []
+    _assert_same_derived(manager, _default_manager(data_dir))
+
+
+def test_korean_theme_names_follow_category_map(data_dir):
+    manager = _default_manager(data_dir)
+    table = manager.get('destination_table')
+    content_id = int(table.loc[table['wellness_theme'] == 'EX050100', 'content_id'].iloc[0])
+    assert manager.get('localized_content').lookup(content_id)['category'] == '온천 / 사우나 / 스파'
+
+    def rename(rows):
+        for row in rows:
+            if row['lclsSystm3Cd'] == 'EX050100':
+                row['lclsSystm3Nm'] = '온천·스파'
+
+    _edit(data_dir / 'category_map.csv', rename)
+    manager.refresh(wait=True)
+    assert manager.get('localized_content').lookup(content_id)['category'] == '온천·스파'
+    assert manager.get('localized_content').lookup(content_id, 'en')['category'] == 'Hot springs, saunas & spas'
+    _assert_same_derived(manager, _default_manager(data_dir))
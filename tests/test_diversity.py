@@ -0,0 +1,61 @@
+# tests/test_diversity.py - MMR 다양성 재정렬
+
+import numpy as np
+import pytest
+
+from wellness import diversity
+from wellness.diversity import DiversitySimilarity, mmr_select, normalize_relevance
+
+
+def _similarity(n=40, seed=0):
+    rng = np.random.default_rng(seed)
+    return DiversitySimilarity(rng.integers(0, 4, n), rng.choice(['A', 'B', 'C'], n),
+                               rng.uniform(33, 38, n), rng.uniform(126, 129, n))
+
+
+def _naive_mmr(positions, scores, similarity, k, diversity_lambda):
+    """매 단계 이미 고른 전체와의 유사도를 다시 계산하는 기준 구현"""
+    relevance = normalize_relevance(scores)
+    selected = []
+    for _ in range(min(k, len(positions))):
+        best, best_value = None, -np.inf
+        for i in range(len(positions)):
+            if i in selected:
+                continue
+            penalty = max((similarity.block([positions[i]], [positions[j]])[0, 0] for j in selected), default=0.0)
+            value = diversity_lambda * relevance[i] - (1 - diversity_lambda) * penalty
+            if value > best_value:
+                best, best_value = i, value
+        selected.append(best)
+    return selected
+
+
+@pytest.mark.parametrize('diversity_lambda', [0.0, 0.3, 0.7])
+def test_mmr_matches_naive_implementation(diversity_lambda):
+    similarity = _similarity()
+    rng = np.random.default_rng(1)
+    positions = rng.permutation(40)[:25]
+    scores = rng.random(25)
+    assert mmr_select(positions, scores, similarity, 10, diversity_lambda).tolist() == \
+        _naive_mmr(positions, scores, similarity, 10, diversity_lambda)
+
+
+def test_mmr_without_diversity_keeps_score_order():
+    scores = np.array([0.2, 0.9, 0.5, 0.9, 0.1])
+    assert mmr_select(np.arange(5), scores, _similarity(5), 5, 1.0).tolist() == [1, 3, 2, 0, 4]
+    assert mmr_select(np.arange(5), scores, _similarity(5), 0).tolist() == []
+
+
+def test_mmr_spreads_duplicates():
+    # 같은 지역/테마/좌표의 고득점 두 곳보다 다른 곳이 두 번째로 선택됨
+    similarity = DiversitySimilarity([1, 1, 2], ['A', 'A', 'B'], [37.5, 37.5, 33.5], [127.0, 127.0, 126.5])
+    assert mmr_select(np.arange(3), [1.0, 0.95, 0.5], similarity, 2, 0.5).tolist() == [0, 2]
+
+
+def test_block_matches_precomputed_matrix(monkeypatch):
+    precomputed = _similarity(30)
+    monkeypatch.setattr(diversity, 'PRECOMPUTE_LIMIT', 0)
+    on_demand = _similarity(30)
+    assert on_demand._matrix is None
+    rows, columns = [0, 5, 29], [1, 2, 3, 29]
+    np.testing.assert_allclose(on_demand.block(rows, columns), precomputed.block(rows, columns))
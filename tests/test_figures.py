@@ -0,0 +1,73 @@
+# tests/test_figures.py - 차트 JSON 템플릿 패치와 사용자별 차트
+
+import json
+
+import pytest
+
+from wellness.figures import patch_figure
+
+TEMPLATE = json.dumps({
+    'data': [
+        {'type': 'scatterpolar', 'r': [], 'theta': [], 'line': {'color': '#3498DB', 'width': 2}},
+        {'type': 'bar', 'x': [1, 2], 'y': [3, 4]},
+    ],
+    'layout': {'title': {'text': '여행 성향 분석'},
+               'polar': {'radialaxis': {'visible': True, 'range': [0, 1]}}},
+})
+
+
+def test_patch_replaces_trace_values_and_merges_nested_layout():
+    figure = patch_figure(TEMPLATE, traces={0: {'r': [1.5, 2], 'theta': ['a', 'b'], 'line': {'width': 4}}},
+                          layout={'polar': {'radialaxis': {'range': [0, 3]}}})
+
+    assert figure['data'][0] == {'type': 'scatterpolar', 'r': [1.5, 2], 'theta': ['a', 'b'],
+                                 'line': {'color': '#3498DB', 'width': 4}}
+    assert figure['data'][1] == {'type': 'bar', 'x': [1, 2], 'y': [3, 4]}
+    assert figure['layout'] == {'title': {'text': '여행 성향 분석'},
+                                'polar': {'radialaxis': {'visible': True, 'range': [0, 3]}}}
+
+
+def test_patch_replaces_lists_instead_of_merging():
+    figure = patch_figure(TEMPLATE, traces={1: {'x': [9]}})
+    assert figure['data'][1]['x'] == [9]
+    assert figure['data'][1]['y'] == [3, 4]
+
+
+def test_patch_replaces_scalar_with_dict():
+    figure = patch_figure(TEMPLATE, layout={'title': 'plain', 'xaxis': {'range': [0, 1]}})
+    assert figure['layout']['title'] == 'plain'
+    assert figure['layout']['xaxis'] == {'range': [0, 1]}
+    assert patch_figure(TEMPLATE, layout={'title': {'font': {'size': 20}}})['layout']['title'] == {
+        'text': '여행 성향 분석', 'font': {'size': 20}}
+
+
+def test_patch_without_updates_and_without_layout():
+    assert patch_figure(TEMPLATE) == json.loads(TEMPLATE)
+    assert patch_figure(json.dumps({'data': [{}]}), layout={'height': 300}) == {
+        'data': [{}], 'layout': {'height': 300}}
+
+
+def test_patches_do_not_leak_between_calls():
+    patch_figure(TEMPLATE, traces={0: {'r': [1]}}, layout={'polar': {'radialaxis': {'range': [0, 9]}}})
+    figure = patch_figure(TEMPLATE)
+    assert figure['data'][0]['r'] == []
+    assert figure['layout']['polar']['radialaxis']['range'] == [0, 1]
+
+
+def test_patch_unknown_trace_raises():
+    with pytest.raises(IndexError):
+        patch_figure(TEMPLATE, traces={5: {'x': [1]}})
+
+
+def test_factor_chart_matches_patched_values():
+    charts = pytest.importorskip('charts')
+    first = charts.create_factor_analysis_chart({'휴식': 0.5, '문화': 2})
+    second = charts.create_factor_analysis_chart({'자연': 1})
+
+    assert list(first.data[0].r) == [0.5, 2.0]
+    assert list(first.data[0].theta) == ['휴식', '문화']
+    assert list(first.layout.polar.radialaxis.range) == [0, 3.0]
+    # 캐시된 템플릿은 이전 사용자 값에 오염되지 않음
+    assert list(second.data[0].r) == [1.0]
+    assert list(second.layout.polar.radialaxis.range) == [0, 2.0]
+    assert second.layout.title.text == '여행 성향 분석'
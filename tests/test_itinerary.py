@@ -0,0 +1,79 @@
+# tests/test_itinerary.py - 일정 생성 (최근접 삽입, 2-opt, 날짜 분할)
+
+import time
+
+import numpy as np
+import pytest
+
+from wellness.itinerary import (MAX_ITINERARY_PLACES, nearest_insertion, plan_itinerary, travel_time_matrix,
+                                two_opt)
+
+
+def _places(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [{'content_id': i, 'latitude': float(lat), 'longitude': float(lon)}
+            for i, (lat, lon) in enumerate(zip(rng.uniform(34, 38, n), rng.uniform(126, 129, n)))]
+
+
+def _cost(n, seed=0):
+    places = _places(n, seed)
+    return travel_time_matrix([p['latitude'] for p in places], [p['longitude'] for p in places])
+
+
+def _path_cost(tour, cost):
+    return sum(cost[a, b] for a, b in zip(tour, tour[1:]))
+
+
+def _scheduled_ids(plan):
+    return [stop['place']['content_id'] for day in plan['days'] for stop in day['stops']]
+
+
+@pytest.mark.parametrize('deadline', [None, 0.0])
+def test_nearest_insertion_visits_every_node_once(deadline):
+    cost = _cost(40)
+    tour = nearest_insertion(cost, deadline)
+    assert tour[0] == 0
+    assert sorted(tour) == list(range(40))
+
+
+def test_two_opt_never_increases_cost():
+    cost = _cost(60)
+    tour = nearest_insertion(cost)
+    improved = two_opt(tour, cost)
+    assert improved[0] == 0 and sorted(improved) == list(range(60))
+    assert _path_cost(improved, cost) <= _path_cost(tour, cost) + 1e-9
+    # 이미 지난 마감 시간이면 그대로 반환
+    assert two_opt(tour, cost, deadline=time.perf_counter() - 1) == tour
+
+
+def test_plan_schedules_every_place_once():
+    places = _places(30)
+    plan = plan_itinerary(places, max_days=30)
+    assert sorted(_scheduled_ids(plan)) == list(range(30))
+    assert plan['unscheduled'] == []
+    assert plan['total_travel_minutes'] == pytest.approx(sum(day['travel_minutes'] for day in plan['days']), abs=0.5)
+    for day in plan['days']:
+        assert day['over_budget'] == (day['total_minutes'] > 480)
+        # 하루 예산을 넘는 날은 관광지 하나뿐
+        assert not day['over_budget'] or len(day['stops']) == 1
+
+
+def test_plan_with_expired_time_limit_still_covers_all_places():
+    plan = plan_itinerary(_places(50), max_days=50, time_limit_ms=0)
+    assert sorted(_scheduled_ids(plan)) == list(range(50))
+
+
+def test_plan_leaves_overflow_and_extra_days_unscheduled():
+    places = _places(MAX_ITINERARY_PLACES + 5)
+    plan = plan_itinerary(places, max_days=2, time_limit_ms=1)
+    assert len(plan['days']) == 2
+    scheduled = _scheduled_ids(plan)
+    unscheduled = [place['content_id'] for place in plan['unscheduled']]
+    assert sorted(scheduled + unscheduled) == list(range(len(places)))
+    assert unscheduled[-5:] == list(range(MAX_ITINERARY_PLACES, MAX_ITINERARY_PLACES + 5))
+
+
+def test_plan_skips_places_without_coordinates():
+    assert plan_itinerary([])['days'] == []
+    plan = plan_itinerary([{'content_id': 1, 'latitude': np.nan, 'longitude': 127.0}] + _places(2))
+    assert sorted(_scheduled_ids(plan)) == [0, 1]
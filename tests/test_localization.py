@@ -0,0 +1,112 @@
+# tests/test_localization.py - 언어별 제목/설명/카테고리 조회 테이블 (번역 행, 테마 이름, 증분 재생성)
+
+import pandas as pd
+import pytest
+
+from wellness.data import load_category_map
+from wellness.localization import (
+    DEFAULT_CATEGORY, DEFAULT_DESCRIPTION, LOCALES, THEME_NAMES, LocalizedContent, korean_theme_names,
+    locale_options, normalize_locale,
+)
+from wellness.schema import SCHEMA_DEFAULTS, conform_to_schema
+
+CATEGORY_MAP = pd.DataFrame({
+    'lclsSystm3Cd': ['EX050100', 'EX050200'],
+    'lclsSystm3Nm': ['온천 / 사우나 / 스파', '찜질방'],
+})
+
+
+def _destinations():
+    return conform_to_schema(pd.DataFrame({
+        'content_id': [1, 2, 3, 4],
+        'title': ['온천마을', '숲길', '찜질방', '명상센터'],
+        'description': ['따뜻한 온천', None, '넓은 찜질방', '조용한 곳'],
+        'wellness_theme': ['EX050100', 'EX050200', 'EX050200', 'ZZ999999'],
+    }))
+
+
+def _translations():
+    return pd.DataFrame({
+        'contentId': [101, 102, 2, 103],
+        'oldContentId': [1, None, None, 99],
+        'langDivCd': ['ENG', 'JPN', 'ENG', 'ENG'],
+        'title': ['Hot Spring Village', '森の道', 'Forest Trail', 'Unrelated'],
+        'overview': ['Warm springs', None, '  ', 'Not a destination'],
+    })
+
+
+@pytest.fixture
+def content():
+    return LocalizedContent.from_frames(_destinations(), _translations(), category_map=CATEGORY_MAP)
+
+
+def test_korean_uses_source_values_and_category_map_names(content):
+    assert content.lookup(1, 'ko') == {'title': '온천마을', 'description': '따뜻한 온천',
+                                       'category': '온천 / 사우나 / 스파'}
+    # 설명이 없으면 표준 테이블 기본 문구 대신 언어별 기본 문구
+    assert content.lookup(2, 'ko')['description'] == DEFAULT_DESCRIPTION['ko'] == SCHEMA_DEFAULTS['description']
+    # 매핑에 없는 테마는 기본 카테고리
+    assert content.lookup(4, 'ko')['category'] == DEFAULT_CATEGORY['ko']
+
+
+def test_non_korean_rows_are_linked_by_old_content_id_or_content_id(content):
+    assert content.lookup(1, 'en') == {'title': 'Hot Spring Village', 'description': 'Warm springs',
+                                       'category': THEME_NAMES['EX050100']['en']}
+    # 번역 설명이 비어 있으면 한국어 설명, 한국어 설명도 없으면 언어별 기본 문구
+    assert content.lookup(2, 'en') == {'title': 'Forest Trail', 'description': DEFAULT_DESCRIPTION['en'],
+                                       'category': THEME_NAMES['EX050200']['en']}
+    assert content.lookup(3, 'en') == {'title': '찜질방', 'description': '넓은 찜질방',
+                                       'category': THEME_NAMES['EX050200']['en']}
+    assert content.lookup(4, 'en')['category'] == DEFAULT_CATEGORY['en']
+    # 다른 언어의 번역 행은 섞이지 않음 (JPN 행 102는 한국어 관광지와 연결되지 않음)
+    assert content.lookup(1, 'ja')['title'] == '온천마을'
+    assert content.lookup(1, 'zh-CN')['title'] == '온천마을'
+    assert content.lookup(103) is None
+    assert content.lookup(101) is None
+
+
+def test_translation_without_korean_target_keeps_its_own_content_id():
+    content = LocalizedContent.from_frames(_destinations(), pd.DataFrame({
+        'contentId': [3], 'oldContentId': [77], 'langDivCd': ['JPN'], 'title': ['チムジルバン'],
+    }), category_map=CATEGORY_MAP)
+    assert content.lookup(3, 'ja')['title'] == 'チムジルバン'
+    assert content.lookup(3, 'ja')['description'] == '넓은 찜질방'
+
+
+def test_localize_records_and_unknown_locale(content):
+    records = [{'content_id': 1, 'title': '온천마을', 'score': 0.9}, {'content_id': 999, 'title': 'x'}]
+    localized = content.localize(records, 'en')
+    assert localized[0] == {'content_id': 1, 'title': 'Hot Spring Village', 'description': 'Warm springs',
+                            'category': THEME_NAMES['EX050100']['en'], 'score': 0.9}
+    assert localized[1] == records[1] and localized[1] is not records[1]
+    assert records[0]['title'] == '온천마을'
+    assert content.localize(records[:1], 'fr') == content.localize(records[:1], 'ko')
+
+
+def test_locale_helpers():
+    assert normalize_locale('en') == 'en'
+    assert normalize_locale(None) == 'ko'
+    assert list(locale_options()) == list(LOCALES)
+
+
+def test_theme_names_come_from_category_map():
+    korean = korean_theme_names(load_category_map())
+    assert korean['EX050100'] == '온천 / 사우나 / 스파'
+    for code, names in THEME_NAMES.items():
+        assert code in korean
+        # 코드에는 한국어가 아닌 이름만 둠
+        assert set(names) == set(LOCALES) - {'ko'}
+    assert korean_theme_names(None) == {}
+
+
+def test_incremental_rebuild_matches_full_build(content):
+    destinations = _destinations()
+    destinations.loc[destinations['content_id'] == 3, 'title'] = '새 찜질방'
+    changed = destinations[destinations['content_id'] != 4]
+    updated = LocalizedContent.from_frames(changed, _translations(), previous=content, changed_ids={3},
+                                           category_map=CATEGORY_MAP)
+    fresh = LocalizedContent.from_frames(changed, _translations(), category_map=CATEGORY_MAP)
+
+    assert updated._rows == fresh._rows
+    assert updated._tables == fresh._tables
+    assert updated.lookup(3, 'en')['title'] == '새 찜질방'
@@ -0,0 +1,44 @@
+# tests/test_parsing.py - region_data.csv 금액/이동 시간 문자열 파서
+
+import numpy as np
+import pandas as pd
+
+from wellness.parsing import add_price_columns, add_travel_columns, parse_krw_range, parse_travel_time
+
+
+def test_parse_krw_range():
+    low, high = parse_krw_range(['500,000-1,500,000원', '무료-50,000원', '20,000원', '무료', '문의', None])
+    np.testing.assert_array_equal(low[:4], [500000, 0, 20000, 0])
+    np.testing.assert_array_equal(high[:4], [1500000, 50000, 20000, 0])
+    assert np.isnan(low[4:]).all() and np.isnan(high[4:]).all()
+
+
+def test_add_price_columns():
+    df = pd.DataFrame({'price_range': ['15,000-40,000원', '문의']})
+    result = add_price_columns(df)
+    assert result['price_min'].tolist()[0] == 15000 and result['price_max'].tolist()[0] == 40000
+    assert result[['price_min', 'price_max']].iloc[1].isna().all()
+    assert 'price_min' not in df.columns
+    # price_range가 없으면 그대로
+    assert add_price_columns(pd.DataFrame({'title': ['a']})).columns.tolist() == ['title']
+
+
+def test_parse_travel_time():
+    modes, minutes = parse_travel_time(['항공 1시간 10분', '자차 4시간', '공항버스 50분', '정보 없음', None])
+    assert modes.tolist() == ['항공', '자차', '공항버스', '', '']
+    np.testing.assert_array_equal(minutes[:3], [70, 240, 50])
+    assert np.isnan(minutes[3:]).all()
+
+
+def test_add_travel_columns_takes_fastest_route():
+    df = pd.DataFrame({
+        'travel_time_primary': ['자차 2시간', '정보 없음', '정보 없음'],
+        'travel_time_secondary': ['KTX 1시간 30분', '버스 3시간', '정보 없음'],
+        'travel_cost_primary': ['10,000원', '무료', ''],
+    })
+    result = add_travel_columns(df)
+    np.testing.assert_array_equal(result['travel_minutes_fastest'].to_numpy()[:2], [90, 180])
+    assert np.isnan(result['travel_minutes_fastest'].iloc[2])
+    assert result['travel_cost_primary_min'].tolist()[:2] == [10000, 0]
+    # 원본은 그대로
+    assert 'travel_minutes_fastest' not in df.columns
@@ -0,0 +1,75 @@
+# tests/test_ranking.py - 상위 k개 선택, 혼합 가중치, 필터 정규화, 추천 레코드 변환
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wellness.ranking import (DEFAULT_RATING, apply_wellness_filters, build_place_record, cluster_weights,
+                              normalize_filter_values, top_k_positions)
+from wellness.schema import SCHEMA_DEFAULTS
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, None),
+    ('', None),
+    ('전체', None),
+    (['전체'], None),
+    ('EX050100', ['EX050100']),
+    ([{'code': 1}, {'code': '전체'}, 2], [1, 2]),
+    ({3}, [3]),
+])
+def test_normalize_filter_values(value, expected):
+    assert normalize_filter_values(value) == expected
+
+
+def test_build_place_record_fills_schema_defaults():
+    record = build_place_record({'content_id': 7, 'region_code': 3, 'latitude': 37, 'longitude': 127,
+                                 'distance_from_incheon': 10, 'rating': np.nan, 'title': None,
+                                 'score_cluster_1': 0.5}, 'score_cluster_1')
+    assert record['content_id'] == 7 and isinstance(record['content_id'], int)
+    assert record['title'] == SCHEMA_DEFAULTS['title']
+    assert record['rating'] == DEFAULT_RATING
+    assert record['score'] == 0.5
+
+
+def test_apply_wellness_filters_matches_nlargest():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'content_id': np.arange(30),
+        'wellness_theme': rng.choice(['A', 'B'], 30),
+        'region_code': rng.integers(1, 4, 30),
+        'latitude': 37.0, 'longitude': 127.0, 'distance_from_incheon': 5.0, 'rating': 4.5,
+        'score_cluster_0': rng.integers(0, 4, 30).astype(float),
+    })
+    records = apply_wellness_filters({'cluster': 0}, df, theme_filter=['A'], region_filter=[1, 2], limit=5)
+    subset = df[(df['wellness_theme'] == 'A') & df['region_code'].isin([1, 2])]
+    assert [r['content_id'] for r in records] == subset.nlargest(5, 'score_cluster_0')['content_id'].tolist()
+    assert apply_wellness_filters({'cluster': 0}, df, theme_filter=['없음']) == []
+    assert apply_wellness_filters({'cluster': 0}, pd.DataFrame()) == []
+
+
+def _stable_top(scores, k):
+    return np.argsort(-np.asarray(scores, dtype=float), kind='stable')[:k]
+
+
+@pytest.mark.parametrize('k', [0, 1, 5, 20, 50])
+def test_top_k_matches_stable_sort_with_ties(k):
+    rng = np.random.default_rng(k)
+    # 동점이 많도록 작은 정수 점수
+    scores = rng.integers(0, 5, size=(4, 20)).astype(float)
+    positions = top_k_positions(scores, k)
+    assert positions.shape == (4, min(k, 20))
+    for row, expected in zip(scores, positions):
+        np.testing.assert_array_equal(expected, _stable_top(row, k))
+    np.testing.assert_array_equal(top_k_positions(scores[0], k), _stable_top(scores[0], k))
+
+
+def test_cluster_weights_normalizes_and_falls_back():
+    np.testing.assert_allclose(cluster_weights({'cluster': 0, 'cluster_scores': {'cluster_0': 3, 'cluster_2': 1}}),
+                               [0.75, 0.0, 0.25])
+    # 음수는 0으로 자르고, 합이 0이면 소속 클러스터 하나에 가중치 1
+    np.testing.assert_allclose(cluster_weights({'cluster': 2, 'cluster_scores': [-1, 0, 0]}), [0, 0, 1])
+    np.testing.assert_allclose(cluster_weights({'cluster': 1}), [0, 1, 0])
+    np.testing.assert_allclose(cluster_weights(1), [0, 1, 0])
+    weights = cluster_weights({'cluster': np.array([0, 1]), 'cluster_scores': np.array([[1, 1, 2], [0, 0, 0]])})
+    np.testing.assert_allclose(weights, [[0.25, 0.25, 0.5], [0, 1, 0]])
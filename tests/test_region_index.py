@@ -0,0 +1,79 @@
+# tests/test_region_index.py - 가격/이동 시간 정렬 인덱스 검색과 전체 행 필터 비교
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wellness.parsing import add_price_columns, add_travel_columns
+from wellness.region_index import RegionIndex, SortedColumnIndex, budget_from_answers
+
+
+def _region_frame(n=80, seed=0):
+    rng = np.random.default_rng(seed)
+    prices = ['무료', '20,000원', '15,000-40,000원', '100,000-300,000원', '문의', '무료-50,000원']
+    times = ['자차 2시간', '항공 1시간 10분', 'KTX 3시간 30분', '버스 50분', '정보 없음']
+    df = pd.DataFrame({
+        'title': [f'관광지 {i}' for i in range(n)],
+        'price_range': rng.choice(prices, n),
+        'travel_time_primary': rng.choice(times, n),
+        'travel_time_secondary': rng.choice(times, n),
+    })
+    return add_travel_columns(add_price_columns(df))
+
+
+@pytest.fixture
+def index():
+    return RegionIndex(_region_frame())
+
+
+def _sorted_titles(df, column):
+    return df.sort_values(column, kind='stable')['title'].tolist()
+
+
+def test_sorted_column_index_skips_nan():
+    column = SortedColumnIndex([3.0, np.nan, 1.0, 3.0, 2.0])
+    assert column.at_most(2.5).tolist() == [2, 4]
+    assert column.between(2, 3).tolist() == [4, 0, 3]
+    assert column.between().tolist() == [2, 4, 0, 3]
+
+
+@pytest.mark.parametrize('budget', [0, 20000, 45000, 1000000])
+def test_within_budget_matches_full_scan(index, budget):
+    df = index.region_df
+    expected = df[df['price_min'] <= budget]
+    assert index.within_budget(budget)['title'].tolist() == _sorted_titles(expected, 'price_min')
+    expected = df[df['price_max'] <= budget]
+    assert index.within_budget(budget, fully=True)['title'].tolist() == _sorted_titles(expected, 'price_min')
+
+
+def test_price_between_matches_full_scan(index):
+    df = index.region_df
+    expected = df[df['price_min'].between(10000, 100000)]
+    assert index.price_between(10000, 100000)['title'].tolist() == _sorted_titles(expected, 'price_min')
+    # 가격 정보가 없는 행('문의')은 범위 제한이 없어도 제외
+    assert len(index.price_between()) == df['price_min'].notna().sum()
+
+
+@pytest.mark.parametrize('answer, budget', [(0, 150 * 1350), (2, 700 * 1350), (3, None), (None, None)])
+def test_budget_from_answers(answer, budget):
+    assert budget_from_answers({'q2': answer}) == budget
+
+
+@pytest.mark.parametrize('hours', [0.5, 1.2, 3, 10])
+def test_reachable_within_matches_full_scan(index, hours):
+    df = index.region_df
+    expected = df[df['travel_minutes_fastest'] <= hours * 60]
+    assert index.reachable_within(hours)['title'].tolist() == _sorted_titles(expected, 'travel_minutes_fastest')
+
+
+@pytest.mark.parametrize('mode', ['자차', '버스', '배'])
+def test_reachable_within_by_mode_matches_full_scan(index, mode):
+    df = index.region_df
+    minutes = np.fmin(df['travel_minutes_primary'].where(df['travel_mode_primary'] == mode),
+                      df['travel_minutes_secondary'].where(df['travel_mode_secondary'] == mode))
+    expected = df.assign(minutes=minutes)[minutes <= 150]
+    assert index.reachable_within(2.5, mode)['title'].tolist() == _sorted_titles(expected, 'minutes')
+
+
+def test_travel_modes(index):
+    assert index.travel_modes() == ['KTX', '버스', '자차', '항공']
@@ -0,0 +1,102 @@
+# tests/test_service.py - 추천 서비스 (기존 순위 함수와의 동등성, 캐시, 재생성)
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wellness.ranking import apply_wellness_filters
+from wellness.schema import conform_to_schema
+from wellness.service import RecommendationService
+
+
+def _destinations(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    return conform_to_schema(pd.DataFrame({
+        'content_id': np.arange(1000, 1000 + n),
+        'title': [f'관광지 {i}' for i in range(n)],
+        'wellness_theme': rng.choice(['EX050100', 'EX050200', 'EX050300'], n),
+        'region_code': rng.integers(1, 6, n),
+        'latitude': rng.uniform(33, 38, n),
+        'longitude': rng.uniform(126, 129, n),
+        # 동점이 생기도록 0.1 단위 점수
+        'score_cluster_0': rng.integers(0, 10, n) / 10,
+        'score_cluster_1': rng.integers(0, 10, n) / 10,
+        'score_cluster_2': rng.integers(0, 10, n) / 10,
+    }))
+
+
+@pytest.fixture
+def service():
+    return RecommendationService(_destinations())
+
+
+@pytest.mark.parametrize('cluster', [0, 1, 2])
+@pytest.mark.parametrize('theme, region', [(None, None), (['EX050100'], None), (None, [1, 2]),
+                                           ([{'code': 'EX050200'}], [{'code': 3}])])
+def test_recommend_matches_legacy_ranking(service, cluster, theme, region):
+    expected = apply_wellness_filters({'cluster': cluster}, service.wellness_df, theme, region, limit=7)
+    assert service.recommend({'cluster': cluster}, theme, region, limit=7) == expected
+
+
+def test_cache_returns_copies_and_evicts_oldest():
+    service = RecommendationService(_destinations(), cache_size=2)
+    first = service.recommend({'cluster': 0}, limit=3)
+    first[0]['title'] = '변경'
+    assert service.recommend({'cluster': 0}, limit=3)[0]['title'] != '변경'
+    service.recommend({'cluster': 1}, limit=3)
+    service.recommend({'cluster': 2}, limit=3)
+    assert len(service._cache) == 2
+    assert (0, None, None, 3, None, None, None) not in service._cache
+
+
+def test_iter_ranked_matches_recommend(service):
+    ranked = list(service.iter_ranked(2, theme_filter=['EX050300']))
+    assert ranked[:4] == service.recommend({'cluster': 2}, ['EX050300'], limit=4)
+    assert all(record['wellness_theme'] == 'EX050300' for record in ranked)
+
+
+def test_personalized_matches_brute_force(service):
+    cluster_result = {'cluster': 1, 'cluster_scores': {'cluster_0': 1, 'cluster_1': 2, 'cluster_2': 1}}
+    records = service.recommend(cluster_result, limit=10, scoring='personalized')
+    df = service.wellness_df
+    blended = df['score_cluster_0'] * 0.25 + df['score_cluster_1'] * 0.5 + df['score_cluster_2'] * 0.25
+    expected = np.argsort(-blended.to_numpy(), kind='stable')[:10]
+    assert [r['content_id'] for r in records] == df['content_id'].to_numpy()[expected].tolist()
+    np.testing.assert_allclose([r['score'] for r in records], blended.to_numpy()[expected])
+
+
+def test_invalid_scoring_is_rejected(service):
+    with pytest.raises(ValueError):
+        service.recommend({'cluster': 0}, scoring='unknown')
+
+
+def test_diversity_lambda_is_rounded_once_for_key(service):
+    first = service.recommend({'cluster': 0}, limit=5, diversity=0.501)
+    assert service.recommend({'cluster': 0}, limit=5, diversity=0.504) == first
+    assert len(service._cache) == 1
+    # λ=1이면 다양성 항이 없어 점수 순서 그대로
+    assert service.recommend({'cluster': 0}, limit=5, diversity=1.0) == service.recommend({'cluster': 0}, limit=5)
+
+
+def test_incremental_rebuild_matches_full_rebuild(service):
+    df = service.wellness_df.copy()
+    df.loc[3, 'title'] = '수정된 관광지'
+    df.loc[5, 'score_cluster_0'] = 0.95
+    changed = {int(df.loc[3, 'content_id']), int(df.loc[5, 'content_id'])}
+    df = df.drop(index=[7]).reset_index(drop=True)
+    incremental = RecommendationService(df, previous=service, changed_ids=changed)
+    full = RecommendationService(df)
+    assert incremental._records == full._records
+    for cluster in (0, 1, 2):
+        assert incremental.recommend({'cluster': cluster}, limit=20) == full.recommend({'cluster': cluster}, limit=20)
+    # 바뀌지 않은 관광지 레코드는 이전 서비스 객체를 그대로 재사용
+    assert incremental._records[1][0] is service._records[1][0]
+    assert incremental._records[1][3] is not service._records[1][3]
+
+
+def test_place_records_restores_order_and_scores(service):
+    ranked = service.recommend({'cluster': 2}, limit=2)
+    # 데이터셋에 없는 content_id(1)는 건너뜀
+    restored = service.place_records([ranked[1]['content_id'], 1, ranked[0]['content_id']], [0.3, 0.2, 0.1])
+    assert [r['content_id'] for r in restored] == [ranked[1]['content_id'], ranked[0]['content_id']]
+    assert [r['score'] for r in restored] == [0.3, 0.1]
@@ -0,0 +1,97 @@
+# tests/test_session.py - 세션 메모리 측정, 추천 목록 압축, 상한 초과 시 키 정리
+
+import pickle
+
+from wellness.session import (
+    CompactPlaces, EVICTABLE_KEYS, compact_session, deep_sizeof, enforce_session_budget,
+    is_place_records, session_usage,
+)
+
+
+def _records(n, text_length=200):
+    return [{'content_id': 1000 + i, 'title': f'관광지 {i}', 'description': '설명' * text_length,
+             'score': i / 10} for i in range(n)]
+
+
+def test_compact_places_keeps_ids_and_scores():
+    places = CompactPlaces.from_records([{'content_id': 7, 'score': 0.5}, {'content_id': '8'}])
+    assert list(places.content_ids) == [7, 8]
+    assert list(places.scores) == [0.5, 0.0]
+    assert len(places) == 2
+    assert places == CompactPlaces([7, 8], [0.5, 0.0])
+    assert places != CompactPlaces([7, 8], [0.5, 0.1])
+    assert pickle.loads(pickle.dumps(places)) == places
+
+
+def test_compact_places_resolve_uses_service():
+    class FakeService:
+        def place_records(self, content_ids, scores):
+            return [{'content_id': content_id, 'score': score} for content_id, score in zip(content_ids, scores)]
+
+    resolved = CompactPlaces([3, 4], [0.1, 0.2]).resolve(FakeService())
+    assert resolved == [{'content_id': 3, 'score': 0.1}, {'content_id': 4, 'score': 0.2}]
+
+
+def test_is_place_records():
+    assert is_place_records([{'content_id': 1}])
+    assert not is_place_records([])
+    assert not is_place_records([{'title': 'x'}])
+    assert not is_place_records(({'content_id': 1},))
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    text = 'x' * 10000
+    single = deep_sizeof([text])
+    assert deep_sizeof([text, text]) < single + 1000
+    assert deep_sizeof({'a': [text]}) > len(text)
+
+
+def test_session_usage_is_sorted_by_size():
+    usage = session_usage({'small': 1, 'large': 'x' * 5000, 'medium': 'x' * 500})
+    assert list(usage) == ['large', 'medium', 'small']
+
+
+def test_compact_session_replaces_record_lists_only():
+    state = {'recommended_places': _records(3), 'recommendation_results': [], 'username': 'kim'}
+    assert compact_session(state) == ['recommended_places']
+    assert state['recommended_places'] == CompactPlaces([1000, 1001, 1002], [0.0, 0.1, 0.2])
+    assert state['recommendation_results'] == []
+    assert state['username'] == 'kim'
+
+
+def test_enforce_session_budget_within_budget_keeps_everything():
+    state = {'recommended_places': _records(5), 'show_results': True}
+    report = enforce_session_budget(state)
+    assert report['compacted'] == ['recommended_places']
+    assert report['evicted'] == []
+    assert not report['over_budget']
+    assert report['total_bytes'] == sum(report['keys'].values()) <= report['budget_bytes']
+    assert set(state) == {'recommended_places', 'show_results'}
+
+
+def test_enforce_session_budget_evicts_in_order_until_under_budget():
+    state = {
+        'survey_answers': {'q1': 0},
+        'score_breakdown': 'x' * 3000,
+        'validation_errors': ['y' * 3000],
+        'show_results': True,
+    }
+    usage = session_usage(state)
+    budget = sum(usage.values()) - usage['score_breakdown'] + 1
+    report = enforce_session_budget(state, budget=budget)
+
+    assert report['evicted'] == ['score_breakdown']
+    assert set(state) == {'survey_answers', 'validation_errors', 'show_results'}
+    assert not report['over_budget']
+    assert report['total_bytes'] == sum(report['keys'].values())
+
+
+def test_enforce_session_budget_reports_over_budget_when_nothing_left_to_evict():
+    state = {'survey_answers': {'q1': 'x' * 5000}}
+    state.update({key: 'v' for key in EVICTABLE_KEYS})
+    report = enforce_session_budget(state, budget=100)
+
+    assert report['evicted'] == list(EVICTABLE_KEYS)
+    assert report['over_budget']
+    assert set(state) == {'survey_answers'}
+    assert report['keys'] == {'survey_answers': report['total_bytes']}
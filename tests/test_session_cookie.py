@@ -0,0 +1,87 @@
+# tests/test_session_cookie.py - 세션 토큰 쿠키 미들웨어와 공유 저장소 설정 검증
+
+import asyncio
+
+import pytest
+
+from wellness import session_store
+from wellness.session_cookie import SessionCookieMiddleware, request_cookie
+
+
+async def _page(scope, receive, send):
+    await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'text/html')]})
+    await send({'type': 'http.response.body', 'body': b'ok'})
+
+
+def _call(scope, secure=True):
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b''}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(SessionCookieMiddleware(_page, secure=secure)(scope, receive, send))
+    return messages
+
+
+def _request(headers, method='GET', secure=True):
+    scope = {'type': 'http', 'method': method, 'path': '/', 'headers': headers}
+    messages = _call(scope, secure)
+    return [value for name, value in messages[0]['headers'] if name == b'set-cookie']
+
+
+def test_page_request_without_cookie_gets_http_only_cookie():
+    cookies = _request([(b'accept', b'text/html,*/*')])
+    assert len(cookies) == 1
+    cookie = cookies[0].decode('latin-1')
+    assert 'HttpOnly' in cookie and 'Secure' in cookie and 'SameSite=Lax' in cookie
+    token = request_cookie({'headers': [(b'cookie', cookies[0].split(b';')[0])]})
+    assert session_store.verify_token(token) is not None
+
+
+def test_valid_cookie_is_kept_and_forged_cookie_is_replaced():
+    token = session_store.new_session_token()
+    assert _request([(b'accept', b'text/html'), (b'cookie', f'a=1; wellness_session={token}'.encode())]) == []
+    forged = token.split('.')[0] + '.forged'
+    assert len(_request([(b'accept', b'text/html'), (b'cookie', f'wellness_session={forged}'.encode())])) == 1
+
+
+def test_assets_and_insecure_option():
+    assert _request([(b'accept', b'application/json')]) == []
+    assert _request([(b'accept', b'text/html')], method='POST') == []
+    assert b'Secure' not in _request([(b'accept', b'text/html')], secure=False)[0]
+
+
+def test_shared_store_requires_secret(monkeypatch, tmp_path):
+    monkeypatch.delenv('WELLNESS_SESSION_SECRET', raising=False)
+    with pytest.raises(RuntimeError):
+        session_store.create_session_store(f'sqlite:{tmp_path / "sessions.db"}')
+    monkeypatch.setenv('WELLNESS_SESSION_SECRET', 'shared')
+    assert isinstance(session_store.create_session_store(f'sqlite:{tmp_path / "sessions.db"}'),
+                      session_store.SqliteSessionStore)
+
+
+def _rotate_request(code, token, monkeypatch, store):
+    monkeypatch.setattr(session_store, '_store', store)
+    scope = {'type': 'http', 'method': 'GET', 'path': session_store.ROTATE_PATH,
+             'query_string': f'code={code}'.encode(), 'headers': [(b'cookie', f'wellness_session={token}'.encode())]}
+    start, body = _call(scope)
+    cookies = [value for name, value in start['headers'] if name == b'set-cookie']
+    return start['status'], cookies
+
+
+def test_rotation_endpoint_issues_new_cookie_once(monkeypatch):
+    store = session_store.MemorySessionStore()
+    planted = session_store.new_session_token()
+    new_token, code = session_store.rotate_session(planted, store)
+
+    # 이전 토큰만 아는 다른 브라우저는 코드 없이 새 토큰을 얻을 수 없음
+    assert _rotate_request('wrong', planted, monkeypatch, store) == (403, [])
+    status, cookies = _rotate_request(code, planted, monkeypatch, store)
+    assert status == 204
+    assert request_cookie({'headers': [(b'cookie', cookies[0].split(b';')[0])]}) == new_token
+    assert b'HttpOnly' in cookies[0]
+    assert _rotate_request(code, planted, monkeypatch, store) == (403, [])
+
@@ -0,0 +1,130 @@
+# tests/test_session_store.py - 세션 토큰 서명과 세션 상태 직렬화/저장
+
+import numpy as np
+import pytest
+
+from wellness import session_store
+from wellness.session import CompactPlaces
+from wellness.session_store import (MemorySessionStore, SqliteSessionStore, create_session_store, decode_state,
+                                    delete_session, encode_state, load_session, new_session_token, redeem_rotation,
+                                    rotate_session, rotation_pending, save_session, sign_session_id, verify_token)
+
+SECRET = b'test-secret'
+
+
+def test_token_round_trip():
+    token = sign_session_id('abc123', SECRET)
+    assert verify_token(token, SECRET) == 'abc123'
+    assert verify_token(new_session_token(SECRET), SECRET) is not None
+    # 프로세스 서명 키로 만든 토큰은 기본 키로 검증됨
+    assert verify_token(new_session_token()) is not None
+
+
+@pytest.mark.parametrize('token', [
+    None, '', 'abc123', 'abc123.', 'abc.123.sig', 'abc124.{signature}', 'abc123.{signature}x', '세션.{signature}',
+])
+def test_tampered_or_malformed_tokens_are_rejected(token):
+    if token:
+        token = token.format(signature=sign_session_id('abc123', SECRET).split('.')[1])
+    assert verify_token(token, SECRET) is None
+
+
+def test_token_signed_with_other_secret_is_rejected():
+    assert verify_token(sign_session_id('abc123', b'other'), SECRET) is None
+
+
+def test_state_round_trip():
+    state = {
+        'logged_in': True,
+        'username': '사용자',
+        'answers': {'q1': 3, 'q2': np.int64(5)},
+        'cluster_result': {'cluster': 1, 'cluster_scores': {'cluster_0': 0.5}},
+        'recommended_places': CompactPlaces([101, 202], [0.9, 0.25]),
+        'widget_value': '저장하지 않음',
+    }
+    restored = decode_state(encode_state(state))
+    assert set(restored) == {'logged_in', 'username', 'answers', 'cluster_result', 'recommended_places'}
+    assert restored['answers'] == {'q1': 3, 'q2': 5}
+    assert restored['recommended_places'] == state['recommended_places']
+    assert restored['cluster_result'] == state['cluster_result']
+
+
+@pytest.mark.parametrize('payload', [None, b'', b'\x02' + encode_state({'username': 'x'})[1:], b'\x01garbage'])
+def test_unknown_or_corrupt_payload_decodes_to_empty_state(payload):
+    assert decode_state(payload) == {}
+
+
+@pytest.mark.parametrize('make_store', [lambda tmp_path: MemorySessionStore(),
+                                        lambda tmp_path: SqliteSessionStore(str(tmp_path / 'sessions.db'))])
+def test_save_load_delete(tmp_path, make_store):
+    store = make_store(tmp_path)
+    token = new_session_token()
+    digest = save_session(token, {'username': 'a', 'locale': 'en'}, store=store)
+    assert load_session(token, store) == {'username': 'a', 'locale': 'en'}
+
+    # 직렬화 결과가 같으면 다시 저장하지 않음
+    store.put(verify_token(token), encode_state({'username': 'b'}))
+    assert save_session(token, {'username': 'a', 'locale': 'en'}, digest, store) == digest
+    assert load_session(token, store) == {'username': 'b'}
+
+    delete_session(token, store)
+    assert load_session(token, store) == {}
+    # 서명이 맞지 않는 토큰은 저장/조회하지 않음
+    assert save_session(token + 'x', {'username': 'a'}, store=store) is None
+    assert load_session(token + 'x', store) == {}
+
+
+@pytest.mark.parametrize('make_store', [lambda tmp_path: MemorySessionStore(ttl=-1),
+                                        lambda tmp_path: SqliteSessionStore(str(tmp_path / 'sessions.db'), ttl=-1)])
+def test_expired_sessions_are_not_returned(tmp_path, make_store):
+    store = make_store(tmp_path)
+    store.put('expired', b'payload')
+    assert store.get('expired') is None
+
+
+def test_create_session_store(tmp_path, monkeypatch):
+    monkeypatch.delenv('WELLNESS_SESSION_SECRET', raising=False)
+    assert isinstance(create_session_store('memory'), MemorySessionStore)
+    with pytest.raises(RuntimeError):
+        create_session_store(f'sqlite:{tmp_path / "sessions.db"}')
+    with pytest.raises(ValueError):
+        create_session_store('redis://localhost')
+    monkeypatch.setenv('WELLNESS_SESSION_SECRET', 'shared')
+    assert isinstance(create_session_store(f'sqlite:{tmp_path / "sessions.db"}'), SqliteSessionStore)
+
+
+@pytest.mark.parametrize('make_store', [lambda tmp_path: MemorySessionStore(),
+                                        lambda tmp_path: SqliteSessionStore(str(tmp_path / 'sessions.db'))])
+def test_rotation_replaces_planted_token(tmp_path, make_store):
+    store = make_store(tmp_path)
+    planted = new_session_token()
+    save_session(planted, {'username': 'victim', 'logged_in': True}, store=store)
+
+    new_token, code = rotate_session(planted, store)
+    assert verify_token(new_token) not in (None, verify_token(planted))
+    # 이전 토큰으로는 로그인한 세션을 복원할 수 없음
+    assert load_session(planted, store) == {}
+    assert rotation_pending(code, store)
+
+    # 코드를 만든 세션의 쿠키가 아니면 거절하고 코드는 소모하지 않음
+    assert redeem_rotation(code, new_session_token(), store) is None
+    assert redeem_rotation('guess', planted, store) is None
+    assert redeem_rotation(code, planted, store) == new_token
+    assert not rotation_pending(code, store)
+    assert redeem_rotation(code, planted, store) is None
+
+
+def test_rotation_code_expires(monkeypatch):
+    store = MemorySessionStore()
+    monkeypatch.setattr(session_store, 'ROTATION_TTL_SECONDS', -1)
+    token = new_session_token()
+    _, code = rotate_session(token, store)
+    assert not rotation_pending(code, store)
+    assert redeem_rotation(code, token, store) is None
+
+
+def test_rotation_requires_valid_token():
+    store = MemorySessionStore()
+    assert rotate_session(None, store) is None
+    assert rotate_session('forged.token', store) is None
+
@@ -0,0 +1,101 @@
+# tests/test_similarity.py - 유사 관광지 인덱스 (전체 계산, 증분 갱신, 근사 검색)
+
+import numpy as np
+import pytest
+
+from wellness.similarity import SimilarityIndex, weight_vectors
+from wellness.sparse import CsrMatrix
+
+
+def _counts(n=120, columns=15, seed=0):
+    """관광지별 소분류 개수 (동점이 나오지 않도록 연속값, 약 70%는 0)"""
+    rng = np.random.default_rng(seed)
+    dense = rng.uniform(1, 4, (n, columns)) * (rng.random((n, columns)) < 0.3)
+    return dense
+
+
+def _brute_force(content_ids, vectors, k):
+    """전체 유사도 행렬을 만들어 구한 관광지별 [(content_id, 유사도), ...]"""
+    scores = vectors @ vectors.T
+    np.fill_diagonal(scores, -np.inf)
+    results = {}
+    for row, content_id in enumerate(content_ids):
+        order = np.lexsort((np.arange(len(scores)), -scores[row]))[:k]
+        results[content_id] = [(content_ids[i], scores[row, i]) for i in order if scores[row, i] > 0]
+    return results
+
+
+def _assert_matches(index, expected, k):
+    for content_id, neighbours in expected.items():
+        found = index.similar(content_id, k)
+        assert [c for c, _ in found] == [c for c, _ in neighbours], content_id
+        np.testing.assert_allclose([s for _, s in found], [s for _, s in neighbours], rtol=1e-5)
+
+
+@pytest.mark.parametrize('weighting', ['tfidf', 'l2'])
+def test_full_build_matches_brute_force(weighting):
+    dense = _counts()
+    dense[5] = 0  # 소분류가 없는 관광지
+    content_ids = list(range(100, 100 + len(dense)))
+    index = SimilarityIndex(content_ids, CsrMatrix.from_dense(dense), k=8, weighting=weighting)
+    vectors = weight_vectors(CsrMatrix.from_dense(dense), weighting).to_dense()
+    _assert_matches(index, _brute_force(content_ids, vectors, 8), 8)
+    assert index.similar(105) == []
+    assert index.similar(1) == []
+
+
+def _changed(dense, content_ids):
+    """행 두 개 삭제, 세 행 수정, 두 행 추가"""
+    new = np.delete(dense, [2, 40], axis=0)
+    new_ids = [c for i, c in enumerate(content_ids) if i not in (2, 40)]
+    replacements = _counts(5, dense.shape[1], seed=1)
+    new[[0, 17, 60]] = replacements[:3]
+    return np.vstack([new, replacements[3:]]), new_ids + [900, 901]
+
+
+@pytest.mark.parametrize('weighting', ['tfidf', 'l2'])
+def test_incremental_update_matches_rebuild(weighting):
+    dense = _counts()
+    content_ids = list(range(100, 100 + len(dense)))
+    previous = SimilarityIndex(content_ids, CsrMatrix.from_dense(dense), k=8, weighting=weighting)
+    new_dense, new_ids = _changed(dense, content_ids)
+    updated = SimilarityIndex(new_ids, CsrMatrix.from_dense(new_dense), k=8, weighting=weighting,
+                              previous=previous)
+    # 증분 갱신은 이전 IDF를 유지하므로 같은 IDF로 만든 전체 유사도와 비교
+    assert updated.idf is previous.idf
+    vectors = weight_vectors(CsrMatrix.from_dense(new_dense), weighting, previous.idf).to_dense()
+    _assert_matches(updated, _brute_force(new_ids, vectors, 8), 8)
+    if weighting == 'l2':
+        rebuilt = SimilarityIndex(new_ids, CsrMatrix.from_dense(new_dense), k=8, weighting=weighting)
+        np.testing.assert_array_equal(updated.neighbours, rebuilt.neighbours)
+        np.testing.assert_allclose(updated.scores, rebuilt.scores)
+
+
+def test_incompatible_previous_is_rebuilt():
+    dense = _counts()
+    content_ids = list(range(len(dense)))
+    previous = SimilarityIndex(content_ids, CsrMatrix.from_dense(dense), k=5)
+    index = SimilarityIndex(content_ids, CsrMatrix.from_dense(dense), k=8, previous=previous)
+    assert index.idf is not previous.idf
+    assert index.neighbours.shape == (len(dense), 8)
+
+
+def test_ann_path_with_full_probe_matches_exact():
+    dense = _counts()
+    content_ids = list(range(len(dense)))
+    ann = {'method': 'ivf', 'n_lists': 4, 'n_probe': 4}
+    index = SimilarityIndex(content_ids, CsrMatrix.from_dense(dense), k=6, weighting='l2', exact_limit=0, ann=ann)
+    assert index._ann is not None
+    vectors = weight_vectors(CsrMatrix.from_dense(dense), 'l2').to_dense()
+    _assert_matches(index, _brute_force(content_ids, vectors, 6), 6)
+
+    new_dense, new_ids = _changed(dense, content_ids)
+    updated = SimilarityIndex(new_ids, CsrMatrix.from_dense(new_dense), k=6, weighting='l2', previous=index,
+                              exact_limit=0, ann=ann)
+    vectors = weight_vectors(CsrMatrix.from_dense(new_dense), 'l2').to_dense()
+    _assert_matches(updated, _brute_force(new_ids, vectors, 6), 6)
+
+
+def test_unknown_weighting_is_rejected():
+    with pytest.raises(ValueError):
+        weight_vectors(CsrMatrix.from_dense(_counts(4)), 'bm25')
@@ -0,0 +1,40 @@
+# tests/test_sparse.py - CSR 희소 행렬 연산 (밀집 계산과 비교)
+
+import numpy as np
+
+from wellness.sparse import CsrMatrix
+
+
+def _dense(seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.poisson(0.5, (12, 7))
+
+
+def test_from_coo_sums_duplicates_and_drops_zeros():
+    matrix = CsrMatrix.from_coo([2, 0, 2, 1, 0], [1, 3, 1, 0, 2], [1, 4, 2, 0, 5], (3, 4))
+    np.testing.assert_array_equal(matrix.to_dense(), [[0, 0, 5, 4], [0, 0, 0, 0], [0, 3, 0, 0]])
+    assert matrix.nnz == 3
+    assert CsrMatrix.from_coo([], [], np.array([], dtype=np.int64), (2, 3)).to_dense().tolist() == [[0] * 3] * 2
+
+
+def test_operations_match_dense():
+    dense = _dense()
+    matrix = CsrMatrix.from_dense(dense)
+    vector = np.arange(7, dtype=float)
+    np.testing.assert_array_equal(matrix.to_dense(), dense)
+    np.testing.assert_array_equal(matrix.column(3), dense[:, 3])
+    np.testing.assert_allclose(matrix.dot(vector), dense @ vector)
+    np.testing.assert_allclose(matrix.matmul_dense(np.eye(7)[:, :3], block_rows=5), dense[:, :3])
+    np.testing.assert_array_equal(matrix.column_sums(), dense.sum(axis=0))
+    np.testing.assert_array_equal(matrix.row_sums(), dense.sum(axis=1))
+    np.testing.assert_allclose(matrix.row_norms(), np.linalg.norm(dense, axis=1))
+    np.testing.assert_array_equal(matrix.take_rows([5, 0, 5]).to_dense(), dense[[5, 0, 5]])
+    np.testing.assert_array_equal(matrix.row_block(3, 8).to_dense(), dense[3:8])
+
+
+def test_group_columns_matches_dense():
+    dense = _dense(1)
+    groups = np.array([0, 2, 0, 1, 1, 2, 0])
+    grouped = CsrMatrix.from_dense(dense).group_columns(groups, 3)
+    expected = np.stack([dense[:, groups == g].sum(axis=1) for g in range(3)], axis=1)
+    np.testing.assert_array_equal(grouped.to_dense(), expected)
@@ -0,0 +1,67 @@
+# tests/test_stats.py - 통계 큐브 rollup과 원본 groupby 결과 비교
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from wellness.stats import StatisticsCube, distance_buckets, price_buckets, rating_buckets
+
+
+def _frame(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    price = rng.choice([0, 15000, 50000, 200000, np.nan], n)
+    return pd.DataFrame({
+        'type': rng.choice(['관광지', '숙박'], n),
+        'cluster': rng.integers(0, 3, n),
+        'region_code': rng.integers(1, 5, n),
+        'wellness_theme': rng.choice(['EX050100', 'EX050200'], n),
+        'distance_from_incheon': rng.uniform(0, 500, n),
+        'price_min': price,
+        'rating': np.round(rng.uniform(1, 5, n), 1),
+    })
+
+
+def test_buckets():
+    assert distance_buckets([0, 50, 50.1, 450]).tolist() == [
+        "수도권 (50km 이내)", "수도권 (50km 이내)", "근거리 (50-200km)", "원거리 (400km 이상)"]
+    assert price_buckets([0, 30000, np.nan]).tolist() == ["무료", "저렴 (3만원 이하)", "기타"]
+    assert rating_buckets([4.49, 4.5, 1.0]).tolist() == [4.0, 4.5, 1.0]
+
+
+@pytest.mark.parametrize('dimensions, columns', [
+    (('region',), ['region_code']),
+    (('cluster', 'theme'), ['cluster', 'wellness_theme']),
+    (('type', 'region', 'cluster'), ['type', 'region_code', 'cluster']),
+])
+def test_rollup_matches_groupby(dimensions, columns):
+    df = _frame()
+    rollup = StatisticsCube.from_frame(df).rollup(dimensions)
+    grouped = df.groupby(columns, sort=True)
+    expected = grouped.agg(count=('rating', 'size'), rating_mean=('rating', 'mean'), rating_std=('rating', 'std'),
+                           rating_min=('rating', 'min'), rating_max=('rating', 'max'),
+                           distance_mean=('distance_from_incheon', 'mean'))
+    np.testing.assert_array_equal(rollup['count'].to_numpy(), expected['count'].to_numpy())
+    np.testing.assert_allclose(rollup['rating_mean'], expected['rating_mean'])
+    np.testing.assert_allclose(rollup['rating_std'], expected['rating_std'], equal_nan=True)
+    np.testing.assert_allclose(rollup['rating_min'], expected['rating_min'])
+    np.testing.assert_allclose(rollup['rating_max'], expected['rating_max'])
+    np.testing.assert_allclose(rollup['distance_from_incheon_mean'], expected['distance_mean'])
+
+
+def test_totals_and_missing_dimensions():
+    df = _frame().drop(columns=['type', 'wellness_theme'])
+    cube = StatisticsCube.from_frame(df)
+    totals = cube.totals()
+    assert totals['count'] == len(df)
+    assert totals['rating_mean'] == pytest.approx(df['rating'].mean())
+    assert totals['rating_std'] == pytest.approx(df['rating'].std())
+    # 원본에 없는 차원은 값 하나('전체')
+    assert cube.distinct_count('type') == 1
+    assert cube.distinct_count('price_bucket') == 5
+    # 같은 차원 조합은 메모된 결과를 재사용
+    assert cube.rollup(('region',)) is cube.rollup(('region',))
+
+
+def test_single_row_group_has_no_std():
+    df = _frame(1)
+    assert np.isnan(StatisticsCube.from_frame(df).totals()['rating_std'])
@@ -0,0 +1,87 @@
+# tests/test_styles.py - CSS 압축과 버전 붙은 스타일시트 생성/기록
+
+import os
+
+import pytest
+
+from wellness import styles
+from wellness.styles import Stylesheet, minify_css, publish_stylesheet
+
+
+@pytest.mark.parametrize('css, expected', [
+    ('a  {\n  color : red ;\n}\n', 'a{color :red}'),
+    ('/* 주석 */ .card  >  .title , .x { margin: 0  auto; }', '.card>.title,.x{margin:0 auto}'),
+    ('.a .b { padding: 1px 2px; }', '.a .b{padding:1px 2px}'),
+    ('a::after { content: "a  :  b ; }"; }', 'a::after{content:"a  :  b ; }"}'),
+    ("b { background: url('/*x*/'); } /* '끝' */", "b{background:url('/*x*/')}"),
+    ('p { content: "say \\"hi  there\\""; }', 'p{content:"say \\"hi  there\\""}'),
+    ('', ''),
+])
+def test_minify_css(css, expected):
+    assert minify_css(css) == expected
+
+
+@pytest.fixture
+def styles_dir(tmp_path, monkeypatch):
+    directory = tmp_path / 'styles'
+    directory.mkdir()
+    (directory / 'global.css').write_text('body { margin: 0; }\n', encoding='utf-8')
+    (directory / 'home.css').write_text('.hero  { color: green; }\n', encoding='utf-8')
+    monkeypatch.setattr(styles, 'STYLES_DIR', str(directory))
+    monkeypatch.setattr(styles, '_stylesheets', {})
+    return directory
+
+
+def test_build_stylesheet_concatenates_global_and_page(styles_dir):
+    stylesheet = styles.build_stylesheet('home')
+    assert stylesheet.css == 'body{margin:0}.hero{color:green}'
+    assert stylesheet.filename == f'wellness-home.{stylesheet.version}.css'
+    assert stylesheet.url == f'app/static/css/{stylesheet.filename}'
+    assert styles.build_stylesheet().name == 'global'
+    assert styles.build_stylesheet().css == 'body{margin:0}'
+
+
+def test_version_depends_only_on_content():
+    assert Stylesheet('a', 'x{}').version == Stylesheet('b', 'x{}').version
+    assert Stylesheet('a', 'x{}').version != Stylesheet('a', 'y{}').version
+
+
+def test_get_stylesheet_is_rebuilt_only_when_sources_change(styles_dir):
+    first = styles.get_stylesheet('home')
+    assert styles.get_stylesheet('home') is first
+
+    path = styles_dir / 'home.css'
+    path.write_text('.hero { color: blue; }\n', encoding='utf-8')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    second = styles.get_stylesheet('home')
+    assert second is not first
+    assert second.css == 'body{margin:0}.hero{color:blue}'
+    assert second.version != first.version
+
+
+def test_publish_stylesheet_writes_once(tmp_path):
+    directory = tmp_path / 'static' / 'css'
+    stylesheet = Stylesheet('home', 'a{b:c}')
+    path = publish_stylesheet(stylesheet, str(directory))
+
+    assert path == str(directory / stylesheet.filename)
+    assert open(path, encoding='utf-8').read() == 'a{b:c}'
+    assert os.listdir(directory) == [stylesheet.filename]
+    assert stylesheet.published
+
+    # 이미 기록한 스타일시트는 파일을 다시 확인하지 않음
+    os.remove(path)
+    assert publish_stylesheet(stylesheet, str(directory)) == path
+    assert not os.path.exists(path)
+
+
+def test_publish_stylesheet_keeps_existing_file_with_same_hash(tmp_path):
+    stylesheet = Stylesheet('home', 'a{b:c}')
+    path = tmp_path / stylesheet.filename
+    path.write_text('written by another process', encoding='utf-8')
+
+    assert publish_stylesheet(Stylesheet('home', 'a{b:c}'), str(tmp_path)) == str(path)
+    assert path.read_text(encoding='utf-8') == 'written by another process'
+    assert os.listdir(tmp_path) == [stylesheet.filename]
@@ -0,0 +1,124 @@
+# tests/test_templates.py - HTML 템플릿 (이스케이프, 형식 지정, 카드/팝업 조각, 조각 캐시)
+
+import pytest
+
+from wellness import templates
+from wellness.templates import FragmentCache, HtmlTemplate, Markup, escape
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('<b>"A&B"</b>', '&lt;b&gt;&quot;A&amp;B&quot;&lt;/b&gt;'),
+    ("it's", 'it&#x27;s'),
+    (None, ''),
+    (3.5, '3.5'),
+    (Markup('<i>ok</i>'), '<i>ok</i>'),
+])
+def test_escape(value, expected):
+    result = escape(value)
+    assert isinstance(result, Markup)
+    assert result == expected
+
+
+def test_render_escapes_values_but_not_markup():
+    template = HtmlTemplate('<p>{text}</p>{html}')
+    result = template.render(text='<script>', html=Markup('<br>'))
+    assert result == '<p>&lt;script&gt;</p><br>'
+    # 렌더링 결과를 다른 템플릿에 넣어도 두 번 이스케이프되지 않음
+    assert HtmlTemplate('<div>{inner}</div>').render(inner=result) == '<div><p>&lt;script&gt;</p><br></div>'
+
+
+def test_render_applies_format_spec_before_escaping():
+    template = HtmlTemplate('{value:.1f}% {label:>3}')
+    assert template.render(value=12.345, label='<') == '12.3%   &lt;'
+
+
+def test_conversion_is_rejected():
+    with pytest.raises(ValueError):
+        HtmlTemplate('{value!r}')
+
+
+def test_missing_field_raises():
+    with pytest.raises(KeyError):
+        HtmlTemplate('{a}{b}').render(a=1)
+
+
+def test_render_many():
+    template = HtmlTemplate('<li>{name}</li>')
+    assert template.render_many([{'name': 'a'}, {'name': '<b>'}]) == '<li>a</li><li>&lt;b&gt;</li>'
+    assert template.render_many([]) == ''
+
+
+def test_card_body_escapes_place_fields_and_omits_empty_sections():
+    place = {'title': '<온천>', 'description': 'A & B'}
+    body = templates.render_card_body(place, '서울 "중구"', [])
+    assert '<h3>&lt;온천&gt;</h3>' in body
+    assert 'A &amp; B' in body
+    assert '서울 &quot;중구&quot;' in body
+    assert 'place-category' not in body
+    assert 'nearby-spots' not in body
+
+
+def test_card_body_with_category_and_nearby_spots():
+    place = {'title': '온천', 'category': '스파'}
+    body = templates.render_card_body(place, '주소', [{'name': '<카페>', 'category1': '음식'}])
+    assert '<p class="place-category">스파</p>' in body
+    assert '설명 정보가 없습니다.' in body
+    assert '<span class="nearby-spot-name">&lt;카페&gt;</span>' in body
+    assert '<span class="nearby-spot-category">음식</span>' in body
+
+
+def test_card_and_similar_list():
+    similar = templates.render_similar_list([{'title': '숲', 'similarity': 0.876}])
+    assert '<li><strong>숲</strong> · 유사도 88%</li>' in similar
+    assert templates.render_similar_list([]) == ''
+
+    card = templates.render_card(3, Markup('<h3>x</h3>'), similar)
+    assert card.startswith('<div class="recommendation-card"><div class="ranking-badge">#3</div><h3>x</h3>')
+    assert card.endswith('</details></div>')
+
+
+def test_map_popup_truncates_description():
+    long_text = '가' * (templates.POPUP_DESCRIPTION_CHARS + 10)
+    body = templates.render_map_popup_body({'description': long_text}, [])
+    assert '가' * templates.POPUP_DESCRIPTION_CHARS + '...' in body
+    assert '가' * (templates.POPUP_DESCRIPTION_CHARS + 1) not in body
+    assert '주변 관광지' not in body
+
+    popup = templates.render_map_popup(1, {'title': '<숲>'}, body)
+    assert '#1 &lt;숲&gt;' in popup
+    assert body in popup
+
+
+def test_nearby_marker_popup():
+    popup = templates.render_nearby_marker_popup('카페 & 빵', '음식', '온천')
+    assert '<h5 style="color: #689F38; margin-bottom: 8px;">카페 &amp; 빵</h5>' in popup
+    assert '<strong>주변 관광지:</strong> 온천' in popup
+
+
+def test_fragment_cache_reuses_fragments_per_version():
+    cache = FragmentCache()
+    builds = []
+
+    def build(text):
+        return lambda: builds.append(text) or Markup(text)
+
+    assert cache.get('card', 1, 'v1', build('a')) == 'a'
+    assert cache.get('card', 1, 'v1', build('b')) == 'a'
+    assert cache.get('card', 1, 'v2', build('c')) == 'c'
+    assert cache.get('popup', 1, 'v1', build('d')) == 'd'
+    assert builds == ['a', 'c', 'd']
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_fragment_cache_evicts_least_recently_used():
+    cache = FragmentCache(maxsize=2)
+    cache.get('card', 1, None, lambda: 'one')
+    cache.get('card', 2, None, lambda: 'two')
+    cache.get('card', 1, None, lambda: 'unused')
+    cache.get('card', 3, None, lambda: 'three')
+
+    assert cache.get('card', 1, None, lambda: 'rebuilt') == 'one'
+    assert cache.get('card', 2, None, lambda: 'rebuilt') == 'rebuilt'
+
+    cache.clear()
+    assert cache.get('card', 1, None, lambda: 'fresh') == 'fresh'
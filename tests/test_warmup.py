@@ -0,0 +1,122 @@
+# tests/test_warmup.py - 워밍업 단계 실행, 필수 단계 재시도, 준비 상태 엔드포인트
+
+import pytest
+
+from wellness import api, warmup
+
+
+class Flaky:
+    """처음 failures번은 실패하고 그 뒤로는 성공하는 단계"""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise OSError(f"attempt {self.calls} failed")
+
+
+def _state(**kwargs):
+    return warmup.WarmupState(**dict({'retry_backoff': 0}, **kwargs))
+
+
+def test_steps_run_in_order_and_report_ready():
+    calls = []
+    state = _state()
+    state.register('a', lambda: calls.append('a'))
+    state.register('b', lambda: calls.append('b'))
+    assert state.run()
+    assert calls == ['a', 'b']
+    assert state.is_ready()
+    report = state.report()
+    assert report['ready']
+    assert {name: step['status'] for name, step in report['steps'].items()} == {'a': 'done', 'b': 'done'}
+
+
+def test_failed_required_step_is_retried_with_backoff(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(warmup.time, 'sleep', sleeps.append)
+    step = Flaky(failures=2)
+    state = _state(max_attempts=3, retry_backoff=0.5)
+    state.register('datasets', step)
+
+    assert state.run()
+    assert step.calls == 3
+    assert sleeps == [0.5, 1.0]
+    assert state.report()['steps']['datasets'] == {'status': 'done', 'elapsed_ms': pytest.approx(0, abs=50),
+                                                   'required': True, 'attempts': 3}
+
+
+def test_optional_step_is_not_retried_and_does_not_block_ready():
+    step = Flaky(failures=1)
+    state = _state()
+    state.register('charts', step, required=False)
+    assert state.run()
+    assert step.calls == 1
+    assert state.report()['steps']['charts']['error'] == 'attempt 1 failed'
+
+
+def test_start_reruns_only_unfinished_steps_after_failure():
+    done = Flaky(failures=0)
+    flaky = Flaky(failures=2)
+    state = _state(max_attempts=2)
+    state.register('datasets', done)
+    state.register('ranking', flaky)
+
+    state.start()
+    state._thread.join(5)
+    assert not state.is_ready()
+    assert state.status['ranking'] == 'failed'
+
+    state.start()
+    assert state.wait(5)
+    assert (done.calls, flaky.calls) == (1, 3)
+    assert 'error' not in state.report()['steps']['ranking']
+
+
+def test_start_does_not_rerun_when_ready():
+    step = Flaky(failures=0)
+    state = _state()
+    state.register('datasets', step)
+    state.start()
+    assert state.wait(5)
+    state.start()
+    state._thread.join(5)
+    assert step.calls == 1
+
+
+def test_register_replaces_step_with_same_name():
+    state = _state()
+    state.register('a', lambda: None)
+    state.register('a', lambda: None, required=False)
+    assert state.steps == ['a']
+    assert state.report()['steps']['a']['required'] is False
+
+
+def test_readiness_response(monkeypatch):
+    state = _state()
+    state.register('datasets', Flaky(failures=0))
+    monkeypatch.setattr(warmup, '_state', state)
+
+    assert warmup._readiness_response('/ready')[0] == 503
+    assert warmup._readiness_response('/health')[0] == 200
+    assert warmup._readiness_response('/nope')[0] == 404
+    state.run()
+    assert warmup._readiness_response('/ready/?probe=1')[0] == 200
+
+
+def test_api_ready_probe_restarts_failed_warmup(monkeypatch):
+    step = Flaky(failures=1)
+    state = _state(max_attempts=1)
+    state.register('datasets', step)
+    monkeypatch.setattr(warmup, '_state', state)
+    state.start()
+    state._thread.join(5)
+
+    status, report = api.handle_request('GET', '/ready', b'')
+    assert status == 503 and not report['ready']
+    assert state.wait(5)
+    assert api.handle_request('GET', '/ready', b'')[0] == 200
+    assert step.calls == 2
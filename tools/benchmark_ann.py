@@ -0,0 +1,144 @@
+# tools/benchmark_ann.py - 유사 관광지 ANN 인덱스 재현율/지연 시간 측정
+#
+# 사용법: python tools/benchmark_ann.py [--rows 50000] [--queries 200] [--k 10]
+# category_counts의 실제 관광지 벡터를 기반으로 --rows개까지 개수를 흔든 합성 관광지를 만들어
+# 전국 단위 규모를 흉내 내고, 정확한 전수 비교 결과 대비 설정별 recall@k와 질의 지연을 출력합니다.
+# --min-recall을 주면 어느 설정도 그 재현율에 못 미칠 때 종료 코드 1을 반환합니다.
+# --switchover는 EXACT_SEARCH_LIMIT 행에서 SimilarityIndex 전체 생성(전수 비교 대 ANN)과
+# 일부 행 증분 갱신의 시간/최대 메모리/이웃 재현율을 비교해 전환 기준이 맞는지 확인합니다.
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from wellness.ann import build_ann_index, exact_search, recall_at_k
+from wellness.categories import get_category_index
+from wellness.similarity import DEFAULT_NEIGHBOURS, EXACT_SEARCH_LIMIT, SimilarityIndex, weight_vectors
+from wellness.sparse import CsrMatrix
+
+# 측정할 설정: (이름, build_ann_index 인자, search 인자)
+BENCHMARK_CONFIGS = [
+    ('ivf n_probe=1', {'method': 'ivf'}, {'n_probe': 1}),
+    ('ivf n_probe=4', {'method': 'ivf'}, {'n_probe': 4}),
+    ('ivf n_probe=8', {'method': 'ivf'}, {'n_probe': 8}),
+    ('ivf n_probe=16', {'method': 'ivf'}, {'n_probe': 16}),
+    ('lsh 8x12 probe=0', {'method': 'lsh', 'n_tables': 8, 'n_bits': 12}, {'n_probe': 0}),
+    ('lsh 8x12 probe=2', {'method': 'lsh', 'n_tables': 8, 'n_bits': 12}, {'n_probe': 2}),
+    ('lsh 16x10 probe=2', {'method': 'lsh', 'n_tables': 16, 'n_bits': 10}, {'n_probe': 2}),
+]
+
+def synthetic_counts(counts, rows, seed=0):
+    """실제 관광지 두 곳의 개수를 무작위 비율로 섞고 포아송 잡음을 더한 rows행 CSR 행렬"""
+    rng = np.random.default_rng(seed)
+    dense = counts.to_dense().astype(float)
+    mix = rng.uniform(0, 1, (rows, 1))
+    base = mix * dense[rng.integers(0, len(dense), rows)] + (1 - mix) * dense[rng.integers(0, len(dense), rows)]
+    return CsrMatrix.from_dense(rng.poisson(base * rng.uniform(0.2, 1.0, (rows, 1))))
+
+def run_benchmark(vectors, queries, k, configs, seed=0):
+    """설정별 (이름, 생성 시간 s, 질의당 지연 ms, recall@k) 리스트"""
+    exact, _ = exact_search(vectors, queries, k)
+    # 요청 하나에 질의 하나인 서비스 상황과 맞추기 위해 지연 시간은 질의별로 측정
+    start = time.perf_counter()
+    for query in queries:
+        exact_search(vectors, query, k)
+    exact_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    results = [('exact', 0.0, exact_ms, 1.0)]
+    for name, build_params, search_params in configs:
+        params = dict(build_params)
+        start = time.perf_counter()
+        index = build_ann_index(vectors, params.pop('method'), seed=seed, **params)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found, _ = index.search(queries, k, **search_params)
+        latency_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        results.append((name, build_s, latency_ms, recall_at_k(found, exact)))
+    return results
+
+def _measure(build):
+    """build() 실행 시간(s)과 최대 추가 메모리(MB), 결과"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+def _changed_counts(counts, fraction, seed=0):
+    """행의 fraction 비율만 개수를 새로 뽑은 CSR 행렬 (증분 갱신 측정용)"""
+    rng = np.random.default_rng(seed)
+    dense = counts.to_dense().copy()
+    rows = rng.choice(len(dense), max(1, int(len(dense) * fraction)), replace=False)
+    dense[rows] = rng.permutation(dense[rows].ravel()).reshape(len(rows), -1)
+    return CsrMatrix.from_dense(dense)
+
+def run_switchover(counts, changed_fraction=0.01, seed=0):
+    """전환 기준 행 수에서 (이름, 시간 s, 최대 메모리 MB, 이웃 재현율 또는 None) 리스트"""
+    content_ids = np.arange(counts.shape[0])
+    exact_s, exact_mb, exact = _measure(lambda: SimilarityIndex(content_ids, counts, exact_limit=len(content_ids)))
+    ann_s, ann_mb, ann = _measure(lambda: SimilarityIndex(content_ids, counts, exact_limit=0))
+
+    updated = _changed_counts(counts, changed_fraction, seed)
+    update_s, update_mb, _ = _measure(lambda: SimilarityIndex(content_ids, updated, previous=ann, exact_limit=0))
+    return [
+        ('exact build', exact_s, exact_mb, 1.0),
+        ('ann build', ann_s, ann_mb, recall_at_k(ann.neighbours, exact.neighbours)),
+        (f'ann update {changed_fraction:.0%}', update_s, update_mb, None),
+    ]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="유사 관광지 ANN 인덱스 재현율/지연 시간 측정")
+    parser.add_argument('--rows', type=int, default=50000, help="합성 관광지 수 (0이면 실제 데이터만)")
+    parser.add_argument('--queries', type=int, default=200, help="측정 질의 수")
+    parser.add_argument('--k', type=int, default=10, help="찾을 이웃 수")
+    parser.add_argument('--weighting', default='tfidf', help="벡터 가중 방식 (tfidf, l2)")
+    parser.add_argument('--seed', type=int, default=0, help="난수 시드")
+    parser.add_argument('--min-recall', type=float, default=None, help="최소 재현율 (선택)")
+    parser.add_argument('--switchover', action='store_true',
+                        help=f"EXACT_SEARCH_LIMIT({EXACT_SEARCH_LIMIT:,})행에서 전수 비교와 ANN 인덱스 생성 비교")
+    args = parser.parse_args(argv)
+
+    counts = get_category_index().counts
+    if args.switchover:
+        counts = synthetic_counts(counts, EXACT_SEARCH_LIMIT, args.seed)
+        print(f"관광지 {EXACT_SEARCH_LIMIT:,}곳 (전환 기준), 이웃 수 {DEFAULT_NEIGHBOURS}")
+        print(f"{'단계':<20}{'시간(s)':>10}{'최대 메모리(MB)':>18}{'recall':>10}")
+        for name, elapsed, peak, recall in run_switchover(counts, seed=args.seed):
+            recall = '-' if recall is None else f"{recall:.3f}"
+            print(f"{name:<20}{elapsed:>10.2f}{peak:>18.0f}{recall:>10}")
+        return 0
+
+    if args.rows:
+        counts = synthetic_counts(counts, args.rows, args.seed)
+    vectors = weight_vectors(counts, args.weighting).to_dense().astype(np.float32)
+
+    rng = np.random.default_rng(args.seed + 1)
+    queries = vectors[rng.choice(len(vectors), min(args.queries, len(vectors)), replace=False)]
+
+    print(f"관광지 {len(vectors):,}곳, 차원 {vectors.shape[1]}, 질의 {len(queries)}개, k={args.k}")
+    print(f"{'설정':<20}{'생성(s)':>10}{'질의(ms)':>12}{'recall@k':>12}")
+    results = run_benchmark(vectors, queries, args.k, BENCHMARK_CONFIGS, args.seed)
+    for name, build_s, latency_ms, recall in results:
+        print(f"{name:<20}{build_s:>10.2f}{latency_ms:>12.3f}{recall:>12.3f}")
+
+    if args.min_recall is not None:
+        best = max(recall for name, _, _, recall in results if name != 'exact')
+        if best < args.min_recall:
+            print(f"❌ 최고 재현율 {best:.3f}가 기준 {args.min_recall:.3f}에 못 미칩니다.")
+            return 1
+        print(f"✅ 재현율 기준 {args.min_recall:.3f}을 만족하는 설정이 있습니다.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
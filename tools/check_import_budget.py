@@ -0,0 +1,113 @@
+# tools/check_import_budget.py - 페이지 공통 모듈의 임포트 시간 예산 점검
+#
+# 사용법: python tools/check_import_budget.py [--budget-ms 150] [--runs 3]
+# 예산을 넘거나 금지된 무거운 모듈이 끌려오면 종료 코드 1을 반환합니다.
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 점검 대상 모듈별 설정
+#   budget_ms: 임포트 시간 예산
+#   baseline: 어차피 사용하는 기본 라이브러리 (미리 임포트해 측정에서 제외)
+#   forbidden: FORBIDDEN_MODULES 외에 추가로 금지할 모듈
+IMPORT_TARGETS = {
+    'utils': {
+        'budget_ms': 150,
+        'baseline': ['streamlit', 'pandas', 'numpy'],
+        'forbidden': [],
+    },
+    # 코어 라이브러리는 Streamlit 없이 임포트되어야 함
+    'wellness': {
+        'budget_ms': 50,
+        'baseline': ['pandas', 'numpy'],
+        'forbidden': ['streamlit'],
+    },
+}
+
+# 공통 모듈 임포트 시 끌려오면 안 되는 무거운 의존성
+FORBIDDEN_MODULES = [
+    'sklearn',
+    'scipy',
+    'plotly.express',
+    'folium',
+    'streamlit_folium',
+    'reverse_geocoder',
+]
+
+def measure_import(module_name, baseline):
+    """새 인터프리터에서 모듈 임포트 시간(ms)과 새로 로드된 모듈 목록 측정"""
+    code = f"import {', '.join(baseline)}; import {module_name}"
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module_name} 임포트 실패:\n{result.stderr}")
+
+    # 기본 라이브러리 로딩이 끝난 뒤의 로그만 사용
+    lines = result.stderr.splitlines()
+    start = 0
+    for i, line in enumerate(lines):
+        if line.rstrip().endswith(f'| {baseline[-1]}'):
+            start = i + 1
+
+    elapsed_us = 0
+    loaded = []
+    for line in lines[start:]:
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = [part.strip() for part in line[len('import time:'):].split('|')]
+        loaded.append(name)
+        if name == module_name:
+            elapsed_us = int(cumulative)
+
+    return elapsed_us / 1000, loaded
+
+def check_module(module_name, target, runs, budget_ms=None):
+    """임포트 시간 예산 및 금지 모듈 점검 (실패 메시지 리스트 반환)"""
+    budget_ms = budget_ms or target['budget_ms']
+    failures = []
+    timings = []
+    loaded = []
+    for _ in range(runs):
+        elapsed_ms, loaded = measure_import(module_name, target['baseline'])
+        timings.append(elapsed_ms)
+
+    # 측정 잡음을 줄이기 위해 최솟값 사용
+    best_ms = min(timings)
+    print(f"{module_name}: {best_ms:.1f}ms (예산 {budget_ms}ms, {runs}회 중 최솟값)")
+    if best_ms > budget_ms:
+        failures.append(f"{module_name} 임포트 시간 {best_ms:.1f}ms가 예산 {budget_ms}ms를 초과했습니다.")
+
+    for forbidden in FORBIDDEN_MODULES + target['forbidden']:
+        if any(name == forbidden or name.startswith(forbidden + '.') for name in loaded):
+            failures.append(f"{module_name} 임포트 시 무거운 모듈 '{forbidden}'이(가) 함께 로드됩니다.")
+
+    return failures
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="페이지 공통 모듈 임포트 시간 예산 점검")
+    parser.add_argument('--budget-ms', type=float, default=None, help="모든 대상에 적용할 예산 (ms)")
+    parser.add_argument('--runs', type=int, default=3, help="측정 반복 횟수")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for module_name, target in IMPORT_TARGETS.items():
+        failures.extend(check_module(module_name, target, args.runs, args.budget_ms))
+
+    for message in failures:
+        print(f"❌ {message}")
+    if failures:
+        return 1
+
+    print("✅ 임포트 예산을 만족합니다.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,34 @@
+# tools/serve_streamlit.py - 워밍업과 준비 상태 엔드포인트를 켠 채 Streamlit 앱 실행
+#
+# 사용법: python tools/serve_streamlit.py [--readiness-port 8502] [streamlit run 옵션...]
+# `streamlit run app.py`는 첫 세션이 연결될 때 앱 스크립트를 실행하므로 그 전에는 워밍업을 시작할 수 없습니다.
+# 이 스크립트는 같은 프로세스에서 워밍업을 먼저 시작한 뒤 Streamlit 서버를 띄우므로
+# 첫 방문자 전에 데이터셋과 인덱스가 준비되며, 로드 밸런서는 --readiness-port의 GET /ready를
+# 폴링하면 됩니다 (준비 전 503, 준비 후 200).
+# 앱은 asgi.py의 st.App으로 실행되어 세션 토큰 쿠키를 서버에서 HttpOnly 쿠키로 발급합니다.
+
+import argparse
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from wellness.warmup import serve_readiness, start_warmup
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="워밍업과 함께 Streamlit 앱 실행")
+    parser.add_argument('--readiness-port', type=int, default=None, help="준비 상태 엔드포인트 포트 (선택)")
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    if args.readiness_port:
+        serve_readiness(args.readiness_port)
+    start_warmup(ui=True)
+
+    from streamlit.web import cli as streamlit_cli
+    sys.argv = ['streamlit', 'run', os.path.join(ROOT_DIR, 'asgi.py'), *streamlit_args]
+    return streamlit_cli.main()
+
+if __name__ == '__main__':
+    sys.exit(main())
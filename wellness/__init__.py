@@ -0,0 +1,60 @@
+# wellness - Streamlit에 의존하지 않는 웰니스 관광 추천 핵심 라이브러리
+#
+# 데이터 로딩, 설문 점수화, 순위 산정, 필터링, 거리 계산 로직을 담고 있으며
+# 배치 작업, 워커 풀, 다른 프론트엔드에서도 그대로 임포트해 사용할 수 있습니다.
+# Streamlit 화면용 캐시/오류 표시는 utils.py의 얇은 어댑터가 담당합니다.
+
+from .survey import (
+    questions,
+    get_cluster_info,
+    get_cluster_region_info,
+    calculate_cluster_scores,
+    determine_cluster,
+    determine_clusters,
+    answers_to_matrix,
+    calculate_factor_scores,
+    classify_wellness_type,
+    find_missing_answers,
+)
+from .data import (
+    DATA_DIR,
+    load_wellness_destinations,
+    load_region_destinations,
+    load_wellness_nearby_spots,
+    load_category_map,
+    load_category_counts,
+    get_wellness_theme_names,
+    get_region_names,
+)
+from .ranking import (
+    CLUSTER_WEIGHTS,
+    calculate_recommendations_by_cluster,
+    get_wellness_theme_filter_options,
+    get_region_filter_options,
+    apply_wellness_filters,
+    get_statistics_summary,
+)
+from .schema import (
+    SCHEMA_VERSION,
+    DESTINATION_SCHEMA,
+    DESTINATION_COLUMNS,
+    build_destination_table,
+    get_destination_table,
+    recommendable_destinations,
+    rated_destinations,
+)
+from .service import RecommendationService, get_service, reset_service
+from .geo import calculate_distance, haversine_km, get_nearby_attractions
+from .stats import StatisticsCube, get_statistics_cube
+from .categories import CategoryTaxonomy, CategoryIndex, get_category_index
+from .similarity import SimilarityIndex, get_similarity_index
+from .itinerary import plan_itinerary
+from .datasets import DatasetManager, get_dataset_manager, get_dataset
+from .region_index import RegionIndex, get_region_index, budget_from_answers
+from .export import (
+    EXPORT_COLUMNS,
+    iter_recommendations_csv,
+    iter_cluster_destinations_csv,
+    export_recommendations_to_csv,
+    export_cluster_destinations_to_csv,
+)
@@ -0,0 +1,218 @@
+# wellness/ann.py - 유사 관광지 검색용 근사 최근접 이웃(ANN) 인덱스 (NumPy 구현)
+#
+# 관광지가 전국 단위(수만~수십만 곳)로 늘어나면 모든 쌍의 유사도를 계산할 수 없으므로
+# 후보를 먼저 좁힌 뒤 후보만 정확한 내적으로 다시 정렬합니다.
+#   IVFIndex             - 구면 k-means 중심점으로 나눈 역색인, 가까운 n_probe개 목록만 검색
+#   RandomProjectionLSH  - 무작위 초평면 부호 해시 테이블, 같은 버킷(+인접 버킷)만 검색
+# 두 인덱스 모두 L2 정규화된 벡터를 받아 내적(코사인 유사도)으로 순위를 매기며,
+# n_probe를 키우면 재현율이 오르고 지연 시간도 늘어납니다.
+# 원천 행이 일부만 바뀌면 update()가 중심점/초평면은 그대로 두고 바뀐 행만 다시 배정(해시)합니다.
+# 재현율/지연 측정은 tools/benchmark_ann.py를 사용합니다.
+
+import copy
+
+import numpy as np
+
+# 한 번에 내적을 계산하는 행 수 (메모리 사용량 제한)
+SEARCH_CHUNK_ROWS = 4096
+
+def _select_top(rows, scores, k):
+    """후보 행과 유사도에서 상위 k개 (유사도 내림차순, 동점은 행 번호 오름차순)"""
+    if len(rows) > k:
+        part = np.argpartition(-scores, k - 1)[:k]
+        rows, scores = rows[part], scores[part]
+    order = np.lexsort((rows, -scores))
+    return rows[order], scores[order]
+
+def _pad(results, k):
+    """질의별 (행, 유사도) 결과를 -1/0으로 채운 (질의 수 x k) 배열 쌍으로 변환"""
+    neighbours = np.full((len(results), k), -1, dtype=np.int64)
+    similarities = np.zeros((len(results), k), dtype=float)
+    for i, (rows, scores) in enumerate(results):
+        neighbours[i, :len(rows)] = rows
+        similarities[i, :len(rows)] = scores
+    return neighbours, similarities
+
+def _updated_vectors(vectors, old_rows, changed, changed_vectors):
+    """이전 벡터 배열에서 유지된 행을 옮기고 바뀐 행(신규 포함)만 채운 새 벡터 배열"""
+    old_rows = np.asarray(old_rows, dtype=np.int64)
+    changed = np.asarray(changed, dtype=bool)
+    updated = np.empty((len(old_rows), vectors.shape[1]), dtype=np.float32)
+    updated[~changed] = vectors[old_rows[~changed]]
+    updated[changed] = np.asarray(changed_vectors, dtype=np.float32).reshape(-1, vectors.shape[1])
+    return updated
+
+def exact_search(vectors, queries, k):
+    """전체 벡터와 내적해 구한 정확한 상위 k개 (재현율 기준값)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+    results = []
+    all_rows = np.arange(len(vectors))
+    for start in range(0, len(queries), SEARCH_CHUNK_ROWS):
+        scores = queries[start:start + SEARCH_CHUNK_ROWS] @ vectors.T
+        results.extend(_select_top(all_rows, row_scores, k) for row_scores in scores)
+    return _pad(results, k)
+
+def recall_at_k(approximate, exact):
+    """근사 결과가 정확한 상위 k개를 찾아낸 비율 (-1 자리는 제외)"""
+    found = total = 0
+    for approximate_rows, exact_rows in zip(approximate, exact):
+        exact_rows = exact_rows[exact_rows >= 0]
+        found += len(np.intersect1d(approximate_rows[approximate_rows >= 0], exact_rows))
+        total += len(exact_rows)
+    return found / total if total else 1.0
+
+class IVFIndex:
+    """구면 k-means 중심점 기반 역색인 (Inverted File)
+
+    n_lists개 목록으로 나눈 뒤 질의와 가까운 n_probe개 목록의 벡터만 정확히 비교합니다.
+    """
+
+    def __init__(self, vectors, n_lists=None, n_probe=4, iterations=10, seed=0):
+        self.vectors = np.asarray(vectors, dtype=np.float32)
+        n = len(self.vectors)
+        self.n_lists = max(1, min(n, n_lists or int(np.sqrt(n))))
+        self.n_probe = n_probe
+        rng = np.random.default_rng(seed)
+
+        self.centroids = self.vectors[rng.choice(n, self.n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = self._assign(self.vectors)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, assignment, self.vectors)
+            # 비어 있는 목록은 무작위 벡터로 다시 시작
+            empty = np.bincount(assignment, minlength=self.n_lists) == 0
+            sums[empty] = self.vectors[rng.choice(n, int(empty.sum()), replace=False)]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            self.centroids = np.divide(sums, norms, out=np.zeros_like(sums), where=norms > 0)
+
+        self._set_lists(self._assign(self.vectors))
+
+    def _set_lists(self, assignment):
+        """행별 목록 번호로 목록별 행 구간(order, offsets) 구성"""
+        self.assignment = assignment
+        self.order = np.argsort(assignment, kind='stable')
+        self.offsets = np.searchsorted(assignment[self.order], np.arange(self.n_lists + 1))
+
+    def update(self, old_rows, changed, changed_vectors):
+        """바뀐 행만 반영한 새 인덱스 (중심점은 그대로, 유지된 행은 이전 목록 배정을 재사용)
+
+        old_rows: 새 행별 이전 행 번호, changed: 바뀐(또는 신규) 행 마스크,
+        changed_vectors: 바뀐 행의 새 벡터 (changed 순서)
+        """
+        index = copy.copy(self)
+        index.vectors = _updated_vectors(self.vectors, old_rows, changed, changed_vectors)
+        changed = np.asarray(changed, dtype=bool)
+        assignment = np.empty(len(index.vectors), dtype=np.int64)
+        assignment[~changed] = self.assignment[np.asarray(old_rows)[~changed]]
+        assignment[changed] = index._assign(index.vectors[changed])
+        index._set_lists(assignment)
+        return index
+
+    def _assign(self, vectors):
+        """벡터마다 가장 가까운 중심점 번호"""
+        return np.concatenate([
+            np.argmax(vectors[start:start + SEARCH_CHUNK_ROWS] @ self.centroids.T, axis=1)
+            for start in range(0, len(vectors), SEARCH_CHUNK_ROWS)
+        ]) if len(vectors) else np.empty(0, dtype=np.int64)
+
+    def search(self, queries, k, n_probe=None):
+        """질의별 근사 상위 k개 (행 번호, 유사도) 배열 쌍 (찾지 못한 자리는 -1)"""
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        n_probe = min(n_probe or self.n_probe, self.n_lists)
+        centroid_scores = queries @ self.centroids.T
+        probes = np.argpartition(-centroid_scores, n_probe - 1, axis=1)[:, :n_probe]
+
+        results = []
+        for query, lists in zip(queries, probes):
+            rows = np.concatenate([self.order[self.offsets[i]:self.offsets[i + 1]] for i in lists])
+            results.append(_select_top(rows, self.vectors[rows] @ query, k))
+        return _pad(results, k)
+
+class RandomProjectionLSH:
+    """무작위 초평면 부호로 만든 n_tables개 해시 테이블 (코사인 유사도용 LSH)
+
+    테이블마다 해시 값을 정렬해 두고 np.searchsorted로 같은 버킷을 찾습니다.
+    n_probe > 0이면 초평면에 가장 가까운(부호가 불확실한) 비트를 하나씩 뒤집은 버킷도 검색합니다.
+    """
+
+    def __init__(self, vectors, n_tables=8, n_bits=12, n_probe=0, seed=0):
+        self.vectors = np.asarray(vectors, dtype=np.float32)
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.n_probe = n_probe
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((n_tables, n_bits, self.vectors.shape[1])).astype(np.float32)
+        self._bit_values = 1 << np.arange(n_bits, dtype=np.int64)
+
+        self._set_tables([self._codes(self.vectors @ self.planes[table].T) for table in range(n_tables)])
+
+    def _set_tables(self, codes):
+        """테이블별 행 해시 값으로 정렬된 검색 테이블 구성"""
+        self.codes = codes
+        self.orders = []
+        self.sorted_codes = []
+        for table_codes in codes:
+            order = np.argsort(table_codes, kind='stable')
+            self.orders.append(order)
+            self.sorted_codes.append(table_codes[order])
+
+    def update(self, old_rows, changed, changed_vectors):
+        """바뀐 행만 다시 해시한 새 인덱스 (초평면은 그대로, 유지된 행은 이전 해시 값 재사용)
+
+        인자는 IVFIndex.update와 같습니다.
+        """
+        index = copy.copy(self)
+        index.vectors = _updated_vectors(self.vectors, old_rows, changed, changed_vectors)
+        changed = np.asarray(changed, dtype=bool)
+        stable_old = np.asarray(old_rows)[~changed]
+        codes = []
+        for table, table_codes in enumerate(self.codes):
+            updated = np.empty(len(index.vectors), dtype=np.int64)
+            updated[~changed] = table_codes[stable_old]
+            updated[changed] = self._codes(index.vectors[changed] @ self.planes[table].T)
+            codes.append(updated)
+        index._set_tables(codes)
+        return index
+
+    def _codes(self, projections):
+        """투영값 부호를 정수 해시 값으로 묶음"""
+        return (projections > 0).astype(np.int64) @ self._bit_values
+
+    def _bucket(self, table, code):
+        """테이블에서 해시 값이 code인 행 번호"""
+        codes = self.sorted_codes[table]
+        start, end = np.searchsorted(codes, code, side='left'), np.searchsorted(codes, code, side='right')
+        return self.orders[table][start:end]
+
+    def search(self, queries, k, n_probe=None):
+        """질의별 근사 상위 k개 (행 번호, 유사도) 배열 쌍 (찾지 못한 자리는 -1)"""
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        n_probe = min(self.n_probe if n_probe is None else n_probe, self.n_bits)
+
+        results = []
+        for query in queries:
+            buckets = []
+            for table in range(self.n_tables):
+                projection = self.planes[table] @ query
+                code = int(self._codes(projection))
+                buckets.append(self._bucket(table, code))
+                # 경계에 가까운 비트부터 뒤집은 인접 버킷
+                for bit in np.argsort(np.abs(projection))[:n_probe]:
+                    buckets.append(self._bucket(table, code ^ int(self._bit_values[bit])))
+            rows = np.unique(np.concatenate(buckets))
+            results.append(_select_top(rows, self.vectors[rows] @ query, k))
+        return _pad(results, k)
+
+ANN_METHODS = {
+    'ivf': IVFIndex,
+    'lsh': RandomProjectionLSH,
+}
+
+def build_ann_index(vectors, method='ivf', **params):
+    """method('ivf' 또는 'lsh')에 해당하는 ANN 인덱스 생성"""
+    try:
+        index_class = ANN_METHODS[method]
+    except KeyError:
+        raise ValueError(f"unknown ANN method '{method}' (choose from {sorted(ANN_METHODS)})")
+    return index_class(vectors, **params)
@@ -0,0 +1,367 @@
+# wellness/api.py - Streamlit 없이 추천 결과를 JSON으로 제공하는 비동기 HTTP 서버
+#
+# 사용법: python -m wellness.api --host 0.0.0.0 --port 8000 --workers 4
+#
+#   GET  /health                   상태 확인
+#   GET  /ready                    준비 상태 (워밍업 전 503, 로드 밸런서 헬스 체크용)
+#   POST /cluster                  {"answers": {"q1": 0, ...}}
+#   POST /recommendations          {"answers": {...}} 또는 {"cluster": 1},
+#                                  선택: "theme": [...], "region": [...], "limit": 10,
+#                                        "category": {"FD": 5} (주변 시설 최소 개수),
+#                                        "scoring": "cluster" | "personalized" (클러스터 점수 혼합),
+#                                        "diversity": 0.5 (지역/테마 다양성 재정렬 λ, 0~1)
+#   POST /recommendations/batch    {"requests": [<recommendations 요청>, ...]}
+#   POST /recommendations/export   {"cluster": 1} 또는 {"answers": {...}}, 선택: "theme", "region", "category"
+#                                  클러스터 순위 전체를 CSV로 (chunked 응답으로 조각마다 바로 전송)
+#                                  전체 순위라 "scoring": "personalized"와 "diversity"는 400으로 거절
+#
+# 표준 라이브러리 asyncio만 사용하며 HTTP/1.1 keep-alive를 지원합니다.
+# 데이터셋과 결과 캐시는 wellness.service의 공용 서비스를 그대로 사용합니다.
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import socket
+
+import numpy as np
+
+from .categories import get_category_index
+from .export import iter_cluster_destinations_csv
+from .ranking import SCORING_MODES
+from .service import get_service
+from .survey import get_cluster_info, questions
+from .warmup import get_warmup_state, start_warmup
+
+MAX_BODY_BYTES = 1024 * 1024
+MAX_BATCH_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+class StreamingResponse:
+    """조각 단위로 보내는 응답 본문 (chunks는 bytes 이터레이터)"""
+
+    def __init__(self, chunks, content_type, filename=None):
+        self.chunks = chunks
+        self.content_type = content_type
+        self.filename = filename
+
+class ApiError(Exception):
+    """HTTP 상태 코드를 가진 요청 오류"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def _json_default(value):
+    """numpy 스칼라 등 기본 JSON 인코더가 처리하지 못하는 값 변환"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _is_integer(value):
+    """bool을 제외한 정수인지 (JSON true/false가 1/0으로 통과하지 않도록)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def _validate_filter(name, value):
+    """테마/지역 필터 검증 (코드 하나, 코드 목록, 또는 {"code": ...} 객체 목록)"""
+    if value is None:
+        return None
+    items = value if isinstance(value, list) else [value]
+    for item in items:
+        code = item.get('code') if isinstance(item, dict) else item
+        if not (isinstance(code, str) or _is_integer(code)):
+            raise ApiError(400, f"'{name}' must be a code, a list of codes or a list of {{\"code\": ...}} objects")
+    return value
+
+def _validate_answers(answers):
+    """설문 답변 형식 검증"""
+    if not isinstance(answers, dict):
+        raise ApiError(400, "'answers' must be an object")
+    for q_key, answer_idx in answers.items():
+        if q_key not in questions:
+            raise ApiError(400, f"unknown question '{q_key}'")
+        if answer_idx is not None and (not _is_integer(answer_idx)
+                                       or answer_idx not in questions[q_key]['weights']):
+            raise ApiError(400, f"invalid answer for '{q_key}': {answer_idx!r}")
+    return answers
+
+def _normalize_request(payload):
+    """추천 요청 하나를 서비스 입력 형식으로 정리"""
+    if not isinstance(payload, dict):
+        raise ApiError(400, "request must be an object")
+
+    request = {
+        'theme': _validate_filter('theme', payload.get('theme')),
+        'region': _validate_filter('region', payload.get('region')),
+        'limit': payload.get('limit', 10),
+        'category': payload.get('category'),
+        'scoring': payload.get('scoring', 'cluster'),
+        'diversity': payload.get('diversity'),
+    }
+    if not _is_integer(request['limit']) or not 1 <= request['limit'] <= 100:
+        raise ApiError(400, "'limit' must be an integer between 1 and 100")
+    if request['scoring'] not in SCORING_MODES:
+        raise ApiError(400, f"'scoring' must be one of {', '.join(SCORING_MODES)}")
+    diversity = request['diversity']
+    if diversity is not None and (isinstance(diversity, bool) or not isinstance(diversity, (int, float))
+                                  or not 0 <= diversity <= 1):
+        raise ApiError(400, "'diversity' must be a number between 0 and 1")
+    category = request['category']
+    if category is not None and (not isinstance(category, dict) or not all(
+            isinstance(code, str) and _is_integer(minimum) and minimum >= 0
+            for code, minimum in category.items())):
+        raise ApiError(400, "'category' must be an object of category code to non-negative integer count")
+    if category:
+        taxonomy = get_category_index().taxonomy
+        unknown = [code for code in category if taxonomy.level_of(code) is None]
+        if unknown:
+            raise ApiError(400, f"unknown category code '{unknown[0]}'")
+
+    if 'cluster' in payload:
+        if not _is_integer(payload['cluster']) or payload['cluster'] not in (0, 1, 2):
+            raise ApiError(400, "'cluster' must be 0, 1 or 2")
+        request['cluster'] = payload['cluster']
+    elif 'answers' in payload:
+        request['answers'] = _validate_answers(payload['answers'])
+    else:
+        raise ApiError(400, "either 'answers' or 'cluster' is required")
+
+    return request
+
+def handle_request(method, path, body):
+    """요청을 라우팅하고 (상태 코드, 응답 객체) 반환"""
+    path = path.split('?', 1)[0].rstrip('/') or '/'
+
+    if path == '/health':
+        if method != 'GET':
+            raise ApiError(405, "use GET")
+        return 200, {'status': 'ok'}
+
+    if path == '/ready':
+        if method != 'GET':
+            raise ApiError(405, "use GET")
+        report = get_warmup_state().report()
+        if not report['ready']:
+            # 필수 단계가 재시도 끝에 실패했으면 헬스 체크 폴링이 끝나지 않은 단계를 다시 실행
+            start_warmup()
+        return (200 if report['ready'] else 503), report
+
+    if path not in ('/cluster', '/recommendations', '/recommendations/batch', '/recommendations/export'):
+        raise ApiError(404, f"no route for {path}")
+    if method != 'POST':
+        raise ApiError(405, "use POST")
+
+    # 헬스 체크는 워밍업 중에도 바로 응답하도록 서비스는 추천 경로에서만 가져옴
+    service = get_service()
+
+    try:
+        payload = json.loads(body or b'{}')
+    except ValueError:
+        raise ApiError(400, "request body must be valid JSON")
+
+    if path == '/cluster':
+        if not isinstance(payload, dict):
+            raise ApiError(400, "request must be an object")
+        return 200, service.classify(_validate_answers(payload.get('answers', {})))
+
+    if path == '/recommendations':
+        result = service.recommend_batch([_normalize_request(payload)])[0]
+        return 200, result
+
+    if path == '/recommendations/export':
+        request = _normalize_request(payload)
+        # 내보내기는 클러스터 점수 순의 전체 목록이므로 순위를 바꾸는 옵션은 조용히 무시하지 않고 거절
+        if request['scoring'] != 'cluster':
+            raise ApiError(400, "'scoring' must be 'cluster' for export")
+        if request['diversity'] is not None:
+            raise ApiError(400, "'diversity' is not supported for export")
+        cluster_result = ({'cluster': request['cluster']} if 'cluster' in request
+                          else service.classify(request['answers']))
+        # 페이지 다운로드와 같이 사용자클러스터 컬럼에 클러스터 이름 기록
+        user_info = {'cluster_id': cluster_result['cluster'],
+                     'cluster_name': get_cluster_info()[cluster_result['cluster']]['name']}
+        chunks = iter_cluster_destinations_csv(cluster_result, user_info=user_info,
+                                               theme_filter=request['theme'], region_filter=request['region'],
+                                               service=service, category_filter=request['category'])
+        return 200, StreamingResponse(chunks, 'text/csv; charset=utf-8', 'wellness_destinations.csv')
+
+    requests = payload.get('requests') if isinstance(payload, dict) else None
+    if not isinstance(requests, list):
+        raise ApiError(400, "'requests' must be a list")
+    if len(requests) > MAX_BATCH_SIZE:
+        raise ApiError(413, f"at most {MAX_BATCH_SIZE} requests per batch")
+    return 200, {'results': service.recommend_batch([_normalize_request(r) for r in requests])}
+
+# 이벤트 루프에서 바로 처리하는 가벼운 경로 (나머지는 스레드 풀에서 실행)
+_LOOP_ROUTES = ('/health', '/ready')
+
+async def handle_request_async(method, path, body, executor=None):
+    """상태 확인은 이벤트 루프에서 바로 응답하고, 서비스 로드/추천 계산은 스레드 풀에서 실행
+
+    워밍업 중이거나 추천 계산이 몰려도 /health, /ready 응답이 늦어지지 않습니다.
+    """
+    if (path.split('?', 1)[0].rstrip('/') or '/') in _LOOP_ROUTES:
+        return handle_request(method, path, body)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, handle_request, method, path, body)
+
+def _content_length(headers):
+    """Content-Length 헤더 값 (형식이 잘못되었으면 ApiError 400)"""
+    try:
+        length = int(headers.get('content-length', 0) or 0)
+    except ValueError:
+        raise ApiError(400, "malformed Content-Length header")
+    if length < 0:
+        raise ApiError(400, "malformed Content-Length header")
+    return length
+
+def _encode_response(status, payload, keep_alive):
+    """HTTP 응답 바이트 생성"""
+    body = json.dumps(payload, ensure_ascii=False, default=_json_default).encode('utf-8')
+    headers = [
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    return ('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1') + body
+
+async def _stream_response(writer, status, response, keep_alive):
+    """chunked 전송으로 조각마다 바로 보내기 (조각 생성은 스레드 풀에서 실행)
+
+    헤더를 보낸 뒤 조각 생성이 실패하면 상태 코드를 바꿀 수 없으므로 오류를 기록하고 종료 조각 없이
+    False를 반환합니다. 호출 측은 연결을 닫아 클라이언트가 잘린 응답임을 알 수 있게 합니다.
+    """
+    headers = [
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+        f"Content-Type: {response.content_type}",
+        "Transfer-Encoding: chunked",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if response.filename:
+        headers.append(f'Content-Disposition: attachment; filename="{response.filename}"')
+    writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1'))
+
+    loop = asyncio.get_running_loop()
+    chunks = iter(response.chunks)
+    while True:
+        try:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+        except Exception:
+            logger.exception("스트리밍 응답 생성 중 오류 발생")
+            return False
+        if chunk is None:
+            break
+        if chunk:
+            writer.write(f"{len(chunk):x}\r\n".encode('latin-1') + chunk + b'\r\n')
+            # 느린 클라이언트에 맞춰 다음 조각 생성을 늦춤 (전체 파일을 버퍼에 쌓지 않음)
+            await writer.drain()
+    writer.write(b'0\r\n\r\n')
+    return True
+
+async def _handle_connection(reader, writer):
+    """연결 하나에서 keep-alive 요청들을 순서대로 처리"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, path, version = request_line.decode('latin-1').split()
+            except ValueError:
+                writer.write(_encode_response(400, {'error': 'malformed request line'}, False))
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+            try:
+                length = _content_length(headers)
+            except ApiError as e:
+                writer.write(_encode_response(e.status, {'error': e.message}, False))
+                break
+            if length > MAX_BODY_BYTES:
+                writer.write(_encode_response(413, {'error': 'request body too large'}, False))
+                break
+            body = await reader.readexactly(length) if length else b''
+
+            try:
+                status, payload = await handle_request_async(method.upper(), path, body)
+            except ApiError as e:
+                status, payload = e.status, {'error': e.message}
+            except Exception:
+                # 내부 오류 내용은 응답에 싣지 않고 서버 로그에만 남김
+                logger.exception("요청 처리 중 오류 발생: %s %s", method, path)
+                status, payload = 500, {'error': 'internal server error'}
+
+            if isinstance(payload, StreamingResponse):
+                if not await _stream_response(writer, status, payload, keep_alive):
+                    break
+            else:
+                writer.write(_encode_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+async def _serve(host, port, reuse_port):
+    server = await asyncio.start_server(
+        _handle_connection, host, port, reuse_port=reuse_port, backlog=1024
+    )
+    async with server:
+        await server.serve_forever()
+
+def _run_worker(host, port, reuse_port):
+    """워커 프로세스 진입점: 백그라운드 워밍업을 시작하고 바로 서버 실행 (/ready로 준비 상태 확인)"""
+    start_warmup()
+    asyncio.run(_serve(host, port, reuse_port))
+
+def serve(host='127.0.0.1', port=8000, workers=1):
+    """HTTP 서버 실행 (workers > 1이면 SO_REUSEPORT로 포트를 공유하는 프로세스 여러 개)"""
+    if workers <= 1:
+        _run_worker(host, port, False)
+        return
+
+    if not hasattr(socket, 'SO_REUSEPORT'):
+        raise RuntimeError("이 플랫폼은 SO_REUSEPORT를 지원하지 않아 다중 워커를 실행할 수 없습니다.")
+
+    processes = [
+        multiprocessing.Process(target=_run_worker, args=(host, port, True), daemon=True)
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="웰니스 관광 추천 HTTP API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=1, help="서버 프로세스 수")
+    args = parser.parse_args(argv)
+
+    print(f"🌿 웰니스 추천 API: http://{args.host}:{args.port} (workers={args.workers})")
+    serve(args.host, args.port, args.workers)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+# wellness/auth.py - 로그인/회원가입 처리 (단일 쓰기 스레드, 아이디 집합, 토큰 버킷 속도 제한)
+#
+# 회원가입이 몰리면 요청마다 INSERT를 실행하는 방식은 SQLite 쓰기 잠금에서 줄을 서고,
+# 실패한 로그인도 매번 DB를 조회합니다. AuthService는
+#   - 가입 요청을 큐에 넣고 쓰기 스레드 하나가 모아서 한 트랜잭션으로 기록하며 (호출 측은 Future로 결과 대기),
+#   - 이미 있는 아이디를 메모리 집합으로 바로 거절하고 (집합에 없으면 기본 키 조회 한 번으로 다른 복제본이
+#     추가한 아이디인지 확인),
+#   - 아이디별/IP별 토큰 버킷으로 로그인/가입 시도 속도를 제한해 크리덴셜 스터핑이 DB까지 닿지 않게 하고,
+#   - 확인한 비밀번호 해시를 캐시해 반복 로그인 시도가 DB를 다시 읽지 않게 합니다.
+
+import hashlib
+import hmac
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from .data import ROOT_DIR
+
+USERS_DB_PATH = os.path.join(ROOT_DIR, 'wellness_users.db')
+
+# 테스트 계정 (DB에 없어도 로그인 가능)
+TEST_ACCOUNT = ('wellness', '1234')
+
+# 최소 비밀번호 길이
+MIN_PASSWORD_LENGTH = 4
+
+# 아이디별 로그인 시도: 최대 5회 연속, 이후 12초마다 1회
+USERNAME_LOGIN_RATE = (5, 1 / 12)
+# IP별 로그인 시도: 최대 20회 연속, 이후 초당 1회
+IP_LOGIN_RATE = (20, 1.0)
+# IP별 회원가입 시도: 최대 5회 연속, 이후 분당 2회
+IP_SIGNUP_RATE = (5, 2 / 60)
+
+# 쓰기 스레드가 한 트랜잭션에 모으는 최대 가입 요청 수
+SIGNUP_BATCH_SIZE = 64
+
+# 비밀번호 해시 캐시 크기
+CREDENTIAL_CACHE_SIZE = 10000
+
+# 로그인/가입 결과 상태
+LOGIN_OK = 'ok'
+LOGIN_INVALID = 'invalid'
+RATE_LIMITED = 'rate_limited'
+SIGNUP_CREATED = 'created'
+SIGNUP_EXISTS = 'exists'
+SIGNUP_INVALID = 'invalid'
+
+def hash_password(password):
+    """비밀번호를 SHA256 해시로 변환합니다."""
+    return hashlib.sha256(str.encode(password)).hexdigest()
+
+class TokenBucket:
+    """용량 capacity, 초당 rate개씩 채워지는 토큰 버킷"""
+
+    __slots__ = ('capacity', 'rate', 'tokens', 'updated_at')
+
+    def __init__(self, capacity, rate, now=None):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic() if now is None else now
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def consume(self, tokens=1, now=None):
+        """토큰이 충분하면 꺼내고 True, 부족하면 False"""
+        self._refill(time.monotonic() if now is None else now)
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    def retry_after(self, tokens=1, now=None):
+        """토큰이 충분해질 때까지 남은 시간 (초)"""
+        self._refill(time.monotonic() if now is None else now)
+        return max(0.0, (tokens - self.tokens) / self.rate)
+
+class RateLimiter:
+    """키(아이디, IP 등)별 토큰 버킷 (오래 쓰지 않은 키부터 max_keys개까지만 보관)"""
+
+    def __init__(self, capacity, rate, max_keys=100000):
+        self.capacity = capacity
+        self.rate = rate
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _bucket(self, key, now):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.capacity, self.rate, now)
+            self._buckets[key] = bucket
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def allow(self, key, now=None):
+        """key의 시도를 허용하면 True (토큰 하나 소비)"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return self._bucket(key, now).consume(1, now)
+
+    def retry_after(self, key, now=None):
+        """key가 다시 시도할 수 있을 때까지 남은 시간 (초)"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return self._bucket(key, now).retry_after(1, now)
+
+def setup_database(db_path=USERS_DB_PATH):
+    """users 테이블 생성 (없을 때만)"""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('''CREATE TABLE IF NOT EXISTS users
+                        (username TEXT PRIMARY KEY, password TEXT)''')
+        conn.commit()
+    finally:
+        conn.close()
+
+class AuthService:
+    """로그인 확인과 대기열 기반 회원가입을 제공하는 프로세스 공용 인증 서비스"""
+
+    def __init__(self, db_path=USERS_DB_PATH, username_login_rate=USERNAME_LOGIN_RATE,
+                 ip_login_rate=IP_LOGIN_RATE, ip_signup_rate=IP_SIGNUP_RATE):
+        self.db_path = db_path
+        setup_database(db_path)
+        self.username_limiter = RateLimiter(*username_login_rate)
+        self.ip_login_limiter = RateLimiter(*ip_login_rate)
+        self.ip_signup_limiter = RateLimiter(*ip_signup_rate)
+
+        self._usernames = set()
+        self._credentials = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._load_usernames()
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="auth-signup-writer", daemon=True)
+        self._writer.start()
+
+    def _connection(self):
+        """읽기용 스레드별 연결"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0)
+            self._local.conn = conn
+        return conn
+
+    def _load_usernames(self):
+        """DB의 아이디 전체를 집합에 로드 (서비스 시작 시 한 번)"""
+        rows = self._connection().execute('SELECT username FROM users').fetchall()
+        with self._lock:
+            self._usernames.update(username for username, in rows)
+
+    def user_exists(self, username):
+        """아이디가 있는지 (메모리 집합에 없으면 다른 프로세스가 방금 추가했을 수 있어 기본 키로 한 번 조회)
+
+        조회하면서 비밀번호 해시도 캐시하므로 이어지는 로그인 확인은 DB를 다시 읽지 않습니다.
+        """
+        if username in self._usernames:
+            return True
+        return self._stored_hash(username) is not None
+
+    def _stored_hash(self, username):
+        """저장된 비밀번호 해시 (캐시 우선)"""
+        with self._lock:
+            cached = self._credentials.get(username)
+            if cached is not None:
+                self._credentials.move_to_end(username)
+                return cached
+        row = self._connection().execute('SELECT password FROM users WHERE username = ?', (username,)).fetchone()
+        if row is None:
+            return None
+        self._remember(username, row[0])
+        return row[0]
+
+    def _remember(self, username, password_hash):
+        with self._lock:
+            self._usernames.add(username)
+            self._credentials[username] = password_hash
+            self._credentials.move_to_end(username)
+            while len(self._credentials) > CREDENTIAL_CACHE_SIZE:
+                self._credentials.popitem(last=False)
+
+    def login(self, username, password, ip=None):
+        """로그인 확인 {'status': 'ok' | 'invalid' | 'rate_limited', 'retry_after': 초}"""
+        if ip is not None and not self.ip_login_limiter.allow(ip):
+            return {'status': RATE_LIMITED, 'retry_after': self.ip_login_limiter.retry_after(ip)}
+        if not self.username_limiter.allow(username):
+            return {'status': RATE_LIMITED, 'retry_after': self.username_limiter.retry_after(username)}
+
+        if (username, password) == TEST_ACCOUNT:
+            return {'status': LOGIN_OK, 'retry_after': 0.0}
+        # 없는 아이디는 기본 키 조회 한 번으로 거절
+        if not username or not self.user_exists(username):
+            return {'status': LOGIN_INVALID, 'retry_after': 0.0}
+        stored = self._stored_hash(username)
+        if stored is not None and hmac.compare_digest(stored, hash_password(password)):
+            return {'status': LOGIN_OK, 'retry_after': 0.0}
+        return {'status': LOGIN_INVALID, 'retry_after': 0.0}
+
+    def signup(self, username, password, ip=None):
+        """가입 요청을 대기열에 넣고 Future 반환 (결과: {'status': 'created' | 'exists' | 'invalid' | 'rate_limited', ...})"""
+        future = Future()
+        if ip is not None and not self.ip_signup_limiter.allow(ip):
+            future.set_result({'status': RATE_LIMITED, 'retry_after': self.ip_signup_limiter.retry_after(ip)})
+            return future
+        if not username or len(password) < MIN_PASSWORD_LENGTH:
+            future.set_result({'status': SIGNUP_INVALID, 'retry_after': 0.0})
+            return future
+        # 아이디를 먼저 집합에 예약해 동시에 들어온 같은 아이디는 DB까지 가지 않고 거절
+        with self._lock:
+            if username in self._usernames or username == TEST_ACCOUNT[0]:
+                future.set_result({'status': SIGNUP_EXISTS, 'retry_after': 0.0})
+                return future
+            self._usernames.add(username)
+        self._queue.put((username, hash_password(password), future))
+        return future
+
+    def _write_loop(self):
+        """대기열의 가입 요청을 SIGNUP_BATCH_SIZE개까지 모아 한 트랜잭션으로 기록"""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < SIGNUP_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                results = []
+                with conn:
+                    for username, password_hash, _ in batch:
+                        cursor = conn.execute('INSERT OR IGNORE INTO users (username, password) VALUES (?, ?)',
+                                              (username, password_hash))
+                        results.append(cursor.rowcount == 1)
+                for (username, password_hash, future), created in zip(batch, results):
+                    if created:
+                        self._remember(username, password_hash)
+                    # 다른 프로세스가 먼저 만든 아이디면 예약은 그대로 둠 (실제로 존재함)
+                    future.set_result({'status': SIGNUP_CREATED if created else SIGNUP_EXISTS,
+                                       'retry_after': 0.0})
+            except Exception as e:
+                with self._lock:
+                    for username, _, _ in batch:
+                        self._usernames.discard(username)
+                for _, _, future in batch:
+                    future.set_exception(e)
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_auth_service():
+    """프로세스 공용 인증 서비스 (처음 호출 시 아이디 목록 로드와 쓰기 스레드 시작)"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = AuthService()
+    return _service
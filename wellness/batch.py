@@ -0,0 +1,283 @@
+# wellness/batch.py - 대량 설문 응답을 청크 단위로 분류하고 추천 결과를 파일로 기록하는 배치 CLI
+#
+# 사용법:
+#   python -m wellness.batch --answers answers.csv --output recommendations.csv
+#   python -m wellness.batch --db wellness_users.db --output recommendations.csv --workers 4
+#   python -m wellness.batch --answers answers.csv --output recommendations.csv --scoring personalized
+#
+# 입력
+#   --answers  q1~q7 컬럼(0부터 시작하는 선택지 번호, 미응답은 빈 값)과 선택적인 ID 컬럼을 가진 CSV
+#   --db       user_surveys 테이블의 survey_data(JSON)를 id 순서로 읽음
+#   두 입력 모두 유효한 답변이 하나도 없는 응답(예전 형식의 설문, 빈 행)은 분류하지 않고 건너뜀
+#
+# 출력 (CSV, 응답자 x 순위 한 행씩)
+#   respondent_id, cluster, confidence, rank, content_id, title, score
+#   confidence와 score는 점수 방식과 관계없이 소수점 넷째 자리로 반올림
+#
+# --scoring personalized이면 응답자별 클러스터 점수 비율로 세 클러스터 점수를 섞어
+# 청크마다 (응답자 x 3) 가중치와 (3 x 관광지) 점수 행렬의 곱 한 번으로 순위를 매깁니다.
+#
+# 입력을 chunk_size 행씩 읽어 워커 프로세스에서 한 번에 분류하고,
+# 처리가 끝난 청크는 입력 순서대로 바로 파일에 덧붙이므로 메모리 사용량은
+# 동시에 처리 중인 청크 수(workers x 2)에만 비례합니다.
+
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import sqlite3
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .ranking import SCORING_MODES, cluster_weights, top_k_positions
+from .service import CLUSTER_IDS, RecommendationService
+from .survey import QUESTION_KEYS, questions, determine_clusters
+
+OUTPUT_COLUMNS = ['respondent_id', 'cluster', 'confidence', 'rank', 'content_id', 'title', 'score']
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# 워커 프로세스마다 한 번만 만드는 클러스터별 추천 행 꼬리 (rank 이후 컬럼의 CSV 텍스트)
+_cluster_rows = None
+
+# 개인 맞춤 점수 방식에서 워커가 쓰는 관광지 점수 테이블
+_score_table = None
+
+def _csv_field(value):
+    """CSV 필드 하나를 필요할 때만 따옴표로 감싸 문자열로 변환"""
+    text = str(value)
+    if any(ch in text for ch in ',"\r\n'):
+        text = '"' + text.replace('"', '""') + '"'
+    return text
+
+def build_cluster_rows(service, theme_filter=None, region_filter=None, limit=10):
+    """클러스터별 상위 limit개 추천을 미리 CSV 행 꼬리(rank,content_id,title,score)로 만들어 둠
+
+    필터가 없으면 추천 결과는 클러스터에만 의존하므로 응답자마다 순위를 다시 매길 필요가 없습니다.
+    """
+    return {
+        cluster_id: [
+            ','.join(_csv_field(value) for value in
+                     (rank, record['content_id'], record['title'], round(float(record['score']), 4))) + '\n'
+            for rank, record in enumerate(
+                service.recommend(cluster_id, theme_filter, region_filter, limit), start=1)
+        ]
+        for cluster_id in CLUSTER_IDS
+    }
+
+def build_score_table(service, theme_filter=None, region_filter=None, limit=10):
+    """개인 맞춤 점수용 테이블: 필터 통과 관광지의 (관광지 수 x 3) 점수 행렬과 CSV 필드 접두어"""
+    positions, scores = service.candidate_scores(theme_filter, region_filter)
+    places = service.wellness_df.iloc[positions]
+    return {
+        'scores': scores,
+        'fields': [f"{_csv_field(content_id)},{_csv_field(title)},"
+                   for content_id, title in zip(places['content_id'].tolist(), places['title'].tolist())],
+        'limit': limit,
+    }
+
+def _init_worker(cluster_rows, score_table=None):
+    global _cluster_rows, _score_table
+    _cluster_rows = cluster_rows
+    _score_table = score_table
+
+def rank_chunk_personalized(respondent_ids, result, score_table):
+    """분류 결과의 클러스터 점수 비율로 관광지 점수를 섞어 응답자별 상위 k개 CSV 텍스트 반환
+
+    클러스터 점수는 문항 가중치의 정수 합이라 청크 안의 서로 다른 혼합 가중치는 많지 않으므로
+    고유한 가중치마다 한 번만 점수를 계산하고 CSV 행 꼬리를 만들어 응답자끼리 공유합니다.
+    """
+    weights = cluster_weights({'cluster': result['cluster'], 'cluster_scores': result['cluster_scores']})
+    unique_weights, inverse = np.unique(weights, axis=0, return_inverse=True)
+    scores = unique_weights @ score_table['scores'].T
+    top = top_k_positions(scores, score_table['limit'])
+    top_scores = np.round(np.take_along_axis(scores, top, axis=1), 4).tolist()
+    fields = score_table['fields']
+    tails = [
+        [f"{rank},{fields[position]}{score}\n"
+         for rank, (position, score) in enumerate(zip(positions, row_scores), start=1)]
+        for positions, row_scores in zip(top.tolist(), top_scores)
+    ]
+
+    parts = []
+    for respondent_id, cluster_id, confidence, weight_id in zip(
+            respondent_ids, result['cluster'].tolist(), result['confidence'].tolist(), inverse.ravel().tolist()):
+        prefix = f"{_csv_field(respondent_id)},{cluster_id},{round(confidence, 4)},"
+        parts.extend(prefix + tail for tail in tails[weight_id])
+    return ''.join(parts)
+
+def rank_chunk(respondent_ids, answer_matrix, cluster_rows=None, score_table=None):
+    """답변 청크를 벡터화 분류하고 결과 행들을 CSV 텍스트로 반환 (헤더 제외)"""
+    cluster_rows = cluster_rows or _cluster_rows
+    score_table = score_table or _score_table
+    result = determine_clusters(answer_matrix)
+    if score_table is not None:
+        return rank_chunk_personalized(respondent_ids, result, score_table)
+
+    parts = []
+    for respondent_id, cluster_id, confidence in zip(
+            respondent_ids, result['cluster'].tolist(), result['confidence'].tolist()):
+        prefix = f"{_csv_field(respondent_id)},{cluster_id},{round(confidence, 4)},"
+        parts.extend(prefix + tail for tail in cluster_rows[cluster_id])
+    return ''.join(parts)
+
+def _answer_column_matrix(chunk):
+    """CSV 청크의 q1~q7 컬럼을 정수 배열로 변환 (없는 컬럼과 빈 값은 미응답 -1)"""
+    matrix = np.full((len(chunk), len(QUESTION_KEYS)), -1, dtype=np.int64)
+    for q_idx, q_key in enumerate(QUESTION_KEYS):
+        if q_key in chunk.columns:
+            values = pd.to_numeric(chunk[q_key], errors='coerce')
+            valid = values.notna() & values.between(0, len(questions[q_key]['options']) - 1)
+            matrix[valid.to_numpy(), q_idx] = values[valid].to_numpy(dtype=np.int64)
+    return matrix
+
+def iter_csv_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, id_column='respondent_id', stats=None):
+    """답변 CSV를 청크 단위로 읽어 (응답자 ID 리스트, 답변 배열) 생성
+
+    유효한 답변이 하나도 없는 행은 건너뛰고 stats['skipped']에 셉니다 (--db 입력과 같은 방식).
+    ID 컬럼이 없으면 건너뛴 행을 포함한 CSV 행 번호(0부터)를 ID로 씁니다.
+    """
+    offset = 0
+    for chunk in pd.read_csv(path, chunksize=chunk_size):
+        if id_column in chunk.columns:
+            respondent_ids = np.array(chunk[id_column].tolist(), dtype=object)
+        else:
+            respondent_ids = np.arange(offset, offset + len(chunk))
+        offset += len(chunk)
+        matrix = _answer_column_matrix(chunk)
+        answered = (matrix != -1).any(axis=1)
+        if stats is not None:
+            stats['skipped'] += int((~answered).sum())
+        if answered.any():
+            yield respondent_ids[answered].tolist(), matrix[answered]
+
+def parse_survey_data(survey_data):
+    """user_surveys.survey_data JSON에서 q1~q7 답변 번호 추출 (해석할 수 없으면 None)
+
+    값은 선택지 번호 또는 선택지 문구 모두 허용하며, {"answers": {...}}로 감싼 형식도 읽습니다.
+    """
+    try:
+        data = json.loads(survey_data) if isinstance(survey_data, str) else survey_data
+    except ValueError:
+        return None
+    if isinstance(data, dict) and isinstance(data.get('answers'), dict):
+        data = data['answers']
+    if not isinstance(data, dict):
+        return None
+
+    answers = []
+    for q_key in QUESTION_KEYS:
+        value = data.get(q_key)
+        options = questions[q_key]['options']
+        if isinstance(value, str) and value in options:
+            value = options.index(value)
+        if isinstance(value, bool) or not isinstance(value, int) or not 0 <= value < len(options):
+            value = -1
+        answers.append(value)
+
+    # 문항 키가 하나도 없으면 예전 형식의 설문으로 보고 건너뜀
+    if all(value == -1 for value in answers):
+        return None
+    return answers
+
+def iter_db_chunks(db_path, chunk_size=DEFAULT_CHUNK_SIZE, stats=None):
+    """user_surveys 테이블을 id 순서로 청크 단위로 읽어 (응답자 ID 리스트, 답변 배열) 생성"""
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.execute("SELECT id, username, survey_data FROM user_surveys ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            respondent_ids = []
+            answers = []
+            for survey_id, username, survey_data in rows:
+                parsed = parse_survey_data(survey_data)
+                if parsed is None:
+                    if stats is not None:
+                        stats['skipped'] += 1
+                    continue
+                respondent_ids.append(f"{username}:{survey_id}")
+                answers.append(parsed)
+            if respondent_ids:
+                yield respondent_ids, np.array(answers, dtype=np.int64)
+    finally:
+        conn.close()
+
+def run_batch(chunks, output, cluster_rows, workers=None, score_table=None):
+    """청크를 분류해 출력 파일 객체에 입력 순서대로 기록하고 처리한 응답자 수 반환
+
+    workers가 0이면 현재 프로세스에서 처리하고, 그 외에는 프로세스 풀에서
+    최대 workers x 2개의 청크만 동시에 처리합니다. score_table을 주면 개인 맞춤 점수로 순위를 매깁니다.
+    """
+    processed = 0
+    if workers == 0:
+        for respondent_ids, answer_matrix in chunks:
+            output.write(rank_chunk(respondent_ids, answer_matrix, cluster_rows, score_table))
+            processed += len(respondent_ids)
+        return processed
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cluster_rows, score_table)) as executor:
+        pending = deque()
+        for respondent_ids, answer_matrix in chunks:
+            pending.append((len(respondent_ids),
+                            executor.submit(rank_chunk, respondent_ids, answer_matrix)))
+            # 가장 오래된 청크부터 기록해 출력 순서와 메모리 상한 유지
+            while len(pending) >= max_pending:
+                count, future = pending.popleft()
+                output.write(future.result())
+                processed += count
+        while pending:
+            count, future = pending.popleft()
+            output.write(future.result())
+            processed += count
+    return processed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="웰니스 관광 추천 배치 생성")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--answers', help="q1~q7 컬럼을 가진 답변 CSV 경로")
+    source.add_argument('--db', help="user_surveys 테이블이 있는 SQLite DB 경로")
+    parser.add_argument('--output', required=True, help="추천 결과 CSV 경로")
+    parser.add_argument('--id-column', default='respondent_id', help="답변 CSV의 응답자 ID 컬럼")
+    parser.add_argument('--limit', type=int, default=10, help="응답자별 추천 개수")
+    parser.add_argument('--theme', action='append', help="웰니스 테마 코드 필터 (여러 번 지정 가능)")
+    parser.add_argument('--region', type=int, action='append', help="지역 코드 필터 (여러 번 지정 가능)")
+    parser.add_argument('--scoring', choices=SCORING_MODES, default='cluster',
+                        help="점수 방식 (cluster: 소속 클러스터 점수, personalized: 클러스터 점수 혼합)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=None, help="워커 프로세스 수 (0이면 단일 프로세스)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    service = RecommendationService()
+    cluster_rows = build_cluster_rows(service, args.theme, args.region, args.limit)
+    score_table = None
+    if args.scoring == 'personalized':
+        score_table = build_score_table(service, args.theme, args.region, args.limit)
+
+    stats = {'skipped': 0}
+    if args.answers:
+        chunks = iter_csv_chunks(args.answers, args.chunk_size, args.id_column, stats)
+    else:
+        chunks = iter_db_chunks(args.db, args.chunk_size, stats)
+
+    with open(args.output, 'w', encoding='utf-8-sig', newline='') as output:
+        output.write(','.join(OUTPUT_COLUMNS) + '\n')
+        processed = run_batch(chunks, output, cluster_rows, args.workers, score_table)
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ {processed}명 처리 완료 ({elapsed:.1f}초) → {args.output}")
+    if stats['skipped']:
+        print(f"⚠️ 유효한 답변(q1~q7)이 없는 응답 {stats['skipped']}건은 건너뛰었습니다.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,216 @@
+# wellness/categories.py - 주변 시설 카테고리 분류 체계와 관광지별 개수 인덱스
+#
+# category_map.csv의 3단계 분류(대/중/소분류)를 소분류 순서의 부모 번호 배열로,
+# category_counts.csv의 관광지 x 소분류 개수 행렬을 CSR 희소 행렬로 보관합니다.
+# 상위 분류 집계는 부모 번호 배열로 열을 묶는 희소 연산 한 번이며 분류 단계별로 메모합니다.
+# 코드별 개수, 집계, 패싯 질의는 밀집 행렬을 만들지 않고 indices/data 배열 위의 bincount로 계산합니다.
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .data import load_category_map, load_category_counts
+from .sparse import CsrMatrix
+
+# 분류 단계 (1: 대분류, 2: 중분류, 3: 소분류)
+CATEGORY_LEVELS = (1, 2, 3)
+
+# 분류 체계 원천 컬럼 (코드, 이름)
+_LEVEL_COLUMNS = {
+    1: ('lclsSystm1Cd', 'lclsSystm1Nm'),
+    2: ('lclsSystm2Cd', 'lclsSystm2Nm'),
+    3: ('lclsSystm3Cd', 'lclsSystm3Nm'),
+}
+
+class CategoryTaxonomy:
+    """3단계 카테고리 분류 체계
+
+    단계별 코드/이름 배열과, 소분류 번호 → 상위 단계 번호 배열(parents)을 보관합니다.
+    """
+
+    def __init__(self, category_map):
+        category_map = category_map.drop_duplicates(_LEVEL_COLUMNS[3][0]).reset_index(drop=True)
+        self.codes = {}
+        self.names = {}
+        self.parents = {}
+        for level, (code_column, name_column) in _LEVEL_COLUMNS.items():
+            level_codes, first = np.unique(category_map[code_column].astype(str).to_numpy(), return_index=True)
+            self.codes[level] = level_codes
+            self.names[level] = category_map[name_column].astype(str).to_numpy()[first]
+            # 소분류 행마다 해당 단계 코드의 번호
+            self.parents[level] = np.searchsorted(level_codes, category_map[code_column].astype(str).to_numpy())
+        # 소분류 번호 자체는 코드 정렬 순서
+        leaf_order = np.argsort(self.parents[3], kind='stable')
+        for level in CATEGORY_LEVELS:
+            self.parents[level] = self.parents[level][leaf_order]
+
+    def level_of(self, code):
+        """코드가 속한 분류 단계 (없으면 None)"""
+        for level in CATEGORY_LEVELS:
+            position = np.searchsorted(self.codes[level], code)
+            if position < len(self.codes[level]) and self.codes[level][position] == code:
+                return level
+        return None
+
+    def position(self, code, level=None):
+        """단계 내 코드 번호 (없으면 KeyError)"""
+        level = level or self.level_of(code)
+        if level is None:
+            raise KeyError(code)
+        return level, int(np.searchsorted(self.codes[level], code))
+
+    def name(self, code):
+        """코드의 이름 (없으면 코드 그대로)"""
+        try:
+            level, position = self.position(code)
+        except KeyError:
+            return code
+        return self.names[level][position]
+
+    def leaf_positions(self, code):
+        """코드에 속한 소분류 번호 배열"""
+        level, position = self.position(code)
+        return np.flatnonzero(self.parents[level] == position)
+
+class CategoryIndex:
+    """관광지별 주변 시설 카테고리 개수 (소분류 CSR 희소 행렬 + 단계별 집계)
+
+    previous(같은 분류 체계의 이전 인덱스)와 changed_ids(추가/수정된 contentId)를 주면
+    나머지 관광지 행은 이전 CSR 행을 그대로 옮기고 바뀐 행만 개수 컬럼에서 읽습니다.
+    """
+
+    def __init__(self, category_map, category_counts, version=None, previous=None, changed_ids=None):
+        self.taxonomy = CategoryTaxonomy(category_map)
+        self.version = version
+        self.content_ids = category_counts['contentId'].to_numpy(dtype=np.int64)
+        self.titles = category_counts['title'].to_numpy() if 'title' in category_counts.columns else None
+
+        # 0이 아닌 개수만 (행, 소분류 번호, 개수)로 골라 CSR 생성 (분류 체계에 없는 컬럼은 무시)
+        leaf_codes = self.taxonomy.codes[3]
+        leaf_set = set(leaf_codes)
+        known = [c for c in category_counts.columns if c not in ('contentId', 'title') and c in leaf_set]
+        leaf_positions = np.searchsorted(leaf_codes, np.asarray(known, dtype=leaf_codes.dtype))
+
+        reused = np.zeros(len(self.content_ids), dtype=bool)
+        if (previous is not None and changed_ids is not None
+                and np.array_equal(previous.taxonomy.codes[3], leaf_codes)):
+            old_rows, found = previous._lookup(self.content_ids)
+            reused = found & ~np.isin(self.content_ids, list(changed_ids))
+        fresh = np.flatnonzero(~reused)
+        values = category_counts[known].iloc[fresh].fillna(0).to_numpy(dtype=np.int64)
+        rows, columns = np.nonzero(values)
+        rows, columns, data = fresh[rows], leaf_positions[columns], values[rows, columns]
+        if reused.any():
+            kept = previous.counts.take_rows(old_rows[reused])
+            rows = np.concatenate([rows, np.flatnonzero(reused)[kept.row_ids()]])
+            columns = np.concatenate([columns, kept.indices])
+            data = np.concatenate([data, kept.data])
+        self.counts = CsrMatrix.from_coo(rows, columns, data, (len(category_counts), len(leaf_codes)))
+
+        self._order = np.argsort(self.content_ids, kind='stable')
+        self._levels = {}
+        self._lock = threading.Lock()
+
+    def level_counts(self, level):
+        """관광지 x 분류 단계 코드 개수 CSR 행렬 (단계별로 메모)"""
+        if level == 3:
+            return self.counts
+        result = self._levels.get(level)
+        if result is None:
+            result = self.counts.group_columns(self.taxonomy.parents[level], len(self.taxonomy.codes[level]))
+            with self._lock:
+                self._levels[level] = result
+        return result
+
+    def counts_for(self, code):
+        """관광지별 코드(어느 단계든) 주변 시설 개수 벡터"""
+        level, position = self.taxonomy.position(code)
+        return self.level_counts(level).column(position)
+
+    def _level_rows(self, level, content_ids):
+        """분류 단계 개수 행렬 (content_ids를 주면 해당 관광지 행만)"""
+        counts = self.level_counts(level)
+        return counts if content_ids is None else counts.take_rows(self.rows_for(content_ids))
+
+    def rollup(self, level=1, content_ids=None):
+        """분류 단계별 주변 시설 개수 합계 (code, name, count, destinations 데이터프레임)
+
+        content_ids를 주면 해당 관광지만 집계합니다. destinations는 시설이 하나 이상 있는 관광지 수입니다.
+        """
+        counts = self._level_rows(level, content_ids)
+        n_codes = len(self.taxonomy.codes[level])
+        return pd.DataFrame({
+            'code': self.taxonomy.codes[level],
+            'name': self.taxonomy.names[level],
+            'count': np.bincount(counts.indices, weights=counts.data, minlength=n_codes).astype(np.int64),
+            'destinations': np.bincount(counts.indices, minlength=n_codes),
+        })
+
+    def facet_counts(self, level=1, minimum=1, content_ids=None):
+        """분류 코드별로 주변 시설이 minimum개 이상인 관광지 수 (code, name, destinations 데이터프레임)
+
+        content_ids를 주면 해당 관광지 안에서만 셉니다 (다른 필터를 적용한 뒤의 패싯 개수).
+        """
+        counts = self._level_rows(level, content_ids)
+        n_codes = len(self.taxonomy.codes[level])
+        if minimum <= 0:
+            # 시설이 없는(저장되지 않은 0) 관광지까지 모두 해당
+            destinations = np.full(n_codes, counts.shape[0])
+        else:
+            destinations = np.bincount(counts.indices[counts.data >= minimum], minlength=n_codes)
+        return pd.DataFrame({
+            'code': self.taxonomy.codes[level],
+            'name': self.taxonomy.names[level],
+            'destinations': destinations,
+        })
+
+    def _lookup(self, content_ids):
+        """content_id 배열의 (행 번호, 인덱스에 있는지 여부) 배열 쌍"""
+        content_ids = np.asarray(content_ids, dtype=np.int64)
+        if not len(self._order):
+            return np.zeros(len(content_ids), dtype=np.int64), np.zeros(len(content_ids), dtype=bool)
+        positions = np.searchsorted(self.content_ids, content_ids, sorter=self._order)
+        rows = self._order[np.minimum(positions, len(self._order) - 1)]
+        return rows, self.content_ids[rows] == content_ids
+
+    def rows_for(self, content_ids):
+        """content_id 배열에 대응하는 행 번호 (인덱스에 없는 id는 제외)"""
+        rows, found = self._lookup(content_ids)
+        return rows[found]
+
+    def min_count_mask(self, min_counts):
+        """{코드: 최소 개수} 조건을 모두 만족하는 관광지 행 마스크"""
+        mask = np.ones(len(self.content_ids), dtype=bool)
+        for code, minimum in (min_counts or {}).items():
+            mask &= self.counts_for(code) >= minimum
+        return mask
+
+    def content_ids_with(self, min_counts):
+        """{코드: 최소 개수} 조건을 모두 만족하는 관광지 content_id 배열 (예: {'FD': 5})"""
+        return self.content_ids[self.min_count_mask(min_counts)]
+
+    def mask_for(self, content_ids, min_counts):
+        """주어진 content_id 순서의 조건 충족 마스크 (개수 정보가 없는 관광지는 False)"""
+        rows, found = self._lookup(content_ids)
+        if not found.any():
+            return found
+        return found & self.min_count_mask(min_counts)[rows]
+
+def normalize_category_filter(category_filter):
+    """카테고리 필터 입력을 (코드, 최소 개수) 정렬 튜플로 정규화 (조건이 없으면 None)
+
+    {'FD': 5} 딕셔너리 또는 [('FD', 5)] 형태를 받으며 최소 개수가 1 미만인 조건은 무시합니다.
+    """
+    if not category_filter:
+        return None
+    items = category_filter.items() if isinstance(category_filter, dict) else category_filter
+    normalized = tuple(sorted((str(code), int(minimum)) for code, minimum in items if int(minimum) >= 1))
+    return normalized or None
+
+def get_category_index(data_dir=None):
+    """프로세스 공용 카테고리 인덱스 (데이터셋 관리자의 현재 스냅숏, data_dir을 지정하면 새로 생성)"""
+    if data_dir is not None:
+        return CategoryIndex(load_category_map(data_dir), load_category_counts(data_dir))
+    from .datasets import get_dataset
+    return get_dataset('category_index')
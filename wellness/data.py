@@ -0,0 +1,142 @@
+# wellness/data.py - GIS CSV 데이터 로딩 (Streamlit 비의존)
+
+import os
+
+import pandas as pd
+
+from .parsing import add_price_columns, add_travel_columns
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT_DIR, 'GIS')
+REGION_DATA_PATH = os.path.join(ROOT_DIR, 'region_data.csv')
+
+# 한국관광공사 데이터의 언어 구분 코드(langDivCd) 중 한국어
+KOREAN_LANGUAGE_CODE = 'KOR'
+
+def data_path(filename, data_dir=None):
+    """데이터 디렉토리 기준 파일 경로 반환"""
+    return os.path.join(data_dir or DATA_DIR, filename)
+
+def load_wellness_destinations(data_dir=None):
+    """실제 CSV 파일들에서 웰니스 관광지 데이터 로드"""
+    # 웰니스 관광지 기본 정보 (다른 언어 행은 번역으로만 쓰므로 한국어 행만 사용)
+    wellness_df = pd.read_csv(data_path('wellness_tourism_list.csv', data_dir))
+    if 'langDivCd' in wellness_df.columns:
+        wellness_df = wellness_df[wellness_df['langDivCd'].fillna(KOREAN_LANGUAGE_CODE) == KOREAN_LANGUAGE_CODE]
+
+    # 클러스터 점수 정보 (기본 정보와 겹치는 컬럼은 기본 정보 쪽을 사용)
+    cluster_score_df = pd.read_csv(data_path('wellness_cluster_score.csv', data_dir))
+    overlapping = [col for col in cluster_score_df.columns
+                   if col != 'contentId' and col in wellness_df.columns]
+    cluster_score_df = cluster_score_df.drop(columns=overlapping)
+
+    # 두 데이터프레임 조인
+    df = pd.merge(wellness_df, cluster_score_df, on='contentId', how='inner')
+
+    # address 컬럼 생성 (addr1이 있다면 사용)
+    if 'addr1' in df.columns:
+        df['address'] = df['addr1']
+    else:
+        df['address'] = "주소 정보 없음"
+
+    # wellness_theme 컬럼 생성 (wellnessThemaCd 사용)
+    if 'wellnessThemaCd' in df.columns:
+        df['wellness_theme'] = df['wellnessThemaCd']
+    else:
+        df['wellness_theme'] = "A0202"  # 기본값
+
+    # 필수 컬럼 매핑
+    column_mapping = {
+        'contentId': 'content_id',
+        'mapX': 'longitude',
+        'mapY': 'latitude',
+        'lDongRegnCd': 'region_code'
+    }
+    df = df.rename(columns=column_mapping)
+
+    # NaN 값 처리
+    df['address'] = df['address'].fillna('주소 정보 없음')
+    df['wellness_theme'] = df['wellness_theme'].fillna('A0202')
+    df['region_code'] = df['region_code'].fillna('0')
+
+    return df
+
+def file_version(path):
+    """파일 수정 시각과 크기로 데이터 파일 버전 식별"""
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+def load_region_destinations(path=None):
+    """프리미엄 웰니스 관광지(region_data.csv) 데이터 로드 (유형, 평점, 가격대, 인천 기준 거리 포함)
+
+    가격대와 이동 시간/비용 문구는 로드 시점에 숫자 컬럼(원, 분)으로 해석해 둡니다.
+    """
+    return add_travel_columns(add_price_columns(pd.read_csv(path or REGION_DATA_PATH)))
+
+def load_destination_translations(data_dir=None):
+    """웰니스 관광지 목록의 한국어 외 언어 행 (contentId, oldContentId, langDivCd, title, 있으면 overview)"""
+    df = pd.read_csv(data_path('wellness_tourism_list.csv', data_dir))
+    if 'langDivCd' not in df.columns:
+        return df.iloc[:0]
+    columns = [col for col in ('contentId', 'oldContentId', 'langDivCd', 'title', 'overview') if col in df.columns]
+    return df.loc[df['langDivCd'].notna() & (df['langDivCd'] != KOREAN_LANGUAGE_CODE), columns]
+
+def load_wellness_nearby_spots(data_dir=None):
+    """웰니스 관광지 주변 관광지 데이터 로드"""
+    return pd.read_csv(data_path('wellness_nearby_spots_list.csv', data_dir))
+
+def load_category_map(data_dir=None):
+    """카테고리 매핑 정보 로드"""
+    # 대분류 코드 'NA'(자연관광)가 결측값으로 읽히지 않도록 빈 칸만 결측으로 처리
+    return pd.read_csv(data_path('category_map.csv', data_dir), keep_default_na=False, na_values=[''])
+
+def load_category_counts(data_dir=None):
+    """웰니스 관광지별 주변 시설 카테고리(소분류) 개수 로드"""
+    return pd.read_csv(data_path('category_counts.csv', data_dir))
+
+def get_wellness_theme_names():
+    """웰니스 테마 코드-이름 매핑"""
+    return {
+        'A0101': '자연',
+        'A0102': '인문(문화/예술/역사)',
+        'A0201': '숙박',
+        'A0202': '관광지',
+        'A0203': '레포츠',
+        'A0204': '쇼핑',
+        'A0205': '음식',
+        'A0206': '교통',
+        'A0207': '문화시설',
+        'A0208': '축제공연행사',
+        'B0201': '숙박업소',
+        'C0101': '추천코스',
+        'C0102': '가족코스',
+        'C0103': '나홀로코스',
+        'C0104': '힐링코스',
+        'C0105': '도보코스',
+        'C0106': '캠핑코스',
+        'C0107': '맛코스',
+        'C0108': '문화관광코스',
+        'C0109': '건강걷기코스'
+    }
+
+def get_region_names():
+    """지역 코드-이름 매핑"""
+    return {
+        1: '서울특별시',
+        2: '인천광역시',
+        3: '대전광역시',
+        4: '대구광역시',
+        5: '광주광역시',
+        6: '부산광역시',
+        7: '울산광역시',
+        8: '세종특별자치시',
+        31: '경기도',
+        32: '강원도',
+        33: '충청북도',
+        34: '충청남도',
+        35: '경상북도',
+        36: '경상남도',
+        37: '전라북도',
+        38: '전라남도',
+        39: '제주특별자치도'
+    }
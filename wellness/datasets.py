@@ -0,0 +1,476 @@
+# wellness/datasets.py - GIS CSV 데이터셋 변경 감지와 백그라운드 증분 갱신
+#
+# 원천 데이터셋(CSV)과, 그로부터 만드는 파생 데이터셋(표준 관광지 테이블, 추천 서비스, 통계 큐브,
+# 지역/카테고리/유사도 인덱스 등)을 한 관리자가 한 벌의 스냅숏으로 제공합니다.
+# 원천 파일의 (수정 시각, 크기)는 CHECK_INTERVAL_SECONDS 간격으로만 확인하고, 바뀌었으면
+# 백그라운드 스레드 하나가
+#   1. 내용 해시(SHA-1)를 비교해 실제로 바뀐 원천만 다시 읽고 (touch, 복사 등은 무시,
+#      CSV는 행 단위로 골라 읽을 수 없으므로 바뀐 파일은 전체를 읽음)
+#      키 컬럼(content_id/contentId, mdfcnDt)으로 추가/삭제/수정된 행을 구한 뒤,
+#   2. 바뀐 원천에 의존하는 파생 데이터셋을 등록 순서대로 갱신하고
+#      (행 변경 내역을 알면 이전 값에 바뀐 행만 반영, 모르면 새로 생성),
+#   3. 모든 스냅숏을 담은 사전 참조 하나를 바꿔 끼웁니다.
+# 행 변경 내역을 반영하는 파생 데이터셋
+#   - 표준 관광지 테이블: 바뀐 GIS 행만 region_data.csv와 다시 조인 (region_data.csv가 그대로일 때)
+#   - 추천 서비스, 언어별 조회 테이블: 바뀌지 않은 관광지의 레코드/문자열 재사용
+#   - 통계 큐브, 지역 인덱스: 평점 보유 행이 바뀌지 않았으면 이전 값을 그대로 사용 (아니면 새로 생성)
+#   - 카테고리 인덱스: 바뀐 관광지 행만 CSR로 변환하고 나머지는 이전 행 재사용
+#   - 유사도 인덱스: 바뀐 행과 영향받은 이웃 목록만 다시 계산
+# 요청 쪽은 항상 현재 스냅숏을 바로 받으므로, 처음 로드할 때를 제외하면 다시 읽기나
+# 인덱스 재생성을 기다리지 않고, 파생 데이터셋끼리 서로 다른 버전이 섞이지 않습니다.
+
+import hashlib
+import threading
+import time
+
+import pandas as pd
+
+from .data import (REGION_DATA_PATH, data_path, file_version, load_category_counts, load_category_map,
+                   load_destination_translations, load_region_destinations, load_wellness_destinations,
+                   load_wellness_nearby_spots)
+
+# 원천 파일 수정 시각/크기를 다시 확인하는 최소 간격 (초)
+CHECK_INTERVAL_SECONDS = 5.0
+
+# 내용 해시를 계산할 때 한 번에 읽는 바이트 수
+_HASH_BLOCK_BYTES = 1 << 20
+
+def file_digest(paths):
+    """파일들의 내용 해시 (SHA-1, 파일 순서 포함)"""
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_BYTES), b''):
+                digest.update(block)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def _same_values(left, right):
+    """같은 모양의 두 데이터프레임에서 행별로 모든 값이 같은지 (둘 다 결측이면 같음)"""
+    equal = (left == right) | (left.isna() & right.isna())
+    return equal.all(axis=1).to_numpy()
+
+def diff_rows(old, new, key, modified_column=None):
+    """키 컬럼 기준 행 변경 내역 {'added', 'removed', 'modified'} (키 리스트), 비교할 수 없으면 None
+
+    modified_column(예: mdfcnDt)이 달라진 행은 바로 수정으로 보고, 나머지 행은 값을 직접 비교합니다.
+    (수정 일시가 없는 파일과 합쳐진 데이터셋도 있어 수정 일시만으로는 판단하지 않습니다.)
+    """
+    if (key not in old.columns or key not in new.columns or list(old.columns) != list(new.columns)
+            or old[key].duplicated().any() or new[key].duplicated().any()):
+        return None
+
+    old_keys = pd.Index(old[key])
+    new_keys = pd.Index(new[key])
+    common = new_keys[new_keys.isin(old_keys)]
+    old_common = old.set_index(key).loc[common]
+    new_common = new.set_index(key).loc[common]
+
+    modified = pd.Series(False, index=common)
+    if modified_column is not None and modified_column in new_common.columns:
+        modified |= (old_common[modified_column] != new_common[modified_column]).to_numpy()
+    unchecked = ~modified.to_numpy()
+    if unchecked.any():
+        modified[unchecked] = ~_same_values(old_common[unchecked], new_common[unchecked])
+
+    return {
+        'added': new_keys[~new_keys.isin(old_keys)].tolist(),
+        'removed': old_keys[~old_keys.isin(new_keys)].tolist(),
+        'modified': common[modified.to_numpy()].tolist(),
+    }
+
+class DatasetSnapshot:
+    """한 시점의 데이터셋 (공유되므로 호출 측에서 frame을 수정하지 않아야 합니다)
+
+    원천 데이터셋은 frame이 데이터프레임이고 fingerprints가 파일 정보, 파생 데이터셋은 frame이
+    만들어진 값(서비스, 인덱스 등)이고 sources가 만들 때 쓴 의존 데이터셋별 버전입니다.
+    changes는 previous_digest 버전 대비 행 변경 내역입니다 (키 컬럼이 없거나 비교할 수 없으면 None).
+    """
+
+    def __init__(self, frame, fingerprints, digest, changes=None, previous_digest=None, sources=None):
+        self.frame = frame
+        self.fingerprints = fingerprints
+        self.digest = digest
+        self.changes = changes
+        self.previous_digest = previous_digest
+        self.sources = sources or {}
+        self.loaded_at = time.time()
+        if isinstance(frame, pd.DataFrame):
+            frame.attrs['dataset_version'] = digest
+
+    @property
+    def version(self):
+        """내용 해시 기반 데이터셋 버전"""
+        return self.digest
+
+def _derived_digest(name, sources, salt=''):
+    """파생 데이터셋 버전 (이름, 의존 데이터셋 버전, salt의 해시)"""
+    digest = hashlib.sha1(f"{name}\0{salt}".encode('utf-8'))
+    for source, version in sorted(sources.items()):
+        digest.update(f"\0{source}={version}".encode('utf-8'))
+    return digest.hexdigest()
+
+class DatasetManager:
+    """등록된 데이터셋의 현재 스냅숏을 제공하고, 원천 파일이 바뀌면 백그라운드에서 갱신"""
+
+    def __init__(self, check_interval=CHECK_INTERVAL_SECONDS):
+        self.check_interval = check_interval
+        self._specs = {}
+        # 이름 → 스냅숏 (교체할 때는 새 사전을 만들어 참조만 바꿈)
+        self._snapshots = {}
+        self._checked_at = 0.0
+        self._refreshing = False
+        self._load_locks = {}
+        self._lock = threading.Lock()
+        # 데이터셋별 마지막 백그라운드 갱신 오류 (성공하면 제거)
+        self.errors = {}
+
+    def register(self, name, loader, paths, key=None, modified_column=None):
+        """원천 데이터셋 등록 (loader는 인자 없이 데이터프레임 반환, key가 있으면 행 변경 내역 계산)"""
+        self._specs[name] = {
+            'loader': loader,
+            'paths': list(paths),
+            'key': key,
+            'modified_column': modified_column,
+        }
+        self._load_locks[name] = threading.Lock()
+
+    def register_derived(self, name, build, depends, salt='', changes=None):
+        """파생 데이터셋 등록 (의존 데이터셋은 먼저 등록되어 있어야 함)
+
+        build(inputs, previous, version)는 의존 데이터셋별 스냅숏 사전, 이전 스냅숏(없으면 None),
+        새 버전 문자열을 받아 값을 반환합니다. salt는 코드/스키마 버전처럼 버전에 더할 값입니다.
+        changes(inputs, previous, value)를 주면 이전 값 대비 행 변경 내역(없으면 None)을 스냅숏에
+        기록해, 이 데이터셋에 의존하는 파생 데이터셋도 바뀐 행만 갱신할 수 있게 합니다.
+        """
+        unknown = [dependency for dependency in depends if dependency not in self._specs]
+        if unknown:
+            raise ValueError(f"dataset '{name}' depends on unregistered '{unknown[0]}'")
+        self._specs[name] = {'build': build, 'depends': tuple(depends), 'salt': salt, 'changes': changes}
+        self._load_locks[name] = threading.Lock()
+
+    @property
+    def names(self):
+        """등록된 데이터셋 이름"""
+        return list(self._specs)
+
+    @property
+    def version(self):
+        """현재 로드된 모든 스냅숏을 묶은 버전"""
+        snapshots = self._snapshots
+        return _derived_digest('', {name: snapshot.digest for name, snapshot in snapshots.items()})
+
+    def _is_derived(self, name):
+        return 'build' in self._specs[name]
+
+    def snapshot(self, name):
+        """현재 스냅숏 (처음에는 동기 로드, 이후에는 필요하면 백그라운드 갱신만 예약)"""
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            with self._load_locks[name]:
+                snapshot = self._snapshots.get(name)
+                if snapshot is None:
+                    snapshot = self._load(name)
+                    with self._lock:
+                        self._snapshots = dict(self._snapshots, **{name: snapshot})
+            return snapshot
+        self._schedule_check()
+        return snapshot
+
+    def get(self, name):
+        """현재 데이터프레임 또는 파생 값 (공유 객체)"""
+        return self.snapshot(name).frame
+
+    def is_loaded(self, name):
+        """스냅숏이 한 번이라도 로드되었는지"""
+        return name in self._snapshots
+
+    def refresh(self, name=None, wait=False):
+        """변경 확인을 즉시 실행 (wait=False면 백그라운드 스레드에서, name이 아직 없으면 먼저 로드)"""
+        if name is not None and name not in self._snapshots:
+            self.snapshot(name)
+            return
+        if wait:
+            with self._lock:
+                self._refreshing = True
+            self._refresh()
+        else:
+            self._start_refresh()
+
+    def _fingerprints(self, name):
+        """원천 파일들의 (경로, 수정 시각, 크기)"""
+        return tuple(file_version(path) for path in self._specs[name]['paths'])
+
+    def _load(self, name):
+        """원천 파일을 전부 읽거나 (원천), 의존 데이터셋으로 값을 만들어 (파생) 새 스냅숏 생성"""
+        spec = self._specs[name]
+        if self._is_derived(name):
+            inputs = {dependency: self.snapshot(dependency) for dependency in spec['depends']}
+            return self._build(name, inputs, None)
+        fingerprints = self._fingerprints(name)
+        digest = file_digest(spec['paths'])
+        return DatasetSnapshot(spec['loader'](), fingerprints, digest)
+
+    def _build(self, name, inputs, previous):
+        """의존 스냅숏으로 파생 스냅숏 생성"""
+        spec = self._specs[name]
+        sources = {dependency: snapshot.digest for dependency, snapshot in inputs.items()}
+        digest = _derived_digest(name, sources, spec['salt'])
+        value = spec['build'](inputs, previous, digest)
+        changes = None
+        if previous is not None and spec['changes'] is not None:
+            changes = spec['changes'](inputs, previous, value)
+        return DatasetSnapshot(value, None, digest, changes, previous_digest=previous.digest if previous is not None else None,
+                               sources=sources)
+
+    def _stale(self, snapshots):
+        """원천 파일 정보가 바뀌었거나, 의존 데이터셋 버전과 어긋난 스냅숏이 있는지"""
+        for name, snapshot in snapshots.items():
+            spec = self._specs[name]
+            if self._is_derived(name):
+                if any(dependency in snapshots and snapshots[dependency].digest != snapshot.sources.get(dependency)
+                       for dependency in spec['depends']):
+                    return True
+            elif self._fingerprints(name) != snapshot.fingerprints:
+                return True
+        return False
+
+    def _schedule_check(self):
+        """확인 간격이 지났고 바뀐 데이터셋이 있으면 백그라운드 갱신 시작"""
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        try:
+            stale = self._stale(self._snapshots)
+        except OSError as e:
+            # 파일이 교체 중이거나 사라졌으면 기존 스냅숏을 계속 사용
+            self.errors['files'] = str(e)
+            return
+        if stale:
+            self._start_refresh()
+
+    def _start_refresh(self):
+        """갱신 스레드는 하나만 실행"""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._refresh, name="dataset-refresh", daemon=True).start()
+
+    def _refresh_source(self, name, current):
+        """원천 하나를 다시 확인해 새 스냅숏 반환 (내용이 같으면 파일 정보만 갱신한 기존 스냅숏)
+
+        내용이 바뀐 파일은 전체를 다시 읽고, key가 있으면 이전 데이터프레임과 비교한 행 변경 내역을
+        스냅숏에 담습니다 (데이터프레임 자체는 새로 읽은 것). 변경 내역은 파생 데이터셋 갱신에 쓰입니다.
+        """
+        spec = self._specs[name]
+        fingerprints = self._fingerprints(name)
+        if fingerprints == current.fingerprints:
+            return current
+        digest = file_digest(spec['paths'])
+        if digest == current.digest:
+            # 내용은 그대로이고 수정 시각만 바뀜: 다시 읽지 않고 파일 정보만 갱신
+            current.fingerprints = fingerprints
+            return current
+        frame = spec['loader']()
+        changes = None
+        if spec['key'] is not None:
+            changes = diff_rows(current.frame, frame, spec['key'], spec['modified_column'])
+        return DatasetSnapshot(frame, fingerprints, digest, changes, previous_digest=current.digest)
+
+    def _refresh(self):
+        """바뀐 원천을 다시 읽고 영향받은 파생 데이터셋을 다시 만든 뒤 한 번에 교체
+
+        데이터셋 하나가 실패하면 그 데이터셋(과 그에 의존하는 파생 데이터셋)은 기존 스냅숏을 유지합니다.
+        """
+        try:
+            current = self._snapshots
+            updated = dict(current)
+            for name in self._specs:
+                if name not in current:
+                    continue
+                try:
+                    if self._is_derived(name):
+                        spec = self._specs[name]
+                        sources = {dependency: updated[dependency].digest for dependency in spec['depends']}
+                        if sources != current[name].sources:
+                            inputs = {dependency: updated[dependency] for dependency in spec['depends']}
+                            updated[name] = self._build(name, inputs, current[name])
+                    else:
+                        updated[name] = self._refresh_source(name, current[name])
+                    self.errors.pop(name, None)
+                except Exception as e:
+                    self.errors[name] = str(e)
+            self.errors.pop('files', None)
+            with self._lock:
+                # 갱신 중 처음 로드된 데이터셋은 그대로 두고 (다음 확인 때 버전을 맞춤) 나머지만 교체
+                self._snapshots = dict(self._snapshots, **updated)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+def _source_changes(inputs, previous, source, unchanged=()):
+    """previous를 만든 뒤 source의 행 변경 내역 {'added', 'removed', 'modified'}
+
+    unchanged에 든 다른 의존 데이터셋도 그대로여야 하며, 변경 내역을 알 수 없으면 None (전부 다시 생성).
+    """
+    snapshot = inputs[source]
+    if (previous is None or snapshot.changes is None
+            or previous.sources.get(source) != snapshot.previous_digest
+            or any(previous.sources.get(name) != inputs[name].digest for name in unchanged)):
+        return None
+    return snapshot.changes
+
+def _changed_content_ids(inputs, previous, source='destination_table', unchanged=()):
+    """previous를 만든 뒤 source에서 추가/수정된 content_id 집합 (알 수 없으면 None)"""
+    changes = _source_changes(inputs, previous, source, unchanged)
+    if changes is None:
+        return None
+    return set(changes['added']) | set(changes['modified'])
+
+def _build_destination_table(inputs, previous):
+    """표준 관광지 테이블 (region_data.csv가 그대로이고 GIS 행 변경 내역을 알면 바뀐 행만 다시 조인)"""
+    from .schema import build_destination_table, update_destination_table
+    wellness = inputs['wellness_destinations'].frame
+    region = inputs['region_destinations'].frame
+    changed = _changed_content_ids(inputs, previous, 'wellness_destinations', unchanged=('region_destinations',))
+    if changed is None:
+        return build_destination_table(wellness, region)
+    return update_destination_table(previous.frame, wellness, region, changed)
+
+def _destination_table_changes(inputs, previous, table):
+    """표준 관광지 테이블의 content_id 변경 내역 (GIS 행 변경 내역 + 평점 보유 행 중 바뀐 content_id 'rated')
+
+    GIS 행만 바뀐 경우에만 알 수 있으며, region_data.csv가 바뀌었으면 None입니다.
+    """
+    from .schema import rated_destinations
+    changes = _source_changes(inputs, previous, 'wellness_destinations', unchanged=('region_destinations',))
+    if changes is None:
+        return None
+    touched = set(changes['added']) | set(changes['removed']) | set(changes['modified'])
+    # 관광지명이 바뀌어 region_data.csv 행과 새로 맞거나 떨어진 관광지도 이전/새 테이블 중 한쪽에서 평점 보유 행
+    rated = (set(rated_destinations(previous.frame)['content_id'].dropna().tolist())
+             | set(rated_destinations(table)['content_id'].dropna().tolist()))
+    return dict(changes, rated=sorted(touched & rated))
+
+def _rated_rows_unchanged(inputs, previous):
+    """이전 값을 만든 뒤 표준 테이블의 평점 보유 행(통계 큐브, 지역 인덱스 대상)이 그대로인지"""
+    changes = _source_changes(inputs, previous, 'destination_table')
+    return changes is not None and not changes['rated']
+
+def _register_default_datasets(manager, data_dir=None):
+    """GIS CSV 원천 데이터셋과 그로부터 만드는 파생 데이터셋(테이블, 서비스, 인덱스) 등록"""
+    from .categories import CategoryIndex
+    from .localization import LocalizedContent
+    from .region_index import RegionIndex
+    from .schema import SCHEMA_VERSION, rated_destinations, recommendable_destinations
+    from .service import RecommendationService
+    from .similarity import SimilarityIndex
+    from .stats import StatisticsCube
+
+    manager.register(
+        'wellness_destinations',
+        lambda: load_wellness_destinations(data_dir),
+        [data_path('wellness_tourism_list.csv', data_dir), data_path('wellness_cluster_score.csv', data_dir)],
+        key='content_id',
+        modified_column='mdfcnDt',
+    )
+    manager.register(
+        'wellness_nearby_spots',
+        lambda: load_wellness_nearby_spots(data_dir),
+        [data_path('wellness_nearby_spots_list.csv', data_dir)],
+    )
+    manager.register(
+        'category_map',
+        lambda: load_category_map(data_dir),
+        [data_path('category_map.csv', data_dir)],
+    )
+    manager.register(
+        'category_counts',
+        lambda: load_category_counts(data_dir),
+        [data_path('category_counts.csv', data_dir)],
+        key='contentId',
+    )
+    manager.register('region_destinations', load_region_destinations, [REGION_DATA_PATH])
+    manager.register(
+        'destination_translations',
+        lambda: load_destination_translations(data_dir),
+        [data_path('wellness_tourism_list.csv', data_dir)],
+    )
+
+    # 표준 관광지 테이블과 그 위의 서비스/인덱스 (모두 테이블 버전을 자신의 버전으로 사용)
+    manager.register_derived(
+        'destination_table',
+        lambda inputs, previous, version: _build_destination_table(inputs, previous),
+        ('wellness_destinations', 'region_destinations'),
+        salt=SCHEMA_VERSION,
+        changes=_destination_table_changes,
+    )
+    manager.register_derived(
+        'recommendation_service',
+        # 추가/수정되지 않은 관광지의 추천 레코드는 이전 서비스에서 재사용
+        lambda inputs, previous, version: RecommendationService(
+            recommendable_destinations(inputs['destination_table'].frame),
+            previous=previous.frame if previous is not None else None,
+            changed_ids=_changed_content_ids(inputs, previous)),
+        ('destination_table',),
+    )
+    # 평점 보유 행이 그대로이면 이전 큐브/인덱스(와 그 버전으로 캐시한 차트)를 그대로 사용
+    manager.register_derived(
+        'statistics_cube',
+        lambda inputs, previous, version: previous.frame if _rated_rows_unchanged(inputs, previous) else
+        StatisticsCube.from_frame(rated_destinations(inputs['destination_table'].frame),
+                                  inputs['destination_table'].digest),
+        ('destination_table',),
+    )
+    manager.register_derived(
+        'region_index',
+        lambda inputs, previous, version: previous.frame if _rated_rows_unchanged(inputs, previous) else
+        RegionIndex(rated_destinations(inputs['destination_table'].frame), inputs['destination_table'].digest),
+        ('destination_table',),
+    )
+    manager.register_derived(
+        'localized_content',
+        # 번역 행과 카테고리 매핑이 그대로이면 추가/수정되지 않은 관광지의 언어별 문자열은 이전 테이블에서 재사용
+        lambda inputs, previous, version: LocalizedContent.from_frames(
+            inputs['destination_table'].frame, inputs['destination_translations'].frame,
+            inputs['destination_table'].digest, previous=previous.frame if previous is not None else None,
+            changed_ids=_changed_content_ids(inputs, previous,
+                                             unchanged=('destination_translations', 'category_map')),
+            category_map=inputs['category_map'].frame),
+        ('destination_table', 'destination_translations', 'category_map'),
+    )
+
+    # 주변 시설 카테고리 인덱스와 유사 관광지 이웃 목록 (이전 목록에서 바뀐 행만 갱신)
+    manager.register_derived(
+        'category_index',
+        lambda inputs, previous, version: CategoryIndex(
+            inputs['category_map'].frame, inputs['category_counts'].frame, version,
+            previous=previous.frame if previous is not None else None,
+            changed_ids=_changed_content_ids(inputs, previous, 'category_counts', unchanged=('category_map',))),
+        ('category_map', 'category_counts'),
+    )
+    manager.register_derived(
+        'similarity_index',
+        lambda inputs, previous, version: SimilarityIndex.from_category_index(
+            inputs['category_index'].frame, previous=previous.frame if previous is not None else None),
+        ('category_index',),
+    )
+    return manager
+
+_manager = None
+_manager_lock = threading.Lock()
+
+def get_dataset_manager():
+    """프로세스 공용 데이터셋 관리자"""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = _register_default_datasets(DatasetManager())
+    return _manager
+
+def get_dataset(name):
+    """프로세스 공용 데이터셋의 현재 데이터프레임 또는 파생 값 (공유 객체이므로 수정하지 말 것)"""
+    return get_dataset_manager().get(name)
@@ -0,0 +1,97 @@
+# wellness/diversity.py - 추천 목록 다양성 재정렬 (MMR, Maximal Marginal Relevance)
+#
+# 상위 추천이 한 지역/테마(예: 제주 리조트 여러 곳)에 몰리지 않도록, 후보를 하나씩 고를 때
+#   λ x 관련도(점수를 0~1로 정규화) - (1 - λ) x 이미 고른 관광지와의 최대 유사도
+# 가 가장 큰 후보를 선택합니다. 유사도는 같은 지역, 같은 테마, 지리적 근접도의 가중합입니다.
+# 관광지 간 유사도는 코드/좌표 배열로 후보 블록 단위로 벡터화해 계산하며 (관광지 수가 적으면
+# 전체 행렬을 미리 계산), 후보별 최대 유사도 벡터는 하나를 고를 때마다 그 행 하나로만 갱신하므로
+# 후보 n개에서 k개를 고르는 비용은 O(n x k)입니다.
+
+import numpy as np
+
+from .geo import haversine_km
+
+# 유사도 구성 요소 가중치 (합 1)
+DEFAULT_DIVERSITY_WEIGHTS = {'region': 0.4, 'theme': 0.3, 'geo': 0.3}
+
+# 지리 유사도 exp(-거리 / 척도)의 거리 척도 (km)
+GEO_SCALE_KM = 50.0
+
+# 관련도 가중치 λ 기본값 (1이면 재정렬 없음)
+DEFAULT_DIVERSITY_LAMBDA = 0.5
+
+# 이 수 이하의 관광지는 전체 유사도 행렬을 미리 계산
+PRECOMPUTE_LIMIT = 2048
+
+class DiversitySimilarity:
+    """관광지 간 지역/테마/거리 유사도 (0~1)"""
+
+    def __init__(self, region_codes, theme_codes, latitudes, longitudes, weights=None):
+        weights = dict(DEFAULT_DIVERSITY_WEIGHTS, **(weights or {}))
+        self.weights = weights
+        # 문자열/정수가 섞인 코드도 빠르게 비교하도록 정수 번호로 변환
+        self.regions = np.unique(np.asarray(region_codes).astype(str), return_inverse=True)[1].ravel()
+        self.themes = np.unique(np.asarray(theme_codes).astype(str), return_inverse=True)[1].ravel()
+        self.latitudes = np.asarray(latitudes, dtype=float)
+        self.longitudes = np.asarray(longitudes, dtype=float)
+        self._matrix = None
+        if len(self.regions) <= PRECOMPUTE_LIMIT:
+            everything = np.arange(len(self.regions))
+            self._matrix = self._compute(everything, everything)
+
+    @classmethod
+    def from_frame(cls, df, weights=None):
+        """표준 스키마 관광지 데이터프레임으로 생성"""
+        return cls(df['region_code'].to_numpy(), df['wellness_theme'].to_numpy(),
+                   df['latitude'].to_numpy(), df['longitude'].to_numpy(), weights)
+
+    def _compute(self, rows, columns):
+        """rows x columns 유사도 블록 계산"""
+        rows, columns = rows[:, None], columns[None, :]
+        block = self.weights['region'] * (self.regions[rows] == self.regions[columns])
+        block = block + self.weights['theme'] * (self.themes[rows] == self.themes[columns])
+        distance = haversine_km(self.latitudes[rows], self.longitudes[rows],
+                                self.latitudes[columns], self.longitudes[columns])
+        # 좌표가 없으면 지리 유사도 0
+        geo = np.nan_to_num(np.exp(-distance / GEO_SCALE_KM), nan=0.0)
+        return block + self.weights['geo'] * geo
+
+    def block(self, rows, columns):
+        """관광지 위치 rows x columns 유사도 블록"""
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        if self._matrix is not None:
+            return self._matrix[np.ix_(rows, columns)]
+        return self._compute(rows, columns)
+
+def normalize_relevance(scores):
+    """점수를 후보 안에서 0~1로 정규화 (모두 같으면 1)"""
+    scores = np.asarray(scores, dtype=float)
+    low, high = scores.min(), scores.max()
+    if high <= low:
+        return np.ones_like(scores)
+    return (scores - low) / (high - low)
+
+def mmr_select(positions, scores, similarity, k, diversity_lambda=DEFAULT_DIVERSITY_LAMBDA):
+    """후보 관광지 위치와 점수에서 MMR로 k개를 골라 후보 순번 배열로 반환
+
+    첫 후보는 관련도 최대값이며, 이후에는 후보별 '이미 고른 관광지와의 최대 유사도' 벡터를
+    새로 고른 관광지의 유사도 행 하나로만 갱신합니다. 동점이면 앞 순번 후보를 고릅니다.
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    k = min(int(k), len(positions))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    relevance = diversity_lambda * normalize_relevance(scores)
+    max_similarity = np.zeros(len(positions))
+    available = np.ones(len(positions), dtype=bool)
+    selected = np.empty(k, dtype=np.int64)
+    for step in range(k):
+        marginal = np.where(available, relevance - (1 - diversity_lambda) * max_similarity, -np.inf)
+        choice = int(np.argmax(marginal))
+        selected[step] = choice
+        available[choice] = False
+        np.maximum(max_similarity, similarity.block(positions[choice:choice + 1], positions)[0],
+                   out=max_similarity)
+    return selected
@@ -0,0 +1,108 @@
+# wellness/export.py - 추천 결과 내보내기
+#
+# 추천 레코드(표준 스키마 기반 build_place_record 결과)를 중간 DataFrame이나 큰 문자열 없이
+# 행 묶음 단위로 바로 인코딩해 바이트 조각으로 흘려보냅니다 (iter_*_csv). HTTP API의
+# POST /recommendations/export는 이 조각을 chunked 응답으로 바로 보내고, Streamlit 다운로드
+# 버튼은 파일 전체가 필요하므로 클릭했을 때만 조각을 한 번 이어 붙입니다 (export_*_to_csv).
+# 컬럼 구성은 EXPORT_COLUMNS로 고정되어 있어 페이지나 레코드 종류와 관계없이 항상 같은 스키마의
+# CSV가 만들어집니다.
+
+import csv
+import io
+
+from .data import get_wellness_theme_names, get_region_names
+from .service import get_service
+
+EXPORT_ENCODING = 'utf-8-sig'
+
+# 한 번에 인코딩할 행 수
+EXPORT_BATCH_ROWS = 500
+
+DESCRIPTION_MAX_LENGTH = 100
+
+# 내보내기 CSV 컬럼 (순서 고정)
+EXPORT_COLUMNS = [
+    '순위', '콘텐츠ID', '관광지명', '유형', '웰니스테마', '지역', '추천점수', '평점',
+    '거리(km)', '가격대', '위도', '경도', '주소', '설명', '사용자클러스터'
+]
+
+def _short_description(description):
+    """설명을 최대 길이로 자르기"""
+    description = description or ''
+    if len(description) > DESCRIPTION_MAX_LENGTH:
+        return description[:DESCRIPTION_MAX_LENGTH] + '...'
+    return description
+
+def _export_row(rank, place, theme_names, region_names, cluster_name):
+    """추천 레코드 하나를 EXPORT_COLUMNS 순서의 값 리스트로 변환"""
+    theme_code = place['wellness_theme']
+    region_code = place['region_code']
+    return [
+        rank,
+        place['content_id'],
+        place['title'],
+        place['type'],
+        theme_names.get(theme_code, theme_code),
+        region_names.get(region_code, region_code),
+        f"{place['score']:.1f}",
+        place['rating'],
+        place['distance_from_incheon'],
+        place['price_range'],
+        place['latitude'],
+        place['longitude'],
+        place['address'],
+        _short_description(place['description']),
+        cluster_name
+    ]
+
+def iter_recommendations_csv(recommendations, user_info=None, encoding=EXPORT_ENCODING,
+                             batch_rows=EXPORT_BATCH_ROWS):
+    """추천 레코드 이터러블을 CSV 바이트 조각으로 순차 생성 (첫 조각은 BOM과 헤더)
+
+    레코드를 batch_rows개씩 작은 버퍼에 쓰고 바로 인코딩하므로 메모리 사용량은
+    전체 결과 크기가 아니라 한 묶음 크기에만 비례합니다.
+    """
+    theme_names = get_wellness_theme_names()
+    region_names = get_region_names()
+    cluster_name = (user_info or {}).get('cluster_name', '')
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(EXPORT_COLUMNS)
+
+    for rank, place in enumerate(recommendations, 1):
+        writer.writerow(_export_row(rank, place, theme_names, region_names, cluster_name))
+        if rank % batch_rows == 0:
+            yield buffer.getvalue().encode(encoding)
+            # BOM은 첫 조각에만 붙임
+            encoding = 'utf-8' if encoding == 'utf-8-sig' else encoding
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode(encoding)
+
+def iter_cluster_destinations_csv(cluster_result, user_info=None, theme_filter=None,
+                                  region_filter=None, service=None, category_filter=None):
+    """클러스터 점수 순으로 정렬한 전체 관광지를 CSV 바이트 조각으로 순차 생성"""
+    service = service or get_service()
+
+    cluster_id = cluster_result['cluster'] if isinstance(cluster_result, dict) else int(cluster_result)
+    return iter_recommendations_csv(
+        service.iter_ranked(cluster_id, theme_filter, region_filter, category_filter), user_info)
+
+def export_recommendations_to_csv(recommendations, user_info=None):
+    """추천 결과를 CSV 바이트로 내보내기 (응답으로 흘려보낼 때는 iter_recommendations_csv 사용)"""
+    if not recommendations:
+        return None
+
+    return b''.join(iter_recommendations_csv(recommendations, user_info))
+
+def export_cluster_destinations_to_csv(cluster_result, user_info=None, theme_filter=None,
+                                       region_filter=None, service=None, category_filter=None):
+    """클러스터 점수 순으로 정렬한 전체 관광지를 CSV 바이트로 내보내기
+
+    응답으로 흘려보낼 때는 iter_cluster_destinations_csv를 사용합니다.
+    """
+    return b''.join(iter_cluster_destinations_csv(cluster_result, user_info, theme_filter,
+                                                  region_filter, service, category_filter))
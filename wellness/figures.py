@@ -0,0 +1,39 @@
+# wellness/figures.py - 차트 JSON 캐시와 사용자별 데이터 패치
+#
+# 평점 분포, 상관관계 히트맵, 클러스터 분포처럼 모든 사용자에게 같은 차트는
+# (차트 이름, 변형, 데이터 버전)별로 직렬화한 Plotly 그림 JSON을 한 번만 만들어 두고 재사용합니다.
+# 변형은 전체 차트면 None, 클러스터별 차트면 클러스터 번호처럼 입력을 구분하는 값입니다.
+# 요인 점수처럼 사용자마다 다른 차트는 스타일/레이아웃만 담은 템플릿 JSON을 캐시해 두고,
+# patch_figure로 데이터 배열과 일부 레이아웃 값만 바꿔 끼웁니다.
+# 이 모듈은 plotly를 임포트하지 않으며, 그림 객체로 되돌리는 일은 charts.py가 담당합니다.
+
+import json
+
+from .templates import FragmentCache
+
+# 캐시할 차트 JSON 개수 (전체 차트 + 클러스터별 템플릿)
+FIGURE_CACHE_SIZE = 256
+
+def _merge(target, updates):
+    """중첩 딕셔너리에 updates 값을 재귀적으로 덮어씀"""
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+    return target
+
+def patch_figure(figure_json, traces=None, layout=None):
+    """캐시된 그림 JSON에 트레이스별 값({트레이스 번호: {속성: 값}})과 레이아웃 값을 덮어쓴 그림 딕셔너리"""
+    figure = json.loads(figure_json)
+    for index, values in (traces or {}).items():
+        _merge(figure['data'][index], values)
+    if layout:
+        _merge(figure.setdefault('layout', {}), layout)
+    return figure
+
+_figure_cache = FragmentCache(maxsize=FIGURE_CACHE_SIZE)
+
+def get_figure_cache():
+    """프로세스 공용 차트 JSON 캐시 (키: 차트 이름, 변형, 데이터 버전)"""
+    return _figure_cache
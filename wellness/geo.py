@@ -0,0 +1,49 @@
+# wellness/geo.py - 거리 계산 및 주변 관광지 조회
+
+from math import radians, sin, cos, sqrt, atan2
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371  # 지구 반경 (km)
+
+# 인천국제공항 좌표 (위도, 경도) - 거리/일정 계산의 출발점
+INCHEON_AIRPORT = (37.4602, 126.4407)
+
+def calculate_distance(lat1, lon1, lat2, lon2):
+    """두 지점 간의 거리 계산 (km)"""
+    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
+    c = 2 * atan2(sqrt(a), sqrt(1-a))
+
+    return EARTH_RADIUS_KM * c
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """배열 단위 하버사인 거리 계산 (km, 브로드캐스팅 지원)"""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def get_nearby_attractions(nearby_df, wellness_content_id, limit=5):
+    """특정 웰니스 관광지의 주변 관광지 상위 limit개 반환"""
+    if nearby_df is None or nearby_df.empty:
+        return []
+
+    # 해당 웰니스 관광지의 주변 관광지 필터링
+    nearby_spots = nearby_df[nearby_df['wellness_contentId'] == wellness_content_id]
+
+    # 상위 limit개 선택 (데이터가 이미 우선순위대로 정렬되어 있다고 가정)
+    top_nearby = nearby_spots.head(limit)
+
+    return [
+        {
+            'contentId': spot['nearby_contentid'],
+            'name': spot['nearby_title'],
+            'category1': spot['nearby_category1'],
+            'category2': spot['nearby_category2'],
+            'category3': spot['nearby_category3']
+        }
+        for spot in top_nearby.to_dict('records')
+    ]
@@ -0,0 +1,178 @@
+# wellness/itinerary.py - 인천공항에서 출발하는 추천 관광지 여행 일정 계획
+#
+# 인천공항과 관광지들 사이의 이동 시간 행렬(하버사인 직선거리 x 도로 우회 계수 / 평균 속도)을
+# 한 번에 계산한 뒤, 최근접 삽입(nearest insertion)으로 인천에서 시작하는 경로를 만들고
+# 2-opt로 교차 구간을 풀어 줄입니다. 완성된 경로를 하루 시간 예산(이동 + 체류)에 맞춰
+# 날짜별로 나누며, 다음 날은 전날 마지막 관광지 근처에서 출발합니다.
+# 경로 생성과 2-opt 개선 모두 time_limit_ms 안에서만 수행하므로 (시간이 다 되면 생성은 남은 지점을
+# 가까운 순으로 이어 붙이고 개선은 중단) 관광지 수가 많아도 응답 시간 상한이 지켜집니다.
+
+import time
+
+import numpy as np
+
+from .geo import INCHEON_AIRPORT, haversine_km
+
+# 하루 일정 시간 예산 (분, 이동 + 체류)
+DEFAULT_DAY_MINUTES = 8 * 60
+
+# 관광지 한 곳 체류 시간 (분)
+DEFAULT_VISIT_MINUTES = 90
+
+# 직선거리 → 도로 거리 우회 계수와 평균 이동 속도 (km/h)
+ROAD_DETOUR_FACTOR = 1.3
+AVERAGE_SPEED_KMH = 60.0
+
+# 경로 생성과 개선(2-opt)에 쓸 수 있는 최대 시간 (ms)
+DEFAULT_TIME_LIMIT_MS = 50
+
+# 일정에 넣을 최대 관광지 수 (이동 시간 행렬이 O(n²)이므로 나머지는 점수 순서대로 미배정 처리)
+MAX_ITINERARY_PLACES = 500
+
+def travel_time_matrix(latitudes, longitudes):
+    """지점 간 예상 이동 시간 행렬 (분)"""
+    latitudes = np.asarray(latitudes, dtype=float)
+    longitudes = np.asarray(longitudes, dtype=float)
+    distance = haversine_km(latitudes[:, None], longitudes[:, None], latitudes[None, :], longitudes[None, :])
+    return distance * ROAD_DETOUR_FACTOR / AVERAGE_SPEED_KMH * 60
+
+def nearest_insertion(cost, deadline=None):
+    """0번 지점에서 시작하는 열린 경로를 최근접 삽입으로 생성 (지점 번호 리스트)
+
+    아직 방문하지 않은 지점 중 경로와 가장 가까운 지점을 고르고, 추가 비용이 가장 작은 자리
+    (두 지점 사이 또는 경로 끝)에 끼워 넣습니다. deadline(perf_counter)을 넘으면 남은 지점은
+    경로까지의 거리 순으로 끝에 이어 붙입니다.
+    """
+    n = len(cost)
+    tour = [0]
+    remaining = np.ones(n, dtype=bool)
+    remaining[0] = False
+    # 방문하지 않은 지점별 경로까지의 최소 이동 시간
+    nearest = cost[0].copy()
+    while remaining.any():
+        candidates = np.flatnonzero(remaining)
+        if deadline is not None and time.perf_counter() > deadline:
+            tour.extend(int(node) for node in candidates[np.argsort(nearest[candidates], kind='stable')])
+            break
+        node = int(candidates[np.argmin(nearest[candidates])])
+
+        path = np.asarray(tour)
+        insert_costs = cost[path[:-1], node] + cost[node, path[1:]] - cost[path[:-1], path[1:]]
+        append_cost = cost[path[-1], node]
+        if len(insert_costs) and insert_costs.min() < append_cost:
+            tour.insert(int(np.argmin(insert_costs)) + 1, node)
+        else:
+            tour.append(node)
+
+        remaining[node] = False
+        np.minimum(nearest, cost[node], out=nearest)
+    return tour
+
+def two_opt(tour, cost, deadline=None):
+    """시작 지점을 고정한 열린 경로의 2-opt 개선 (구간 뒤집기), deadline(perf_counter)을 넘으면 중단"""
+    tour = np.asarray(tour, dtype=np.int64)
+    n = len(tour)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 1):
+            if deadline is not None and time.perf_counter() > deadline:
+                return tour.tolist()
+            a, b = tour[i - 1], tour[i]
+            k = np.arange(i + 1, n)
+            c = tour[k]
+            # 구간 tour[i..k]를 뒤집을 때의 비용 변화 (k가 마지막이면 뒤쪽 연결 없음)
+            e = tour[np.minimum(k + 1, n - 1)]
+            after = np.where(k + 1 < n, cost[b, e] - cost[c, e], 0.0)
+            delta = cost[a, c] - cost[a, b] + after
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-9:
+                tour[i:k[best] + 1] = tour[i:k[best] + 1][::-1]
+                improved = True
+    return tour.tolist()
+
+def _split_days(tour, cost, visit_minutes, day_minutes, max_days):
+    """경로를 하루 예산에 맞춰 날짜별 지점 목록으로 분할 (남는 지점은 미배정)"""
+    days = []
+    current = []
+    used = 0.0
+    previous = tour[0]
+    unscheduled = []
+    for node in tour[1:]:
+        # 새 날은 전날 마지막 관광지에서 출발하므로 이동 시간은 그대로 이어서 계산
+        needed = cost[previous, node] + visit_minutes
+        if current and used + needed > day_minutes:
+            days.append(current)
+            current, used = [], 0.0
+        if len(days) >= max_days:
+            unscheduled.append(node)
+            continue
+        current.append(node)
+        used += needed
+        previous = node
+    if current:
+        days.append(current)
+    return days, unscheduled
+
+def plan_itinerary(places, day_minutes=DEFAULT_DAY_MINUTES, visit_minutes=DEFAULT_VISIT_MINUTES,
+                   max_days=7, time_limit_ms=DEFAULT_TIME_LIMIT_MS, start=INCHEON_AIRPORT):
+    """추천 레코드(latitude/longitude 포함)로 인천공항 출발 날짜별 일정 생성
+
+    반환 딕셔너리
+      days: [{'day', 'stops': [{'place', 'travel_minutes', 'arrival_minute', 'departure_minute'}],
+              'travel_minutes', 'total_minutes', 'over_budget', 'path': [(위도, 경도), ...]}]
+      unscheduled: max_days 안에 넣지 못한 레코드 (MAX_ITINERARY_PLACES개를 넘는 레코드 포함)
+      total_travel_minutes, elapsed_ms
+    하루 예산보다 오래 걸리는 관광지(예: 먼 섬)는 그날 단독 일정으로 넣고 over_budget을 표시합니다.
+    """
+    started = time.perf_counter()
+    places = [place for place in places
+              if np.isfinite(place.get('latitude', np.nan)) and np.isfinite(place.get('longitude', np.nan))]
+    if not places:
+        return {'days': [], 'unscheduled': [], 'total_travel_minutes': 0.0, 'elapsed_ms': 0.0}
+    places, overflow = places[:MAX_ITINERARY_PLACES], places[MAX_ITINERARY_PLACES:]
+
+    latitudes = [start[0]] + [place['latitude'] for place in places]
+    longitudes = [start[1]] + [place['longitude'] for place in places]
+    cost = travel_time_matrix(latitudes, longitudes)
+
+    deadline = started + time_limit_ms / 1000
+    tour = two_opt(nearest_insertion(cost, deadline), cost, deadline)
+    day_nodes, unscheduled = _split_days(tour, cost, visit_minutes, day_minutes, max_days)
+
+    days = []
+    previous = 0
+    total_travel = 0.0
+    for day_number, nodes in enumerate(day_nodes, start=1):
+        stops = []
+        clock = 0.0
+        path = [(latitudes[previous], longitudes[previous])]
+        for node in nodes:
+            travel = float(cost[previous, node])
+            clock += travel
+            stops.append({
+                'place': places[node - 1],
+                'travel_minutes': round(travel, 1),
+                'arrival_minute': round(clock, 1),
+                'departure_minute': round(clock + visit_minutes, 1),
+            })
+            clock += visit_minutes
+            total_travel += travel
+            path.append((latitudes[node], longitudes[node]))
+            previous = node
+        day_travel = sum(stop['travel_minutes'] for stop in stops)
+        days.append({
+            'day': day_number,
+            'stops': stops,
+            'travel_minutes': round(day_travel, 1),
+            'total_minutes': round(clock, 1),
+            'over_budget': clock > day_minutes,
+            'path': path,
+        })
+
+    return {
+        'days': days,
+        'unscheduled': [places[node - 1] for node in unscheduled] + overflow,
+        'total_travel_minutes': round(total_travel, 1),
+        'elapsed_ms': (time.perf_counter() - started) * 1000,
+    }
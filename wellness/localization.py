@@ -0,0 +1,194 @@
+# wellness/localization.py - 관광지 제목/설명/카테고리의 언어별 사전 계산 조회 테이블
+#
+# 클러스터 1(외국인 첫 방문객)처럼 한국어가 아닌 화면이 필요한 사용자를 위해, 데이터셋이 바뀔 때
+# 한 번만 언어별 (제목, 설명, 카테고리) 문자열 배열을 만들어 둡니다.
+#   - 제목/설명: 한국관광공사 목록의 langDivCd가 해당 언어인 행 (contentId 또는 oldContentId로 연결),
+#     번역 행이 없으면 한국어 값 (설명이 아예 없으면 언어별 기본 문구)
+#   - 카테고리: 웰니스 테마 코드별 이름 (한국어는 GIS/category_map.csv의 소분류 이름,
+#     다른 언어는 THEME_NAMES)
+#   - 기본 문구(설명 없음 등): 언어별 고정 문구
+# 화면에서는 번역기를 호출하지 않고 content_id → 행 번호 → 언어별 배열 조회만 하므로,
+# 한국어 추천 목록을 그릴 때와 비용이 같습니다.
+
+from .data import KOREAN_LANGUAGE_CODE
+from .schema import SCHEMA_DEFAULTS
+
+DEFAULT_LOCALE = 'ko'
+
+# 화면 언어 → (langDivCd, 언어 이름)
+LOCALES = {
+    'ko': (KOREAN_LANGUAGE_CODE, '한국어'),
+    'en': ('ENG', 'English'),
+    'ja': ('JPN', '日本語'),
+    'zh-CN': ('CHS', '简体中文'),
+    'zh-TW': ('CHT', '繁體中文'),
+}
+
+# 웰니스 테마 코드별 한국어가 아닌 언어의 이름 (한국어 이름은 category_map.csv에서 읽음)
+THEME_NAMES = {
+    'EX050100': {'en': 'Hot springs, saunas & spas', 'ja': '温泉・サウナ・スパ',
+                 'zh-CN': '温泉/桑拿/水疗', 'zh-TW': '溫泉/三溫暖/水療'},
+    'EX050200': {'en': 'Korean dry sauna (jjimjilbang)', 'ja': 'チムジルバン',
+                 'zh-CN': '汗蒸房', 'zh-TW': '汗蒸幕'},
+    'EX050300': {'en': 'Traditional Korean medicine', 'ja': '韓方体験',
+                 'zh-CN': '韩方体验', 'zh-TW': '韓方體驗'},
+    'EX050400': {'en': 'Healing & meditation', 'ja': 'ヒーリング・瞑想',
+                 'zh-CN': '疗愈冥想', 'zh-TW': '療癒冥想'},
+    'EX050500': {'en': 'Beauty spas', 'ja': 'ビューティースパ',
+                 'zh-CN': '美容水疗', 'zh-TW': '美容水療'},
+    'EX050600': {'en': 'Other wellness', 'ja': 'その他ウェルネス',
+                 'zh-CN': '其他康养', 'zh-TW': '其他養生'},
+    'EX050700': {'en': 'Nature healing', 'ja': '自然治癒',
+                 'zh-CN': '自然疗愈', 'zh-TW': '自然療癒'},
+}
+
+# 테마 이름이 없을 때의 카테고리
+DEFAULT_CATEGORY = {'ko': '웰니스 관광지', 'en': 'Wellness destination', 'ja': 'ウェルネス観光地',
+                    'zh-CN': '康养旅游地', 'zh-TW': '養生旅遊地'}
+
+# 설명이 없을 때의 문구 (표준 테이블의 한국어 기본값과 같은 뜻)
+DEFAULT_DESCRIPTION = {'ko': '설명 정보가 없습니다.', 'en': 'No description available.', 'ja': '説明情報がありません。',
+                       'zh-CN': '暂无介绍。', 'zh-TW': '暫無介紹。'}
+
+LOCALIZED_FIELDS = ('title', 'description', 'category')
+
+def normalize_locale(locale):
+    """지원하지 않는 언어는 기본 언어(한국어)로"""
+    return locale if locale in LOCALES else DEFAULT_LOCALE
+
+def locale_options():
+    """언어 선택 옵션 {화면 언어: 언어 이름}"""
+    return {locale: name for locale, (_, name) in LOCALES.items()}
+
+def korean_theme_names(category_map):
+    """카테고리 매핑(category_map.csv)의 소분류 코드별 한국어 이름 {코드: 이름}"""
+    if category_map is None:
+        return {}
+    return dict(zip(category_map['lclsSystm3Cd'], category_map['lclsSystm3Nm']))
+
+def _theme_name(theme, locale, korean_names):
+    """테마 코드의 언어별 이름 (없으면 언어별 기본 카테고리)"""
+    if locale == DEFAULT_LOCALE:
+        name = korean_names.get(theme)
+    else:
+        name = THEME_NAMES.get(theme, {}).get(locale)
+    return name or DEFAULT_CATEGORY[locale]
+
+def _text(value):
+    """결측/빈 값이면 None, 아니면 양쪽 공백을 제거한 문자열"""
+    if value is None or value != value:
+        return None
+    value = str(value).strip()
+    return value or None
+
+class LocalizedContent:
+    """관광지별 언어별 (제목, 설명, 카테고리) 조회 테이블
+
+    content_id → 행 번호 사전 하나와, 언어마다 필드별 문자열 튜플(행 번호 순서)을 가집니다.
+    같은 문자열(기본 문구, 테마 이름)은 한 객체를 공유합니다.
+    """
+
+    def __init__(self, content_ids, tables, version=None):
+        self._rows = {int(content_id): row for row, content_id in enumerate(content_ids)}
+        self._tables = tables
+        self.version = version
+
+    @classmethod
+    def from_frames(cls, destinations, translations=None, version=None, previous=None, changed_ids=None,
+                    category_map=None):
+        """표준 관광지 테이블(한국어)과 번역 행(langDivCd별)으로 조회 테이블 생성
+
+        한국어 카테고리는 category_map(category_map.csv)의 소분류 이름을 씁니다.
+        previous(같은 번역 행과 카테고리 매핑으로 만든 이전 테이블)와 changed_ids(추가/수정된 content_id)를
+        주면 나머지 관광지의 언어별 문자열은 이전 테이블의 것을 그대로 씁니다.
+        """
+        destinations = destinations[destinations['content_id'].notna()]
+        content_ids = [int(content_id) for content_id in destinations['content_id']]
+        known = set(content_ids)
+        korean_titles = [_text(title) for title in destinations['title']]
+        # 표준 테이블의 기본 설명 문구는 설명이 없는 것으로 보고 언어별 기본 문구 사용
+        placeholder = SCHEMA_DEFAULTS['description']
+        korean_descriptions = [None if _text(description) == placeholder else _text(description)
+                               for description in destinations['description']]
+        themes = destinations['wellness_theme'].tolist()
+        korean_names = korean_theme_names(category_map)
+
+        # 언어 코드별 {content_id: (제목, 설명)} (oldContentId가 한국어 관광지를 가리키면 그쪽으로 연결)
+        translated = {}
+        if translations is not None and not translations.empty:
+            overviews = translations['overview'] if 'overview' in translations.columns else [None] * len(translations)
+            old_ids = (translations['oldContentId'] if 'oldContentId' in translations.columns
+                       else [None] * len(translations))
+            for content_id, old_id, language, title, overview in zip(
+                    translations['contentId'], old_ids, translations['langDivCd'], translations['title'], overviews):
+                target = int(old_id) if old_id == old_id and old_id is not None and int(old_id) in known \
+                    else int(content_id)
+                translated.setdefault(language, {})[target] = (_text(title), _text(overview))
+
+        # 관광지별 이전 테이블 행 번호 (다시 만들어야 하면 None)
+        reused = [None] * len(content_ids)
+        if previous is not None and changed_ids is not None:
+            # 추가/삭제된 관광지를 oldContentId로 가리키는 번역 행은 연결 대상이 바뀌므로 양쪽 다 다시 만듦
+            added_or_removed = known.symmetric_difference(previous._rows)
+            retargeted = set()
+            if translations is not None and 'oldContentId' in translations.columns:
+                for content_id, old_id in zip(translations['contentId'], translations['oldContentId']):
+                    if old_id == old_id and old_id is not None and int(old_id) in added_or_removed:
+                        retargeted.update((int(content_id), int(old_id)))
+            reused = [None if content_id in changed_ids or content_id in retargeted
+                      else previous._rows.get(content_id) for content_id in content_ids]
+
+        pool = {}
+        def shared(value):
+            return pool.setdefault(value, value)
+
+        tables = {}
+        for locale, (language, _) in LOCALES.items():
+            rows = translated.get(language, {})
+            titles, descriptions, categories = [], [], []
+            previous_table = previous._tables.get(locale) if previous is not None else None
+            for i, content_id in enumerate(content_ids):
+                if reused[i] is not None and previous_table is not None:
+                    titles.append(previous_table['title'][reused[i]])
+                    descriptions.append(previous_table['description'][reused[i]])
+                    categories.append(previous_table['category'][reused[i]])
+                    continue
+                title, description = rows.get(content_id, (None, None))
+                titles.append(shared(title or korean_titles[i] or SCHEMA_DEFAULTS['title']))
+                descriptions.append(shared(description or korean_descriptions[i] or DEFAULT_DESCRIPTION[locale]))
+                categories.append(shared(_theme_name(themes[i], locale, korean_names)))
+            tables[locale] = {'title': tuple(titles), 'description': tuple(descriptions),
+                              'category': tuple(categories)}
+        return cls(content_ids, tables, version)
+
+    @property
+    def locales(self):
+        """조회 테이블이 있는 화면 언어"""
+        return list(self._tables)
+
+    def lookup(self, content_id, locale=DEFAULT_LOCALE):
+        """관광지 하나의 {'title', 'description', 'category'} (없는 관광지면 None)"""
+        row = self._rows.get(int(content_id))
+        if row is None:
+            return None
+        table = self._tables[normalize_locale(locale)]
+        return {field: table[field][row] for field in LOCALIZED_FIELDS}
+
+    def localize(self, records, locale=DEFAULT_LOCALE):
+        """추천 레코드 목록의 제목/설명/카테고리를 해당 언어 값으로 바꾼 새 레코드 목록"""
+        table = self._tables[normalize_locale(locale)]
+        titles, descriptions, categories = table['title'], table['description'], table['category']
+        results = []
+        for record in records:
+            row = self._rows.get(int(record.get('content_id') or 0))
+            if row is None:
+                results.append(dict(record))
+            else:
+                results.append(dict(record, title=titles[row], description=descriptions[row],
+                                    category=categories[row]))
+        return results
+
+def get_localized_content():
+    """표준 관광지 테이블 기반 언어별 조회 테이블 (데이터셋 관리자의 현재 스냅숏)"""
+    from .datasets import get_dataset
+    return get_dataset('localized_content')
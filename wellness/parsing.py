@@ -0,0 +1,74 @@
+# wellness/parsing.py - region_data.csv의 자유 형식 문자열을 숫자 컬럼으로 변환하는 벡터화 파서
+
+import numpy as np
+import pandas as pd
+
+# "500,000-1,500,000원", "무료-50,000원", "20,000원" 형식
+_KRW_RANGE_PATTERN = r'^\s*(?P<low>무료|[\d,]+)\s*원?\s*(?:[-~]\s*(?P<high>무료|[\d,]+)\s*원?)?\s*$'
+
+def _krw_to_number(values):
+    """'무료' 또는 쉼표가 들어간 금액 문자열 Series를 float Series로 변환 (해석 불가는 NaN)"""
+    values = values.where(values != '무료', '0')
+    return pd.to_numeric(values.str.replace(',', '', regex=False), errors='coerce')
+
+def parse_krw_range(texts):
+    """금액 범위 문자열을 (최소, 최대) 원 단위 float 배열 쌍으로 변환
+
+    단일 금액은 최소와 최대가 같고, 형식이 맞지 않으면 둘 다 NaN입니다.
+    """
+    parts = pd.Series(texts, dtype='object').astype(str).str.extract(_KRW_RANGE_PATTERN)
+    low = _krw_to_number(parts['low'])
+    high = _krw_to_number(parts['high']).fillna(low)
+    return low.to_numpy(dtype=float), high.to_numpy(dtype=float)
+
+def add_price_columns(df):
+    """price_range를 해석한 price_min/price_max 컬럼을 추가한 새 데이터프레임 반환"""
+    if 'price_range' not in df.columns:
+        return df
+    price_min, price_max = parse_krw_range(df['price_range'])
+    return df.assign(price_min=price_min, price_max=price_max)
+
+# "항공 1시간 10분", "자차 4시간", "공항버스 50분" 형식
+_TRAVEL_TIME_PATTERN = r'^\s*(?P<mode>[^\d]*?)\s*(?:(?P<hours>\d+)\s*시간)?\s*(?:(?P<minutes>\d+)\s*분)?\s*$'
+
+def parse_travel_time(texts):
+    """이동 시간 문자열을 (교통수단 배열, 소요 분 float 배열) 쌍으로 변환 (해석 불가는 빈 교통수단과 NaN)"""
+    parts = pd.Series(texts, dtype='object').astype(str).str.extract(_TRAVEL_TIME_PATTERN)
+    hours = pd.to_numeric(parts['hours'], errors='coerce')
+    minutes = pd.to_numeric(parts['minutes'], errors='coerce')
+    total = hours.fillna(0) * 60 + minutes.fillna(0)
+    total = total.where(hours.notna() | minutes.notna())
+    # 소요 시간을 읽지 못한 문자열('정보 없음' 등)은 교통수단도 비움
+    mode = parts['mode'].fillna('').str.strip().where(total.notna(), '')
+    return mode.to_numpy(dtype=object), total.to_numpy(dtype=float)
+
+# 이동 정보 컬럼 접미사 (주 교통수단, 보조 교통수단)
+TRAVEL_ROUTES = ['primary', 'secondary']
+
+def add_travel_columns(df):
+    """travel_time_*/travel_cost_*를 해석한 숫자 컬럼을 추가한 새 데이터프레임 반환
+
+    추가 컬럼: travel_mode_*, travel_minutes_*, travel_cost_*_min/max (원),
+    그리고 두 경로 중 빠른 쪽 소요 시간인 travel_minutes_fastest
+    """
+    columns = {}
+    for route in TRAVEL_ROUTES:
+        if f'travel_time_{route}' in df.columns:
+            mode, minutes = parse_travel_time(df[f'travel_time_{route}'])
+            columns[f'travel_mode_{route}'] = mode
+            columns[f'travel_minutes_{route}'] = minutes
+        if f'travel_cost_{route}' in df.columns:
+            cost_min, cost_max = parse_krw_range(df[f'travel_cost_{route}'])
+            columns[f'travel_cost_{route}_min'] = cost_min
+            columns[f'travel_cost_{route}_max'] = cost_max
+
+    minute_columns = [columns[f'travel_minutes_{route}'] for route in TRAVEL_ROUTES
+                      if f'travel_minutes_{route}' in columns]
+    if minute_columns:
+        stacked = np.vstack(minute_columns)
+        fastest = np.full(len(df), np.nan)
+        has_value = ~np.isnan(stacked).all(axis=0)
+        fastest[has_value] = np.nanmin(stacked[:, has_value], axis=0)
+        columns['travel_minutes_fastest'] = fastest
+
+    return df.assign(**columns)
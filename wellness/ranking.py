@@ -0,0 +1,248 @@
+# wellness/ranking.py - 클러스터 기반 관광지 점수화, 필터링, 순위 산정
+
+import numpy as np
+import pandas as pd
+
+from .data import get_wellness_theme_names, get_region_names
+from .schema import SCHEMA_DEFAULTS
+
+# 클러스터별 가중치 설정
+CLUSTER_WEIGHTS = {
+    0: {'nature': 0.3, 'culture': 0.2, 'healing': 0.5},  # 장기체류 지인방문형
+    1: {'nature': 0.4, 'culture': 0.4, 'healing': 0.2},  # 전형적 중간형 관광객
+    2: {'nature': 0.2, 'culture': 0.5, 'healing': 0.3}   # 단기 고소비 재방문층
+}
+
+# 점수 컬럼이 없을 때 대체할 원본 컬럼
+_FACTOR_FALLBACKS = {
+    'nature': 'natureScore',
+    'culture': 'cultureScore',
+    'healing': 'healingScore'
+}
+
+def calculate_recommendations_by_cluster(cluster_result, wellness_df, limit=10):
+    """클러스터 결과를 기반으로 웰니스 관광지 추천"""
+    if wellness_df is None or wellness_df.empty:
+        return []
+
+    weights = CLUSTER_WEIGHTS[cluster_result['cluster']]
+
+    # 클러스터별 가중 점수 계산 (원본 데이터프레임은 변경하지 않음)
+    weighted_score = 0
+    for factor, weight in weights.items():
+        if factor in wellness_df.columns:
+            factor_values = wellness_df[factor]
+        else:
+            factor_values = wellness_df.get(_FACTOR_FALLBACKS[factor], 0.5)
+        weighted_score = weighted_score + factor_values * weight
+
+    scored_df = wellness_df.assign(weighted_score=weighted_score)
+
+    # 상위 관광지 선정
+    top_recommendations = scored_df.nlargest(limit, 'weighted_score')
+
+    # 결과를 딕셔너리 리스트로 변환
+    recommendations = []
+    for row in top_recommendations.to_dict('records'):
+        recommendations.append({
+            'title': row.get('title', row.get('name', '제목 없음')),
+            'content_id': row.get('contentId', row.get('content_id', 0)),
+            'address': row.get('addr1', row.get('address', '주소 정보 없음')),
+            'description': row.get('overview', row.get('description', '설명 없음')),
+            'rating': float(row.get('rating', 0.0)),
+            'price_level': str(row.get('price_level', '정보 없음')),
+            'theme': row.get('wellness_theme', 'A0202'),
+            'score': float(row.get('weighted_score', 0.0)),
+            'region': row.get('region_code', row.get('areacode', 0)),
+            'latitude': float(row.get('mapY', row.get('latitude', 0.0))),
+            'longitude': float(row.get('mapX', row.get('longitude', 0.0)))
+        })
+
+    return recommendations
+
+def _build_filter_options(wellness_df, column, names, code_cast=None, fallback_name='{code}'):
+    """컬럼 값별 개수를 세어 필터 옵션 리스트 생성"""
+    counts = wellness_df[column].dropna().value_counts()
+
+    filter_options = []
+    for code, count in counts.items():
+        if code_cast is not None:
+            code = code_cast(code)
+        filter_options.append({
+            'code': code,
+            'name': names.get(code, fallback_name.format(code=code)),
+            'count': int(count)
+        })
+
+    # 개수 순으로 정렬
+    filter_options.sort(key=lambda x: x['count'], reverse=True)
+
+    return filter_options
+
+def get_wellness_theme_filter_options(wellness_df):
+    """웰니스 테마 필터 옵션 반환"""
+    if wellness_df is None or wellness_df.empty:
+        return []
+
+    return _build_filter_options(wellness_df, 'wellness_theme', get_wellness_theme_names())
+
+def get_region_filter_options(wellness_df):
+    """지역 필터 옵션 반환"""
+    if wellness_df is None or wellness_df.empty:
+        return []
+
+    return _build_filter_options(
+        wellness_df, 'region_code', get_region_names(),
+        code_cast=int, fallback_name='지역코드 {code}'
+    )
+
+def normalize_filter_values(filter_value):
+    """필터 입력(단일 값, 리스트, 옵션 딕셔너리)을 코드 리스트로 정규화 ('전체'/빈 값은 None)"""
+    if filter_value is None or (isinstance(filter_value, str) and filter_value in ('', '전체')):
+        return None
+
+    values = filter_value if isinstance(filter_value, (list, tuple, set)) else [filter_value]
+    codes = [value['code'] if isinstance(value, dict) else value for value in values]
+    codes = [code for code in codes if code != '전체']
+
+    return codes or None
+
+def filter_mask(wellness_df, theme_filter=None, region_filter=None):
+    """테마/지역 필터에 해당하는 행의 불리언 마스크 반환"""
+    mask = pd.Series(True, index=wellness_df.index)
+
+    theme_codes = normalize_filter_values(theme_filter)
+    if theme_codes is not None:
+        mask &= wellness_df['wellness_theme'].isin(theme_codes)
+
+    region_codes = normalize_filter_values(region_filter)
+    if region_codes is not None:
+        mask &= wellness_df['region_code'].isin(region_codes)
+
+    return mask
+
+def apply_wellness_filters(cluster_result, wellness_df, theme_filter=None, region_filter=None, limit=10):
+    """필터 적용된 웰니스 관광지 추천"""
+    if wellness_df is None or wellness_df.empty:
+        return []
+
+    filtered_df = wellness_df[filter_mask(wellness_df, theme_filter, region_filter)]
+
+    if filtered_df.empty:
+        return []
+
+    user_cluster = cluster_result['cluster']
+    score_column = f'score_cluster_{user_cluster}'
+
+    if score_column not in filtered_df.columns:
+        return []
+
+    # 클러스터 점수 기준으로 정렬하여 상위 limit개 선택
+    top_recommendations = filtered_df.nlargest(limit, score_column)
+
+    return [
+        build_place_record(place, score_column)
+        for place in top_recommendations.to_dict('records')
+    ]
+
+# 추천 레코드에 담는 표준 컬럼
+PLACE_RECORD_COLUMNS = [
+    'content_id', 'title', 'latitude', 'longitude', 'address', 'wellness_theme',
+    'region_code', 'description', 'type', 'rating', 'distance_from_incheon', 'price_range'
+]
+
+# 평점 정보가 없는 관광지의 표시용 기본 평점
+DEFAULT_RATING = 4.0
+
+def _record_value(place, column):
+    """표준 컬럼 값 하나 (없거나 비어 있으면 스키마 기본값)"""
+    value = place.get(column)
+    if value is None or value is pd.NA or (isinstance(value, float) and np.isnan(value)):
+        value = SCHEMA_DEFAULTS[column]
+    return value
+
+def build_place_record(place, score_column):
+    """표준 스키마 관광지 행(딕셔너리)을 추천 결과 레코드로 변환"""
+    record = {column: _record_value(place, column) for column in PLACE_RECORD_COLUMNS}
+    record['content_id'] = int(record['content_id'])
+    record['region_code'] = int(record['region_code'])
+    record['latitude'] = float(record['latitude'])
+    record['longitude'] = float(record['longitude'])
+    record['distance_from_incheon'] = float(record['distance_from_incheon'])
+    if np.isnan(record['rating']):
+        record['rating'] = DEFAULT_RATING
+    record['score'] = float(place.get(score_column, 0.0))
+    record['price_level'] = 2  # 기본 가격대 레벨 설정
+    return record
+
+# 추천 점수 방식: 'cluster' (소속 클러스터 점수), 'personalized' (클러스터 점수 혼합)
+SCORING_MODES = ('cluster', 'personalized')
+
+def cluster_weights(cluster_result, n_clusters=3):
+    """클러스터 결과의 cluster_scores를 합이 1인 혼합 가중치로 정규화
+
+    cluster_scores는 {'cluster_0': ...} 딕셔너리, 길이 n_clusters 배열 또는 (N, n_clusters) 배열을 받습니다.
+    점수가 없거나 합이 0이면 소속 클러스터 하나에 가중치 1을 줍니다 (클러스터 점수 방식과 같은 결과).
+    """
+    if isinstance(cluster_result, dict):
+        scores, cluster = cluster_result.get('cluster_scores'), cluster_result.get('cluster')
+    else:
+        scores, cluster = None, cluster_result
+    if isinstance(scores, dict):
+        scores = [scores.get(f'cluster_{i}', 0) for i in range(n_clusters)]
+
+    fallback = np.zeros(n_clusters)
+    if cluster is not None and np.ndim(cluster) == 0:
+        fallback[int(cluster)] = 1.0
+    if scores is None:
+        return fallback
+
+    weights = np.clip(np.asarray(scores, dtype=float), 0, None)
+    total = weights.sum(axis=-1, keepdims=True)
+    if weights.ndim == 1:
+        return weights / total if total[0] > 0 else fallback
+    one_hot = np.eye(n_clusters)[np.asarray(cluster, dtype=np.int64)] if cluster is not None else 1.0 / n_clusters
+    return np.where(total > 0, weights / np.where(total > 0, total, 1), one_hot)
+
+def top_k_positions(scores, k):
+    """점수(길이 N 배열 또는 (R, N) 배열)의 행별 상위 k개 위치 (점수 내림차순, 동점은 앞 위치 우선)
+
+    np.argpartition으로 k번째 점수를 찾은 뒤 그보다 큰 값과, 같은 값 중 앞쪽 위치만 골라
+    전체 정렬 없이 stable 내림차순 정렬과 같은 결과를 냅니다.
+    """
+    scores = np.asarray(scores, dtype=float)
+    single = scores.ndim == 1
+    scores = np.atleast_2d(scores)
+    k = min(int(k), scores.shape[1])
+    if k <= 0:
+        positions = np.empty((scores.shape[0], 0), dtype=np.int64)
+        return positions[0] if single else positions
+
+    kth = np.take_along_axis(scores, np.argpartition(-scores, k - 1, axis=1)[:, k - 1:k], axis=1)
+    above = scores > kth
+    tied = scores == kth
+    keep = above | (tied & (np.cumsum(tied, axis=1) <= k - above.sum(axis=1, keepdims=True)))
+    positions = np.nonzero(keep)[1].reshape(scores.shape[0], k)
+    order = np.lexsort((positions, -np.take_along_axis(scores, positions, axis=1)), axis=-1)
+    positions = np.take_along_axis(positions, order, axis=1)
+    return positions[0] if single else positions
+
+def get_statistics_summary(wellness_df):
+    """시스템 통계 요약 정보"""
+    if wellness_df is None or wellness_df.empty:
+        return {}
+
+    return {
+        'total_destinations': len(wellness_df),
+        'total_types': wellness_df['type'].nunique(),
+        'total_clusters': wellness_df['cluster'].nunique(),
+        'avg_rating': wellness_df['rating'].mean(),
+        'avg_distance': wellness_df['distance_from_incheon'].mean(),
+        'type_distribution': wellness_df['type'].value_counts().to_dict(),
+        'cluster_distribution': wellness_df['cluster'].value_counts().to_dict(),
+        'rating_stats': {
+            'min': wellness_df['rating'].min(),
+            'max': wellness_df['rating'].max(),
+            'std': wellness_df['rating'].std()
+        }
+    }
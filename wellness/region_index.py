@@ -0,0 +1,93 @@
+# wellness/region_index.py - 프리미엄 웰니스 관광지(region_data.csv) 조건 검색용 정렬 인덱스
+#
+# 숫자로 해석한 컬럼을 미리 정렬해 두고 np.searchsorted(이진 탐색)로 범위를 잘라내므로
+# "10만원 이하"처럼 한쪽 범위 조건은 행 전체를 훑지 않고 처리합니다.
+
+import numpy as np
+
+from .parsing import TRAVEL_ROUTES
+
+# 설문 Q2(1인 1일 예상 지출, USD) 선택지별 상한과 환산 환율
+Q2_DAILY_BUDGET_USD = {0: 150, 1: 350, 2: 700, 3: None}
+USD_TO_KRW = 1350
+
+def budget_from_answers(answers):
+    """설문 Q2 답변을 1인 1일 예산(원)으로 환산 (미응답이거나 상한이 없으면 None)"""
+    upper_usd = Q2_DAILY_BUDGET_USD.get((answers or {}).get('q2'))
+    return None if upper_usd is None else upper_usd * USD_TO_KRW
+
+class SortedColumnIndex:
+    """숫자 컬럼 하나의 오름차순 정렬 인덱스 (NaN 값은 제외)"""
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=float)
+        valid = np.flatnonzero(~np.isnan(values))
+        order = valid[np.argsort(values[valid], kind='stable')]
+        self.positions = order
+        self.sorted_values = values[order]
+
+    def at_most(self, upper):
+        """값이 upper 이하인 행 위치 (값 오름차순)"""
+        return self.positions[:np.searchsorted(self.sorted_values, upper, side='right')]
+
+    def between(self, lower=None, upper=None):
+        """값이 [lower, upper] 범위인 행 위치 (값 오름차순)"""
+        start = 0 if lower is None else np.searchsorted(self.sorted_values, lower, side='left')
+        end = len(self.sorted_values) if upper is None else np.searchsorted(self.sorted_values, upper, side='right')
+        return self.positions[start:end]
+
+class RegionIndex:
+    """평점/가격/이동 정보가 있는 관광지와 가격/이동 시간 정렬 인덱스"""
+
+    def __init__(self, region_df, version=None):
+        self.region_df = region_df.reset_index(drop=True)
+        self.version = version
+        self.price_min = SortedColumnIndex(self.region_df['price_min'])
+        self.price_max = SortedColumnIndex(self.region_df['price_max'])
+        self.travel_minutes = SortedColumnIndex(self.region_df['travel_minutes_fastest'])
+
+    def within_budget(self, budget, fully=False):
+        """예산 안에서 이용 가능한 관광지 (최저 가격 오름차순)
+
+        fully가 True이면 최고 가격까지 예산 안에 드는 곳만 반환합니다.
+        """
+        positions = (self.price_max if fully else self.price_min).at_most(budget)
+        if fully:
+            # 최저 가격 오름차순으로 맞춤 (같은 가격은 행 순서, fully=False와 같은 순서)
+            positions = np.sort(positions)
+            positions = positions[np.argsort(self.region_df['price_min'].to_numpy()[positions], kind='stable')]
+        return self.region_df.iloc[positions]
+
+    def price_between(self, lower=None, upper=None):
+        """최저 가격이 [lower, upper] 범위인 관광지 (최저 가격 오름차순)"""
+        return self.region_df.iloc[self.price_min.between(lower, upper)]
+
+    def reachable_within(self, hours, mode=None):
+        """인천에서 hours시간 안에 갈 수 있는 관광지 (소요 시간 오름차순)
+
+        mode를 주면 해당 교통수단(예: '자차', '버스')으로 가능한 경로만 봅니다.
+        """
+        limit = hours * 60
+        if mode is None:
+            return self.region_df.iloc[self.travel_minutes.at_most(limit)]
+
+        # 교통수단 조건은 두 경로를 한 번에 마스크로 계산
+        df = self.region_df
+        minutes = np.full(len(df), np.inf)
+        for route in TRAVEL_ROUTES:
+            route_minutes = df[f'travel_minutes_{route}'].to_numpy(dtype=float)
+            usable = (df[f'travel_mode_{route}'].to_numpy() == mode) & ~np.isnan(route_minutes)
+            minutes = np.where(usable, np.minimum(minutes, route_minutes), minutes)
+        positions = np.flatnonzero(minutes <= limit)
+        positions = positions[np.argsort(minutes[positions], kind='stable')]
+        return df.iloc[positions]
+
+    def travel_modes(self):
+        """데이터에 등장하는 교통수단 목록"""
+        modes = set().union(*(self.region_df[f'travel_mode_{route}'] for route in TRAVEL_ROUTES))
+        return sorted(mode for mode in modes if mode)
+
+def get_region_index():
+    """표준 관광지 테이블 기반 조건 검색 인덱스 (데이터셋 관리자의 현재 스냅숏)"""
+    from .datasets import get_dataset
+    return get_dataset('region_index')
@@ -0,0 +1,182 @@
+# wellness/schema.py - GIS 웰니스 관광지와 region_data.csv를 하나로 합친 표준 관광지 테이블
+#
+# 두 원천은 컬럼 이름과 내용이 서로 다릅니다.
+#   GIS (wellness_tourism_list + wellness_cluster_score): content_id, 좌표, 테마/지역 코드, 클러스터 점수
+#   region_data.csv: 유형, 평점, 지역 클러스터, 인천 기준 거리, 가격대, 이동 정보
+# 이 모듈은 관광지명으로 두 원천을 한 번만 조인해 DESTINATION_SCHEMA의 컬럼 이름과
+# 타입으로 맞춘 테이블을 만들고, 화면/서비스/내보내기는 모두 이 컬럼만 읽습니다.
+
+import numpy as np
+import pandas as pd
+
+from .data import REGION_DATA_PATH, load_wellness_destinations, load_region_destinations
+from .geo import INCHEON_AIRPORT, haversine_km
+
+# 스키마가 바뀌면 올려서 캐시/저장된 결과와 구분
+SCHEMA_VERSION = 1
+
+CLUSTER_SCORE_COLUMNS = ['score_cluster_0', 'score_cluster_1', 'score_cluster_2']
+
+# 표준 컬럼: (이름, 타입, 값이 없을 때 기본값)
+DESTINATION_SCHEMA = [
+    ('content_id', 'Int64', pd.NA),
+    ('title', 'string', '제목 없음'),
+    ('type', 'string', '웰니스 관광지'),
+    ('wellness_theme', 'string', 'A0202'),
+    ('region_code', 'Int64', 0),
+    ('cluster', 'Int64', pd.NA),
+    ('latitude', 'float64', np.nan),
+    ('longitude', 'float64', np.nan),
+    ('address', 'string', '주소 정보 없음'),
+    ('description', 'string', '설명 정보가 없습니다.'),
+    ('website', 'string', ''),
+    ('rating', 'float64', np.nan),
+    ('distance_from_incheon', 'float64', np.nan),
+    ('price_range', 'string', ''),
+    ('price_min', 'float64', np.nan),
+    ('price_max', 'float64', np.nan),
+    ('travel_time_primary', 'string', ''),
+    ('travel_time_secondary', 'string', ''),
+    ('travel_cost_primary', 'string', ''),
+    ('travel_cost_secondary', 'string', ''),
+    ('travel_mode_primary', 'string', ''),
+    ('travel_mode_secondary', 'string', ''),
+    ('travel_minutes_primary', 'float64', np.nan),
+    ('travel_minutes_secondary', 'float64', np.nan),
+    ('travel_minutes_fastest', 'float64', np.nan),
+    ('travel_cost_primary_min', 'float64', np.nan),
+    ('travel_cost_primary_max', 'float64', np.nan),
+    ('travel_cost_secondary_min', 'float64', np.nan),
+    ('travel_cost_secondary_max', 'float64', np.nan),
+] + [(column, 'float64', np.nan) for column in CLUSTER_SCORE_COLUMNS] + [
+    ('source', 'string', ''),
+]
+
+DESTINATION_COLUMNS = [name for name, _, _ in DESTINATION_SCHEMA]
+SCHEMA_DEFAULTS = {name: default for name, _, default in DESTINATION_SCHEMA}
+
+# 원천 테이블 구분 값
+SOURCE_GIS = 'gis'
+SOURCE_REGION = 'region'
+SOURCE_BOTH = 'gis+region'
+
+def conform_to_schema(df):
+    """컬럼 이름/순서/타입을 DESTINATION_SCHEMA에 맞추고 빈 값은 기본값으로 채움"""
+    columns = {}
+    for name, dtype, default in DESTINATION_SCHEMA:
+        if name in df.columns:
+            column = df[name]
+        else:
+            column = pd.Series(default, index=df.index)
+        if default is not pd.NA and not (isinstance(default, float) and np.isnan(default)):
+            column = column.fillna(default)
+        columns[name] = column.astype(dtype)
+    conformed = pd.DataFrame(columns, index=df.index).reset_index(drop=True)
+    conformed.attrs['schema_version'] = SCHEMA_VERSION
+    return conformed
+
+def _gis_frame(wellness_df):
+    """GIS 병합 데이터를 표준 컬럼 이름으로 변환"""
+    address = wellness_df.get('baseAddr')
+    if address is not None:
+        detail = wellness_df['detailAddr'].fillna('') if 'detailAddr' in wellness_df.columns else ''
+        address = (address.fillna('') + ' ' + detail).str.strip().replace('', np.nan)
+    else:
+        address = wellness_df['address']
+    return wellness_df.assign(address=address)
+
+def _region_frame(region_df):
+    """region_data.csv를 표준 컬럼 이름으로 변환"""
+    return region_df.rename(columns={'name': 'title', 'lat': 'latitude', 'lon': 'longitude'})
+
+def build_destination_table(wellness_df, region_df):
+    """GIS 관광지와 region_data.csv 관광지를 관광지명으로 조인한 표준 테이블 생성
+
+    같은 관광지는 한 행으로 합치며 좌표/코드/클러스터 점수는 GIS, 유형/평점/가격/이동 정보는
+    region_data.csv 값을 사용합니다. 인천 기준 거리가 없는 행은 좌표로 직선거리를 계산합니다.
+    """
+    gis = _gis_frame(wellness_df)
+    region = _region_frame(region_df)
+
+    gis_columns = [c for c in DESTINATION_COLUMNS if c in gis.columns]
+    region_columns = [c for c in DESTINATION_COLUMNS if c in region.columns and c not in
+                      ('latitude', 'longitude')] + ['latitude', 'longitude']
+
+    merged = pd.merge(
+        gis[gis_columns].assign(_gis_order=np.arange(len(gis))),
+        region[region_columns].assign(_region_order=np.arange(len(region))),
+        on='title', how='outer', suffixes=('', '_region'), indicator=True
+    )
+    # 원래 순서 유지 (GIS 행 먼저, 이어서 region_data.csv에만 있는 행)
+    merged = merged.sort_values(['_gis_order', '_region_order'], na_position='last', kind='stable')
+    merged = merged.drop(columns=['_gis_order', '_region_order'])
+
+    # 양쪽에 모두 있는 컬럼은 GIS 값을 우선하고 비어 있으면 region 값 사용
+    for column in list(merged.columns):
+        if column.endswith('_region'):
+            base = column[:-len('_region')]
+            merged[base] = merged[base].fillna(merged[column])
+            merged = merged.drop(columns=column)
+
+    merged['source'] = merged['_merge'].map({
+        'left_only': SOURCE_GIS, 'right_only': SOURCE_REGION, 'both': SOURCE_BOTH
+    }).astype(str)
+    merged = merged.drop(columns='_merge')
+
+    missing_distance = merged['distance_from_incheon'].isna()
+    merged.loc[missing_distance, 'distance_from_incheon'] = np.round(haversine_km(
+        INCHEON_AIRPORT[0], INCHEON_AIRPORT[1],
+        merged.loc[missing_distance, 'latitude'], merged.loc[missing_distance, 'longitude']
+    ))
+
+    return conform_to_schema(merged)
+
+def update_destination_table(previous, wellness_df, region_df, changed_ids):
+    """이전 표준 테이블에 GIS 관광지 변경분만 반영한 새 테이블 (region_data.csv가 그대로일 때만 사용)
+
+    추가/수정된 content_id(changed_ids)의 GIS 행만 region_data.csv와 다시 조인하고, 나머지 GIS 행은
+    이전 테이블의 행을 그대로 씁니다. 관광지명이 바뀌면 region_data.csv에만 있는 행도 달라질 수 있어
+    그 부분(수십 행)은 새 관광지명 기준으로 다시 고릅니다. 결과는 build_destination_table과 같습니다.
+    """
+    content_ids = wellness_df['content_id']
+    changed = content_ids.isin(list(changed_ids)).to_numpy()
+    previous_gis = previous[previous['source'] != SOURCE_REGION]
+    kept = previous_gis[previous_gis['content_id'].isin(content_ids[~changed])]
+    rebuilt = build_destination_table(wellness_df[changed], region_df)
+    rebuilt = rebuilt[rebuilt['source'] != SOURCE_REGION]
+
+    # GIS 행은 원천 순서대로 (한 관광지가 여러 region 행과 맞으면 그 안의 순서는 유지)
+    order = pd.Series(np.arange(len(content_ids)), index=content_ids.to_numpy())
+    gis_rows = pd.concat([kept, rebuilt])
+    gis_rows = gis_rows.iloc[np.argsort(order.loc[gis_rows['content_id'].to_numpy()].to_numpy(), kind='stable')]
+
+    region = _region_frame(region_df)
+    region_only = build_destination_table(
+        wellness_df.iloc[:0], region_df[~region['title'].isin(_gis_frame(wellness_df)['title']).to_numpy()])
+    return conform_to_schema(pd.concat([gis_rows, region_only]))
+
+def load_destination_table(data_dir=None, region_path=None):
+    """원천 CSV들을 읽어 표준 관광지 테이블 생성"""
+    return build_destination_table(
+        load_wellness_destinations(data_dir),
+        load_region_destinations(region_path)
+    )
+
+def recommendable_destinations(table):
+    """클러스터 점수가 있어 추천 대상이 되는 행 (GIS 관광지)"""
+    return table[table['content_id'].notna() & table[CLUSTER_SCORE_COLUMNS].notna().all(axis=1)]
+
+def rated_destinations(table):
+    """평점/거리 통계가 있는 행 (region_data.csv 관광지)"""
+    return table[table['rating'].notna()]
+
+def get_destination_table(data_dir=None, region_path=None):
+    """프로세스 공용 표준 관광지 테이블 (데이터셋 관리자의 현재 스냅숏)
+
+    경로를 지정하면 관리자를 거치지 않고 새로 만듭니다.
+    반환된 데이터프레임은 공유되므로 호출 측에서 수정하지 않아야 합니다.
+    """
+    if data_dir is not None or region_path is not None:
+        return load_destination_table(data_dir, region_path)
+    from .datasets import get_dataset
+    return get_dataset('destination_table')
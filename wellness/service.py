@@ -0,0 +1,275 @@
+# wellness/service.py - 데이터셋을 메모리에 상주시키고 추천 결과를 캐시하는 서비스
+
+from collections import OrderedDict
+import threading
+
+import numpy as np
+
+from .schema import CLUSTER_SCORE_COLUMNS, get_destination_table, recommendable_destinations
+from .categories import get_category_index, normalize_category_filter
+from .similarity import get_similarity_index
+from .diversity import DiversitySimilarity, mmr_select
+from .ranking import (SCORING_MODES, build_place_record, cluster_weights, filter_mask,
+                      normalize_filter_values, top_k_positions)
+from .survey import determine_cluster
+
+CLUSTER_IDS = (0, 1, 2)
+
+# 다양성 재정렬 시 limit의 몇 배까지 후보로 볼지 (최소 DIVERSITY_MIN_POOL개)
+DIVERSITY_POOL_FACTOR = 5
+DIVERSITY_MIN_POOL = 50
+
+class RecommendationService:
+    """클러스터 분류와 상위 k개 추천을 제공하는 상주형 서비스
+
+    데이터셋은 한 번만 읽고, 클러스터별 점수 내림차순 인덱스와 결과 레코드를
+    미리 만들어 둡니다. 요청마다 정렬하지 않고 (클러스터, 필터, k) 조합별 결과를
+    LRU 캐시에 보관하므로 Streamlit 화면과 HTTP API가 같은 캐시를 공유합니다.
+    개인 맞춤 점수('personalized')는 (관광지 수 x 3) 점수 행렬과 사용자 혼합 가중치의
+    행렬-벡터 곱 한 번과 argpartition 상위 k개 선택으로 계산합니다.
+    """
+
+    def __init__(self, wellness_df=None, data_dir=None, cache_size=4096, previous=None, changed_ids=None):
+        if wellness_df is None:
+            wellness_df = recommendable_destinations(get_destination_table(data_dir))
+        self.wellness_df = wellness_df.reset_index(drop=True)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 클러스터별 점수 내림차순 인덱스 (동점은 원래 순서 유지 = nlargest와 동일)
+        self._orders = {}
+        self._records = {}
+        content_ids = [int(content_id) for content_id in self.wellness_df['content_id']]
+        self._rows = {content_id: i for i, content_id in enumerate(content_ids)}
+
+        # previous와 changed_ids(추가/수정된 content_id)를 주면 나머지 관광지의 레코드는 이전 서비스 것을 재사용
+        reused = {}
+        if previous is not None and changed_ids is not None:
+            reused = {i: previous._rows[content_id] for i, content_id in enumerate(content_ids)
+                      if content_id not in changed_ids and content_id in previous._rows}
+        rebuild = [i for i in range(len(content_ids)) if i not in reused]
+        rows = dict(zip(rebuild, self.wellness_df.iloc[rebuild].to_dict('records')))
+
+        for cluster_id in CLUSTER_IDS:
+            score_column = f'score_cluster_{cluster_id}'
+            if score_column not in self.wellness_df.columns:
+                continue
+            scores = self.wellness_df[score_column].to_numpy(dtype=float)
+            self._orders[cluster_id] = np.argsort(-scores, kind='stable')
+            previous_records = previous._records.get(cluster_id) if reused else None
+            self._records[cluster_id] = [
+                previous_records[reused[i]] if previous_records is not None and i in reused
+                else build_place_record(rows[i], score_column)
+                for i in range(len(content_ids))
+            ]
+
+        # 개인 맞춤 점수용 (관광지 수 x 클러스터 수) 점수 행렬
+        self._score_matrix = None
+        if all(column in self.wellness_df.columns for column in CLUSTER_SCORE_COLUMNS):
+            self._score_matrix = self.wellness_df[CLUSTER_SCORE_COLUMNS].to_numpy(dtype=float)
+
+        # 다양성 재정렬용 지역/테마/거리 유사도
+        self._diversity = DiversitySimilarity.from_frame(self.wellness_df)
+
+    def classify(self, answers):
+        """설문 답변으로 클러스터 결정"""
+        return determine_cluster(answers)
+
+    def recommend(self, cluster_result, theme_filter=None, region_filter=None, limit=10,
+                  category_filter=None, scoring='cluster', diversity=None):
+        """필터 적용된 상위 limit개 추천 (캐시 사용)
+
+        category_filter는 {카테고리 코드: 최소 주변 시설 수} 조건입니다 (예: {'FD': 5}).
+        scoring이 'personalized'이면 cluster_result의 cluster_scores로 세 클러스터 점수를 섞습니다.
+        diversity(0~1 미만의 λ)를 주면 상위 후보를 지역/테마/거리 다양성 기준으로 MMR 재정렬합니다.
+        """
+        if scoring not in SCORING_MODES:
+            raise ValueError(f"unknown scoring '{scoring}' (choose from {SCORING_MODES})")
+        cluster_id = cluster_result['cluster'] if isinstance(cluster_result, dict) else int(cluster_result)
+        theme_codes = normalize_filter_values(theme_filter)
+        region_codes = normalize_filter_values(region_filter)
+        category_codes = normalize_category_filter(category_filter)
+        # 캐시 키와 재정렬에 같은 값을 쓰도록 λ는 소수 둘째 자리로 한 번만 반올림
+        if diversity is not None:
+            diversity = round(float(diversity), 2)
+        weights = None
+        if scoring == 'personalized':
+            # 캐시 적중률을 위해 가중치는 소수 넷째 자리까지만 구분
+            weights = tuple(np.round(cluster_weights(cluster_result), 4).tolist())
+        key = (
+            cluster_id,
+            tuple(sorted(theme_codes, key=str)) if theme_codes else None,
+            tuple(sorted(region_codes, key=str)) if region_codes else None,
+            int(limit),
+            category_codes,
+            weights,
+            diversity
+        )
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is None:
+            pool = int(limit)
+            if diversity is not None:
+                pool = max(pool * DIVERSITY_POOL_FACTOR, DIVERSITY_MIN_POOL)
+            if weights is None:
+                cached = self._rank(cluster_id, theme_codes, region_codes, pool, category_codes)
+            else:
+                cached = self._rank_personalized(cluster_id, np.array(weights), theme_codes, region_codes,
+                                                 pool, category_codes)
+            if diversity is not None:
+                cached = self._diversify(cached, int(limit), diversity)
+            with self._lock:
+                self._cache[key] = cached
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        # 호출 측에서 레코드를 수정해도 캐시가 오염되지 않도록 얕은 복사본 반환
+        return [dict(record) for record in cached]
+
+    def recommend_batch(self, requests):
+        """여러 요청을 한 번에 처리 (각 요청은 answers 또는 cluster를 포함한 딕셔너리)"""
+        results = []
+        for request in requests:
+            cluster_result = request.get('cluster_result')
+            if cluster_result is None:
+                if 'cluster' in request:
+                    cluster_result = {'cluster': int(request['cluster'])}
+                else:
+                    cluster_result = self.classify(request.get('answers', {}))
+            results.append({
+                'cluster_result': cluster_result,
+                'recommendations': self.recommend(
+                    cluster_result,
+                    request.get('theme'),
+                    request.get('region'),
+                    request.get('limit', 10),
+                    request.get('category'),
+                    request.get('scoring', 'cluster'),
+                    request.get('diversity')
+                )
+            })
+        return results
+
+    def iter_ranked(self, cluster_id, theme_filter=None, region_filter=None, category_filter=None):
+        """필터를 통과한 전체 관광지 레코드를 클러스터 점수 내림차순으로 하나씩 반환 (캐시 미사용)"""
+        records = self._records.get(cluster_id, [])
+        for i in self._filtered_order(cluster_id, normalize_filter_values(theme_filter),
+                                      normalize_filter_values(region_filter),
+                                      normalize_category_filter(category_filter)):
+            yield records[i]
+
+    def similar(self, content_id, cluster_result, limit=5):
+        """content_id와 주변 시설 구성이 비슷한 관광지 레코드 (유사도 내림차순, similarity 포함)"""
+        cluster_id = cluster_result['cluster'] if isinstance(cluster_result, dict) else int(cluster_result)
+        records = self._records.get(cluster_id, [])
+        results = []
+        # 추천 대상이 아닌 관광지는 건너뛰므로 여유 있게 가져와 limit개만 사용
+        for similar_id, similarity in get_similarity_index().similar(content_id):
+            row = self._rows.get(similar_id)
+            if row is None or not records:
+                continue
+            results.append(dict(records[row], similarity=similarity))
+            if len(results) >= limit:
+                break
+        return results
+
+    def place_records(self, content_ids, scores):
+        """content_id와 점수 목록을 추천 레코드로 복원 (현재 데이터셋에 없는 관광지는 건너뜀)"""
+        records = next(iter(self._records.values()), [])
+        results = []
+        for content_id, score in zip(content_ids, scores):
+            row = self._rows.get(int(content_id))
+            if row is not None:
+                results.append(dict(records[row], score=float(score)))
+        return results
+
+    def candidate_scores(self, theme_filter=None, region_filter=None, category_filter=None):
+        """필터를 통과한 관광지 위치 배열과 그 (관광지 수 x 3) 클러스터 점수 행렬"""
+        positions = np.arange(len(self.wellness_df))
+        mask = self._filter_mask(normalize_filter_values(theme_filter), normalize_filter_values(region_filter),
+                                 normalize_category_filter(category_filter))
+        if mask is not None:
+            positions = positions[mask]
+        if self._score_matrix is None:
+            return positions[:0], np.empty((0, len(CLUSTER_SCORE_COLUMNS)))
+        return positions, self._score_matrix[positions]
+
+    def content_ids(self, theme_filter=None, region_filter=None):
+        """테마/지역 필터를 통과한 관광지 content_id 배열 (원래 순서)"""
+        mask = filter_mask(self.wellness_df, normalize_filter_values(theme_filter),
+                           normalize_filter_values(region_filter)).to_numpy()
+        return self.wellness_df['content_id'].to_numpy(dtype=np.int64)[mask]
+
+    def clear_cache(self):
+        """추천 결과 캐시 비우기"""
+        with self._lock:
+            self._cache.clear()
+
+    def _filtered_order(self, cluster_id, theme_codes, region_codes, category_codes=None):
+        """미리 정렬된 인덱스 중 필터를 통과한 것만 순서대로 반환"""
+        order = self._orders.get(cluster_id)
+        if order is None:
+            return np.empty(0, dtype=np.int64)
+
+        mask = self._filter_mask(theme_codes, region_codes, category_codes)
+        if mask is None:
+            return order
+        return order[mask[order]]
+
+    def _filter_mask(self, theme_codes, region_codes, category_codes=None):
+        """필터를 통과한 관광지 불리언 배열 (필터가 없으면 None)"""
+        if theme_codes is None and region_codes is None and category_codes is None:
+            return None
+        mask = filter_mask(self.wellness_df, theme_codes, region_codes).to_numpy()
+        if category_codes is not None:
+            mask = mask & get_category_index().mask_for(self.wellness_df['content_id'].to_numpy(dtype=np.int64),
+                                                         dict(category_codes))
+        return mask
+
+    def _rank(self, cluster_id, theme_codes, region_codes, limit, category_codes=None):
+        """미리 정렬된 인덱스에서 필터를 통과한 앞쪽 limit개 선택"""
+        selected = self._filtered_order(cluster_id, theme_codes, region_codes, category_codes)[:limit]
+        records = self._records.get(cluster_id, [])
+        return [records[i] for i in selected]
+
+    def _diversify(self, records, limit, diversity_lambda):
+        """점수 순 후보 레코드를 MMR로 재정렬해 limit개 선택"""
+        if len(records) <= 1:
+            return records[:limit]
+        positions = [self._rows[record['content_id']] for record in records]
+        scores = [record['score'] for record in records]
+        return [records[i] for i in mmr_select(positions, scores, self._diversity, limit, diversity_lambda)]
+
+    def _rank_personalized(self, cluster_id, weights, theme_codes, region_codes, limit, category_codes=None):
+        """혼합 가중치로 섞은 점수의 상위 limit개 선택 (레코드의 score는 혼합 점수)"""
+        records = self._records.get(cluster_id, [])
+        if self._score_matrix is None or not records:
+            return []
+        candidates = np.arange(len(self._score_matrix))
+        mask = self._filter_mask(theme_codes, region_codes, category_codes)
+        if mask is not None:
+            candidates = candidates[mask]
+        scores = self._score_matrix[candidates] @ weights
+        selected = top_k_positions(scores, limit)
+        return [dict(records[candidates[i]], score=float(scores[i])) for i in selected]
+
+_default_service = None
+_default_service_lock = threading.Lock()
+
+def get_service():
+    """프로세스 공용 추천 서비스 (데이터셋 관리자의 현재 스냅숏, reset_service로 교체했으면 그 서비스)"""
+    service = _default_service
+    if service is not None:
+        return service
+    from .datasets import get_dataset
+    return get_dataset('recommendation_service')
+
+def reset_service(service=None):
+    """프로세스 공용 추천 서비스 교체 (None이면 다시 데이터셋 관리자의 서비스 사용)"""
+    global _default_service
+    with _default_service_lock:
+        _default_service = service
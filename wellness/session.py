@@ -0,0 +1,123 @@
+# wellness/session.py - 사용자 세션 상태의 메모리 사용량 측정과 상한 적용
+#
+# 추천 결과 레코드에는 설명문 같은 긴 문자열이 들어 있어, 세션마다 목록을 그대로 들고 있으면
+# 동시 접속이 많을 때 서버 메모리 대부분을 차지합니다. 세션에는 CompactPlaces(content_id와
+# 점수 배열)만 보관하고, 제목/설명/좌표 같은 표시 필드는 화면을 그릴 때 상주 추천 서비스의
+# 공용 레코드에서 복원합니다. enforce_session_budget은 큰 추천 목록을 압축하고, 그래도
+# 상한을 넘으면 다시 계산할 수 있는 키부터 지운 뒤 세션별 사용량을 보고합니다.
+
+import sys
+from array import array
+
+# 세션 하나가 쓸 수 있는 메모리 상한 (바이트)
+SESSION_BUDGET_BYTES = 256 * 1024
+
+# content_id/점수만 남겨 압축하는 추천 목록 키
+COMPACT_KEYS = ('recommended_places', 'recommendation_results')
+
+# 상한을 넘으면 이 순서대로 지우는 키 (다시 계산할 수 있는 값)
+EVICTABLE_KEYS = ('recommendation_results', 'score_breakdown', 'validation_errors', 'show_results')
+
+class CompactPlaces:
+    """세션에 보관하는 추천 결과 (순서대로의 content_id와 점수 배열)"""
+
+    __slots__ = ('content_ids', 'scores')
+
+    def __init__(self, content_ids=(), scores=()):
+        self.content_ids = array('q', (int(content_id) for content_id in content_ids))
+        self.scores = array('d', (float(score) for score in scores))
+
+    @classmethod
+    def from_records(cls, records):
+        """추천 레코드 목록에서 content_id와 점수만 추출"""
+        return cls([record['content_id'] for record in records],
+                   [record.get('score', 0.0) for record in records])
+
+    def __len__(self):
+        return len(self.content_ids)
+
+    def __eq__(self, other):
+        return (isinstance(other, CompactPlaces) and self.content_ids == other.content_ids
+                and self.scores == other.scores)
+
+    def __getstate__(self):
+        return (self.content_ids, self.scores)
+
+    def __setstate__(self, state):
+        self.content_ids, self.scores = state
+
+    @property
+    def nbytes(self):
+        """배열이 차지하는 바이트 수"""
+        return sys.getsizeof(self.content_ids) + sys.getsizeof(self.scores)
+
+    def resolve(self, service=None):
+        """공용 추천 서비스에서 표시 필드를 채운 추천 레코드 목록 (새 딕셔너리)"""
+        if service is None:
+            from .service import get_service
+            service = get_service()
+        return service.place_records(self.content_ids, self.scores)
+
+def is_place_records(value):
+    """추천 레코드(content_id 포함 딕셔너리) 목록인지"""
+    return (isinstance(value, list) and bool(value)
+            and all(isinstance(item, dict) and 'content_id' in item for item in value))
+
+def deep_sizeof(value, _seen=None):
+    """값이 참조하는 객체까지 포함한 대략적인 메모리 사용량 (바이트, 공유 객체는 한 번만 셈)"""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    if isinstance(value, CompactPlaces):
+        return sys.getsizeof(value) + value.nbytes
+    if hasattr(value, 'memory_usage') and hasattr(value, 'columns'):
+        return int(value.memory_usage(deep=True).sum())
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_sizeof(key, _seen) + deep_sizeof(item, _seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, _seen) for item in value)
+    return size
+
+def session_usage(state):
+    """세션 상태 키별 메모리 사용량 {키: 바이트} (큰 순서)"""
+    seen = set()
+    usage = {str(key): deep_sizeof(state[key], seen) for key in list(state.keys())}
+    return dict(sorted(usage.items(), key=lambda item: item[1], reverse=True))
+
+def compact_session(state):
+    """추천 목록 키를 CompactPlaces로 바꾸고 바꾼 키 목록 반환"""
+    compacted = []
+    for key in COMPACT_KEYS:
+        if key in state and is_place_records(state[key]):
+            state[key] = CompactPlaces.from_records(state[key])
+            compacted.append(key)
+    return compacted
+
+def enforce_session_budget(state, budget=SESSION_BUDGET_BYTES):
+    """추천 목록을 압축하고, 상한을 넘으면 EVICTABLE_KEYS 순서로 지운 뒤 사용량 보고
+
+    반환 딕셔너리: total_bytes, budget_bytes, keys({키: 바이트}), compacted, evicted, over_budget
+    (지울 수 있는 키를 모두 지워도 상한을 넘으면 over_budget이 True입니다.)
+    """
+    compacted = compact_session(state)
+    usage = session_usage(state)
+    total = sum(usage.values())
+    evicted = []
+    for key in EVICTABLE_KEYS:
+        if total <= budget:
+            break
+        if key in usage:
+            del state[key]
+            total -= usage.pop(key)
+            evicted.append(key)
+    return {
+        'total_bytes': total,
+        'budget_bytes': budget,
+        'keys': usage,
+        'compacted': compacted,
+        'evicted': evicted,
+        'over_budget': total > budget,
+    }
@@ -0,0 +1,86 @@
+# wellness/session_cookie.py - 세션 토큰 쿠키를 서버 응답 헤더로 발급하는 ASGI 미들웨어
+#
+# 스크립트로 document.cookie를 쓰면 HttpOnly를 붙일 수 없어 페이지의 다른 스크립트가 토큰을
+# 읽을 수 있습니다. 이 미들웨어는 페이지(HTML) 요청에 유효한 세션 토큰 쿠키가 없으면
+# 새 토큰을 발급해 응답의 Set-Cookie 헤더(HttpOnly, Secure, SameSite=Lax)로 내려보냅니다.
+# 브라우저는 이어지는 웹소켓 연결에 쿠키를 실어 보내므로 앱은 st.context.cookies로 토큰을 읽기만 합니다.
+# 로그인/로그아웃 때 앱이 만든 교환 코드로 ROTATE_PATH를 요청하면 새 토큰 쿠키로 바꿔 줍니다
+# (세션 고정 방지, wellness.session_store.rotate_session 참고).
+# Streamlit에 의존하지 않는 순수 ASGI 미들웨어이며 asgi.py의 st.App에 등록됩니다.
+
+import asyncio
+from http.cookies import CookieError, SimpleCookie
+from urllib.parse import parse_qs
+
+from .session_store import (
+    ROTATE_PATH, SESSION_COOKIE, SESSION_TTL_SECONDS, new_session_token, redeem_rotation, verify_token,
+)
+
+def session_cookie_header(token, secure=True):
+    """세션 토큰 Set-Cookie 헤더 값 (bytes)"""
+    value = f"{SESSION_COOKIE}={token}; Path=/; Max-Age={SESSION_TTL_SECONDS}; HttpOnly; SameSite=Lax"
+    if secure:
+        value += "; Secure"
+    return value.encode('latin-1')
+
+def request_cookie(scope, name=SESSION_COOKIE):
+    """ASGI 요청의 쿠키 값 (없거나 형식이 잘못되었으면 None)"""
+    for header, value in scope.get('headers', ()):
+        if header != b'cookie':
+            continue
+        try:
+            morsel = SimpleCookie(value.decode('latin-1')).get(name)
+        except CookieError:
+            continue
+        if morsel is not None:
+            return morsel.value
+    return None
+
+def _is_page_request(scope):
+    """브라우저가 페이지(HTML)를 여는 GET 요청인지 (정적 파일/API 요청에는 쿠키를 발급하지 않음)"""
+    if scope.get('method') != 'GET':
+        return False
+    accept = dict(scope.get('headers', ())).get(b'accept', b'')
+    return b'text/html' in accept
+
+class SessionCookieMiddleware:
+    """페이지 요청에 유효한 세션 토큰 쿠키가 없으면 새 토큰을 HttpOnly 쿠키로 발급
+
+    ROTATE_PATH 요청은 앱으로 넘기지 않고 교환 코드가 맞으면 204와 새 토큰 쿠키, 아니면 403으로 응답합니다.
+
+    secure=False는 HTTPS 없이 localhost가 아닌 주소로 개발할 때만 사용합니다.
+    """
+
+    def __init__(self, app, secure=True):
+        self.app = app
+        self.secure = secure
+
+    async def _rotate(self, scope, send):
+        """교환 코드를 확인하고 새 토큰 쿠키 발급 (저장소 조회는 스레드에서 실행)"""
+        code = parse_qs(scope.get('query_string', b'').decode('latin-1')).get('code', [None])[0]
+        new_token = None
+        if code:
+            new_token = await asyncio.to_thread(redeem_rotation, code, request_cookie(scope))
+        headers = [(b'cache-control', b'no-store')]
+        if new_token is not None:
+            headers.append((b'set-cookie', session_cookie_header(new_token, self.secure)))
+        await send({'type': 'http.response.start', 'status': 204 if new_token else 403, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and scope.get('path') == ROTATE_PATH:
+            await self._rotate(scope, send)
+            return
+        if (scope['type'] != 'http' or not _is_page_request(scope)
+                or verify_token(request_cookie(scope)) is not None):
+            await self.app(scope, receive, send)
+            return
+
+        header = session_cookie_header(new_session_token(), self.secure)
+
+        async def send_with_cookie(message):
+            if message['type'] == 'http.response.start':
+                message = dict(message, headers=[*message.get('headers', ()), (b'set-cookie', header)])
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
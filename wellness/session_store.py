@@ -0,0 +1,294 @@
+# wellness/session_store.py - 여러 앱 복제본이 공유하는 세션 상태 저장소
+#
+# 설문 답변, 클러스터 결과, 추천 결과(CompactPlaces)처럼 다시 만들기 번거로운 세션 값만
+# 서명된 세션 토큰을 키로 외부 저장소에 보관합니다. 사용자가 다른 복제본으로 연결되거나
+# 노드가 재시작되어도 토큰으로 진행 상황을 복원할 수 있습니다.
+#   - 토큰: '<세션 ID>.<HMAC-SHA256 서명>' (비밀 키는 WELLNESS_SESSION_SECRET)
+#   - 쿠키: SESSION_COOKIE, 서버 응답 헤더로만 발급 (HttpOnly, wellness.session_cookie)
+#   - 직렬화: 압축 JSON (추천 결과는 content_id/점수 배열만)
+#   - 저장소: MemorySessionStore(프로세스 내부) 또는 SqliteSessionStore(공유 파일),
+#     WELLNESS_SESSION_STORE로 선택 ('memory' 또는 'sqlite:<경로>'),
+#     공유 저장소는 복제본끼리 같은 서명 키가 필요하므로 WELLNESS_SESSION_SECRET이 없으면 생성하지 않음
+# 복원은 새 세션에서 한 번만 하고, 저장은 직렬화 결과의 해시가 바뀌었을 때만 합니다.
+#
+# 세션 고정 방지: 로그인/로그아웃 때 rotate_session이 이전 세션을 지우고 새 토큰과 일회용 교환 코드를
+# 만듭니다. 코드는 그 사용자의 웹소켓으로만 전달되고, 브라우저가 ROTATE_PATH?code=...를 요청하면
+# 미들웨어가 redeem_rotation으로 코드를 확인해 새 토큰 쿠키를 발급합니다. 미리 심어 둔 이전 토큰만
+# 아는 사람은 코드를 모르므로 로그인한 세션을 이어받을 수 없습니다.
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+import zlib
+
+from .session import CompactPlaces
+
+# 외부 저장소에 보관하는 세션 키 (위젯 값과 화면용 임시 값은 제외)
+PERSISTED_KEYS = (
+    'logged_in', 'username', 'answers', 'survey_completed',
+    'factor_scores', 'cluster_result', 'recommended_places', 'locale',
+)
+
+# 세션 토큰 쿠키 이름
+SESSION_COOKIE = 'wellness_session'
+
+# 세션 보관 기간 (초)
+SESSION_TTL_SECONDS = 24 * 60 * 60
+
+# 토큰 교체 요청 경로 (미들웨어가 처리)와 교환 코드 유효 시간 (초)
+ROTATE_PATH = '/_wellness/session/rotate'
+ROTATION_TTL_SECONDS = 300
+
+# 저장소에서 교환 코드 항목을 세션 ID와 구분하는 접두어 (세션 ID에는 ':'가 없음)
+_ROTATION_PREFIX = 'rotate:'
+
+# 직렬화 형식 버전 (형식이 바뀌면 이전 세션은 복원하지 않음)
+_FORMAT_VERSION = b'\x01'
+
+def _session_secret():
+    """토큰 서명 키 (여러 복제본이 토큰을 공유하려면 WELLNESS_SESSION_SECRET을 같게 설정해야 함)"""
+    secret = os.environ.get('WELLNESS_SESSION_SECRET')
+    return secret.encode('utf-8') if secret else secrets.token_bytes(32)
+
+_SECRET = _session_secret()
+
+def _signature(session_id, secret):
+    digest = hmac.new(secret, session_id.encode('ascii'), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
+
+def sign_session_id(session_id, secret=None):
+    """세션 ID에 서명을 붙인 토큰"""
+    return f"{session_id}.{_signature(session_id, secret or _SECRET)}"
+
+def verify_token(token, secret=None):
+    """토큰 서명이 맞으면 세션 ID, 아니면 None"""
+    if not token or token.count('.') != 1:
+        return None
+    session_id, signature = token.split('.')
+    try:
+        expected = _signature(session_id, secret or _SECRET)
+    except UnicodeEncodeError:
+        return None
+    return session_id if hmac.compare_digest(signature, expected) else None
+
+def new_session_token(secret=None):
+    """새 세션 ID로 서명된 토큰 발급"""
+    return sign_session_id(secrets.token_urlsafe(16), secret)
+
+def _json_default(value):
+    """CompactPlaces와 numpy 스칼라/배열을 JSON 값으로 변환"""
+    if isinstance(value, CompactPlaces):
+        return {'__places__': [value.content_ids.tolist(), value.scores.tolist()]}
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _json_object(value):
+    if '__places__' in value and len(value) == 1:
+        content_ids, scores = value['__places__']
+        return CompactPlaces(content_ids, scores)
+    return value
+
+def encode_state(state):
+    """PERSISTED_KEYS에 해당하는 값만 압축 JSON 바이트로 직렬화"""
+    values = {key: state[key] for key in PERSISTED_KEYS if key in state}
+    text = json.dumps(values, ensure_ascii=False, separators=(',', ':'), default=_json_default)
+    return _FORMAT_VERSION + zlib.compress(text.encode('utf-8'))
+
+def decode_state(payload):
+    """encode_state 결과를 딕셔너리로 복원 (형식이 다르거나 손상되었으면 빈 딕셔너리)"""
+    if not payload or payload[:1] != _FORMAT_VERSION:
+        return {}
+    try:
+        return json.loads(zlib.decompress(payload[1:]).decode('utf-8'), object_hook=_json_object)
+    except (zlib.error, UnicodeDecodeError, ValueError):
+        return {}
+
+class SessionStore:
+    """세션 ID별 직렬화된 세션 상태 저장소 인터페이스"""
+
+    def __init__(self, ttl=SESSION_TTL_SECONDS):
+        self.ttl = ttl
+
+    def get(self, session_id):
+        """저장된 바이트 (없거나 만료되었으면 None)"""
+        raise NotImplementedError
+
+    def put(self, session_id, payload):
+        """바이트 저장 (보관 기간 갱신)"""
+        raise NotImplementedError
+
+    def delete(self, session_id):
+        """세션 삭제"""
+        raise NotImplementedError
+
+class MemorySessionStore(SessionStore):
+    """프로세스 내부 저장소 (복제본 하나일 때, 또는 개발용)"""
+
+    def __init__(self, ttl=SESSION_TTL_SECONDS):
+        super().__init__(ttl)
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        with self._lock:
+            item = self._items.get(session_id)
+            if item is None:
+                return None
+            payload, expires_at = item
+            if expires_at <= time.time():
+                del self._items[session_id]
+                return None
+            return payload
+
+    def put(self, session_id, payload):
+        with self._lock:
+            self._items[session_id] = (payload, time.time() + self.ttl)
+
+    def delete(self, session_id):
+        with self._lock:
+            self._items.pop(session_id, None)
+
+class SqliteSessionStore(SessionStore):
+    """SQLite 파일 저장소 (같은 파일을 공유하는 복제본끼리 세션 공유)"""
+
+    # 이 횟수만큼 저장할 때마다 만료된 세션 정리
+    PURGE_EVERY = 500
+
+    def __init__(self, path, ttl=SESSION_TTL_SECONDS):
+        super().__init__(ttl)
+        self.path = path
+        self._local = threading.local()
+        self._puts = 0
+        with self._connection() as conn:
+            conn.execute('''CREATE TABLE IF NOT EXISTS sessions
+                            (session_id TEXT PRIMARY KEY, payload BLOB NOT NULL, expires_at REAL NOT NULL)''')
+
+    def _connection(self):
+        """스레드별 연결 (WAL 모드: 읽기가 쓰기를 기다리지 않음)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, session_id):
+        row = self._connection().execute(
+            'SELECT payload FROM sessions WHERE session_id = ? AND expires_at > ?',
+            (session_id, time.time())).fetchone()
+        return bytes(row[0]) if row else None
+
+    def put(self, session_id, payload):
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute('INSERT OR REPLACE INTO sessions (session_id, payload, expires_at) VALUES (?, ?, ?)',
+                         (session_id, sqlite3.Binary(payload), now + self.ttl))
+            self._puts += 1
+            if self._puts % self.PURGE_EVERY == 0:
+                conn.execute('DELETE FROM sessions WHERE expires_at <= ?', (now,))
+
+    def delete(self, session_id):
+        with self._connection() as conn:
+            conn.execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+
+def create_session_store(spec=None):
+    """설정 문자열로 저장소 생성 ('memory' 또는 'sqlite:<경로>', 기본값은 WELLNESS_SESSION_STORE)
+
+    공유 저장소(sqlite)인데 WELLNESS_SESSION_SECRET이 없으면 복제본마다 서명 키가 달라
+    다른 복제본의 토큰을 모두 거부하게 되므로 RuntimeError를 발생시킵니다.
+    """
+    spec = spec or os.environ.get('WELLNESS_SESSION_STORE', 'memory')
+    if spec == 'memory':
+        return MemorySessionStore()
+    if spec.startswith('sqlite:'):
+        if not os.environ.get('WELLNESS_SESSION_SECRET'):
+            raise RuntimeError("공유 세션 저장소(WELLNESS_SESSION_STORE=sqlite:...)를 쓰려면 모든 복제본에 "
+                               "같은 WELLNESS_SESSION_SECRET을 설정해야 합니다.")
+        return SqliteSessionStore(spec[len('sqlite:'):])
+    raise ValueError(f"unknown session store '{spec}' (use 'memory' or 'sqlite:<path>')")
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_session_store():
+    """프로세스 공용 세션 저장소"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = create_session_store()
+    return _store
+
+def load_session(token, store=None):
+    """토큰이 유효하면 저장된 세션 값 딕셔너리, 아니면 빈 딕셔너리"""
+    session_id = verify_token(token)
+    if session_id is None:
+        return {}
+    return decode_state((store or get_session_store()).get(session_id))
+
+def save_session(token, state, previous_digest=None, store=None):
+    """세션 값을 저장하고 직렬화 해시 반환 (previous_digest와 같으면 저장하지 않음)"""
+    session_id = verify_token(token)
+    if session_id is None:
+        return None
+    payload = encode_state(state)
+    digest = hashlib.sha1(payload).hexdigest()
+    if digest != previous_digest:
+        (store or get_session_store()).put(session_id, payload)
+    return digest
+
+def delete_session(token, store=None):
+    """토큰의 세션 삭제 (로그아웃)"""
+    session_id = verify_token(token)
+    if session_id is not None:
+        (store or get_session_store()).delete(session_id)
+
+def rotate_session(token, store=None):
+    """토큰의 세션을 지우고 새 토큰과 일회용 교환 코드 (새 토큰, 코드) 반환 (토큰이 유효하지 않으면 None)
+
+    새 토큰은 브라우저가 이전 토큰 쿠키와 함께 ROTATE_PATH에 코드를 보내면 쿠키로 발급됩니다.
+    """
+    session_id = verify_token(token)
+    if session_id is None:
+        return None
+    store = store or get_session_store()
+    store.delete(session_id)
+    new_token = new_session_token()
+    code = secrets.token_urlsafe(24)
+    record = {'token': new_token, 'previous': session_id, 'expires_at': time.time() + ROTATION_TTL_SECONDS}
+    store.put(_ROTATION_PREFIX + code, json.dumps(record).encode('utf-8'))
+    return new_token, code
+
+def _rotation_record(code, store):
+    """만료되지 않은 교환 코드 항목 (없으면 None)"""
+    payload = store.get(_ROTATION_PREFIX + code) if code else None
+    if payload is None:
+        return None
+    record = json.loads(payload)
+    return record if record['expires_at'] > time.time() else None
+
+def rotation_pending(code, store=None):
+    """교환 코드가 아직 사용되지 않았고 유효한지"""
+    return _rotation_record(code, store or get_session_store()) is not None
+
+def redeem_rotation(code, token, store=None):
+    """교환 코드를 한 번만 사용해 새 토큰 반환 (이전 토큰 쿠키가 코드를 만든 세션과 다르면 None)
+
+    다른 브라우저의 잘못된 요청이 코드를 소모하지 않도록 확인에 성공했을 때만 코드를 지웁니다.
+    """
+    store = store or get_session_store()
+    record = _rotation_record(code, store)
+    if record is None or verify_token(token) != record['previous']:
+        return None
+    store.delete(_ROTATION_PREFIX + code)
+    return record['token']
@@ -0,0 +1,220 @@
+# wellness/similarity.py - 주변 시설 카테고리 구성 기반 "비슷한 관광지" 엔진
+#
+# category_counts의 관광지 x 소분류 개수 희소 행렬을 TF-IDF(또는 개수 그대로)로 가중하고
+# 행마다 L2 정규화하면 두 행의 내적이 코사인 유사도가 됩니다. 관광지마다 가장 비슷한
+# k곳과 그 유사도를 미리 계산해 두므로 요청 시에는 목록 앞부분만 잘라 반환합니다(O(k)).
+# 원천 행이 바뀌면 바뀐 행과, 이웃 목록에 바뀐 행이 들어 있던 행만 전부 다시 계산하고
+# 나머지 행은 기존 이웃 목록에 바뀐 행과의 유사도만 합쳐 갱신합니다.
+# 관광지 수가 EXACT_SEARCH_LIMIT를 넘으면 이웃 목록은 ANN 인덱스(wellness.ann)로 근사 계산하고,
+# 증분 갱신 시 ANN 인덱스도 바뀐 행만 다시 배정합니다.
+
+import numpy as np
+
+from .ann import build_ann_index
+
+# 가중 방식: 'tfidf' (log1p 개수 x IDF), 'l2' (개수 그대로)
+SIMILARITY_WEIGHTINGS = ('tfidf', 'l2')
+
+# 관광지마다 미리 계산해 두는 이웃 수
+DEFAULT_NEIGHBOURS = 20
+
+# 전수 비교 시 한 번에 처리하는 행 수 (유사도 행렬은 이 행 수 x 관광지 수까지만 만듦)
+SIMILARITY_CHUNK_ROWS = 256
+
+# 이 행 수까지는 모든 쌍을 정확히 비교하고, 넘으면 ANN 인덱스로 이웃 후보를 좁힘
+# (tools/benchmark_ann.py --switchover 기준 약 1만 행에서 전수 비교와 ANN 생성 시간이 비슷해짐)
+EXACT_SEARCH_LIMIT = 10000
+
+# 기본 ANN 설정 (wellness.ann.build_ann_index 인자)
+DEFAULT_ANN = {'method': 'ivf', 'n_probe': 8}
+
+def idf_weights(counts):
+    """열별 IDF 가중치 (smooth idf: log((1 + n) / (1 + df)) + 1)"""
+    document_frequency = np.bincount(counts.indices, minlength=counts.shape[1])
+    return np.log((1 + counts.shape[0]) / (1 + document_frequency)) + 1
+
+def weight_vectors(counts, weighting='tfidf', idf=None):
+    """개수 행렬을 가중한 뒤 행마다 L2 정규화한 CSR 행렬 반환 (모두 0인 행은 그대로 0)"""
+    if weighting == 'tfidf':
+        vectors = counts.map_data(np.log1p).scale_columns(idf_weights(counts) if idf is None else idf)
+    elif weighting == 'l2':
+        vectors = counts.map_data(lambda data: data.astype(float))
+    else:
+        raise ValueError(f"unknown weighting '{weighting}' (choose from {SIMILARITY_WEIGHTINGS})")
+    norms = vectors.row_norms()
+    return vectors.scale_rows(np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0))
+
+def _select_top(candidates, scores, k):
+    """행마다 후보 중 유사도 상위 k개를 (후보 번호, 유사도) 배열 쌍으로 반환
+
+    유사도 내림차순(동점은 번호 오름차순)이며, 유사도가 0 이하인 자리는 번호 -1, 유사도 0으로 채웁니다.
+    """
+    rows = scores.shape[0]
+    neighbours = np.full((rows, k), -1, dtype=np.int64)
+    similarities = np.zeros((rows, k), dtype=float)
+    width = min(k, scores.shape[1])
+    if not rows or not width:
+        return neighbours, similarities
+
+    part = np.argpartition(-scores, width - 1, axis=1)[:, :width]
+    part_scores = np.take_along_axis(scores, part, axis=1)
+    part_candidates = np.take_along_axis(candidates, part, axis=1)
+    order = np.lexsort((part_candidates, -part_scores), axis=-1)
+    part_scores = np.take_along_axis(part_scores, order, axis=1)
+    part_candidates = np.take_along_axis(part_candidates, order, axis=1)
+
+    valid = part_scores > 0
+    neighbours[:, :width] = np.where(valid, part_candidates, -1)
+    similarities[:, :width] = np.where(valid, part_scores, 0.0)
+    return neighbours, similarities
+
+class SimilarityIndex:
+    """관광지별 상위 k개 유사 관광지 목록 (코사인 유사도)
+
+    previous에 이전 인덱스를 주면 IDF 가중치를 그대로 쓰고 바뀐 행과 영향받은 행만 다시 계산합니다.
+    IDF까지 새로 맞추려면 previous 없이 다시 생성합니다. 행 수가 exact_limit를 넘으면
+    ann 설정으로 만든 근사 인덱스로 이웃을 찾습니다.
+    """
+
+    def __init__(self, content_ids, counts, codes=None, k=DEFAULT_NEIGHBOURS, weighting='tfidf',
+                 version=None, previous=None, exact_limit=EXACT_SEARCH_LIMIT, ann=None):
+        self.content_ids = np.asarray(content_ids, dtype=np.int64)
+        self.counts = counts
+        self.codes = None if codes is None else np.asarray(codes)
+        self.k = k
+        self.weighting = weighting
+        self.version = version
+
+        incremental = previous is not None and previous._compatible(self)
+        self.idf = previous.idf if incremental else idf_weights(counts)
+        self.vectors = weight_vectors(counts, weighting, self.idf)
+        self._rows = {content_id: row for row, content_id in enumerate(self.content_ids.tolist())}
+        if incremental:
+            old_rows, changed = self._changed_rows(previous)
+
+        self._ann = None
+        self._ann_params = None
+        if len(self.content_ids) > exact_limit:
+            self._ann_params = dict(ann or DEFAULT_ANN)
+            if incremental and previous._ann is not None and previous._ann_params == self._ann_params:
+                self._ann = previous._ann.update(old_rows, changed,
+                                                 self.vectors.take_rows(np.flatnonzero(changed)).to_dense())
+            else:
+                params = dict(self._ann_params)
+                self._ann = build_ann_index(self.vectors.to_dense().astype(np.float32), params.pop('method'),
+                                            **params)
+
+        if incremental:
+            self.neighbours, self.scores = self._update_from(previous, old_rows, changed)
+        else:
+            self.neighbours, self.scores = self._compute(np.arange(len(self.content_ids)))
+
+    @classmethod
+    def from_category_index(cls, index, k=DEFAULT_NEIGHBOURS, weighting='tfidf', previous=None):
+        """카테고리 인덱스의 소분류 개수 행렬로 생성"""
+        return cls(index.content_ids, index.counts, index.taxonomy.codes[3], k, weighting,
+                   index.version, previous)
+
+    def similar(self, content_id, k=None):
+        """content_id와 비슷한 관광지 [(content_id, 유사도), ...] (유사도 내림차순, 없는 id는 빈 리스트)"""
+        row = self._rows.get(int(content_id))
+        if row is None:
+            return []
+        k = self.k if k is None else min(int(k), self.k)
+        neighbours = self.neighbours[row, :k]
+        valid = neighbours >= 0
+        return list(zip(self.content_ids[neighbours[valid]].tolist(), self.scores[row, :k][valid].tolist()))
+
+    def _compatible(self, other):
+        """같은 열 구성/가중 방식/k라서 이웃 목록을 재사용할 수 있는지"""
+        same_codes = (self.codes is None and other.codes is None) or (
+            self.codes is not None and other.codes is not None and np.array_equal(self.codes, other.codes))
+        return (same_codes and self.counts.shape[1] == other.counts.shape[1]
+                and self.weighting == other.weighting and self.k == other.k)
+
+    def _similarities(self, rows, columns=None):
+        """rows 행과 columns 열(기본: 전체) 사이의 코사인 유사도 행렬 (rows는 청크 크기로 호출)"""
+        targets = self.vectors if columns is None else self.vectors.take_rows(columns)
+        return targets.matmul_dense(self.vectors.take_rows(rows).to_dense().T).T
+
+    def _chunks(self, rows):
+        """rows를 SIMILARITY_CHUNK_ROWS개씩 나눈 배열 목록"""
+        rows = np.asarray(rows, dtype=np.int64)
+        return [rows[start:start + SIMILARITY_CHUNK_ROWS] for start in range(0, len(rows), SIMILARITY_CHUNK_ROWS)]
+
+    def _compute(self, rows):
+        """rows 행의 이웃 목록을 전체 관광지와 비교해 새로 계산 (청크마다 상위 k개만 남김)"""
+        neighbours = np.full((len(rows), self.k), -1, dtype=np.int64)
+        scores = np.zeros((len(rows), self.k), dtype=float)
+        offset = 0
+        for chunk in self._chunks(rows):
+            end = offset + len(chunk)
+            neighbours[offset:end], scores[offset:end] = self._compute_chunk(chunk)
+            offset = end
+        return neighbours, scores
+
+    def _compute_chunk(self, rows):
+        if self._ann is not None:
+            # 자기 자신이 결과에 들어오므로 하나 더 찾은 뒤 제외
+            found, found_scores = self._ann.search(self._ann.vectors[rows], self.k + 1)
+            found_scores = np.where((found >= 0) & (found != rows[:, None]), found_scores, -np.inf)
+            return _select_top(found, found_scores, self.k)
+
+        scores = self._similarities(rows)
+        scores[np.arange(len(rows)), rows] = -np.inf
+        candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+        return _select_top(candidates, scores, self.k)
+
+    def _changed_rows(self, previous):
+        """이전 인덱스와 비교해 (새 행별 이전 행 번호(-1은 신규), 바뀐 행 마스크) 반환"""
+        old_rows = np.array([previous._rows.get(content_id, -1) for content_id in self.content_ids.tolist()],
+                            dtype=np.int64)
+        changed = old_rows < 0
+        for row in np.flatnonzero(~changed):
+            new_indices, new_data = self.counts.row(row)
+            old_indices, old_data = previous.counts.row(old_rows[row])
+            changed[row] = not (np.array_equal(new_indices, old_indices) and np.array_equal(new_data, old_data))
+        return old_rows, changed
+
+    def _update_from(self, previous, old_rows, changed):
+        """이전 이웃 목록을 재사용해 바뀐 부분만 다시 계산"""
+        n = len(self.content_ids)
+
+        # 이전 행 번호 → 새 행 번호 (삭제되었거나 바뀐 행은 -1, 마지막 칸은 빈 이웃 자리 -1용)
+        old_to_new = np.full(len(previous.content_ids) + 1, -1, dtype=np.int64)
+        stable = np.flatnonzero(~changed)
+        old_to_new[old_rows[stable]] = stable
+
+        neighbours = np.full((n, self.k), -1, dtype=np.int64)
+        scores = np.zeros((n, self.k), dtype=float)
+
+        # 이웃 목록에 삭제/변경된 관광지가 있던 행은 유사도가 내려갔을 수 있으므로 전부 다시 계산
+        old_neighbours = previous.neighbours[old_rows[stable]]
+        mapped = old_to_new[old_neighbours]
+        affected = ((old_neighbours >= 0) & (mapped < 0)).any(axis=1)
+        recompute = np.concatenate([np.flatnonzero(changed), stable[affected]])
+        if len(recompute):
+            neighbours[recompute], scores[recompute] = self._compute(recompute)
+
+        # 나머지 행은 기존 이웃 목록과 바뀐 행과의 유사도만 합쳐 상위 k개 선택
+        merge = stable[~affected]
+        new_columns = np.flatnonzero(changed)
+        if len(merge) and not len(new_columns):
+            neighbours[merge] = mapped[~affected]
+            scores[merge] = previous.scores[old_rows[merge]]
+        elif len(merge):
+            merge_neighbours = mapped[~affected]
+            for chunk in self._chunks(np.arange(len(merge))):
+                rows = merge[chunk]
+                kept_neighbours = merge_neighbours[chunk]
+                kept_scores = np.where(kept_neighbours >= 0, previous.scores[old_rows[rows]], -np.inf)
+                candidates = np.hstack([kept_neighbours,
+                                        np.broadcast_to(new_columns, (len(rows), len(new_columns)))])
+                candidate_scores = np.hstack([kept_scores, self._similarities(rows, new_columns)])
+                neighbours[rows], scores[rows] = _select_top(candidates, candidate_scores, self.k)
+        return neighbours, scores
+
+def get_similarity_index():
+    """프로세스 공용 유사 관광지 인덱스 (데이터셋 관리자의 현재 스냅숏, 카테고리 데이터가 바뀌면 바뀐 행만 갱신)"""
+    from .datasets import get_dataset
+    return get_dataset('similarity_index')
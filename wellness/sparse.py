@@ -0,0 +1,134 @@
+# wellness/sparse.py - NumPy만으로 구현한 최소한의 CSR 희소 행렬
+#
+# 카테고리 개수 행렬처럼 대부분이 0인 행렬을 (indptr, indices, data) 세 배열로 보관합니다.
+# 공통 임포트 경로에 scipy를 끌어오지 않기 위해 필요한 연산만 직접 구현합니다.
+
+import numpy as np
+
+# matmul_dense가 한 번에 밀집화하는 행 수
+MATMUL_BLOCK_ROWS = 1024
+
+class CsrMatrix:
+    """압축 행(CSR) 희소 행렬
+
+    행 i의 0이 아닌 값은 data[indptr[i]:indptr[i+1]], 열 번호는 indices의 같은 구간입니다.
+    """
+
+    def __init__(self, indptr, indices, data, shape):
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data)
+        self.shape = tuple(shape)
+
+    @classmethod
+    def from_dense(cls, dense):
+        """2차원 배열에서 0이 아닌 값만 골라 CSR 행렬 생성"""
+        dense = np.asarray(dense)
+        rows, cols = np.nonzero(dense)
+        indptr = np.zeros(dense.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=dense.shape[0]), out=indptr[1:])
+        return cls(indptr, cols, dense[rows, cols], dense.shape)
+
+    @classmethod
+    def from_coo(cls, rows, cols, data, shape):
+        """(행, 열, 값) 세 배열로 CSR 행렬 생성 (같은 칸의 값은 합산, 0은 제외)"""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        data = np.asarray(data)
+        if len(rows):
+            # 행 우선으로 정렬한 뒤 같은 (행, 열) 구간을 하나로 합침
+            order = np.lexsort((cols, rows))
+            rows, cols, data = rows[order], cols[order], data[order]
+            starts = np.flatnonzero(np.r_[True, (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])])
+            rows, cols, data = rows[starts], cols[starts], np.add.reduceat(data, starts)
+        keep = data != 0
+        rows, cols, data = rows[keep], cols[keep], data[keep]
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(indptr, cols, data, shape)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def row_ids(self):
+        """0이 아닌 값 각각의 행 번호"""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def row(self, i):
+        """행 하나의 (열 번호, 값) 배열 쌍"""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def to_dense(self):
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        dense[self.row_ids(), self.indices] = self.data
+        return dense
+
+    def column(self, j):
+        """열 하나를 밀집 벡터로 반환"""
+        values = np.zeros(self.shape[0], dtype=self.data.dtype)
+        hit = self.indices == j
+        values[self.row_ids()[hit]] = self.data[hit]
+        return values
+
+    def dot(self, vector):
+        """행렬 x 밀집 벡터 (길이 행 수)"""
+        vector = np.asarray(vector)
+        return np.bincount(self.row_ids(), weights=self.data * vector[self.indices],
+                           minlength=self.shape[0])
+
+    def matmul_dense(self, other, block_rows=MATMUL_BLOCK_ROWS):
+        """행렬 x 밀집 행렬 (block_rows행씩만 밀집화해 BLAS로 곱하므로 추가 메모리는 블록 크기로 제한)"""
+        other = np.asarray(other, dtype=float)
+        result = np.zeros((self.shape[0], other.shape[1]), dtype=float)
+        if not self.nnz:
+            return result
+        for start in range(0, self.shape[0], block_rows):
+            end = min(start + block_rows, self.shape[0])
+            result[start:end] = self.row_block(start, end).to_dense() @ other
+        return result
+
+    def column_sums(self):
+        return np.bincount(self.indices, weights=self.data, minlength=self.shape[1])
+
+    def row_sums(self):
+        return np.bincount(self.row_ids(), weights=self.data, minlength=self.shape[0])
+
+    def group_columns(self, groups, n_groups):
+        """열을 그룹 번호(groups[열])별로 합산한 (행 수, n_groups) 희소 행렬 반환"""
+        return CsrMatrix.from_coo(self.row_ids(), np.asarray(groups)[self.indices], self.data,
+                                  (self.shape[0], n_groups))
+
+    def scale_columns(self, weights):
+        """열마다 가중치를 곱한 새 행렬"""
+        return CsrMatrix(self.indptr, self.indices, self.data * np.asarray(weights)[self.indices], self.shape)
+
+    def map_data(self, func):
+        """0이 아닌 값마다 func를 적용한 새 행렬 (func(0) == 0인 함수만 사용)"""
+        return CsrMatrix(self.indptr, self.indices, func(self.data), self.shape)
+
+    def row_norms(self):
+        """행별 L2 노름"""
+        return np.sqrt(np.bincount(self.row_ids(), weights=self.data * self.data, minlength=self.shape[0]))
+
+    def scale_rows(self, weights):
+        """행마다 가중치를 곱한 새 행렬"""
+        weights = np.asarray(weights)
+        return CsrMatrix(self.indptr, self.indices, self.data * weights[self.row_ids()], self.shape)
+
+    def row_block(self, start, end):
+        """연속한 행 구간 [start, end)만 담은 새 행렬 (배열 복사 없이 구간 참조)"""
+        begin, finish = self.indptr[start], self.indptr[end]
+        return CsrMatrix(self.indptr[start:end + 1] - begin, self.indices[begin:finish], self.data[begin:finish],
+                         (end - start, self.shape[1]))
+
+    def take_rows(self, rows):
+        """지정한 행만 골라 새 행렬 생성"""
+        rows = np.asarray(rows, dtype=np.int64)
+        lengths = self.indptr[rows + 1] - self.indptr[rows]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        # 새 위치 p가 속한 행의 원래 시작 위치 + (p - 새 시작 위치)
+        positions = np.arange(indptr[-1], dtype=np.int64) + np.repeat(self.indptr[rows] - indptr[:-1], lengths)
+        return CsrMatrix(indptr, self.indices[positions], self.data[positions], (len(rows), self.shape[1]))
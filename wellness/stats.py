@@ -0,0 +1,149 @@
+# wellness/stats.py - 통계 대시보드용 사전 집계 큐브
+#
+# (유형, 클러스터, 지역, 테마, 거리 구간, 가격 구간, 평점 구간) 조합별로
+# 개수와 측정값(평점, 거리)의 합/최소/최대/제곱합을 한 번만 집계해 둡니다.
+# 화면의 차트와 표는 원본 행을 다시 훑지 않고 이 큐브를 원하는 차원으로
+# 접어서(rollup) 얻으며, 접은 결과도 차원 조합별로 메모해 재사용합니다.
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+CUBE_DIMENSIONS = ['type', 'cluster', 'region', 'theme', 'distance_bucket', 'price_bucket', 'rating_bucket']
+CUBE_MEASURES = ['rating', 'distance_from_incheon']
+
+# 큐브 차원별 표준 테이블 컬럼
+DIMENSION_COLUMNS = {
+    'type': 'type',
+    'cluster': 'cluster',
+    'region': 'region_code',
+    'theme': 'wellness_theme',
+}
+
+# 원본에 없는 차원은 이 값 하나로 채움
+MISSING_DIMENSION_VALUE = '전체'
+
+# 인천 기준 거리 구간 (상한 이하 포함)
+DISTANCE_BUCKETS = [
+    (50, "수도권 (50km 이내)"),
+    (200, "근거리 (50-200km)"),
+    (400, "중거리 (200-400km)"),
+    (np.inf, "원거리 (400km 이상)"),
+]
+
+# 최저 가격(price_min) 기준 가격 구간 (상한 이하 포함)
+PRICE_BUCKETS = [
+    (0, "무료"),
+    (30000, "저렴 (3만원 이하)"),
+    (100000, "중간 (3-10만원)"),
+    (np.inf, "고가 (10만원 이상)"),
+]
+PRICE_BUCKET_DEFAULT = "기타"
+
+# 평점 구간 폭
+RATING_BUCKET_WIDTH = 0.5
+
+def distance_buckets(distances):
+    """거리 배열을 거리 구간 라벨 배열로 변환"""
+    edges = [-np.inf] + [upper for upper, _ in DISTANCE_BUCKETS]
+    labels = [label for _, label in DISTANCE_BUCKETS]
+    return pd.cut(pd.Series(distances), bins=edges, labels=labels, right=True).astype(str).to_numpy()
+
+def price_buckets(price_min):
+    """최저 가격 배열을 가격 구간 라벨 배열로 변환 (가격 정보가 없으면 '기타')"""
+    edges = [-np.inf] + [upper for upper, _ in PRICE_BUCKETS]
+    labels = [label for _, label in PRICE_BUCKETS]
+    buckets = pd.cut(pd.Series(price_min, dtype=float), bins=edges, labels=labels, right=True)
+    return buckets.cat.add_categories(PRICE_BUCKET_DEFAULT).fillna(PRICE_BUCKET_DEFAULT).astype(str).to_numpy()
+
+def rating_buckets(ratings):
+    """평점 배열을 구간 하한값 배열로 변환"""
+    return np.floor(np.asarray(ratings, dtype=float) / RATING_BUCKET_WIDTH) * RATING_BUCKET_WIDTH
+
+class StatisticsCube:
+    """차원 조합별 개수/합/최소/최대/제곱합을 담은 집계 큐브"""
+
+    def __init__(self, cells, version=None):
+        self.cells = cells
+        self.version = version
+        self._rollups = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, df, version=None):
+        """원본 데이터프레임을 한 번 훑어 큐브 생성 (원본은 변경하지 않음)"""
+        dimensions = {}
+        for dimension, column in DIMENSION_COLUMNS.items():
+            if column in df.columns:
+                dimensions[dimension] = df[column].to_numpy()
+            else:
+                dimensions[dimension] = np.full(len(df), MISSING_DIMENSION_VALUE, dtype=object)
+        dimensions['distance_bucket'] = distance_buckets(df['distance_from_incheon'])
+        dimensions['price_bucket'] = price_buckets(df['price_min'])
+        dimensions['rating_bucket'] = rating_buckets(df['rating'])
+
+        frame = pd.DataFrame(dimensions)
+        for measure in CUBE_MEASURES:
+            values = df[measure].to_numpy(dtype=float)
+            frame[f'{measure}_sum'] = values
+            frame[f'{measure}_min'] = values
+            frame[f'{measure}_max'] = values
+            frame[f'{measure}_sumsq'] = values * values
+        frame['count'] = 1
+
+        cells = frame.groupby(CUBE_DIMENSIONS, sort=True).agg(cls._aggregations()).reset_index()
+        return cls(cells, version)
+
+    @staticmethod
+    def _aggregations():
+        aggregations = {'count': 'sum'}
+        for measure in CUBE_MEASURES:
+            aggregations.update({
+                f'{measure}_sum': 'sum',
+                f'{measure}_min': 'min',
+                f'{measure}_max': 'max',
+                f'{measure}_sumsq': 'sum',
+            })
+        return aggregations
+
+    def rollup(self, dimensions=()):
+        """지정한 차원으로 큐브를 접은 결과 (mean, std 포함) 반환 — 차원 조합별로 메모
+
+        dimensions가 비어 있으면 전체 합계 한 행을 반환합니다.
+        반환된 데이터프레임은 공유되므로 호출 측에서 수정하지 않아야 합니다.
+        """
+        key = tuple(dimensions)
+        result = self._rollups.get(key)
+        if result is not None:
+            return result
+
+        if key:
+            result = self.cells.groupby(list(key), sort=True).agg(self._aggregations())
+        else:
+            result = self.cells.agg(self._aggregations()).to_frame().T
+
+        count = result['count'].astype(float)
+        for measure in CUBE_MEASURES:
+            total = result[f'{measure}_sum']
+            result[f'{measure}_mean'] = total / count
+            # 표본 표준편차 (pandas std와 동일하게 ddof=1)
+            variance = (result[f'{measure}_sumsq'] - total * total / count) / (count - 1)
+            result[f'{measure}_std'] = np.sqrt(variance.clip(lower=0)).where(count > 1)
+
+        with self._lock:
+            self._rollups[key] = result
+        return result
+
+    def totals(self):
+        """전체 합계 (딕셔너리)"""
+        return self.rollup().iloc[0].to_dict()
+
+    def distinct_count(self, dimension):
+        """차원 값의 개수"""
+        return len(self.rollup((dimension,)))
+
+def get_statistics_cube():
+    """표준 관광지 테이블의 평점 보유 관광지 기반 통계 큐브 (데이터셋 관리자의 현재 스냅숏)"""
+    from .datasets import get_dataset
+    return get_dataset('statistics_cube')
@@ -0,0 +1,110 @@
+# wellness/styles.py - 전역/페이지 CSS를 버전이 붙은 압축 스타일시트 하나로 묶어 제공
+#
+# CSS 원본은 styles/*.css에 두고, 페이지마다 global.css + <페이지>.css를 이어 붙여 압축(주석/공백 제거)한 뒤
+# 내용 해시를 붙인 파일(static/css/wellness-<페이지>.<해시>.css)로 한 번만 씁니다.
+# Streamlit 정적 파일 제공(server.enableStaticServing)으로 이 파일을 내보내면 페이지는 rerun마다
+# 수십 KB의 <style> 블록 대신 <link> 한 줄만 보내고, 브라우저는 해시가 같은 파일을 다시 받지 않습니다.
+# 원본 CSS가 바뀌면 수정 시각으로 감지해 새 해시의 스타일시트를 만듭니다.
+
+import hashlib
+import os
+import re
+import threading
+
+from .data import ROOT_DIR, file_version
+
+STYLES_DIR = os.path.join(ROOT_DIR, 'styles')
+STATIC_DIR = os.path.join(ROOT_DIR, 'static')
+STYLESHEET_DIR = os.path.join(STATIC_DIR, 'css')
+
+# Streamlit 정적 파일 URL 접두사 (static/ 폴더가 app/static/으로 제공됨)
+STATIC_URL_PREFIX = 'app/static'
+
+# 모든 페이지에 공통으로 들어가는 CSS
+GLOBAL_STYLE = 'global'
+
+# 문자열 리터럴 또는 주석 (문자열 안의 /* */는 주석이 아님)
+_STRING_OR_COMMENT = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+_PLACEHOLDER = re.compile(r'\x00(\d+)\x00')
+_WHITESPACE = re.compile(r'\s+')
+_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+_COLON = re.compile(r':\s+')
+
+def minify_css(css):
+    """주석과 불필요한 공백 제거 (선택자의 자손 결합자 공백과 문자열 값은 유지)"""
+    strings = []
+
+    def stash(match):
+        # 문자열은 압축 규칙이 닿지 않도록 자리 표시자로 바꿔 두었다가 되돌림
+        if match.group(1) is None:
+            return ''
+        strings.append(match.group(1))
+        return f'\x00{len(strings) - 1}\x00'
+
+    css = _STRING_OR_COMMENT.sub(stash, css)
+    css = _WHITESPACE.sub(' ', css)
+    css = _PUNCTUATION.sub(r'\1', css)
+    css = _COLON.sub(':', css)
+    css = css.replace(';}', '}').strip()
+    return _PLACEHOLDER.sub(lambda match: strings[int(match.group(1))], css)
+
+def style_sources(page=None):
+    """페이지 스타일시트를 구성하는 CSS 원본 경로 (전역 CSS가 먼저)"""
+    names = [GLOBAL_STYLE] + ([page] if page else [])
+    return [os.path.join(STYLES_DIR, f'{name}.css') for name in names]
+
+class Stylesheet:
+    """압축한 CSS와 내용 해시 버전"""
+
+    def __init__(self, name, css):
+        self.name = name
+        self.css = css
+        self.version = hashlib.sha1(css.encode('utf-8')).hexdigest()[:12]
+        self.published = False
+
+    @property
+    def filename(self):
+        """버전이 붙은 스타일시트 파일 이름"""
+        return f'wellness-{self.name}.{self.version}.css'
+
+    @property
+    def url(self):
+        """Streamlit 정적 파일 URL"""
+        return f'{STATIC_URL_PREFIX}/css/{self.filename}'
+
+def build_stylesheet(page=None):
+    """전역 + 페이지 CSS를 이어 붙여 압축한 스타일시트 생성"""
+    chunks = []
+    for path in style_sources(page):
+        with open(path, encoding='utf-8') as f:
+            chunks.append(f.read())
+    return Stylesheet(page or GLOBAL_STYLE, minify_css('\n'.join(chunks)))
+
+_stylesheets = {}
+_stylesheets_lock = threading.Lock()
+
+def get_stylesheet(page=None):
+    """프로세스 공용 페이지 스타일시트 (CSS 원본이 바뀌었을 때만 다시 생성)"""
+    version = tuple(file_version(path) for path in style_sources(page))
+    cached = _stylesheets.get(page)
+    if cached is None or cached[0] != version:
+        with _stylesheets_lock:
+            cached = _stylesheets.get(page)
+            if cached is None or cached[0] != version:
+                cached = (version, build_stylesheet(page))
+                _stylesheets[page] = cached
+    return cached[1]
+
+def publish_stylesheet(stylesheet, directory=STYLESHEET_DIR):
+    """스타일시트를 정적 파일 폴더에 한 번만 기록 (같은 해시 파일이 있으면 건너뜀)하고 경로 반환"""
+    path = os.path.join(directory, stylesheet.filename)
+    if not stylesheet.published:
+        if not os.path.exists(path):
+            os.makedirs(directory, exist_ok=True)
+            # 다른 프로세스가 읽는 중에도 완성된 파일만 보이도록 임시 파일에 쓴 뒤 교체
+            temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(stylesheet.css)
+            os.replace(temp_path, path)
+        stylesheet.published = True
+    return path
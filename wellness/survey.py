@@ -0,0 +1,338 @@
+# wellness/survey.py - 설문 문항 정의 및 클러스터 분류 로직
+
+import numpy as np
+
+# 7개 문항 정의 (기존 12개에서 7개로 축소)
+questions = {
+    "q1": {
+        "title": "1. 한국에 머무를 계획 기간은 얼마나 되나요?",
+        "category": "체류 기간",
+        "options": [
+            "1~6일 (단기 관광)",
+            "7~10일 (일반적인 여행)",
+            "11~20일 (중장기 여행)",
+            "21일 이상 (장기 체류)"
+        ],
+        "weights": {
+            0: {"cluster_0": 0, "cluster_1": 1, "cluster_2": 2},  # 1~6일
+            1: {"cluster_0": 0, "cluster_1": 2, "cluster_2": 0},  # 7~10일
+            2: {"cluster_0": 1, "cluster_1": 1, "cluster_2": 0},  # 11~20일
+            3: {"cluster_0": 3, "cluster_1": 0, "cluster_2": 0}   # 21일+
+        }
+    },
+    "q2": {
+        "title": "2. 1인 1일 예상 지출액은 어느 정도인가요? (USD 기준)",
+        "category": "지출 수준",
+        "options": [
+            "$0~150 (저예산형)",
+            "$151~350 (중간 예산형)",
+            "$351~700 (고예산형)",
+            "$701 이상 (프리미엄형)"
+        ],
+        "weights": {
+            0: {"cluster_0": 3, "cluster_1": 0, "cluster_2": 0},  # $0~150
+            1: {"cluster_0": 0, "cluster_1": 2, "cluster_2": 0},  # $151~350
+            2: {"cluster_0": 0, "cluster_1": 0, "cluster_2": 1},  # $351~700
+            3: {"cluster_0": 0, "cluster_1": 0, "cluster_2": 3}   # $701+
+        }
+    },
+    "q3": {
+        "title": "3. 한국 방문은 몇 번째인가요?",
+        "category": "방문 경험",
+        "options": [
+            "처음 방문",
+            "2~3번째 방문",
+            "4~5번째 방문",
+            "6번째 이상 방문"
+        ],
+        "weights": {
+            0: {"cluster_0": 0, "cluster_1": 2, "cluster_2": 0},  # 처음
+            1: {"cluster_0": 1, "cluster_1": 2, "cluster_2": 0},  # 2~3번
+            2: {"cluster_0": 1, "cluster_1": 0, "cluster_2": 1},  # 4~5번
+            3: {"cluster_0": 0, "cluster_1": 0, "cluster_2": 3}   # 6번+
+        }
+    },
+    "q4": {
+        "title": "4. 주된 숙박 형태는 무엇에 가장 가깝나요?",
+        "category": "숙박 유형",
+        "options": [
+            "친척이나 친구 집",
+            "호텔이나 리조트",
+            "게스트하우스나 호스텔",
+            "에어비앤비나 콘도미니엄"
+        ],
+        "weights": {
+            0: {"cluster_0": 3, "cluster_1": 0, "cluster_2": 0},  # 친척/친구
+            1: {"cluster_0": 0, "cluster_1": 2, "cluster_2": 1},  # 호텔/리조트
+            2: {"cluster_0": 1, "cluster_1": 1, "cluster_2": 0},  # 게스트/호스텔
+            3: {"cluster_0": 0, "cluster_1": 1, "cluster_2": 1}   # 에어비앤비/콘도
+        }
+    },
+    "q5": {
+        "title": "5. 전통문화 체험(한복 입기, 전통 음식 만들기 등)에 대한 관심도는?",
+        "category": "문화 체험",
+        "options": [
+            "매우 높다 - 꼭 체험하고 싶다",
+            "어느 정도 있다 - 기회가 되면 해보고 싶다",
+            "잘 모르겠다 - 상황에 따라",
+            "관심이 낮다 - 별로 중요하지 않다"
+        ],
+        "weights": {
+            0: {"cluster_0": 1, "cluster_1": 2, "cluster_2": 0},  # 매우 높다
+            1: {"cluster_0": 1, "cluster_1": 1, "cluster_2": 0},  # 어느 정도
+            2: {"cluster_0": 0, "cluster_1": 0, "cluster_2": 0},  # 잘 모름
+            3: {"cluster_0": 0, "cluster_1": 0, "cluster_2": 1}   # 낮다
+        }
+    },
+    "q6": {
+        "title": "6. 박물관이나 전시관 관람에 대한 의향은?",
+        "category": "문화 관람",
+        "options": [
+            "매우 높다 - 여러 곳을 방문하고 싶다",
+            "어느 정도 있다 - 1-2곳 정도는 가보고 싶다",
+            "잘 모르겠다 - 시간이 남으면",
+            "관심이 낮다 - 굳이 가지 않아도 된다"
+        ],
+        "weights": {
+            0: {"cluster_0": 1, "cluster_1": 2, "cluster_2": 0},  # 매우 높다
+            1: {"cluster_0": 1, "cluster_1": 1, "cluster_2": 0},  # 어느 정도
+            2: {"cluster_0": 0, "cluster_1": 0, "cluster_2": 0},  # 잘 모름
+            3: {"cluster_0": 0, "cluster_1": 0, "cluster_2": 1}   # 낮다
+        }
+    },
+    "q7": {
+        "title": "7. 아래 중 가장 본인의 여행 스타일에 가까운 것은?",
+        "category": "여행 스타일",
+        "options": [
+            "오래 머물며 여유있게 지인도 만나고 문화도 천천히 즐긴다",
+            "평균적인 일정으로 주요 명소와 체험을 균형있게 본다",
+            "짧게 강하게! 쇼핑·미식 등 소비 중심으로 효율적으로 즐긴다"
+        ],
+        "weights": {
+            0: {"cluster_0": 3, "cluster_1": 0, "cluster_2": 0},  # 장기·지인·여유
+            1: {"cluster_0": 0, "cluster_1": 3, "cluster_2": 0},  # 평균형·균형
+            2: {"cluster_0": 0, "cluster_1": 0, "cluster_2": 3}   # 짧고 강한 소비
+        }
+    }
+}
+
+# 3개 클러스터 정보 (기존 8개에서 3개로 축소)
+def get_cluster_info():
+    """3개 클러스터 정보"""
+    return {
+        0: {
+            "name": "경제적 웰니스 관광객",
+            "english_name": "Economic Wellness Tourist",
+            "description": "한국에 오래 머물며, 저예산으로 문화를 천천히 체험하는 유형입니다.",
+            "characteristics": ["장기 체류", "지인 방문", "저예산", "문화 체험"],
+            "color": "#3498DB",
+            "percentage": 10.9,
+            "count": 282,
+            "key_factors": {
+                "체류기간": "21일 이상",
+                "지출수준": "저예산형",
+                "방문경험": "재방문자",
+                "숙박형태": "지인집"
+            }
+        },
+        1: {
+            "name": "일반 웰니스 관광객",
+            "english_name": "General Wellness Tourist",
+            "description": "일반적인 관광 일정과 예산으로 한국의 주요 명소와 문화를 균형있게 체험하는 대표적인 관광객 유형입니다.",
+            "characteristics": ["표준 일정", "균형 예산", "문화 관심", "호텔 선호"],
+            "color": "#2ECC71",
+            "percentage": 81.0,
+            "count": 2099,
+            "key_factors": {
+                "체류기간": "7-10일",
+                "지출수준": "중간 예산형",
+                "방문경험": "처음 또는 재방문",
+                "숙박형태": "호텔/리조트"
+            }
+        },
+        2: {
+            "name": "프리미엄 웰니스 관광객",
+            "english_name": "Premium Wellness Tourist",
+            "description": "짧은 기간 동안 고예산으로 쇼핑, 미식 등을 집중적으로 즐기는 경험 많은 재방문 고객입니다.",
+            "characteristics": ["단기 집중", "고예산", "쇼핑 중심", "효율 추구"],
+            "color": "#E37745",
+            "percentage": 8.1,
+            "count": 210,
+            "key_factors": {
+                "체류기간": "1-6일",
+                "지출수준": "고예산형",
+                "방문경험": "다수 재방문",
+                "숙박형태": "프리미엄 숙소"
+            }
+        }
+    }
+
+def get_cluster_region_info():
+    """클러스터별 지역 정보 반환"""
+    return {
+        1: {
+            "name": "경상북도 김천/거창 권역",
+            "description": "산림치유와 전통 체험이 결합된 내륙 산간지역",
+            "recommended_stay": "1박 2일",
+            "main_features": ["산림치유", "전통체험", "자연환경"],
+            "color": "#2ECC71"
+        },
+        2: {
+            "name": "서울/경기/인천 수도권",
+            "description": "접근성이 우수한 도심형 웰니스 시설 집중",
+            "recommended_stay": "당일 또는 1박",
+            "main_features": ["도심접근성", "프리미엄스파", "편의시설"],
+            "color": "#3498DB"
+        },
+        3: {
+            "name": "대구/경북 동남부 권역",
+            "description": "도시형 문화시설과 자연치유 시설 혼재",
+            "recommended_stay": "1박 2일",
+            "main_features": ["문화시설", "도시관광", "자연치유"],
+            "color": "#E67E22"
+        },
+        4: {
+            "name": "제주도 권역",
+            "description": "제주 특유의 자연환경을 활용한 프리미엄 웰니스 리조트",
+            "recommended_stay": "2박 3일",
+            "main_features": ["프리미엄리조트", "제주자연", "특별한경험"],
+            "color": "#E74C3C"
+        }
+    }
+
+def calculate_cluster_scores(answers):
+    """설문 답변을 바탕으로 3개 클러스터 점수 계산"""
+    cluster_scores = {"cluster_0": 0, "cluster_1": 0, "cluster_2": 0}
+
+    # 각 문항의 답변에 따라 클러스터별 점수 누적
+    for q_key, answer_idx in answers.items():
+        if q_key in questions and answer_idx is not None:
+            question_data = questions[q_key]
+            weights = question_data["weights"][answer_idx]
+
+            for cluster, weight in weights.items():
+                cluster_scores[cluster] += weight
+
+    return cluster_scores
+
+def determine_cluster(answers):
+    """설문 답변으로부터 클러스터 결정 (새로운 3개 클러스터 방식)"""
+    cluster_scores = calculate_cluster_scores(answers)
+
+    # 최고 점수의 클러스터 선택
+    best_cluster_key = max(cluster_scores, key=cluster_scores.get)
+    best_cluster_id = int(best_cluster_key.split('_')[1])
+
+    # 신뢰도 계산 (최고 점수 / 전체 점수 합)
+    total_score = sum(cluster_scores.values())
+    confidence = cluster_scores[best_cluster_key] / total_score if total_score > 0 else 0
+
+    # 동점 처리 (타이브레이커)
+    if list(cluster_scores.values()).count(cluster_scores[best_cluster_key]) > 1:
+        # Q1(체류일) 우선순위로 타이브레이커
+        q1_answer = answers.get('q1')
+        if q1_answer is not None:
+            if q1_answer == 3:  # 21일 이상 → cluster_0 우선
+                best_cluster_id = 0
+            elif q1_answer == 1:  # 7-10일 → cluster_1 우선
+                best_cluster_id = 1
+            elif q1_answer == 0:  # 1-6일 → cluster_2 우선
+                best_cluster_id = 2
+
+        # Q2(지출) 2순위 타이브레이커
+        if list(cluster_scores.values()).count(cluster_scores[best_cluster_key]) > 1:
+            q2_answer = answers.get('q2')
+            if q2_answer is not None:
+                if q2_answer == 0:  # 저예산 → cluster_0
+                    best_cluster_id = 0
+                elif q2_answer == 1:  # 중간예산 → cluster_1
+                    best_cluster_id = 1
+                elif q2_answer >= 2:  # 고예산 → cluster_2
+                    best_cluster_id = 2
+
+    return {
+        'cluster': best_cluster_id,
+        'confidence': confidence,
+        'cluster_scores': cluster_scores,
+        'score': cluster_scores[f"cluster_{best_cluster_id}"]
+    }
+
+def calculate_factor_scores(answers):
+    """호환성을 위한 더미 함수 - 3개 클러스터에서는 사용하지 않음"""
+    # 3개 주요 차원으로 간소화된 점수 반환
+    return {
+        "체류기간": answers.get('q1', 0) * 0.5,
+        "지출수준": answers.get('q2', 0) * 0.8,
+        "방문경험": answers.get('q3', 0) * 0.6,
+        "숙박형태": answers.get('q4', 0) * 0.4,
+        "문화관심": (answers.get('q5', 0) + answers.get('q6', 0)) * 0.3,
+        "여행스타일": answers.get('q7', 0) * 0.7
+    }
+
+def classify_wellness_type(answers):
+    """웰니스 성향 분류 (호환성을 위한 별칭)"""
+    return determine_cluster(answers)
+
+def find_missing_answers(answers):
+    """응답하지 않은 문항 키 집합 반환"""
+    return {key for key in questions.keys() if answers.get(key) is None}
+
+QUESTION_KEYS = list(questions.keys())
+N_CLUSTERS = 3
+
+def _build_weight_tensor():
+    """문항 x 선택지 x 클러스터 가중치 배열 생성 (선택지 수가 다른 문항은 0으로 채움)"""
+    max_options = max(len(q["options"]) for q in questions.values())
+    weights = np.zeros((len(QUESTION_KEYS), max_options, N_CLUSTERS))
+    for q_idx, q_key in enumerate(QUESTION_KEYS):
+        for option_idx, option_weights in questions[q_key]["weights"].items():
+            for cluster_id in range(N_CLUSTERS):
+                weights[q_idx, option_idx, cluster_id] = option_weights[f"cluster_{cluster_id}"]
+    return weights
+
+WEIGHT_TENSOR = _build_weight_tensor()
+
+def answers_to_matrix(answers_list):
+    """답변 딕셔너리 리스트를 (N, 문항 수) 정수 배열로 변환 (미응답은 -1)"""
+    matrix = np.full((len(answers_list), len(QUESTION_KEYS)), -1, dtype=np.int64)
+    for row, answers in enumerate(answers_list):
+        for q_idx, q_key in enumerate(QUESTION_KEYS):
+            answer_idx = answers.get(q_key)
+            if answer_idx is not None:
+                matrix[row, q_idx] = answer_idx
+    return matrix
+
+def determine_clusters(answer_matrix):
+    """답변 배열 전체를 한 번에 분류 (determine_cluster의 벡터화 버전)
+
+    answer_matrix: (N, 문항 수) 정수 배열, 미응답은 -1
+    반환: cluster, confidence, score (길이 N 배열)와 cluster_scores ((N, 3) 배열) 딕셔너리
+    """
+    answer_matrix = np.asarray(answer_matrix, dtype=np.int64)
+    answered = answer_matrix >= 0
+    q_index = np.broadcast_to(np.arange(len(QUESTION_KEYS)), answer_matrix.shape)
+
+    # 응답한 문항의 가중치만 누적
+    per_question = WEIGHT_TENSOR[q_index, np.where(answered, answer_matrix, 0)]
+    cluster_scores = (per_question * answered[..., None]).sum(axis=1)
+
+    best_score = cluster_scores.max(axis=1)
+    best_cluster = cluster_scores.argmax(axis=1)
+    total = cluster_scores.sum(axis=1)
+    confidence = np.divide(best_score, total, out=np.zeros_like(best_score), where=total > 0)
+
+    # 동점 처리 (determine_cluster와 동일한 규칙: Q1 다음 Q2가 우선)
+    tied = (cluster_scores == best_score[:, None]).sum(axis=1) > 1
+    q1 = answer_matrix[:, QUESTION_KEYS.index('q1')]
+    q2 = answer_matrix[:, QUESTION_KEYS.index('q2')]
+    q1_choice = np.select([q1 == 3, q1 == 1, q1 == 0], [0, 1, 2], default=-1)
+    q2_choice = np.select([q2 == 0, q2 == 1, q2 >= 2], [0, 1, 2], default=-1)
+    best_cluster = np.where(tied & (q1_choice >= 0), q1_choice, best_cluster)
+    best_cluster = np.where(tied & (q2_choice >= 0), q2_choice, best_cluster)
+
+    return {
+        'cluster': best_cluster,
+        'confidence': confidence,
+        'cluster_scores': cluster_scores,
+        'score': cluster_scores[np.arange(len(best_cluster)), best_cluster]
+    }
@@ -0,0 +1,228 @@
+# wellness/templates.py - 추천 카드/지도 팝업 HTML 템플릿 (미리 컴파일, 자동 이스케이프)
+#
+# str.format 형식의 템플릿을 모듈 로드 시 한 번 (리터럴, 필드, 형식) 조각 목록으로 컴파일해 두고,
+# 렌더링할 때는 값을 html.escape로 이스케이프해 이어 붙이기만 합니다. 이미 렌더링한 HTML 조각은
+# Markup으로 감싸 두 번 이스케이프되지 않게 합니다.
+# 관광지 제목/설명/주소/주변 관광지처럼 사용자와 무관한 카드 본문은 FragmentCache에
+# (조각 종류, content_id, 데이터 버전)별로 저장해 다시 그릴 때 재사용합니다.
+
+import html
+import threading
+from collections import OrderedDict
+from string import Formatter
+
+class Markup(str):
+    """이스케이프하지 않고 그대로 넣는 신뢰된 HTML 조각"""
+
+def escape(value):
+    """값을 HTML 이스케이프한 Markup (Markup은 그대로, None은 빈 문자열)"""
+    if isinstance(value, Markup):
+        return value
+    if value is None:
+        return Markup('')
+    return Markup(html.escape(str(value)))
+
+class HtmlTemplate:
+    """미리 컴파일한 HTML 템플릿 ({이름} 또는 {이름:형식} 필드, 값은 자동 이스케이프)"""
+
+    def __init__(self, source):
+        self.source = source
+        self._parts = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            if conversion:
+                raise ValueError(f"conversion '!{conversion}' is not supported in HTML templates")
+            self._parts.append((literal, field, spec or ''))
+
+    def render(self, **values):
+        """필드 값을 이스케이프해 채운 Markup"""
+        chunks = []
+        for literal, field, spec in self._parts:
+            chunks.append(literal)
+            if field is not None:
+                value = values[field]
+                if spec and not isinstance(value, Markup):
+                    value = format(value, spec)
+                chunks.append(escape(value))
+        return Markup(''.join(chunks))
+
+    def render_many(self, rows):
+        """값 딕셔너리 목록을 차례로 렌더링해 이어 붙인 Markup"""
+        return Markup(''.join(self.render(**row) for row in rows))
+
+# --- 추천 카드 (pages/04_recommendations.py) ---
+CARD_TEMPLATE = HtmlTemplate(
+    '<div class="recommendation-card">'
+    '<div class="ranking-badge">#{rank}</div>'
+    '{body}{similar}'
+    '</div>'
+)
+
+CARD_BODY_TEMPLATE = HtmlTemplate(
+    '<h3>{title}</h3>'
+    '{category}'
+    '<p class="place-description">{description}</p>'
+    '<div class="destination-detail">'
+    '<p class="address">📍 {address}</p>'
+    '{nearby}'
+    '</div>'
+)
+
+PLACE_CATEGORY_TEMPLATE = HtmlTemplate('<p class="place-category">{category}</p>')
+
+NEARBY_SPOTS_TEMPLATE = HtmlTemplate(
+    '<div class="nearby-spots">'
+    '<h4>🏷️ 주변 관광지</h4>'
+    '<div class="nearby-spots-list">{items}</div>'
+    '</div>'
+)
+
+NEARBY_SPOT_TEMPLATE = HtmlTemplate(
+    '<div class="nearby-spot-item">'
+    '<span class="nearby-spot-name">{name}</span>'
+    '<span class="nearby-spot-category">{category}</span>'
+    '</div>'
+)
+
+SIMILAR_PLACES_TEMPLATE = HtmlTemplate(
+    '<details class="similar-places">'
+    '<summary>🔍 이곳과 비슷한 관광지</summary>'
+    '<ul>{items}</ul>'
+    '</details>'
+)
+
+SIMILAR_PLACE_TEMPLATE = HtmlTemplate('<li><strong>{title}</strong> · 유사도 {similarity:.0f}%</li>')
+
+# --- 지도 팝업 (pages/05_map_view.py) ---
+MAP_POPUP_TEMPLATE = HtmlTemplate(
+    '<div style="width: 350px; font-family: \'Noto Sans KR\', sans-serif;">'
+    '<h4 style="color: #2E7D32; margin-bottom: 10px; border-bottom: 2px solid #4CAF50; padding-bottom: 5px;">'
+    '#{rank} {title}'
+    '</h4>'
+    '{body}'
+    '</div>'
+)
+
+MAP_POPUP_BODY_TEMPLATE = HtmlTemplate(
+    '<div style="margin: 15px 0; padding: 10px; background-color: #f5f5f5; border-radius: 8px;">'
+    '<strong>📝 설명:</strong><br>'
+    '<span style="line-height: 1.4;">{description}</span>'
+    '</div>'
+    '{nearby}'
+)
+
+MAP_POPUP_NEARBY_TEMPLATE = HtmlTemplate(
+    "<div style='margin-top: 10px; padding-top: 10px; border-top: 1px solid #4CAF50;'>"
+    "<strong style='color: #2E7D32;'>🏷️ 주변 관광지</strong><br>"
+    '{items}'
+    '</div>'
+)
+
+MAP_POPUP_NEARBY_ITEM_TEMPLATE = HtmlTemplate(
+    "<div style='margin: 5px 0; padding: 5px; background-color: #F1F8E9; border-radius: 4px;'>"
+    "<span style='font-weight: 600;'>{name}</span><br>"
+    "<small style='color: #689F38;'>{category}</small>"
+    '</div>'
+)
+
+NEARBY_MARKER_POPUP_TEMPLATE = HtmlTemplate(
+    '<div style="width: 250px;">'
+    '<h5 style="color: #689F38; margin-bottom: 8px;">{name}</h5>'
+    '<p style="color: #666;">'
+    '<strong>유형:</strong> {category}<br>'
+    '<strong>주변 관광지:</strong> {place_title}'
+    '</p>'
+    '</div>'
+)
+
+# 지도 팝업 설명 최대 길이
+POPUP_DESCRIPTION_CHARS = 150
+
+def render_card_body(place, address, nearby_spots):
+    """추천 카드 본문 (nearby_spots: {'name', 'category1'} 목록, 비어 있으면 주변 관광지 생략)"""
+    category = Markup('')
+    if place.get('category'):
+        category = PLACE_CATEGORY_TEMPLATE.render(category=place['category'])
+    nearby = Markup('')
+    if nearby_spots:
+        nearby = NEARBY_SPOTS_TEMPLATE.render(items=NEARBY_SPOT_TEMPLATE.render_many(
+            {'name': spot['name'], 'category': spot['category1']} for spot in nearby_spots))
+    return CARD_BODY_TEMPLATE.render(
+        title=place.get('title', '제목 없음'),
+        category=category,
+        description=place.get('description', '설명 정보가 없습니다.'),
+        address=address,
+        nearby=nearby,
+    )
+
+def render_similar_list(similar_places):
+    """비슷한 관광지 접이식 목록 (없으면 빈 조각)"""
+    if not similar_places:
+        return Markup('')
+    return SIMILAR_PLACES_TEMPLATE.render(items=SIMILAR_PLACE_TEMPLATE.render_many(
+        {'title': similar['title'], 'similarity': similar['similarity'] * 100} for similar in similar_places))
+
+def render_card(rank, body, similar=Markup('')):
+    """순위 배지를 붙인 추천 카드"""
+    return CARD_TEMPLATE.render(rank=rank, body=body, similar=similar)
+
+def render_map_popup_body(place, nearby_spots):
+    """지도 팝업 본문 (설명은 POPUP_DESCRIPTION_CHARS자까지, nearby_spots: {'name', 'category1'} 목록)"""
+    description = place.get('description', '설명 정보가 없습니다.')
+    if len(description) > POPUP_DESCRIPTION_CHARS:
+        description = description[:POPUP_DESCRIPTION_CHARS] + '...'
+    nearby = Markup('')
+    if nearby_spots:
+        nearby = MAP_POPUP_NEARBY_TEMPLATE.render(items=MAP_POPUP_NEARBY_ITEM_TEMPLATE.render_many(
+            {'name': spot['name'], 'category': spot['category1']} for spot in nearby_spots))
+    return MAP_POPUP_BODY_TEMPLATE.render(description=description, nearby=nearby)
+
+def render_map_popup(rank, place, body):
+    """순위와 제목을 붙인 지도 팝업"""
+    return MAP_POPUP_TEMPLATE.render(rank=rank, title=place['title'], body=body)
+
+def render_nearby_marker_popup(name, category, place_title):
+    """주변 관광지 마커 팝업"""
+    return NEARBY_MARKER_POPUP_TEMPLATE.render(name=name, category=category, place_title=place_title)
+
+# 관광지별 조각 캐시 크기
+FRAGMENT_CACHE_SIZE = 4096
+
+class FragmentCache:
+    """(조각 종류, content_id, 데이터 버전)별 렌더링 결과 LRU 캐시 (프로세스 공용, 스레드 안전)"""
+
+    def __init__(self, maxsize=FRAGMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind, content_id, version, build):
+        """캐시된 조각 반환, 없으면 build()로 만들어 저장"""
+        key = (kind, content_id, version)
+        with self._lock:
+            fragment = self._items.get(key)
+            if fragment is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return fragment
+        # 조각 생성(역지오코딩 등)은 잠금 밖에서 수행
+        fragment = build()
+        with self._lock:
+            self.misses += 1
+            self._items[key] = fragment
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return fragment
+
+    def clear(self):
+        """모든 조각 삭제"""
+        with self._lock:
+            self._items.clear()
+
+_fragment_cache = FragmentCache()
+
+def get_fragment_cache():
+    """프로세스 공용 관광지 조각 캐시"""
+    return _fragment_cache
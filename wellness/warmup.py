@@ -0,0 +1,292 @@
+# wellness/warmup.py - 서버 시작 시 데이터셋/인덱스/무거운 라이브러리 미리 준비 (캐시 워밍업)
+#
+# 배포 직후 첫 방문자가 CSV 파싱, 표준 테이블 병합, 추천/공간/카테고리 인덱스 생성,
+# 역지오코더 KD-트리, Plotly 템플릿과 Folium 임포트 비용을 치르지 않도록
+# start_warmup()이 백그라운드 스레드에서 등록된 단계를 순서대로 실행합니다.
+# 필수 단계가 모두 끝나면 is_ready()가 True가 되며, 로드 밸런서 헬스 체크는
+#   - API 서버(wellness.api)의 GET /ready, 또는
+#   - serve_readiness(port)로 띄운 준비 상태 전용 HTTP 엔드포인트
+#     (Streamlit은 tools/serve_streamlit.py --readiness-port로 실행)
+# 를 폴링하면 됩니다 (준비 전 503, 준비 후 200).
+#
+# 필수 단계가 실패하면 (데이터 파일 교체 중, 일시적인 I/O 오류 등) 간격을 두 배씩 늘리며
+# 최대 max_attempts번까지 다시 시도하고, 그래도 실패하면 다음 start_warmup() 호출이
+# 끝나지 않은 단계만 다시 실행합니다 (성공한 단계는 건너뜀).
+#
+# 역지오코더와 지도/차트 라이브러리 단계는 화면을 그리는 Streamlit 프로세스에만 필요하므로
+# start_warmup(ui=True)일 때만 추가합니다.
+#
+# 사용법: python -m wellness.warmup [--ui]
+#   워밍업을 동기로 실행하고 단계별 소요 시간을 출력합니다 (필수 단계 실패 시 종료 코드 1).
+
+import argparse
+import json
+import sys
+import threading
+import time
+
+# 역지오코더 워밍업에 쓰는 좌표 (서울시청)
+_GEOCODER_PROBE = (37.5665, 126.9780)
+
+# 필수 단계 재시도 횟수(첫 시도 포함)와 첫 재시도 전 대기 시간(초, 매번 두 배)
+WARMUP_MAX_ATTEMPTS = 3
+WARMUP_RETRY_BACKOFF = 1.0
+
+def _warm_datasets():
+    """추천/카테고리 원천 데이터셋 로드"""
+    from .datasets import get_dataset_manager
+    manager = get_dataset_manager()
+    for name in ('wellness_destinations', 'region_destinations', 'category_map', 'category_counts'):
+        manager.get(name)
+
+def _warm_nearby_spots():
+    """주변 관광지 데이터셋 로드"""
+    from .datasets import get_dataset
+    get_dataset('wellness_nearby_spots')
+
+def _warm_ranking():
+    """표준 관광지 테이블과 클러스터별 추천 순위"""
+    from .service import get_service
+    get_service()
+
+def _warm_spatial():
+    """지역/거리 검색용 공간 인덱스"""
+    from .region_index import get_region_index
+    get_region_index()
+
+def _warm_facets():
+    """주변 시설 카테고리 인덱스와 유사 관광지 이웃 목록"""
+    from .categories import get_category_index
+    from .similarity import get_similarity_index
+    get_category_index().level_counts(1)
+    get_similarity_index()
+
+def _warm_statistics():
+    """통계 페이지용 사전 집계 큐브"""
+    from .stats import get_statistics_cube
+    get_statistics_cube()
+
+def warm_geocoder():
+    """역지오코더 KD-트리 생성 (프로세스 공용 싱글턴)"""
+    import reverse_geocoder
+    reverse_geocoder.search(_GEOCODER_PROBE)
+
+def warm_charts():
+    """Plotly 기본 템플릿과 Folium/streamlit-folium 임포트"""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    pio.templates[pio.templates.default]
+    go.Figure(go.Scatter(x=[0], y=[0])).to_json()
+    import folium
+    import streamlit_folium  # noqa: F401
+    folium.Map(location=_GEOCODER_PROBE).get_root().render()
+
+def warm_templates():
+    """추천 카드/지도 팝업 HTML 템플릿 컴파일"""
+    from .templates import get_fragment_cache
+    get_fragment_cache()
+
+class WarmupState:
+    """워밍업 단계 목록과 단계별 상태 ('pending', 'running', 'done', 'failed')"""
+
+    def __init__(self, max_attempts=WARMUP_MAX_ATTEMPTS, retry_backoff=WARMUP_RETRY_BACKOFF):
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self._steps = []
+        self.status = {}
+        self.elapsed_ms = {}
+        self.errors = {}
+        self.attempts = {}
+        self.started_at = None
+        self.finished_at = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def register(self, name, func, required=True):
+        """워밍업 단계 추가 (required=False면 실패해도 준비 완료로 봄, 같은 이름은 교체)"""
+        with self._lock:
+            self._steps = [step for step in self._steps if step[0] != name]
+            self._steps.append((name, func, required))
+            self.status[name] = 'pending'
+
+    @property
+    def steps(self):
+        """등록된 단계 이름"""
+        return [name for name, _, _ in self._steps]
+
+    @property
+    def started(self):
+        """워밍업 스레드를 시작했는지"""
+        return self._thread is not None
+
+    def is_ready(self):
+        """필수 단계가 모두 성공했는지"""
+        return self._ready.is_set()
+
+    def wait(self, timeout=None):
+        """준비 완료까지 대기 (시간 내 준비되면 True)"""
+        return self._ready.wait(timeout)
+
+    def _run_step(self, name, func):
+        """단계 하나를 한 번 실행하고 성공 여부 반환"""
+        self.status[name] = 'running'
+        self.attempts[name] = self.attempts.get(name, 0) + 1
+        started = time.perf_counter()
+        try:
+            func()
+            self.status[name] = 'done'
+            self.errors.pop(name, None)
+        except Exception as e:
+            self.status[name] = 'failed'
+            self.errors[name] = str(e)
+        self.elapsed_ms[name] = (time.perf_counter() - started) * 1000
+        return self.status[name] == 'done'
+
+    def run(self):
+        """끝나지 않은 단계를 순서대로 실행 (필수 단계가 모두 성공하면 준비 완료)
+
+        실패한 필수 단계는 retry_backoff초부터 두 배씩 늘린 간격으로 max_attempts번까지 시도합니다.
+        이미 성공한 단계는 다시 실행하지 않습니다.
+        """
+        self.started_at = time.time()
+        failed_required = False
+        for name, func, required in list(self._steps):
+            if self.status.get(name) == 'done':
+                continue
+            delay = self.retry_backoff
+            for attempt in range(1, (self.max_attempts if required else 1) + 1):
+                if attempt > 1:
+                    time.sleep(delay)
+                    delay *= 2
+                if self._run_step(name, func):
+                    break
+            failed_required = failed_required or (required and self.status[name] != 'done')
+        self.finished_at = time.time()
+        if not failed_required:
+            self._ready.set()
+        return not failed_required
+
+    def start(self):
+        """백그라운드 스레드에서 실행 (실행 중이거나 준비가 끝났으면 그대로 반환)
+
+        이전 실행이 필수 단계 실패로 끝났으면 끝나지 않은 단계만 다시 실행합니다.
+        """
+        with self._lock:
+            if self._thread is None or not (self._thread.is_alive() or self.is_ready()):
+                self._thread = threading.Thread(target=self.run, name="wellness-warmup", daemon=True)
+                self._thread.start()
+        return self
+
+    def report(self):
+        """헬스 체크 응답용 상태 딕셔너리"""
+        return {
+            'ready': self.is_ready(),
+            'steps': {name: {'status': self.status[name],
+                             'elapsed_ms': round(self.elapsed_ms.get(name, 0.0), 1),
+                             'required': required,
+                             'attempts': self.attempts.get(name, 0),
+                             **({'error': self.errors[name]} if name in self.errors else {})}
+                      for name, _, required in self._steps},
+        }
+
+def _default_state():
+    """기본 워밍업 단계를 등록한 상태 객체"""
+    state = WarmupState()
+    state.register('datasets', _warm_datasets)
+    state.register('ranking', _warm_ranking)
+    state.register('spatial', _warm_spatial)
+    state.register('facets', _warm_facets)
+    state.register('statistics', _warm_statistics)
+    # 주변 관광지 파일이 없는 배포도 있어 준비 상태를 막지 않음
+    state.register('nearby_spots', _warm_nearby_spots, required=False)
+    return state
+
+# 화면용 선택 단계 (선택 의존성이므로 실패해도 준비 상태를 막지 않음)
+UI_WARMUP_STEPS = [
+    ('geocoder', warm_geocoder),
+    ('charts', warm_charts),
+    ('templates', warm_templates),
+]
+
+_state = None
+_state_lock = threading.Lock()
+
+def get_warmup_state():
+    """프로세스 공용 워밍업 상태"""
+    global _state
+    if _state is None:
+        with _state_lock:
+            if _state is None:
+                _state = _default_state()
+    return _state
+
+def register_warmup_step(name, func, required=False):
+    """프로세스 공용 워밍업에 단계 추가 (워밍업 시작 전에 호출해야 실행됨)"""
+    get_warmup_state().register(name, func, required)
+
+def start_warmup(ui=False):
+    """프로세스 공용 워밍업을 백그라운드에서 시작 (실행 중이거나 준비가 끝났으면 다시 실행하지 않음)"""
+    state = get_warmup_state()
+    if ui and not state.started:
+        for name, func in UI_WARMUP_STEPS:
+            if name not in state.status:
+                state.register(name, func, required=False)
+    return state.start()
+
+def is_ready():
+    """프로세스 공용 워밍업의 필수 단계가 모두 끝났는지"""
+    return get_warmup_state().is_ready()
+
+def _readiness_response(path):
+    """준비 상태 엔드포인트 (상태 코드, 응답 객체): /ready는 준비 전 503, /health는 항상 200"""
+    path = path.split('?', 1)[0].rstrip('/')
+    report = get_warmup_state().report()
+    if path == '/ready':
+        return (200 if report['ready'] else 503), report
+    if path == '/health':
+        return 200, report
+    return 404, {'error': f"no route for {path}"}
+
+def serve_readiness(port, host='0.0.0.0'):
+    """준비 상태 HTTP 엔드포인트를 데몬 스레드로 실행하고 서버 객체 반환"""
+    # http.server 임포트 비용이 커서 엔드포인트를 켤 때만 로딩
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class ReadinessHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, report = _readiness_response(self.path)
+            body = json.dumps(report, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            """헬스 체크 폴링 로그는 출력하지 않음"""
+
+    server = ThreadingHTTPServer((host, port), ReadinessHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="wellness-readiness", daemon=True).start()
+    return server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="웰니스 추천 캐시 워밍업")
+    parser.add_argument('--ui', action='store_true', help="역지오코더/지도 라이브러리 단계 포함")
+    args = parser.parse_args(argv)
+
+    state = get_warmup_state()
+    if args.ui:
+        for name, func in UI_WARMUP_STEPS:
+            state.register(name, func, required=False)
+    ready = state.run()
+    for name, step in state.report()['steps'].items():
+        mark = {'done': '✅', 'failed': '❌' if step['required'] else '⚠️'}.get(step['status'], '·')
+        detail = f" - {step['error']}" if 'error' in step else ""
+        print(f"{mark} {name:<14}{step['elapsed_ms']:>10.1f}ms{detail}")
+    print("✅ 준비 완료" if ready else "❌ 필수 워밍업 단계가 실패했습니다.")
+    return 0 if ready else 1
+
+if __name__ == '__main__':
+    sys.exit(main())